@@ -11,7 +11,17 @@ from investing_algorithm_framework.domain import ApiException, \
     RESERVED_BALANCES, APP_MODE, AppMode, DATETIME_FORMAT, \
     load_backtest_report, BacktestDateRange, convert_polars_to_pandas, \
     DateRange, get_backtest_report, DEFAULT_LOGGING_CONFIG, \
-    BacktestReport, TradeStatus, MarketDataType, TradeRiskType
+    BacktestReport, TradeStatus, MarketDataType, TradeRiskType, \
+    SnapshotInterval, SNAPSHOT_INTERVAL, BACKTESTING_FILL_MODEL, FillModel, \
+    FixedFee, PercentageFee, SpreadSlippage, CandleRangeSlippage, \
+    SQLiteProfile, SQLITE_PROFILE, BACKTESTING_IN_MEMORY_DATABASE, \
+    BACKTESTING_DATABASE_SNAPSHOT_PATH, SQLitePoolMode, SQLITE_POOL_MODE, \
+    BacktestReportFormat, BACKTESTING_REPORT_FORMAT, \
+    BACKTESTING_EQUITY_CURVE_RESOLUTION, get_equity_curve_metrics, \
+    write_backtest_report_archive, rebuild_backtest_report_index, \
+    iterate_backtest_reports, load_backtest_reports_evaluation, \
+    TraceMetrics, get_trace_metrics, simulate_trade_sequences, \
+    WalkForwardReport, create_walk_forward_date_ranges
 from investing_algorithm_framework.infrastructure import \
     CCXTOrderBookMarketDataSource, CCXTOHLCVMarketDataSource, \
     CCXTTickerMarketDataSource, CSVOHLCVMarketDataSource, \
@@ -61,12 +71,25 @@ __all__ = [
     "pretty_print_backtest_reports_evaluation",
     "BacktestReportsEvaluation",
     "load_backtest_reports",
+    "iterate_backtest_reports",
+    "load_backtest_reports_evaluation",
     "SYMBOLS",
     "RESERVED_BALANCES",
     "APP_MODE",
     "AppMode",
     "DATETIME_FORMAT",
     "load_backtest_report",
+    "write_backtest_report_archive",
+    "rebuild_backtest_report_index",
+    "BacktestReportFormat",
+    "BACKTESTING_REPORT_FORMAT",
+    "BACKTESTING_EQUITY_CURVE_RESOLUTION",
+    "get_equity_curve_metrics",
+    "TraceMetrics",
+    "get_trace_metrics",
+    "simulate_trade_sequences",
+    "WalkForwardReport",
+    "create_walk_forward_date_ranges",
     "BacktestDateRange",
     "convert_polars_to_pandas",
     "DateRange",
@@ -93,5 +116,19 @@ __all__ = [
     "TradeStatus",
     "MarketDataType",
     "TradeRiskType",
-    "Context"
+    "Context",
+    "SnapshotInterval",
+    "SQLiteProfile",
+    "SQLITE_PROFILE",
+    "SQLitePoolMode",
+    "SQLITE_POOL_MODE",
+    "SNAPSHOT_INTERVAL",
+    "BACKTESTING_FILL_MODEL",
+    "BACKTESTING_IN_MEMORY_DATABASE",
+    "BACKTESTING_DATABASE_SNAPSHOT_PATH",
+    "FillModel",
+    "FixedFee",
+    "PercentageFee",
+    "SpreadSlippage",
+    "CandleRangeSlippage",
 ]
@@ -3,6 +3,7 @@ import logging
 import os
 import threading
 from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from time import sleep
 from typing import List, Optional
 
@@ -18,9 +19,13 @@ from investing_algorithm_framework.domain import DATABASE_NAME, TimeUnit, \
     BACKTESTING_START_DATE, BACKTESTING_END_DATE, BacktestReport, \
     BACKTESTING_PENDING_ORDER_CHECK_INTERVAL, APP_MODE, MarketCredential, \
     AppMode, BacktestDateRange, DATABASE_DIRECTORY_NAME, \
-    BACKTESTING_INITIAL_AMOUNT, MarketDataSource
+    BACKTESTING_INITIAL_AMOUNT, MarketDataSource, \
+    BACKTESTING_IN_MEMORY_DATABASE, BACKTESTING_DATABASE_SNAPSHOT_PATH, \
+    BACKTESTING_REPORT_FORMAT, BacktestReportFormat, \
+    BacktestReportsEvaluation, WalkForwardReport, WalkForwardWindow, \
+    get_walk_forward_date_range, DATETIME_FORMAT_BACKTESTING, METRIC_COLUMNS
 from investing_algorithm_framework.infrastructure import setup_sqlalchemy, \
-    create_all_tables
+    create_all_tables, backup_database
 from investing_algorithm_framework.services import OrderBacktestService, \
     BacktestMarketDataSourceService, BacktestPortfolioService, \
     MarketDataSourceService, MarketCredentialService
@@ -30,6 +35,10 @@ COLOR_RESET = '\033[0m'
 COLOR_GREEN = '\033[92m'
 COLOR_YELLOW = '\033[93m'
 
+# The app, the market data sources of the app and the algorithms of a
+# walk-forward worker process, see App.run_walk_forward_backtest
+_walk_forward_worker = None
+
 
 class AppHook:
 
@@ -57,6 +66,11 @@ class App:
         self._name = name
         self._algorithm = Algorithm()
 
+        # Market data that is prepared once for all backtests of
+        # a walk-forward backtest
+        self._backtest_data_date_range = None
+        self._prepared_backtest_market_data_sources = {}
+
     @property
     def algorithm(self) -> Algorithm:
         return self._algorithm
@@ -267,7 +281,10 @@ class App:
                     .market_credential_service(),
                     configuration_service=self.container
                     .configuration_service(),
-                    market_data_sources=market_data_sources
+                    market_data_sources=market_data_sources,
+                    backtest_data_date_range=self._backtest_data_date_range,
+                    prepared_market_data_sources=self
+                    ._prepared_backtest_market_data_sources
                 )
             )
 
@@ -521,6 +538,9 @@ class App:
         finally:
             self.algorithm.stop()
 
+            # Write any buffered portfolio snapshots to the database
+            self.container.portfolio_snapshot_service().flush()
+
             # Upload state if state handler is provided
             if self._state_handler is not None:
                 logger.info("Detected state handler, saving state")
@@ -670,15 +690,7 @@ class App:
         })
 
         self.initialize_config()
-        config = self._configuration_service.get_config()
-        path = os.path.join(
-            config[DATABASE_DIRECTORY_PATH],
-            config[DATABASE_NAME]
-        )
-        # Remove the previous backtest db
-        if os.path.exists(path):
-            os.remove(path)
-
+        self._initialize_backtest_database()
         self.initialize()
 
         backtest_service = self.container.backtest_service()
@@ -689,6 +701,7 @@ class App:
             initial_amount=initial_amount,
             backtest_date_range=backtest_date_range
         )
+        self._snapshot_backtest_database(report)
         config = self.container.configuration_service().get_config()
 
         if output_directory is None:
@@ -696,8 +709,12 @@ class App:
                 config[RESOURCE_DIRECTORY], "backtest_reports"
             )
 
-        backtest_service.write_report_to_json(
-            report=report, output_directory=output_directory
+        backtest_service.write_report(
+            report=report,
+            output_directory=output_directory,
+            report_format=config.get(
+                BACKTESTING_REPORT_FORMAT, BacktestReportFormat.JSON
+            )
         )
         return report
 
@@ -781,17 +798,7 @@ class App:
                     )
                 })
                 self.initialize_config()
-
-                config = self._configuration_service.get_config()
-
-                path = os.path.join(
-                    config[DATABASE_DIRECTORY_PATH],
-                    config[DATABASE_NAME]
-                )
-                # Remove the previous backtest db
-                if os.path.exists(path):
-                    os.remove(path)
-
+                self._initialize_backtest_database()
                 self.initialize()
                 backtest_service = self.container.backtest_service()
                 backtest_service.resource_directory = self.config[
@@ -805,6 +812,7 @@ class App:
                     initial_amount=initial_amount,
                     backtest_date_range=date_range
                 )
+                self._snapshot_backtest_database(report)
 
                 # Add date range name to report if present
                 if date_range.name is not None:
@@ -815,13 +823,327 @@ class App:
                         self.config[RESOURCE_DIRECTORY], "backtest_reports"
                     )
 
-                backtest_service.write_report_to_json(
-                    report=report, output_directory=output_directory
+                backtest_service.write_report(
+                    report=report,
+                    output_directory=output_directory,
+                    report_format=self.config.get(
+                        BACKTESTING_REPORT_FORMAT, BacktestReportFormat.JSON
+                    )
                 )
                 reports.append(report)
 
         return reports
 
+    def run_walk_forward_backtest(
+        self,
+        algorithms,
+        walk_forward_date_ranges,
+        metric="total_net_gain",
+        initial_amount=None,
+        pending_order_check_interval=None,
+        output_directory=None,
+        higher_is_better=None,
+        app_factory=None,
+        max_workers=None
+    ) -> WalkForwardReport:
+        """
+        Run a walk-forward backtest. For every window, backtests are run
+        for all algorithms on the in-sample date range, and the
+        algorithm with the best value for the metric is backtested on
+        the out-of-sample date range. Every out-of-sample backtest starts
+        with the total value at the end of the previous out-of-sample
+        backtest.
+
+        The market data is prepared once for the date range of all
+        windows, and reused by all backtests.
+
+        With an app_factory, the in-sample backtests of a window run in
+        parallel in a pool of worker processes. Every worker creates its
+        own app with the app_factory, runs its backtests against an
+        in-memory database and prepares its own market data.
+
+        Args:
+            algorithms: List[Algorithm] - The algorithms to select from,
+                e.g. an algorithm for every set of parameters
+            walk_forward_date_ranges: List of tuples with the in-sample
+                and out-of-sample BacktestDateRange of every window,
+                see create_walk_forward_date_ranges
+            metric: str - The metric of the backtest reports to select
+                the algorithm on, e.g. total_net_gain or sharpe_ratio,
+                see METRIC_COLUMNS
+            initial_amount: The initial amount of the in-sample backtests
+                and the first out-of-sample backtest.
+            pending_order_check_interval: str - The interval at which to
+                check pending orders
+            output_directory: str - The directory to write the backtest
+                reports to, if None the reports are not written
+            higher_is_better: bool - Select the algorithm with the
+                highest value for the metric, if None the lowest value
+                is selected for the metrics in
+                LOWER_IS_BETTER_METRIC_COLUMNS (e.g. max_drawdown) and
+                the highest value for all other metrics
+            app_factory: Callable without arguments that creates a
+                configured app, e.g. a module level function that calls
+                create_app and adds the portfolio configurations and
+                market data sources. The app_factory and the algorithms
+                must be picklable, as they are sent to the worker
+                processes.
+            max_workers: int - The number of worker processes, if None
+                the number of processors of the machine. Only used
+                with an app_factory.
+
+        Returns:
+            WalkForwardReport
+        """
+
+        if len(algorithms) == 0:
+            raise OperationalException("No algorithms to select from")
+
+        if len(walk_forward_date_ranges) == 0:
+            raise OperationalException("No walk-forward date ranges")
+
+        if metric not in METRIC_COLUMNS:
+            raise OperationalException(
+                f"Unknown metric {metric}, supported metrics are "
+                f"{', '.join(METRIC_COLUMNS)}"
+            )
+
+        if max_workers is not None and app_factory is None:
+            raise OperationalException(
+                "An app_factory is required to run the in-sample "
+                "backtests in worker processes"
+            )
+
+        ascending = None
+
+        if higher_is_better is not None:
+            ascending = not higher_is_better
+
+        self._backtest_data_date_range = get_walk_forward_date_range(
+            walk_forward_date_ranges
+        )
+        self._prepared_backtest_market_data_sources = {}
+        market_data_sources = self._market_data_sources
+        windows = []
+        out_of_sample_amount = initial_amount
+        executor = None
+
+        if app_factory is not None:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_initialize_walk_forward_worker,
+                initargs=(
+                    app_factory,
+                    algorithms,
+                    self._backtest_data_date_range
+                )
+            )
+
+        try:
+            for in_sample_date_range, out_of_sample_date_range \
+                    in walk_forward_date_ranges:
+                print(
+                    f"{COLOR_YELLOW}Running walk-forward window:"
+                    f"{COLOR_RESET} {COLOR_GREEN}"
+                    f"{in_sample_date_range.start_date} - "
+                    f"{out_of_sample_date_range.end_date} for a "
+                    f"total of {len(algorithms)} algorithms.{COLOR_RESET}"
+                )
+
+                if executor is None:
+                    in_sample_reports = [
+                        self._run_walk_forward_backtest(
+                            algorithm,
+                            in_sample_date_range,
+                            initial_amount,
+                            pending_order_check_interval,
+                            output_directory,
+                            market_data_sources
+                        )
+                        for algorithm in algorithms
+                    ]
+                else:
+                    # The workers get the algorithms when they start, as
+                    # an algorithm that has run can't be pickled anymore
+                    in_sample_reports = list(
+                        executor.map(
+                            _run_walk_forward_worker_backtest,
+                            range(len(algorithms)),
+                            [in_sample_date_range] * len(algorithms),
+                            [initial_amount] * len(algorithms),
+                            [pending_order_check_interval] * len(algorithms)
+                        )
+                    )
+
+                    # The reports are written by this process, so the
+                    # workers don't write the report index at the same time
+                    if output_directory is not None:
+                        for report in in_sample_reports:
+                            self._write_walk_forward_report(
+                                report, output_directory
+                            )
+
+                in_sample_metrics = BacktestReportsEvaluation(
+                    in_sample_reports
+                ).get_top_k(len(algorithms), metric, ascending=ascending)
+
+                # Reports without a value for the metric are not ranked
+                selected_algorithm = algorithms[
+                    in_sample_metrics.index[0]
+                    if len(in_sample_metrics) > 0 else 0
+                ]
+                out_of_sample_report = self._run_walk_forward_backtest(
+                    selected_algorithm,
+                    out_of_sample_date_range,
+                    out_of_sample_amount,
+                    pending_order_check_interval,
+                    output_directory,
+                    market_data_sources
+                )
+                out_of_sample_amount = out_of_sample_report.total_value
+                windows.append(
+                    WalkForwardWindow(
+                        in_sample_date_range=in_sample_date_range,
+                        out_of_sample_date_range=out_of_sample_date_range,
+                        selected_algorithm=selected_algorithm.name,
+                        in_sample_metrics=in_sample_metrics,
+                        out_of_sample_report=out_of_sample_report
+                    )
+                )
+        finally:
+            self._backtest_data_date_range = None
+            self._prepared_backtest_market_data_sources = {}
+            self._market_data_sources = market_data_sources
+
+            if executor is not None:
+                executor.shutdown()
+
+        return WalkForwardReport(windows=windows, metric=metric)
+
+    def _run_walk_forward_backtest(
+        self,
+        algorithm,
+        date_range,
+        initial_amount,
+        pending_order_check_interval,
+        output_directory,
+        market_data_sources
+    ) -> BacktestReport:
+        self.algorithm = algorithm
+
+        # Start from the market data sources of the app, the market data
+        # sources of the strategies of another algorithm are added to
+        # this list when the app is initialized
+        self._market_data_sources = list(market_data_sources)
+        self.set_config_with_dict({
+            ENVIRONMENT: Environment.BACKTEST.value,
+            BACKTESTING_START_DATE: date_range.start_date,
+            BACKTESTING_END_DATE: date_range.end_date,
+            DATABASE_NAME: "backtest-database.sqlite3",
+            DATABASE_DIRECTORY_NAME: "backtest_databases",
+            BACKTESTING_PENDING_ORDER_CHECK_INTERVAL: (
+                pending_order_check_interval
+            ),
+            BACKTESTING_INITIAL_AMOUNT: initial_amount
+        })
+        self.initialize_config()
+        self._initialize_backtest_database()
+        self.initialize()
+        backtest_service = self.container.backtest_service()
+        report = backtest_service.run_backtest(
+            algorithm=self.algorithm,
+            initial_amount=initial_amount,
+            backtest_date_range=date_range
+        )
+        self._snapshot_backtest_database(report)
+
+        if date_range.name is not None:
+            report.date_range_name = date_range.name
+
+        if output_directory is not None:
+            self._write_walk_forward_report(report, output_directory)
+
+        return report
+
+    def _write_walk_forward_report(self, report, output_directory):
+        self.container.backtest_service().write_report(
+            report=report,
+            output_directory=output_directory,
+            report_format=self.config.get(
+                BACKTESTING_REPORT_FORMAT, BacktestReportFormat.JSON
+            )
+        )
+
+    def _initialize_backtest_database(self):
+        """
+        Function to prepare the database for a backtest run. If
+        BACKTESTING_IN_MEMORY_DATABASE is set, the backtest runs against
+        an in-memory SQLite database, so nothing is written to disk and
+        parallel backtests can't collide on the same database file.
+        Otherwise, the backtest database file of the previous
+        run is removed.
+
+        Returns:
+            None
+        """
+        configuration_service = self.container.configuration_service()
+        config = configuration_service.get_config()
+
+        if config.get(BACKTESTING_IN_MEMORY_DATABASE, False):
+            configuration_service.add_value(
+                SQLALCHEMY_DATABASE_URI, "sqlite://"
+            )
+            return
+
+        path = os.path.join(
+            config[DATABASE_DIRECTORY_PATH],
+            config[DATABASE_NAME]
+        )
+
+        # Switch back to the database file if a previous
+        # backtest ran in memory
+        if config.get(SQLALCHEMY_DATABASE_URI) == "sqlite://":
+            configuration_service.add_value(
+                SQLALCHEMY_DATABASE_URI, "sqlite:///" + path
+            )
+
+        # Remove the previous backtest db
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _snapshot_backtest_database(self, report):
+        """
+        Function to write the backtest database to the file set with
+        BACKTESTING_DATABASE_SNAPSHOT_PATH, e.g. to inspect the orders
+        and trades of a backtest that ran against an in-memory database.
+
+        The file name is suffixed with the algorithm name and the date
+        range of the backtest, like the backtest report file names, so
+        the snapshots of multiple backtests don't overwrite each other.
+
+        Args:
+            report: The BacktestReport of the backtest
+
+        Returns:
+            None
+        """
+        config = self.container.configuration_service().get_config()
+        path = config.get(BACKTESTING_DATABASE_SNAPSHOT_PATH)
+
+        if path is None:
+            return
+
+        backtest_start_date = report.backtest_start_date \
+            .strftime(DATETIME_FORMAT_BACKTESTING)
+        backtest_end_date = report.backtest_end_date \
+            .strftime(DATETIME_FORMAT_BACKTESTING)
+        root, extension = os.path.splitext(path)
+        backup_database(
+            f"{root}_{report.name}_backtest-start-date_"
+            f"{backtest_start_date}_backtest-end-date_"
+            f"{backtest_end_date}{extension}"
+        )
+
     def add_market_data_source(self, market_data_source):
         """
         Function to add a market data source to the app. The market data
@@ -886,3 +1208,36 @@ class App:
             self.algorithm = Algorithm(name=self._name)
 
         self.algorithm.add_strategy(strategy)
+
+
+def _initialize_walk_forward_worker(
+    app_factory, algorithms, backtest_data_date_range
+):
+    """
+    Function to create the app of a walk-forward worker process. The
+    backtests of the worker run against an in-memory database, so the
+    workers don't share a backtest database file, and the market data
+    of the worker is prepared once for the date range of all windows.
+    """
+    global _walk_forward_worker
+    app = app_factory()
+    app.set_config(BACKTESTING_IN_MEMORY_DATABASE, True)
+    app._backtest_data_date_range = backtest_data_date_range
+    app._prepared_backtest_market_data_sources = {}
+    _walk_forward_worker = (
+        app, list(app._market_data_sources), algorithms
+    )
+
+
+def _run_walk_forward_worker_backtest(
+    algorithm_index, date_range, initial_amount, pending_order_check_interval
+):
+    app, market_data_sources, algorithms = _walk_forward_worker
+    return app._run_walk_forward_backtest(
+        algorithms[algorithm_index],
+        date_range,
+        initial_amount,
+        pending_order_check_interval,
+        None,
+        market_data_sources
+    )
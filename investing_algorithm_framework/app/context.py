@@ -63,6 +63,86 @@ class Context:
         """
         return self.configuration_service.get_config()
 
+    def clear_cache(self):
+        """
+        Function to clear the cache of portfolios and positions. Reads
+        are only cached inside a unit of work (e.g. a strategy run), in
+        the session of the unit of work, so the cache is discarded when
+        the unit of work exits and whenever orders, trades, positions or
+        portfolios are written to the database.
+        """
+        cache = self.portfolio_service.get_read_cache()
+
+        if cache is not None:
+            cache.clear()
+
+    def _get_cached(self, key, loader):
+        cache = self.portfolio_service.get_read_cache()
+
+        if cache is None:
+            return loader()
+
+        if key not in cache:
+            cache[key] = loader()
+
+        return cache[key]
+
+    @staticmethod
+    def _get_cache_key(name, query_params):
+
+        if query_params is None:
+            return name, None
+
+        return name, tuple(
+            sorted((key, repr(value)) for key, value in query_params.items())
+        )
+
+    def _find_portfolio(self, query_params):
+        return self._get_cached(
+            self._get_cache_key("find_portfolio", query_params),
+            lambda: self.portfolio_service.find(query_params)
+        )
+
+    def _get_portfolios(self, query_params=None):
+        return list(
+            self._get_cached(
+                self._get_cache_key("get_portfolios", query_params),
+                lambda: self.portfolio_service.get_all(query_params)
+            )
+        )
+
+    @staticmethod
+    def _get_portfolio_id(portfolio):
+        """
+        Function to get the id of a portfolio, the portfolio can be
+        given as a Portfolio or as the id of the portfolio.
+        """
+
+        if isinstance(portfolio, Portfolio):
+            return portfolio.id
+
+        return portfolio
+
+    def _find_position(self, query_params):
+        return self._get_cached(
+            self._get_cache_key("find_position", query_params),
+            lambda: self.position_service.find(query_params)
+        )
+
+    def _get_positions(self, query_params=None):
+        return list(
+            self._get_cached(
+                self._get_cache_key("get_positions", query_params),
+                lambda: self.position_service.get_all(query_params)
+            )
+        )
+
+    def _position_exists(self, query_params):
+        return self._get_cached(
+            self._get_cache_key("position_exists", query_params),
+            lambda: self.position_service.exists(query_params)
+        )
+
     def create_order(
         self,
         target_symbol,
@@ -95,7 +175,7 @@ class Context:
         Returns:
             The order created
         """
-        portfolio = self.portfolio_service.find({"market": market})
+        portfolio = self._find_portfolio({"market": market})
         order_data = {
             "target_symbol": target_symbol,
             "price": price,
@@ -132,8 +212,8 @@ class Context:
             Boolean: True if the portfolio has enough balance
         """
 
-        portfolio = self.portfolio_service.find({"market": market})
-        position = self.position_service.find(
+        portfolio = self._find_portfolio({"market": market})
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": symbol}
         )
 
@@ -191,7 +271,7 @@ class Context:
         Returns:
             Order: Instance of the order created
         """
-        portfolio = self.portfolio_service.find({"market": market})
+        portfolio = self._find_portfolio({"market": market})
 
         if percentage_of_portfolio is not None:
             if not OrderSide.BUY.equals(order_side):
@@ -210,7 +290,7 @@ class Context:
                     "Percentage of position is only supported for SELL orders."
                 )
 
-            position = self.position_service.find(
+            position = self._find_position(
                 {
                     "symbol": target_symbol,
                     "portfolio": portfolio.id
@@ -257,6 +337,51 @@ class Context:
             order_data, execute=execute, validate=validate, sync=sync
         )
 
+    def create_limit_orders(self, orders, execute=True, validate=True):
+        """
+        Function to create multiple limit orders at once. All orders are
+        created and validated first, after which they are executed as
+        a single batch. In live mode this means that the orders are
+        submitted concurrently to the market.
+
+        Args:
+            orders: List of dicts with the keyword arguments for
+              create_limit_order, e.g. [{"target_symbol": "BTC",
+              "price": 20000, "order_side": "BUY", "amount": 1}]
+            execute (optional): Default True. If set to True,
+              the orders will be executed
+            validate (optional): Default True. If set to
+              True, the orders will be validated
+
+        Returns:
+            List[Order]: The created orders
+        """
+        created_orders = [
+            self.create_limit_order(
+                **order, execute=False, validate=validate
+            ) for order in orders
+        ]
+
+        if not execute:
+            return created_orders
+
+        return self.order_service.execute_orders(
+            [order.id for order in created_orders]
+        )
+
+    def cancel_orders(self, orders):
+        """
+        Function to cancel multiple open orders at once. In live mode
+        the cancellations are sent concurrently to the market.
+
+        Args:
+            orders: List of orders to cancel
+
+        Returns:
+            List[Order]: The cancelled orders
+        """
+        return self.order_service.cancel_orders(orders)
+
     def get_portfolio(self, market=None) -> Portfolio:
         """
         Function to get the portfolio of the algorithm. This function
@@ -272,9 +397,9 @@ class Context:
         """
 
         if market is None:
-            return self.portfolio_service.get_all()[0]
+            return self._get_portfolios()[0]
 
-        return self.portfolio_service.find({{"market": market}})
+        return self._find_portfolio({"market": market})
 
     def get_portfolios(self):
         """
@@ -284,7 +409,7 @@ class Context:
         Returns:
             List[Portfolio]: A list of all portfolios of the algorithm
         """
-        return self.portfolio_service.get_all()
+        return self._get_portfolios()
 
     def get_unallocated(self, market=None) -> float:
         """
@@ -301,12 +426,12 @@ class Context:
         """
 
         if market:
-            portfolio = self.portfolio_service.find({{"market": market}})
+            portfolio = self._find_portfolio({"market": market})
         else:
-            portfolio = self.portfolio_service.get_all()[0]
+            portfolio = self._get_portfolios()[0]
 
         trading_symbol = portfolio.trading_symbol
-        return self.position_service.find(
+        return self._find_position(
             {"portfolio": portfolio.id, "symbol": trading_symbol}
         ).get_amount()
 
@@ -362,8 +487,8 @@ class Context:
             query_params["order_type"] = order_type
 
         if market:
-            portfolio = self.portfolio_service.find({"market": market})
-            positions = self.position_service.get_all(
+            portfolio = self._find_portfolio({"market": market})
+            positions = self._get_positions(
                 {"portfolio": portfolio.id}
             )
             query_params["position"] = [position.id for position in positions]
@@ -381,22 +506,43 @@ class Context:
         status=None,
         order_type=None,
         order_side=None,
-        market=None
+        market=None,
+        limit=None,
+        offset=None
     ) -> List[Order]:
+        """
+        Function to get all orders of a portfolio that match the
+        specified query parameters. Use limit and offset to page
+        through the order history instead of loading all orders.
+
+        Args:
+            target_symbol: The symbol of the asset
+            status: The status of the order
+            order_type: The type of the order
+            order_side: The side of the order
+            market: The market of the portfolio
+            limit: The maximum number of orders to return
+            offset: The number of orders to skip
+
+        Returns:
+            List[Order]: A list of orders that match the query parameters
+        """
 
         if market is None:
-            portfolio = self.portfolio_service.get_all()[0]
+            portfolio = self._get_portfolios()[0]
         else:
-            portfolio = self.portfolio_service.find({"market": market})
+            portfolio = self._find_portfolio({"market": market})
 
-        positions = self.position_service.get_all({"portfolio": portfolio.id})
+        positions = self._get_positions({"portfolio": portfolio.id})
         return self.order_service.get_all(
             {
                 "position": [position.id for position in positions],
                 "target_symbol": target_symbol,
                 "status": status,
                 "order_type": order_type,
-                "order_side": order_side
+                "order_side": order_side,
+                "limit": limit,
+                "offset": offset,
             }
         )
 
@@ -457,13 +603,13 @@ class Context:
         if amount_lte is not None:
             query_params["amount_lte"] = amount_lte
 
-        portfolios = self.portfolio_service.get_all(query_params)
+        portfolios = self._get_portfolios(query_params)
 
         if not portfolios:
             raise OperationalException("No portfolio found.")
 
         portfolio = portfolios[0]
-        return self.position_service.get_all(
+        return self._get_positions(
             {"portfolio": portfolio.id}
         )
 
@@ -493,7 +639,7 @@ class Context:
         if identifier is not None:
             query_params["identifier"] = identifier
 
-        portfolios = self.portfolio_service.get_all(query_params)
+        portfolios = self._get_portfolios(query_params)
 
         if not portfolios:
             raise OperationalException("No portfolio found.")
@@ -501,7 +647,7 @@ class Context:
         portfolio = portfolios[0]
 
         try:
-            return self.position_service.find(
+            return self._find_position(
                 {"portfolio": portfolio.id, "symbol": symbol}
             )
         except OperationalException:
@@ -607,7 +753,7 @@ class Context:
             query_params["amount_lte"] = amount_lte
 
         query_params["symbol"] = symbol
-        return self.position_service.exists(query_params)
+        return self._position_exists(query_params)
 
     def get_position_percentage_of_portfolio(
         self, symbol, market=None, identifier=None
@@ -627,13 +773,13 @@ class Context:
         if identifier is not None:
             query_params["identifier"] = identifier
 
-        portfolios = self.portfolio_service.get_all(query_params)
+        portfolios = self._get_portfolios(query_params)
 
         if not portfolios:
             raise OperationalException("No portfolio found.")
 
         portfolio = portfolios[0]
-        position = self.position_service.find(
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": symbol}
         )
         full_symbol = f"{position.symbol.upper()}/" \
@@ -663,13 +809,13 @@ class Context:
         if identifier is not None:
             query_params["identifier"] = identifier
 
-        portfolios = self.portfolio_service.get_all(query_params)
+        portfolios = self._get_portfolios(query_params)
 
         if not portfolios:
             raise OperationalException("No portfolio found.")
 
         portfolio = portfolios[0]
-        position = self.position_service.find(
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": symbol}
         )
         net_size = portfolio.get_net_size()
@@ -693,10 +839,10 @@ class Context:
         Returns:
             None
         """
-        portfolio = self.portfolio_service.find(
+        portfolio = self._find_portfolio(
             {"market": market, "identifier": identifier}
         )
-        position = self.position_service.find(
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": symbol}
         )
 
@@ -753,7 +899,7 @@ class Context:
         portfolios = []
 
         for portfolio_configuration in portfolio_configurations:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"identifier": portfolio_configuration.identifier}
             )
             portfolio.configuration = portfolio_configuration
@@ -762,7 +908,7 @@ class Context:
         allocated = 0
 
         for portfolio in portfolios:
-            positions = self.position_service.get_all(
+            positions = self._get_positions(
                 {"portfolio": portfolio.id}
             )
 
@@ -804,7 +950,7 @@ class Context:
         portfolios = []
 
         for portfolio_configuration in portfolio_configurations:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"identifier": portfolio_configuration.identifier}
             )
             portfolios.append(portfolio)
@@ -828,13 +974,13 @@ class Context:
         query_params = {}
 
         if identifier is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"identifier": identifier}
             )
             query_params["portfolio"] = portfolio.id
 
         if market is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"market": market}
             )
             query_params["portfolio"] = portfolio.id
@@ -849,13 +995,13 @@ class Context:
         query_params = {}
 
         if identifier is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"identifier": identifier}
             )
             query_params["portfolio"] = portfolio.id
 
         if market is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"market": market}
             )
             query_params["portfolio"] = portfolio.id
@@ -871,13 +1017,13 @@ class Context:
         query_params = {}
 
         if identifier is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"identifier": identifier}
             )
             query_params["portfolio"] = portfolio.id
 
         if market is not None:
-            portfolio = self.portfolio_service.find(
+            portfolio = self._find_portfolio(
                 {"market": market}
             )
             query_params["portfolio"] = portfolio.id
@@ -904,7 +1050,8 @@ class Context:
 
         Args:
             market: The market of the asset
-            portfolio: The portfolio of the asset
+            portfolio: The portfolio of the trades, a Portfolio or
+                the id of a portfolio
             status: The status of the trade
             order_id: The order id of the trade
             target_symbol: The symbol of the asset
@@ -919,7 +1066,7 @@ class Context:
             query_params["market"] = market
 
         if portfolio is not None:
-            query_params["portfolio"] = portfolio
+            query_params["portfolio_id"] = self._get_portfolio_id(portfolio)
 
         if status is not None:
             query_params["status"] = status
@@ -942,18 +1089,24 @@ class Context:
         market=None,
         portfolio=None,
         status=None,
+        limit=None,
+        offset=None,
     ) -> List[Trade]:
         """
         Function to get all trades. This function will return all trades
         that match the specified query parameters. If the market parameter
         is specified, the trades with the specified market will be returned.
+        Use limit and offset to page through the trade history.
 
         Args:
             market: The market of the asset
-            portfolio: The portfolio of the asset
+            portfolio: The portfolio of the trades, a Portfolio or
+                the id of a portfolio
             status: The status of the trade
             target_symbol: The symbol of the asset
             trading_symbol: The trading symbol of the asset
+            limit: The maximum number of trades to return
+            offset: The number of trades to skip
 
         Returns:
             List[Trade]: A list of trades that match the query parameters
@@ -965,7 +1118,7 @@ class Context:
             query_params["market"] = market
 
         if portfolio is not None:
-            query_params["portfolio"] = portfolio
+            query_params["portfolio_id"] = self._get_portfolio_id(portfolio)
 
         if status is not None:
             query_params["status"] = status
@@ -976,7 +1129,13 @@ class Context:
         if trading_symbol is not None:
             query_params["trading_symbol"] = trading_symbol
 
-        return self.trade_service.get_all({"market": market})
+        if limit is not None:
+            query_params["limit"] = limit
+
+        if offset is not None:
+            query_params["offset"] = offset
+
+        return self.trade_service.get_all(query_params)
 
     def get_closed_trades(self) -> List[Trade]:
         """
@@ -1003,7 +1162,8 @@ class Context:
             target_symbol: The symbol of the asset
             trading_symbol: The trading symbol of the asset
             market: The market of the asset
-            portfolio: The portfolio of the asset
+            portfolio: The portfolio of the trades, a Portfolio or
+                the id of a portfolio
 
         Returns:
             int: The number of trades that match the query parameters
@@ -1015,7 +1175,7 @@ class Context:
             query_params["market"] = market
 
         if portfolio is not None:
-            query_params["portfolio"] = portfolio
+            query_params["portfolio_id"] = self._get_portfolio_id(portfolio)
 
         if target_symbol is not None:
             query_params["target_symbol"] = target_symbol
@@ -1161,8 +1321,8 @@ class Context:
             raise OperationalException("Trade has no amount to close.")
 
         position_id = trade.orders[0].position_id
-        portfolio = self.portfolio_service.find({"position": position_id})
-        position = self.position_service.find(
+        portfolio = self._find_portfolio({"position": position_id})
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": trade.target_symbol}
         )
         amount = trade.remaining
@@ -1230,8 +1390,8 @@ class Context:
         :return: True if there is a trading symbol position available with the
         specified parameters, False otherwise.
         """
-        portfolio = self.portfolio_service.find({"market": market})
-        position = self.position_service.find(
+        portfolio = self._find_portfolio({"market": market})
+        position = self._find_position(
             {"portfolio": portfolio.id, "symbol": portfolio.trading_symbol}
         )
 
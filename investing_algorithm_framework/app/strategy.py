@@ -1,11 +1,10 @@
 from typing import List
-import pandas as pd
 from datetime import datetime, timezone
 
 from investing_algorithm_framework.domain import OperationalException, Position
 from investing_algorithm_framework.domain import \
     TimeUnit, StrategyProfile, Trade, ENVIRONMENT, Environment, \
-    BACKTESTING_INDEX_DATETIME
+    BACKTESTING_INDEX_DATETIME, TraceStore
 from .context import Context
 
 
@@ -26,6 +25,10 @@ class TradingStrategy:
         market_data_sources (optional): list - the list of market data
             sources to use for the strategy. This will be passed to the
             run_strategy function.
+        trace_max_rows (optional): int - the maximum number of rows of
+            the traces of a symbol, the most recent rows are kept
+        trace_max_columns (optional): int - the maximum number of
+            columns of the traces of a symbol
     """
     time_unit: str = None
     interval: int = None
@@ -33,8 +36,10 @@ class TradingStrategy:
     strategy_id: str = None
     decorated = None
     market_data_sources = None
-    traces = None
+    trace_max_rows: int = None
+    trace_max_columns: int = None
     context: Context = None
+    _trace_store: TraceStore = None
 
     def __init__(
         self,
@@ -43,7 +48,9 @@ class TradingStrategy:
         interval=None,
         market_data_sources=None,
         worker_id=None,
-        decorated=None
+        decorated=None,
+        trace_max_rows=None,
+        trace_max_columns=None
     ):
 
         if time_unit is not None:
@@ -61,6 +68,12 @@ class TradingStrategy:
         if decorated is not None:
             self.decorated = decorated
 
+        if trace_max_rows is not None:
+            self.trace_max_rows = trace_max_rows
+
+        if trace_max_columns is not None:
+            self.trace_max_columns = trace_max_columns
+
         if worker_id is not None:
             self.worker_id = worker_id
         elif self.decorated:
@@ -93,21 +106,30 @@ class TradingStrategy:
         self.context = context
         config = self.context.get_config()
 
-        if config[ENVIRONMENT] == Environment.BACKTEST.value:
-            self._update_trades_and_orders_for_backtest(market_data)
-        else:
-            self._update_trades_and_orders(market_data)
+        # The strategy run is executed in a single unit of work. Changes
+        # are also committed if the strategy raises an exception, so
+        # orders that have already been created are not lost. The orders
+        # are submitted to the market once the unit of work has committed.
+        with self.context.order_service.unit_of_work(commit_on_error=True):
 
-        self._check_stop_losses()
-        self._check_take_profits()
+            if config[ENVIRONMENT] == Environment.BACKTEST.value:
+                self._update_trades_and_orders_for_backtest(market_data)
+            else:
+                self._update_trades_and_orders(market_data)
 
-        # Run user defined strategy
-        self.apply_strategy(context=context, market_data=market_data)
+            self._check_stop_losses()
+            self._check_take_profits()
 
-        if config[ENVIRONMENT] == Environment.BACKTEST.value:
-            self._last_run = config[BACKTESTING_INDEX_DATETIME]
-        else:
-            self._last_run = datetime.now(tz=timezone.utc)
+            # Run user defined strategy
+            self.apply_strategy(context=context, market_data=market_data)
+
+            if config[ENVIRONMENT] == Environment.BACKTEST.value:
+                self._last_run = config[BACKTESTING_INDEX_DATETIME]
+            else:
+                self._last_run = datetime.now(tz=timezone.utc)
+
+            self.context.order_service\
+                .create_snapshots_on_strategy_run(self._last_run)
 
     def apply_strategy(self, context, market_data):
         if self.decorated:
@@ -222,7 +244,9 @@ class TradingStrategy:
         drop_duplicates=True
     ) -> None:
         """
-        Add data to the straces object for a given symbol
+        Add data to the traces object for a given symbol. The data
+        is buffered, duplicates are only dropped when the traces
+        are requested.
 
         Args:
             symbol (str): The symbol
@@ -233,48 +257,51 @@ class TradingStrategy:
             None
         """
 
-        # Check if data is a DataFrame
-        if not isinstance(data, pd.DataFrame):
-            raise ValueError(
-                "Currently only pandas DataFrames are "
-                "supported as tracing data objects."
+        if self._trace_store is None:
+            self._trace_store = TraceStore(
+                max_rows=self.trace_max_rows,
+                max_columns=self.trace_max_columns
             )
 
-        data: pd.DataFrame = data
+        self._trace_store.add(symbol, data, drop_duplicates=drop_duplicates)
 
-        # Check if index is a datetime object
-        if not isinstance(data.index, pd.DatetimeIndex):
-            raise ValueError("Dataframe Index must be a datetime object.")
+    @property
+    def traces(self) -> dict:
+        return self.get_traces()
 
-        if self.traces is None:
-            self.traces = {}
+    @traces.setter
+    def traces(self, traces) -> None:
+        """
+        Replace the traces of the strategy. The traces can be set to a
+        dict of DataFrames by symbol, a TraceStore, or None to
+        clear the traces.
+        """
 
-        # Check if the key is already in the context dictionary
-        if symbol in self.traces:
-            # If the key is already in the context dictionary,
-            # append the new data to the existing data
-            combined = pd.concat([self.traces[symbol], data])
-        else:
-            # If the key is not in the context dictionary,
-            # add the new data to the context dictionary
-            combined = data
+        if traces is None or isinstance(traces, TraceStore):
+            self._trace_store = traces
+            return
 
-        if drop_duplicates:
-            # Drop duplicates and sort the data by the index
-            combined = combined[~combined.index.duplicated(keep='first')]
+        self._trace_store = TraceStore(
+            max_rows=self.trace_max_rows,
+            max_columns=self.trace_max_columns
+        )
 
-        # Set the datetime column as the index
-        combined.set_index(pd.DatetimeIndex(combined.index), inplace=True)
-        self.traces[symbol] = combined
+        for symbol, data in traces.items():
+            self._trace_store.add(symbol, data, drop_duplicates=False)
 
     def get_traces(self) -> dict:
         """
-        Get the traces object
+        Get the traces object. The added trace data is consolidated
+        when the traces are requested.
 
         Returns:
             dict: The traces object
         """
-        return self.traces
+
+        if self._trace_store is None:
+            return None
+
+        return self._trace_store.to_dict()
 
     def has_open_orders(
         self, target_symbol=None, identifier=None, market=None
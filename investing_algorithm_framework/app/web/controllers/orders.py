@@ -16,5 +16,5 @@ blueprint = Blueprint("order-views", __name__)
 @blueprint.route("/api/orders", methods=["GET"])
 @inject
 def list_orders(order_service=Provide[DependencyContainer.order_service]):
-    orders = order_service.get_all(request.args)
+    orders = order_service.paginate(request.args)
     return create_response(orders, OrderSerializer())
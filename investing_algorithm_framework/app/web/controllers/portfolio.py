@@ -16,5 +16,5 @@ blueprint = Blueprint("portfolio-views", __name__)
 @blueprint.route("/api/portfolios", methods=["GET"])
 @inject
 def retrieve(portfolio_service=Provide[DependencyContainer.portfolio_service]):
-    portfolios = portfolio_service.get_all(request.args)
+    portfolios = portfolio_service.paginate(request.args)
     return create_response(portfolios, PortfolioSerializer())
@@ -14,5 +14,5 @@ blueprint = Blueprint("position-views", __name__)
 @blueprint.route("/api/positions", methods=["GET"])
 @inject
 def list_positions(position_service=Provide["position_service"]):
-    positions = position_service.get_all(request.args)
+    positions = position_service.paginate(request.args)
     return create_response(positions, PositionSerializer())
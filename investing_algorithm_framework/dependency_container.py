@@ -6,12 +6,12 @@ from investing_algorithm_framework.infrastructure import SQLOrderRepository, \
     SQLPortfolioSnapshotRepository, SQLTradeRepository, \
     SQLPositionSnapshotRepository, PerformanceService, CCXTMarketService, \
     SQLTradeStopLossRepository, SQLTradeTakeProfitRepository, \
-    SQLOrderMetadataRepository
+    SQLOrderMetadataRepository, SQLPortfolioSyncWatermarkRepository
 from investing_algorithm_framework.services import OrderService, \
     PositionService, PortfolioService, StrategyOrchestratorService, \
     PortfolioConfigurationService, MarketDataSourceService, BacktestService, \
     ConfigurationService, PortfolioSnapshotService, PositionSnapshotService, \
-    MarketCredentialService, TradeService, PortfolioSyncService
+    MarketCredentialService, TradeService, PortfolioSyncService, OrderPoller
 
 
 def setup_dependency_container(app, modules=None, packages=None):
@@ -47,6 +47,9 @@ class DependencyContainer(containers.DeclarativeContainer):
     trade_take_profit_repository = providers\
         .Factory(SQLTradeTakeProfitRepository)
     trade_stop_loss_repository = providers.Factory(SQLTradeStopLossRepository)
+    portfolio_sync_watermark_repository = providers.Factory(
+        SQLPortfolioSyncWatermarkRepository
+    )
     market_service = providers.Factory(
         CCXTMarketService,
         market_credential_service=market_credential_service,
@@ -61,11 +64,12 @@ class DependencyContainer(containers.DeclarativeContainer):
         PositionSnapshotService,
         repository=position_snapshot_repository,
     )
-    portfolio_snapshot_service = providers.Factory(
+    portfolio_snapshot_service = providers.ThreadSafeSingleton(
         PortfolioSnapshotService,
         repository=portfolio_snapshot_repository,
         position_snapshot_service=position_snapshot_service,
         position_repository=position_repository,
+        configuration_service=configuration_service,
     )
     portfolio_configuration_service = providers.ThreadSafeSingleton(
         PortfolioConfigurationService,
@@ -90,6 +94,11 @@ class DependencyContainer(containers.DeclarativeContainer):
         market_data_source_service=market_data_source_service,
         order_metadata_repository=order_metadata_repository,
     )
+    order_poller = providers.ThreadSafeSingleton(
+        OrderPoller,
+        market_service=market_service,
+        configuration_service=configuration_service,
+    )
     order_service = providers.Factory(
         OrderService,
         configuration_service=configuration_service,
@@ -101,6 +110,7 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_configuration_service=portfolio_configuration_service,
         portfolio_snapshot_service=portfolio_snapshot_service,
         trade_service=trade_service,
+        order_poller=order_poller,
     )
     portfolio_service = providers.Factory(
         PortfolioService,
@@ -123,6 +133,7 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_configuration_service=portfolio_configuration_service,
         market_credential_service=market_credential_service,
         market_service=market_service,
+        watermark_repository=portfolio_sync_watermark_repository,
     )
     strategy_orchestrator_service = providers.Factory(
         StrategyOrchestratorService,
@@ -143,6 +154,7 @@ class DependencyContainer(containers.DeclarativeContainer):
         portfolio_service=portfolio_service,
         performance_service=performance_service,
         position_repository=position_repository,
+        portfolio_snapshot_service=portfolio_snapshot_service,
         market_data_source_service=market_data_source_service,
         portfolio_configuration_service=portfolio_configuration_service,
         strategy_orchestrator_service=strategy_orchestrator_service,
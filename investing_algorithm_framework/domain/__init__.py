@@ -8,7 +8,12 @@ from .constants import ITEMIZE, ITEMIZED, PER_PAGE, PAGE, ENVIRONMENT, \
     CURRENT_UTC_DATETIME, BACKTESTING_END_DATE, SYMBOLS, \
     CCXT_DATETIME_FORMAT_WITH_TIMEZONE, RESERVED_BALANCES, \
     BACKTESTING_PENDING_ORDER_CHECK_INTERVAL, APP_MODE, \
-    DATABASE_DIRECTORY_NAME, BACKTESTING_INITIAL_AMOUNT
+    DATABASE_DIRECTORY_NAME, BACKTESTING_INITIAL_AMOUNT, SNAPSHOT_INTERVAL, \
+    SNAPSHOT_STRATEGY_ITERATIONS, SNAPSHOT_TIME_INTERVAL, \
+    SNAPSHOT_BUFFER_SIZE, BACKTESTING_FILL_MODEL, ORDER_POLL_CACHE_TTL, \
+    SQLITE_PROFILE, SQLITE_POOL_MODE, BACKTESTING_IN_MEMORY_DATABASE, \
+    BACKTESTING_REPORT_FORMAT, BACKTESTING_EQUITY_CURVE_RESOLUTION, \
+    BACKTESTING_DATABASE_SNAPSHOT_PATH
 from .data_structures import PeekableQueue
 from .decimal_parsing import parse_decimal_to_string, parse_string_to_decimal
 from .exceptions import OperationalException, ApiException, \
@@ -19,7 +24,11 @@ from .models import OrderStatus, OrderSide, OrderType, TimeInterval, \
     BacktestReport, PortfolioSnapshot, StrategyProfile, \
     BacktestPosition, Trade, MarketCredential, PositionSnapshot, \
     BacktestReportsEvaluation, AppMode, BacktestDateRange, DateRange, \
-    MarketDataType, TradeRiskType, TradeTakeProfit, TradeStopLoss
+    MarketDataType, TradeRiskType, TradeTakeProfit, TradeStopLoss, \
+    SnapshotInterval, FillModel, FeeModel, FixedFee, PercentageFee, \
+    SlippageModel, SpreadSlippage, CandleRangeSlippage, SQLiteProfile, \
+    SQLitePoolMode, BacktestReportFormat, TraceStore, WalkForwardReport, \
+    WalkForwardWindow, METRIC_COLUMNS, LOWER_IS_BETTER_METRIC_COLUMNS
 from .services import TickerMarketDataSource, OrderBookMarketDataSource, \
     OHLCVMarketDataSource, BacktestMarketDataSource, MarketDataSource, \
     MarketService, MarketCredentialService, AbstractPortfolioSyncService, \
@@ -32,8 +41,17 @@ from .utils import random_string, append_dict_as_row_to_csv, \
     load_backtest_report, convert_polars_to_pandas, \
     csv_to_list, StoppableThread, pretty_print_backtest_reports_evaluation, \
     pretty_print_backtest, load_csv_into_dict, load_backtest_reports, \
-    get_backtest_report
-from .metrics import get_price_efficiency_ratio
+    get_backtest_report, write_backtest_report_archive, \
+    load_backtest_report_archive, read_backtest_report_archive_header, \
+    BACKTEST_REPORT_ARCHIVE_EXTENSION, add_backtest_report_to_index, \
+    read_backtest_report_index, rebuild_backtest_report_index, \
+    BACKTEST_REPORT_INDEX_FILE_NAME, iterate_backtest_reports, \
+    BACKTEST_REPORT_FILE_NAME_PATTERN, \
+    load_backtest_reports_evaluation, create_walk_forward_date_ranges, \
+    get_walk_forward_date_range
+from .metrics import get_price_efficiency_ratio, get_drawdown, \
+    get_equity_curve_metrics, TraceMetrics, get_trace_metrics, \
+    simulate_trade_sequences
 
 __all__ = [
     "OrderStatus",
@@ -109,6 +127,8 @@ __all__ = [
     "BacktestReportsEvaluation",
     "load_csv_into_dict",
     "load_backtest_reports",
+    "iterate_backtest_reports",
+    "load_backtest_reports_evaluation",
     "SYMBOLS",
     "RESERVED_BALANCES",
     "AbstractPortfolioSyncService",
@@ -117,7 +137,31 @@ __all__ = [
     "RoundingService",
     "BacktestDateRange",
     "load_backtest_report",
+    "write_backtest_report_archive",
+    "load_backtest_report_archive",
+    "read_backtest_report_archive_header",
+    "add_backtest_report_to_index",
+    "read_backtest_report_index",
+    "rebuild_backtest_report_index",
+    "BACKTEST_REPORT_INDEX_FILE_NAME",
+    "BACKTEST_REPORT_FILE_NAME_PATTERN",
+    "BACKTEST_REPORT_ARCHIVE_EXTENSION",
+    "BacktestReportFormat",
+    "TraceStore",
+    "WalkForwardReport",
+    "WalkForwardWindow",
+    "METRIC_COLUMNS",
+    "LOWER_IS_BETTER_METRIC_COLUMNS",
+    "create_walk_forward_date_ranges",
+    "get_walk_forward_date_range",
+    "BACKTESTING_REPORT_FORMAT",
     "get_price_efficiency_ratio",
+    "get_drawdown",
+    "get_equity_curve_metrics",
+    "TraceMetrics",
+    "get_trace_metrics",
+    "simulate_trade_sequences",
+    "BACKTESTING_EQUITY_CURVE_RESOLUTION",
     "convert_polars_to_pandas",
     "DateRange",
     "get_backtest_report",
@@ -128,4 +172,24 @@ __all__ = [
     "TradeRiskType",
     "TradeTakeProfit",
     "TradeStopLoss",
+    "SnapshotInterval",
+    "SQLiteProfile",
+    "SQLITE_PROFILE",
+    "SQLitePoolMode",
+    "SQLITE_POOL_MODE",
+    "SNAPSHOT_INTERVAL",
+    "SNAPSHOT_STRATEGY_ITERATIONS",
+    "SNAPSHOT_TIME_INTERVAL",
+    "SNAPSHOT_BUFFER_SIZE",
+    "BACKTESTING_FILL_MODEL",
+    "BACKTESTING_IN_MEMORY_DATABASE",
+    "BACKTESTING_DATABASE_SNAPSHOT_PATH",
+    "ORDER_POLL_CACHE_TTL",
+    "FillModel",
+    "FeeModel",
+    "FixedFee",
+    "PercentageFee",
+    "SlippageModel",
+    "SpreadSlippage",
+    "CandleRangeSlippage",
 ]
@@ -22,6 +22,13 @@ SQLITE_INITIALIZED = "SQLITE_INITIALIZED"
 SQLALCHEMY_INITIALIZED = "SQLALCHEMY_INITIALIZED"
 RESERVED_BALANCES = "RESERVED_BALANCES"
 APP_MODE = "APP_MODE"
+SNAPSHOT_INTERVAL = "SNAPSHOT_INTERVAL"
+SNAPSHOT_STRATEGY_ITERATIONS = "SNAPSHOT_STRATEGY_ITERATIONS"
+SNAPSHOT_TIME_INTERVAL = "SNAPSHOT_TIME_INTERVAL"
+SNAPSHOT_BUFFER_SIZE = "SNAPSHOT_BUFFER_SIZE"
+ORDER_POLL_CACHE_TTL = "ORDER_POLL_CACHE_TTL"
+SQLITE_PROFILE = "SQLITE_PROFILE"
+SQLITE_POOL_MODE = "SQLITE_POOL_MODE"
 BINANCE = "BINANCE"
 
 IDENTIFIER_QUERY_PARAM = "identifier"
@@ -72,6 +79,11 @@ BACKTESTING_END_DATE = "BACKTESTING_END_DATE"
 BACKTESTING_PENDING_ORDER_CHECK_INTERVAL \
     = "BACKTESTING_PENDING_ORDER_CHECK_INTERVAL"
 BACKTESTING_INITIAL_AMOUNT = "BACKTESTING_INITIAL_AMOUNT"
+BACKTESTING_REPORT_FORMAT = "BACKTESTING_REPORT_FORMAT"
+BACKTESTING_FILL_MODEL = "BACKTESTING_FILL_MODEL"
+BACKTESTING_IN_MEMORY_DATABASE = "BACKTESTING_IN_MEMORY_DATABASE"
+BACKTESTING_DATABASE_SNAPSHOT_PATH = "BACKTESTING_DATABASE_SNAPSHOT_PATH"
+BACKTESTING_EQUITY_CURVE_RESOLUTION = "BACKTESTING_EQUITY_CURVE_RESOLUTION"
 TICKER_DATA_TYPE = "TICKER"
 OHLCV_DATA_TYPE = "OHLCV"
 CURRENT_UTC_DATETIME = "CURRENT_UTC_DATETIME"
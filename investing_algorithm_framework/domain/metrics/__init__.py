@@ -1,6 +1,16 @@
 from .price_efficiency import get_price_efficiency_ratio
+from .equity_curve import get_drawdown, get_equity_curve_metrics
+from .monte_carlo import simulate_trade_sequences
+from .trace_metrics import TraceMetrics, get_trace_metrics, \
+    TRACE_METRIC_COLUMNS
 
 
 __all__ = [
-    "get_price_efficiency_ratio"
+    "get_price_efficiency_ratio",
+    "get_drawdown",
+    "get_equity_curve_metrics",
+    "TraceMetrics",
+    "get_trace_metrics",
+    "TRACE_METRIC_COLUMNS",
+    "simulate_trade_sequences",
 ]
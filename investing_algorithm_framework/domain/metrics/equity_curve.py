@@ -0,0 +1,140 @@
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Series
+
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+
+def _check_equity_curve(equity_curve: DataFrame):
+
+    if "total_value" not in equity_curve.columns:
+        raise OperationalException(
+            "total_value column not found in equity curve, "
+            "required for equity curve metrics calculation"
+        )
+
+    if not isinstance(equity_curve.index, DatetimeIndex):
+        raise OperationalException(
+            "Index is not a datetime object, "
+            "required for equity curve metrics calculation"
+        )
+
+
+def get_drawdown(equity_curve: DataFrame) -> Series:
+    """
+    Calculate the drawdown of an equity curve, the percentage the total
+    value is below its running maximum at every point of the curve.
+
+    Args:
+        equity_curve (DataFrame): A pandas DataFrame with a total_value
+            column and a datetime index.
+
+    returns:
+        Series: The drawdown percentage at every point of the curve
+    """
+    _check_equity_curve(equity_curve)
+    values = equity_curve["total_value"]
+    running_maximum = values.cummax()
+    drawdown = (running_maximum - values) / running_maximum * 100
+    return drawdown.where(running_maximum > 0, 0.0)
+
+
+def get_equity_curve_metrics(equity_curve: DataFrame) -> dict:
+    """
+    Calculate the risk metrics of an equity curve.
+
+    The returns are the relative changes of the total value between
+    consecutive points of the curve. Annualized metrics use the median
+    spacing of the curve as the period of the returns, and a risk-free
+    rate of zero.
+
+    1. Max drawdown: largest drop in percentage from a running maximum
+    2. Max drawdown duration: longest time in days below a running maximum
+    3. Volatility: annualized standard deviation of the returns (percentage)
+    4. Sharpe ratio: annualized mean return / standard deviation
+    5. Sortino ratio: annualized mean return / downside deviation
+    6. Exposure: average percentage of the total value that is allocated,
+       only when the curve has an allocated column
+
+    Args:
+        equity_curve (DataFrame): A pandas DataFrame with a total_value
+            column, an optional allocated column and a datetime index.
+
+    returns:
+        dict: The metrics, a metric is None when the curve is too short
+            to calculate it
+    """
+    _check_equity_curve(equity_curve)
+    metrics = {
+        "max_drawdown": None,
+        "max_drawdown_duration": None,
+        "volatility": None,
+        "sharpe_ratio": None,
+        "sortino_ratio": None,
+        "exposure": None,
+    }
+
+    if len(equity_curve) == 0:
+        return metrics
+
+    values = equity_curve["total_value"].to_numpy(dtype=float)
+    timestamps = equity_curve.index.asi8 / 1e9
+    running_maximum = np.maximum.accumulate(values)
+    drawdown = np.where(
+        running_maximum > 0,
+        (running_maximum - values) / np.where(
+            running_maximum > 0, running_maximum, 1
+        ),
+        0.0
+    )
+    metrics["max_drawdown"] = float(drawdown.max() * 100)
+
+    # A drawdown period starts at the last running maximum
+    peak_timestamps = np.maximum.accumulate(
+        np.where(drawdown == 0, timestamps, -np.inf)
+    )
+    metrics["max_drawdown_duration"] = \
+        float((timestamps - peak_timestamps).max() / 86400)
+
+    if "allocated" in equity_curve.columns:
+        allocated = equity_curve["allocated"].to_numpy(dtype=float)
+        exposure = np.divide(
+            allocated,
+            values,
+            out=np.zeros_like(values),
+            where=values > 0
+        )
+        metrics["exposure"] = float(exposure.mean() * 100)
+
+    if len(values) < 3:
+        return metrics
+
+    previous = values[:-1]
+    returns = np.divide(
+        np.diff(values),
+        previous,
+        out=np.zeros_like(previous),
+        where=previous != 0
+    )
+    period = np.median(np.diff(timestamps))
+
+    if period <= 0:
+        return metrics
+
+    periods_per_year = SECONDS_PER_YEAR / period
+    mean = returns.mean() * periods_per_year
+    standard_deviation = returns.std(ddof=1) * np.sqrt(periods_per_year)
+    downside_deviation = np.sqrt(
+        np.mean(np.minimum(returns, 0) ** 2)
+    ) * np.sqrt(periods_per_year)
+    metrics["volatility"] = float(standard_deviation * 100)
+
+    if standard_deviation > 0:
+        metrics["sharpe_ratio"] = float(mean / standard_deviation)
+
+    if downside_deviation > 0:
+        metrics["sortino_ratio"] = float(mean / downside_deviation)
+
+    return metrics
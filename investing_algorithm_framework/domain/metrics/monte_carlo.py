@@ -0,0 +1,149 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+
+MONTE_CARLO_METHODS = ["bootstrap", "permutation"]
+
+# Number of simulations that are calculated in a single matrix, the
+# simulations are split in batches of this size, every batch has its
+# own random stream, so the results do not depend on the number of
+# workers
+MONTE_CARLO_BATCH_SIZE = 1000
+
+
+def _simulate_batch(
+    returns, initial_value, size, method, ruin_value, seed_sequence
+):
+    random = np.random.default_rng(seed_sequence)
+
+    if method == "bootstrap":
+        sequences = returns[
+            random.integers(0, len(returns), size=(size, len(returns)))
+        ]
+    else:
+        sequences = random.permuted(
+            np.tile(returns, (size, 1)), axis=1
+        )
+
+    equity = initial_value * np.cumprod(1 + sequences, axis=1)
+    peaks = np.maximum(np.maximum.accumulate(equity, axis=1), initial_value)
+    drawdowns = np.divide(
+        peaks - equity,
+        peaks,
+        out=np.zeros_like(equity),
+        where=peaks > 0
+    )
+    return (
+        equity[:, -1],
+        drawdowns.max(axis=1) * 100,
+        equity.min(axis=1) <= ruin_value
+    )
+
+
+def simulate_trade_sequences(
+    returns,
+    initial_value: float,
+    number_of_simulations: int = 10000,
+    method: str = "bootstrap",
+    ruin_threshold: float = 50.0,
+    percentiles=(5, 50, 95),
+    seed: int = None,
+    max_workers: int = None,
+    use_processes: bool = False
+) -> dict:
+    """
+    Monte Carlo simulation of a sequence of trade returns.
+
+    Every simulation compounds a resampled sequence of the returns
+    on the initial value:
+
+    1. Bootstrap: the returns are drawn with replacement, which varies
+       both the final equity and the path of the equity
+    2. Permutation: the returns are shuffled, which keeps the final
+       equity and only varies the path, e.g. the drawdowns
+
+    The simulations are calculated in batches with vectorized numpy.
+    With max_workers, the batches are calculated in parallel threads,
+    or processes if use_processes is set.
+
+    Args:
+        returns: The trade returns
+        initial_value (float): The initial value of the portfolio
+        number_of_simulations (int): The number of simulations
+        method (str): bootstrap or permutation
+        ruin_threshold (float): The drop in percentage of the initial
+            value at which a simulation is ruined
+        percentiles: The percentiles of the distributions to return
+        seed (int): The seed of the random generator
+        max_workers (int): The maximum number of parallel workers
+        use_processes (bool): Calculate the batches in separate processes
+
+    returns:
+        dict: The final_equity and max_drawdown (percentage) of every
+            simulation, their percentiles, and the ruin_probability
+    """
+
+    if method not in MONTE_CARLO_METHODS:
+        raise OperationalException(
+            f"Unknown monte carlo method {method}, supported methods "
+            f"are {', '.join(MONTE_CARLO_METHODS)}"
+        )
+
+    if number_of_simulations < 1:
+        raise OperationalException(
+            "The number of simulations must be positive"
+        )
+
+    returns = np.asarray(returns, dtype=float)
+
+    if len(returns) == 0:
+        raise OperationalException(
+            "No trade returns to run a monte carlo simulation on"
+        )
+
+    ruin_value = initial_value * (1 - ruin_threshold / 100)
+    sizes = [MONTE_CARLO_BATCH_SIZE] \
+        * (number_of_simulations // MONTE_CARLO_BATCH_SIZE)
+
+    if number_of_simulations % MONTE_CARLO_BATCH_SIZE:
+        sizes.append(number_of_simulations % MONTE_CARLO_BATCH_SIZE)
+
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(sizes))
+    arguments = [
+        (returns, initial_value, size, method, ruin_value, seed_sequence)
+        for size, seed_sequence in zip(sizes, seed_sequences)
+    ]
+
+    if max_workers is None or max_workers <= 1 or len(sizes) == 1:
+        batches = [_simulate_batch(*argument) for argument in arguments]
+    else:
+        executor_class = ProcessPoolExecutor if use_processes \
+            else ThreadPoolExecutor
+
+        with executor_class(
+            max_workers=min(max_workers, os.cpu_count() or 1, len(sizes))
+        ) as executor:
+            batches = list(
+                executor.map(_simulate_batch, *zip(*arguments))
+            )
+
+    final_equity = np.concatenate([batch[0] for batch in batches])
+    max_drawdown = np.concatenate([batch[1] for batch in batches])
+    ruined = np.concatenate([batch[2] for batch in batches])
+    return {
+        "method": method,
+        "number_of_simulations": number_of_simulations,
+        "final_equity": final_equity,
+        "max_drawdown": max_drawdown,
+        "final_equity_percentiles": dict(
+            zip(percentiles, np.percentile(final_equity, percentiles).tolist())
+        ),
+        "max_drawdown_percentiles": dict(
+            zip(percentiles, np.percentile(max_drawdown, percentiles).tolist())
+        ),
+        "ruin_probability": float(ruined.mean()),
+    }
@@ -42,16 +42,15 @@ def get_price_efficiency_ratio(data: DataFrame):
             "required for price efficiency ratio calculation"
         )
 
-    # Calculate daily price changes
-    data['Daily Change'] = data['Close'].diff()
+    # Calculate daily price changes, without modifying the data
+    daily_change = data['Close'].diff()
 
     # Calculate net price change over the period
     net_price_change = abs(
         data['Close'].iloc[-1] - data['Close'].iloc[0])
 
     # Calculate the sum of absolute daily price changes
-    sum_absolute_changes = data['Daily Change'] \
-        .abs().sum()
+    sum_absolute_changes = daily_change.abs().sum()
 
     # Calculate Efficiency Ratio
     return net_price_change / sum_absolute_changes
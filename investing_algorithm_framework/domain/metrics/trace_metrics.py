@@ -0,0 +1,278 @@
+import numpy as np
+from pandas import DataFrame, DatetimeIndex
+
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+
+TRACE_METRIC_COLUMNS = [
+    "efficiency_ratio",
+    "volatility",
+    "rolling_volatility",
+    "autocorrelation",
+]
+_SUM_COLUMNS = [
+    "sum_absolute_changes",
+    "number_of_returns",
+    "sum_returns",
+    "sum_squared_returns",
+    "number_of_pairs",
+    "sum_previous",
+    "sum_current",
+    "sum_products",
+    "sum_squared_previous",
+    "sum_squared_current",
+]
+
+
+class TraceMetrics:
+    """
+    Incremental calculation of the trace metrics of multiple symbols.
+
+    The metrics are calculated from the close prices in the traces
+    of the symbols:
+
+    1. Efficiency ratio: net price change / sum of absolute price changes
+    2. Volatility: standard deviation of the returns
+    3. Rolling volatility: standard deviation of the last window returns
+    4. Autocorrelation: lag-1 autocorrelation of the returns
+
+    The metrics are kept as running sums per symbol. An update only
+    processes the rows of the traces that are newer than the rows of
+    the previous updates, for all symbols in one vectorized pass, so
+    update can be called on every run of a strategy with its
+    (overlapping) traces. The traces are never modified.
+    """
+
+    def __init__(self, column: str = "Close", window: int = 20):
+
+        if window < 2:
+            raise OperationalException(
+                "The window of the rolling volatility must be at least 2"
+            )
+
+        self.column = column
+        self.window = window
+        self._last_datetimes = {}
+        self._first_closes = {}
+        self._sums = DataFrame(columns=_SUM_COLUMNS, dtype=float)
+
+        # The last two closes of every symbol continue the price changes
+        # and the lagged returns in the next update
+        self._closes = DataFrame(
+            {"symbol": np.array([], dtype=object), "close": []}
+        )
+        self._returns = DataFrame(
+            {"symbol": np.array([], dtype=object), "return": []}
+        )
+
+    def update(self, traces: dict) -> "TraceMetrics":
+        """
+        Update the metrics with the traces of the symbols.
+
+        Args:
+            traces (dict): Pandas DataFrames with a datetime index and a
+                close column by symbol
+
+        Returns:
+            TraceMetrics: The updated trace metrics
+        """
+        symbols = []
+        closes = []
+
+        for symbol, data in traces.items():
+
+            if data is None:
+                continue
+
+            series = self._get_closes(data)
+            last_datetime = self._last_datetimes.get(symbol)
+
+            if last_datetime is not None:
+                series = series[series.index > last_datetime]
+
+            if len(series) == 0:
+                continue
+
+            self._last_datetimes[symbol] = series.index[-1]
+            self._first_closes.setdefault(symbol, series.iloc[0])
+            symbols.append(np.full(len(series), symbol, dtype=object))
+            closes.append(series.to_numpy(dtype=float))
+
+        if len(closes) == 0:
+            return self
+
+        new = DataFrame({
+            "symbol": np.concatenate(symbols),
+            "close": np.concatenate(closes)
+        })
+        frame = DataFrame({
+            "symbol": np.concatenate(
+                [self._closes["symbol"].to_numpy(), new["symbol"].to_numpy()]
+            ),
+            "close": np.concatenate(
+                [self._closes["close"].to_numpy(), new["close"].to_numpy()]
+            ),
+            "new": np.concatenate(
+                [np.zeros(len(self._closes), dtype=bool),
+                 np.ones(len(new), dtype=bool)]
+            ),
+        })
+
+        # The stable sort keeps the closes of a symbol in time order
+        frame = frame.sort_values("symbol", kind="stable", ignore_index=True)
+        grouped = frame.groupby("symbol", sort=False)["close"]
+        previous_close = grouped.shift(1)
+        change = frame["close"] - previous_close
+        returns = (change / previous_close.where(previous_close != 0))
+        previous_return = returns.groupby(frame["symbol"]).shift(1)
+        is_return = frame["new"] & returns.notna()
+        is_pair = is_return & previous_return.notna()
+        current = returns.where(is_pair, 0.0)
+        previous = previous_return.where(is_pair, 0.0)
+        contributions = DataFrame({
+            "sum_absolute_changes": change.abs().where(frame["new"], 0.0)
+            .fillna(0.0),
+            "number_of_returns": is_return.astype(float),
+            "sum_returns": returns.where(is_return, 0.0),
+            "sum_squared_returns": returns.where(is_return, 0.0) ** 2,
+            "number_of_pairs": is_pair.astype(float),
+            "sum_previous": previous,
+            "sum_current": current,
+            "sum_products": previous * current,
+            "sum_squared_previous": previous ** 2,
+            "sum_squared_current": current ** 2,
+        })
+        sums = contributions.groupby(frame["symbol"], sort=False).sum()
+        self._sums = sums.add(
+            self._sums.reindex(sums.index, fill_value=0.0)
+        ).combine_first(self._sums)
+        new_returns = DataFrame(
+            {"symbol": frame["symbol"][is_return],
+             "return": returns[is_return]}
+        )
+        self._returns = self._tail(
+            [self._returns, new_returns], self.window
+        )
+        self._closes = self._tail([frame[["symbol", "close"]]], 2)
+        return self
+
+    def get_metrics(self) -> DataFrame:
+        """
+        Get the metrics of the symbols.
+
+        Returns:
+            DataFrame: The metrics with a row per symbol, a metric is NaN
+                when there are not enough closes to calculate it
+        """
+        symbols = list(self._first_closes)
+        sums = self._sums.reindex(symbols, fill_value=0.0)
+        first = np.array([self._first_closes[s] for s in symbols], dtype=float)
+        last = self._closes.groupby("symbol", sort=False)["close"].last()\
+            .reindex(symbols).to_numpy(dtype=float)
+        absolute_changes = sums["sum_absolute_changes"].to_numpy()
+        efficiency_ratio = np.abs(last - first) / np.where(
+            absolute_changes > 0, absolute_changes, np.nan
+        )
+
+        n = sums["number_of_returns"].to_numpy()
+        variance = (
+            sums["sum_squared_returns"].to_numpy()
+            - sums["sum_returns"].to_numpy() ** 2 / np.where(n > 0, n, 1)
+        ) / np.where(n > 1, n - 1, np.nan)
+        volatility = np.sqrt(np.clip(variance, 0, None))
+
+        rolling_volatility = self._returns\
+            .groupby("symbol", sort=False)["return"].std(ddof=1)\
+            .reindex(symbols).to_numpy(dtype=float)
+
+        pairs = sums["number_of_pairs"].to_numpy()
+        sum_previous = sums["sum_previous"].to_numpy()
+        sum_current = sums["sum_current"].to_numpy()
+        covariance = pairs * sums["sum_products"].to_numpy() \
+            - sum_previous * sum_current
+        deviation = np.sqrt(np.clip(
+            (pairs * sums["sum_squared_previous"].to_numpy()
+             - sum_previous ** 2)
+            * (pairs * sums["sum_squared_current"].to_numpy()
+               - sum_current ** 2),
+            0,
+            None
+        ))
+        autocorrelation = covariance / np.where(
+            (pairs > 1) & (deviation > 0), deviation, np.nan
+        )
+        metrics = DataFrame(
+            {
+                "efficiency_ratio": efficiency_ratio,
+                "volatility": volatility,
+                "rolling_volatility": rolling_volatility,
+                "autocorrelation": autocorrelation,
+            },
+            index=symbols,
+            columns=TRACE_METRIC_COLUMNS
+        )
+        metrics.index.name = "symbol"
+        return metrics
+
+    def _get_closes(self, data):
+
+        if not isinstance(data, DataFrame) or self.column not in data.columns:
+            raise OperationalException(
+                f"{self.column} column not found in data, "
+                "required for trace metrics calculation"
+            )
+
+        if not isinstance(data.index, DatetimeIndex):
+            raise OperationalException(
+                "Index is not a datetime object, "
+                "required for trace metrics calculation"
+            )
+
+        series = data[self.column]
+
+        if not series.index.is_monotonic_increasing:
+            series = series.sort_index(kind="stable")
+
+        return series[~series.index.duplicated(keep="first")]
+
+    @staticmethod
+    def _tail(frames, rows):
+        non_empty = [frame for frame in frames if len(frame) > 0]
+
+        if len(non_empty) == 0:
+            return frames[0]
+
+        frames = non_empty
+
+        if len(frames) == 1:
+            frame = frames[0]
+        else:
+            frame = DataFrame({
+                column: np.concatenate(
+                    [frame[column].to_numpy() for frame in frames]
+                )
+                for column in frames[0].columns
+            })
+
+        return frame.groupby("symbol", sort=False).tail(rows)\
+            .reset_index(drop=True)
+
+
+def get_trace_metrics(
+    traces: dict, column: str = "Close", window: int = 20
+) -> DataFrame:
+    """
+    Calculate the trace metrics of multiple symbols in one vectorized
+    pass, see TraceMetrics. The traces are not modified.
+
+    Args:
+        traces (dict): Pandas DataFrames with a datetime index and a
+            close column by symbol
+        column (str): The close column of the traces
+        window (int): The number of returns of the rolling volatility
+
+    returns:
+        DataFrame: The metrics with a row per symbol
+    """
+    return TraceMetrics(column=column, window=window)\
+        .update(traces).get_metrics()
@@ -1,6 +1,9 @@
 from .app_mode import AppMode
 from .backtesting import BacktestReport, BacktestPosition, \
-    BacktestReportsEvaluation, BacktestDateRange
+    BacktestReportsEvaluation, BacktestDateRange, FillModel, FeeModel, \
+    FixedFee, PercentageFee, SlippageModel, SpreadSlippage, \
+    CandleRangeSlippage, BacktestReportFormat, WalkForwardReport, \
+    WalkForwardWindow, METRIC_COLUMNS, LOWER_IS_BETTER_METRIC_COLUMNS
 from .market import MarketCredential
 from .order import OrderStatus, OrderSide, OrderType, Order
 from .portfolio import PortfolioConfiguration, Portfolio, PortfolioSnapshot
@@ -15,6 +18,10 @@ from .trading_data_types import TradingDataType
 from .trading_time_frame import TradingTimeFrame
 from .date_range import DateRange
 from .market_data_type import MarketDataType
+from .snapshot_interval import SnapshotInterval
+from .sqlite_profile import SQLiteProfile
+from .sqlite_pool_mode import SQLitePoolMode
+from .tracing import TraceStore
 
 __all__ = [
     "OrderStatus",
@@ -40,9 +47,25 @@ __all__ = [
     "BacktestReportsEvaluation",
     "AppMode",
     "BacktestDateRange",
+    "BacktestReportFormat",
+    "TraceStore",
+    "WalkForwardReport",
+    "WalkForwardWindow",
+    "METRIC_COLUMNS",
+    "LOWER_IS_BETTER_METRIC_COLUMNS",
+    "FillModel",
+    "FeeModel",
+    "FixedFee",
+    "PercentageFee",
+    "SlippageModel",
+    "SpreadSlippage",
+    "CandleRangeSlippage",
     "DateRange",
     "MarketDataType",
     "TradeStopLoss",
     "TradeTakeProfit",
     "TradeRiskType",
+    "SnapshotInterval",
+    "SQLiteProfile",
+    "SQLitePoolMode",
 ]
@@ -1,11 +1,28 @@
 from .backtest_position import BacktestPosition
 from .backtest_report import BacktestReport
-from .backtest_reports_evaluation import BacktestReportsEvaluation
+from .backtest_reports_evaluation import BacktestReportsEvaluation, \
+    METRIC_COLUMNS, LOWER_IS_BETTER_METRIC_COLUMNS
 from .backtest_date_range import BacktestDateRange
+from .backtest_report_format import BacktestReportFormat
+from .walk_forward_report import WalkForwardReport, WalkForwardWindow
+from .fill_model import FillModel, FeeModel, FixedFee, PercentageFee, \
+    SlippageModel, SpreadSlippage, CandleRangeSlippage
 
 __all__ = [
     "BacktestReport",
     "BacktestPosition",
     "BacktestReportsEvaluation",
-    "BacktestDateRange"
+    "BacktestDateRange",
+    "BacktestReportFormat",
+    "FillModel",
+    "FeeModel",
+    "FixedFee",
+    "PercentageFee",
+    "SlippageModel",
+    "SpreadSlippage",
+    "CandleRangeSlippage",
+    "WalkForwardReport",
+    "WalkForwardWindow",
+    "METRIC_COLUMNS",
+    "LOWER_IS_BETTER_METRIC_COLUMNS",
 ]
@@ -1,16 +1,19 @@
 from datetime import datetime
 from logging import getLogger
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, to_datetime
 
 from investing_algorithm_framework.domain.constants import DATETIME_FORMAT
 from investing_algorithm_framework.domain.metrics import \
-    get_price_efficiency_ratio
+    get_equity_curve_metrics, get_trace_metrics, TRACE_METRIC_COLUMNS, \
+    simulate_trade_sequences
 from investing_algorithm_framework.domain.models \
     .backtesting.backtest_date_range import BacktestDateRange
 from investing_algorithm_framework.domain.models.base_model import BaseModel
 from investing_algorithm_framework.domain.models.position import Position
-from investing_algorithm_framework.domain.models.trade import Trade
+from investing_algorithm_framework.domain.models.trade import Trade, \
+    TradeStatus
 from investing_algorithm_framework.domain.models.order import Order
 
 logger = getLogger(__name__)
@@ -56,8 +59,16 @@ class BacktestReport(BaseModel):
         orders=None,
         created_at: datetime = None,
         context=None,
+        equity_curve: DataFrame = None,
+        max_drawdown=None,
+        max_drawdown_duration=None,
+        volatility=None,
+        sharpe_ratio=None,
+        sortino_ratio=None,
+        exposure=None,
     ):
         self._traces = {}
+        self._section_loaders = {}
         self.metrics = {}
         self._name = name
         self._strategy_identifiers = strategy_identifiers
@@ -90,6 +101,13 @@ class BacktestReport(BaseModel):
         self._interval = interval
         self._time_unit = time_unit
         self._context = context
+        self._equity_curve = equity_curve
+        self._max_drawdown = max_drawdown
+        self._max_drawdown_duration = max_drawdown_duration
+        self._volatility = volatility
+        self._sharpe_ratio = sharpe_ratio
+        self._sortino_ratio = sortino_ratio
+        self._exposure = exposure
 
         self._symbols = symbols
 
@@ -294,20 +312,169 @@ class BacktestReport(BaseModel):
 
     @property
     def positions(self):
+        self._load_section("positions")
         return self._positions
 
     @positions.setter
     def positions(self, value):
+        self._section_loaders.pop("positions", None)
         self._positions = value
 
     @property
     def orders(self):
+        self._load_section("orders")
         return self._orders
 
     @orders.setter
     def orders(self, value):
+        self._section_loaders.pop("orders", None)
         self._orders = value
 
+    @property
+    def equity_curve(self):
+        """
+        Get the equity curve of the backtest, a DataFrame with a
+        datetime index and the total_value and allocated columns.
+        """
+        self._load_section("equity_curve")
+        return self._equity_curve
+
+    @equity_curve.setter
+    def equity_curve(self, value):
+        self._section_loaders.pop("equity_curve", None)
+        self._equity_curve = value
+
+    @property
+    def max_drawdown(self):
+        return self._max_drawdown
+
+    @max_drawdown.setter
+    def max_drawdown(self, value):
+        self._max_drawdown = value
+
+    @property
+    def max_drawdown_duration(self):
+        return self._max_drawdown_duration
+
+    @max_drawdown_duration.setter
+    def max_drawdown_duration(self, value):
+        self._max_drawdown_duration = value
+
+    @property
+    def volatility(self):
+        return self._volatility
+
+    @volatility.setter
+    def volatility(self, value):
+        self._volatility = value
+
+    @property
+    def sharpe_ratio(self):
+        return self._sharpe_ratio
+
+    @sharpe_ratio.setter
+    def sharpe_ratio(self, value):
+        self._sharpe_ratio = value
+
+    @property
+    def sortino_ratio(self):
+        return self._sortino_ratio
+
+    @sortino_ratio.setter
+    def sortino_ratio(self, value):
+        self._sortino_ratio = value
+
+    @property
+    def exposure(self):
+        return self._exposure
+
+    @exposure.setter
+    def exposure(self, value):
+        self._exposure = value
+
+    def calculate_equity_curve_metrics(self):
+        """
+        Calculate the risk metrics of the backtest (max drawdown, max
+        drawdown duration, volatility, sharpe ratio, sortino ratio and
+        exposure) from the equity curve, see get_equity_curve_metrics.
+
+        returns:
+            None
+        """
+
+        if self.equity_curve is None:
+            return
+
+        metrics = get_equity_curve_metrics(self.equity_curve)
+
+        for key, value in metrics.items():
+            setattr(self, key, value)
+
+    def get_trade_returns(self) -> np.ndarray:
+        """
+        Get the return sequence of the closed trades of the backtest.
+
+        The return of a trade is its net gain relative to the realized
+        value of the portfolio before the trade was closed, which is the
+        initial unallocated plus the net gains of the previously
+        closed trades.
+
+        returns:
+            np.ndarray: The returns of the closed trades in closing order
+        """
+        closed_trades = sorted(
+            (
+                trade for trade in self.trades or []
+                if TradeStatus.CLOSED.equals(trade.status)
+                and trade.closed_at is not None
+            ),
+            key=lambda trade: trade.closed_at
+        )
+        net_gains = np.array(
+            [trade.net_gain for trade in closed_trades], dtype=float
+        )
+        values_before = self.initial_unallocated + np.concatenate(
+            [[0.0], np.cumsum(net_gains)[:-1]]
+        )[:len(net_gains)]
+        return np.divide(
+            net_gains,
+            values_before,
+            out=np.zeros_like(net_gains),
+            where=values_before > 0
+        )
+
+    def monte_carlo(
+        self,
+        number_of_simulations: int = 10000,
+        method: str = "bootstrap",
+        ruin_threshold: float = 50.0,
+        percentiles=(5, 50, 95),
+        seed: int = None,
+        max_workers: int = None,
+        use_processes: bool = False
+    ) -> dict:
+        """
+        Run a monte carlo simulation on the closed trades of the
+        backtest, by bootstrapping or permuting the trade returns
+        (see get_trade_returns), to get the distribution of the final
+        equity, the max drawdown and the probability of ruin.
+        See simulate_trade_sequences for the arguments.
+
+        returns:
+            dict: The results of the simulation
+        """
+        return simulate_trade_sequences(
+            self.get_trade_returns(),
+            self.initial_unallocated,
+            number_of_simulations=number_of_simulations,
+            method=method,
+            ruin_threshold=ruin_threshold,
+            percentiles=percentiles,
+            seed=seed,
+            max_workers=max_workers,
+            use_processes=use_processes
+        )
+
     @property
     def average_trade_duration(self):
         return self._average_trade_duration
@@ -326,10 +493,12 @@ class BacktestReport(BaseModel):
 
     @property
     def trades(self):
+        self._load_section("trades")
         return self._trades
 
     @trades.setter
     def trades(self, value):
+        self._section_loaders.pop("trades", None)
         self._trades = value
 
     @property
@@ -377,10 +546,37 @@ class BacktestReport(BaseModel):
             growth_percentage=self.get_growth_percentage(),
         )
 
-    def to_dict(self):
+    def set_section_loader(self, name, loader):
+        """
+        Set a loader for a section of the report (positions, orders,
+        trades, traces or equity_curve). The loader is called the first
+        time the section is accessed, so large sections are only read
+        from the report file when they are needed.
+
+        Args:
+            name (str): The name of the section
+            loader (callable): Function that returns the section
+
+        returns:
+            None
+        """
+        self._section_loaders[name] = loader
+
+    def _load_section(self, name):
+        loader = self._section_loaders.pop(name, None)
+
+        if loader is not None:
+            setattr(self, f"_{name}", loader())
+
+    def to_dict(self, include_sections=True):
         """
         Convert the backtest report to a dictionary. So it can be
         saved to a file.
+
+        Args:
+            include_sections (bool): Include the positions, trades,
+                orders and equity curve of the report. If False, only
+                the summary of the report is converted.
         """
 
         # Convert context to a dictionary
@@ -393,7 +589,7 @@ class BacktestReport(BaseModel):
                 if isinstance(value, DataFrame):
                     self.context[key] = value.to_json()
 
-        return {
+        data = {
             "name": self.name,
             "context": self.context if self.context is not None else {},
             "strategy_identifiers": self.strategy_identifiers,
@@ -423,17 +619,40 @@ class BacktestReport(BaseModel):
             "total_value": self.total_value,
             "average_trade_duration": self.average_trade_duration,
             "average_trade_size": self.average_trade_size,
-            "positions": [position.to_dict() for position in self.positions],
-            "trades": [
+            "created_at": self.created_at.strftime(DATETIME_FORMAT),
+            "max_drawdown": self.max_drawdown,
+            "max_drawdown_duration": self.max_drawdown_duration,
+            "volatility": self.volatility,
+            "sharpe_ratio": self.sharpe_ratio,
+            "sortino_ratio": self.sortino_ratio,
+            "exposure": self.exposure,
+        }
+
+        if include_sections:
+            data["positions"] = [
+                position.to_dict() for position in self.positions
+            ]
+            data["trades"] = [
                 trade.to_dict(datetime_format=DATETIME_FORMAT)
                 for trade in self.trades
-            ],
-            "orders": [
+            ]
+            data["orders"] = [
                 order.to_dict(datetime_format=DATETIME_FORMAT)
                 for order in self.orders
-            ],
-            "created_at": self.created_at.strftime(DATETIME_FORMAT),
-        }
+            ]
+            data["equity_curve"] = None
+
+            if self.equity_curve is not None:
+                data["equity_curve"] = {
+                    "datetime": self.equity_curve.index
+                    .strftime(DATETIME_FORMAT).tolist(),
+                    **{
+                        column: self.equity_curve[column].tolist()
+                        for column in self.equity_curve.columns
+                    }
+                }
+
+        return data
 
     @staticmethod
     def from_dict(data):
@@ -445,8 +664,13 @@ class BacktestReport(BaseModel):
             start_date=datetime.strptime(
                 data["backtest_start_date"], DATETIME_FORMAT),
             end_date=datetime.strptime(
-                data["backtest_end_date"], DATETIME_FORMAT)
+                data["backtest_end_date"], DATETIME_FORMAT),
+            name=data.get("backtest_date_range_identifier")
         )
+        created_at = data.get("created_at")
+
+        if created_at is not None:
+            created_at = datetime.strptime(created_at, DATETIME_FORMAT)
 
         report = BacktestReport(
             name=data["name"],
@@ -472,25 +696,43 @@ class BacktestReport(BaseModel):
             total_value=float(data["total_value"]),
             average_trade_duration=data["average_trade_duration"],
             average_trade_size=float(data["average_trade_size"]),
+            created_at=created_at,
+            max_drawdown=data.get("max_drawdown"),
+            max_drawdown_duration=data.get("max_drawdown_duration"),
+            volatility=data.get("volatility"),
+            sharpe_ratio=data.get("sharpe_ratio"),
+            sortino_ratio=data.get("sortino_ratio"),
+            exposure=data.get("exposure"),
         )
 
-        positions = data["positions"]
+        positions = data.get("positions")
 
         if positions is not None:
             report.positions = [
                 Position.from_dict(position) for position in positions
             ]
 
-        trades = data["trades"]
+        trades = data.get("trades")
 
         if trades is not None:
             report.trades = [Trade.from_dict(trade) for trade in trades]
 
-        orders = data["orders"]
+        orders = data.get("orders")
 
         if orders is not None:
             report.orders = [Order.from_dict(order) for order in orders]
 
+        equity_curve = data.get("equity_curve")
+
+        if equity_curve is not None:
+            equity_curve = dict(equity_curve)
+            index = to_datetime(
+                equity_curve.pop("datetime"), format=DATETIME_FORMAT
+            )
+            report.equity_curve = DataFrame(
+                equity_curve, index=index.rename("datetime")
+            )
+
         return report
 
     def get_trades(self, symbol=None):
@@ -531,30 +773,36 @@ class BacktestReport(BaseModel):
         """
         Parent method to calculate all metrics.
 
+        The trace metrics (efficiency ratio, volatility, rolling
+        volatility and autocorrelation) of all traced symbols are
+        calculated in one pass, see get_trace_metrics. They are stored
+        by metric and symbol, e.g. metrics['efficiency_ratio'][symbol].
+
         returns:
             None
         """
         if self.traces is not None:
-            self.metrics['efficiency_ratio'] = {}
+            traces = {}
 
+            # A symbol traced by multiple strategies uses the traces
+            # of the last strategy
             for strategy_id in self.traces:
                 entries = self.traces[strategy_id]
 
-                if entries is None:
-                    continue
+                if entries is not None:
+                    traces.update(entries)
 
-                for symbol in entries:
+            trace_metrics = get_trace_metrics(traces)
 
-                    self.metrics['efficiency_ratio'][symbol] = \
-                        get_price_efficiency_ratio(
-                            self.traces[strategy_id][symbol]
-                        )
+            for column in TRACE_METRIC_COLUMNS:
+                self.metrics[column] = trace_metrics[column].to_dict()
 
     @property
     def traces(self):
         """
         Get the traces of the backtest report.
         """
+        self._load_section("traces")
         return self._traces
 
     @traces.setter
@@ -568,6 +816,7 @@ class BacktestReport(BaseModel):
         returns:
             None
         """
+        self._section_loaders.pop("traces", None)
         self._traces = value
 
     def get_trace(self, symbol, strategy_id=None):
@@ -0,0 +1,48 @@
+from enum import Enum
+
+
+class BacktestReportFormat(Enum):
+    """
+    File format of the backtest reports, selected with the
+    BACKTESTING_REPORT_FORMAT config key.
+
+    - JSON: a single json document with all orders, trades
+        and positions.
+    - ARCHIVE: a compact archive with a json header that holds the
+        summary of the report, and parquet sections for the orders,
+        trades, positions and traces. The sections are only loaded
+        when they are accessed.
+    """
+    JSON = "JSON"
+    ARCHIVE = "ARCHIVE"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for entry in BacktestReportFormat:
+
+                if value.upper() == entry.value:
+                    return entry
+
+        raise ValueError(
+            f"Could not convert {value} to BacktestReportFormat"
+        )
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, BacktestReportFormat):
+            for entry in BacktestReportFormat:
+
+                if value == entry:
+                    return entry
+        elif isinstance(value, str):
+            return BacktestReportFormat.from_string(value)
+
+        raise ValueError(
+            f"Could not convert {value} to BacktestReportFormat"
+        )
+
+    def equals(self, other):
+        return BacktestReportFormat.from_value(other) == self
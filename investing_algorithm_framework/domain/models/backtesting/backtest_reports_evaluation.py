@@ -1,4 +1,7 @@
-from typing import List, Dict
+from collections.abc import Sequence
+from typing import List, Dict, Callable
+
+import pandas as pd
 
 from investing_algorithm_framework.domain.exceptions import \
     OperationalException
@@ -6,6 +9,60 @@ from investing_algorithm_framework.domain.models.backtesting\
     .backtest_date_range import BacktestDateRange
 from .backtest_report import BacktestReport
 
+DATE_RANGE_COLUMNS = ["backtest_start_date", "backtest_end_date"]
+METRIC_COLUMNS = [
+    "total_net_gain",
+    "total_net_gain_percentage",
+    "growth",
+    "growth_rate",
+    "total_value",
+    "total_cost",
+    "percentage_positive_trades",
+    "percentage_negative_trades",
+    "number_of_trades_closed",
+    "number_of_trades_open",
+    "average_trade_duration",
+    "average_trade_size",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "exposure",
+]
+
+# Metrics where a lower value is better, all other metrics are ranked
+# with the highest value first
+LOWER_IS_BETTER_METRIC_COLUMNS = [
+    "percentage_negative_trades",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "volatility",
+]
+
+
+class BacktestReportSequence(Sequence):
+    """
+    Sequence of the backtest reports of rows of the metrics table of
+    an evaluation. A report is only loaded when it is accessed.
+    """
+
+    def __init__(self, evaluation, indexes):
+        self._evaluation = evaluation
+        self._indexes = list(indexes)
+
+    def __getitem__(self, item):
+
+        if isinstance(item, slice):
+            return BacktestReportSequence(
+                self._evaluation, self._indexes[item]
+            )
+
+        return self._evaluation.get_report_at(self._indexes[item])
+
+    def __len__(self):
+        return len(self._indexes)
+
 
 class BacktestReportsEvaluation:
     """
@@ -15,70 +72,129 @@ class BacktestReportsEvaluation:
     different metrics. It also groups the reports by backtest date range.
 
     The class has methods to get the best algorithm based on profit and growth.
+
+    The evaluation is done on a metrics table with one row per report,
+    the row label of a report is its position in the backtest_reports
+    list. When a report_loader is given, the backtest_reports can be
+    summaries, and the full report is loaded with the loader when it is
+    requested.
     """
-    report_groupings: Dict[BacktestDateRange, List[BacktestReport]]
 
-    def __init__(self, backtest_reports: List[BacktestReport]):
+    def __init__(
+        self,
+        backtest_reports: List[BacktestReport],
+        report_loader: Callable[[int], BacktestReport] = None
+    ):
 
         if backtest_reports is None:
             raise OperationalException("No backtest reports to evaluate")
 
         self.backtest_reports = backtest_reports
-        self.group_reports(self.backtest_reports)
-        self.profit_order = {}
-        self.profit_order_grouped_by_date = {}
-        self.growth_order = {}
-        self.growth_order_grouped_by_date = {}
-        self.percentage_positive_trades_order = {}
-        self.percentage_positive_trades_order_grouped_by_date = {}
-
-        # Calculate all metrics and group reports
-        for key in self.report_groupings:
-            self.profit_order_grouped_by_date[key] = self.order_on_profit(
-                self.report_groupings[key].copy()
-            )
-            self.growth_order_grouped_by_date[key] = self.order_on_growth(
-                self.report_groupings[key].copy()
-            )
-            self.percentage_positive_trades_order_grouped_by_date[key] = \
-                self.order_on_positive_trades(
-                    self.report_groupings[key].copy()
-                )
-
-        # Overall ordered reports
-        self.percentage_positive_trades_order = \
-            self.order_on_positive_trades(self.backtest_reports)
-        self.growth_order = self.order_on_growth(self.backtest_reports)
-        self.profit_order = self.order_on_profit(self.backtest_reports)
-
-    def order_on_profit(self, reports: List[BacktestReport]):
-        return sorted(reports, key=lambda x: x.total_net_gain, reverse=True)
-
-    def order_on_growth(self, reports: List[BacktestReport]):
-        return sorted(reports, key=lambda x: x.growth_rate, reverse=True)
-
-    def order_on_positive_trades(self, reports: List[BacktestReport]):
-        return sorted(
-            reports, key=lambda x: x.percentage_positive_trades, reverse=True
+        self._report_loader = report_loader
+        self._loaded_reports = {}
+        self._date_ranges = {}
+        self.metrics = self._create_metrics(backtest_reports)
+
+    def _create_metrics(self, reports):
+        rows = []
+
+        for report in reports:
+            date_range = report.backtest_date_range
+            key = (date_range.start_date, date_range.end_date)
+            self._date_ranges.setdefault(key, date_range)
+            row = {
+                "name": report.name,
+                "date_range_name": date_range.name,
+                "backtest_start_date": date_range.start_date,
+                "backtest_end_date": date_range.end_date,
+                "trading_symbol": report.trading_symbol,
+            }
+
+            for column in METRIC_COLUMNS:
+                row[column] = getattr(report, column)
+
+            rows.append(row)
+
+        return pd.DataFrame(
+            rows,
+            columns=[
+                "name",
+                "date_range_name",
+                *DATE_RANGE_COLUMNS,
+                "trading_symbol",
+                *METRIC_COLUMNS
+            ]
         )
 
-    def group_reports(self, reports: List[BacktestReport]):
+    def get_metrics(
+        self, backtest_date_range: BacktestDateRange = None
+    ) -> pd.DataFrame:
+        """
+        Function to get the metrics table of the backtest reports,
+        optionally filtered on a backtest date range.
+
+        :param backtest_date_range: The backtest date range
+        :return: DataFrame with one row per backtest report
         """
-        Group reports by backtest start and end date.
+
+        if backtest_date_range is None:
+            return self.metrics
+
+        metrics = self.metrics[
+            (self.metrics["backtest_start_date"]
+             == backtest_date_range.start_date)
+            & (self.metrics["backtest_end_date"]
+               == backtest_date_range.end_date)
+        ]
+
+        if metrics.empty:
+            raise OperationalException("No matches for given date range")
+
+        return metrics
+
+    def get_report_at(self, index: int) -> BacktestReport:
         """
-        self.report_groupings = {}
+        Function to get the full backtest report of a row of the metrics
+        table. With a report_loader, the report is loaded the first
+        time it is requested.
 
-        for report in reports:
-            key = report.backtest_date_range
-            if key not in self.report_groupings:
-                self.report_groupings[key] = []
-            self.report_groupings[key].append(report)
+        :param index: The row label of the report
+        :return: Backtest report
+        """
+
+        if self._report_loader is None:
+            return self.backtest_reports[index]
+
+        if index not in self._loaded_reports:
+            self._loaded_reports[index] = self._report_loader(index)
+
+        return self._loaded_reports[index]
+
+    def get_reports_for(
+        self, metrics: pd.DataFrame
+    ) -> BacktestReportSequence:
+        """
+        Function to get the full backtest reports of the rows of a
+        (filtered or sorted) metrics table, in the order of the rows.
+        The reports are loaded when they are accessed.
+
+        :param metrics: DataFrame with rows of the metrics table
+        :return: Sequence of backtest reports
+        """
+        return BacktestReportSequence(self, metrics.index)
+
+    def _order_on(self, column, backtest_date_range):
+        return self.get_reports_for(
+            self.get_metrics(backtest_date_range).sort_values(
+                column, ascending=False, kind="stable"
+            )
+        )
 
     def get_date_ranges(self):
         """
         Get the date ranges of the backtest reports.
         """
-        return list(self.report_groupings.keys())
+        return list(self._date_ranges.values())
 
     def get_profit_order(
         self, backtest_date_range: BacktestDateRange = None
@@ -90,15 +206,7 @@ class BacktestReportsEvaluation:
         :param backtest_date_range: Tuple with two datetime objects
         :return: List of backtest reports
         """
-
-        if backtest_date_range is None:
-            return self.profit_order
-        else:
-
-            if backtest_date_range in self.profit_order_grouped_by_date:
-                return self.profit_order_grouped_by_date[backtest_date_range]
-
-            raise OperationalException("No matches for given date range")
+        return self._order_on("total_net_gain", backtest_date_range)
 
     def get_growth_order(
         self, backtest_date_range: BacktestDateRange = None
@@ -110,15 +218,7 @@ class BacktestReportsEvaluation:
         :param backtest_date_range: Tuple with two datetime objects
         :return: List of backtest reports
         """
-
-        if backtest_date_range is None:
-            return self.growth_order
-        else:
-
-            if backtest_date_range in self.growth_order_grouped_by_date:
-                return self.growth_order_grouped_by_date[backtest_date_range]
-
-            raise OperationalException("No matches for given date range")
+        return self._order_on("growth_rate", backtest_date_range)
 
     def get_percentage_positive_trades_order(
         self, backtest_date_range: BacktestDateRange = None
@@ -130,18 +230,85 @@ class BacktestReportsEvaluation:
         :param backtest_date_range: Tuple with two datetime objects
         :return: List of backtest reports
         """
+        return self._order_on(
+            "percentage_positive_trades", backtest_date_range
+        )
 
-        if backtest_date_range is None:
-            return self.percentage_positive_trades_order
-        else:
+    def score(
+        self,
+        weights: Dict[str, float],
+        backtest_date_range: BacktestDateRange = None
+    ) -> pd.DataFrame:
+        """
+        Function to score the backtest reports on the weighted sum of
+        multiple metrics. Every metric is min-max normalized within its
+        backtest date range, so metrics with different scales and date
+        ranges with different market conditions are comparable.
+
+        :param weights: Dict with the metric column as key and its
+            weight as value, e.g. {"total_net_gain": 0.7, "growth": 0.3}
+        :param backtest_date_range: The backtest date range
+        :return: The metrics table with a score column, ordered on score
+        """
+        unknown = set(weights) - set(METRIC_COLUMNS)
 
-            if backtest_date_range in \
-                    self.percentage_positive_trades_order_grouped_by_date:
-                return self.percentage_positive_trades_order_grouped_by_date[
-                    backtest_date_range
-                ]
+        if unknown:
+            raise OperationalException(
+                f"Unknown metrics {', '.join(sorted(unknown))}, "
+                f"supported metrics are {', '.join(METRIC_COLUMNS)}"
+            )
 
-            raise OperationalException("No matches for given date range")
+        metrics = self.get_metrics(backtest_date_range)
+        columns = list(weights)
+        values = metrics[columns].astype(float)
+        grouped = values.groupby(
+            [metrics[column] for column in DATE_RANGE_COLUMNS]
+        )
+        minimum = grouped.transform("min")
+        spread = grouped.transform("max") - minimum
+
+        # A metric without spread within a date range adds nothing
+        normalized = ((values - minimum) / spread.where(spread != 0)) \
+            .fillna(0.0)
+        scored = metrics.assign(
+            score=normalized.mul(pd.Series(weights)).sum(axis=1)
+        )
+        return scored.sort_values("score", ascending=False, kind="stable")
+
+    def get_top_k(
+        self,
+        k: int,
+        metric: str = "total_net_gain",
+        backtest_date_range: BacktestDateRange = None,
+        ascending: bool = None
+    ) -> pd.DataFrame:
+        """
+        Function to get the top k backtest reports of every backtest
+        date range on a metric.
+
+        :param k: The number of reports per date range
+        :param metric: The metric column, or "score" for a table
+            created with the score function
+        :param backtest_date_range: The backtest date range
+        :param ascending: Rank the lowest values first, if not set the
+            lowest values are ranked first for the metrics in
+            LOWER_IS_BETTER_METRIC_COLUMNS
+        :return: The metrics table of the top k reports with a rank column,
+            ordered on date range and rank
+        """
+        metrics = self.get_metrics(backtest_date_range)
+
+        if metric not in metrics.columns:
+            raise OperationalException(f"Unknown metric {metric}")
+
+        if ascending is None:
+            ascending = metric in LOWER_IS_BETTER_METRIC_COLUMNS
+
+        ranks = metrics.groupby(DATE_RANGE_COLUMNS)[metric].rank(
+            method="first", ascending=ascending
+        )
+        return metrics.assign(rank=ranks)[ranks <= k]\
+            .sort_values([*DATE_RANGE_COLUMNS, "rank"])
 
     def rank(
         self,
@@ -157,45 +324,19 @@ class BacktestReportsEvaluation:
         :param weight_growth: Weight for growth
         :return: Name of the best algorithm
         """
+        totals = self.get_metrics(backtest_date_range)\
+            .groupby("name", sort=False)[["total_net_gain", "growth"]].sum()
 
-        # Create a dictionary with the algorithm name as key and group
-        # the reports by name
-        ordered_reports = {}
-
-        if backtest_date_range is not None:
-            reports = self.report_groupings[backtest_date_range]
-        else:
-            reports = self.backtest_reports
+        if totals.empty:
+            return None
 
-        for report in reports:
-            if report.name not in ordered_reports:
-                ordered_reports[report.name] = []
-            ordered_reports[report.name].append(report)
-
-        best_algorithm = None
-        best_score = 0
-        profit_score = 0
-        growth_score = 0
-
-        for algorithm in ordered_reports:
-            profit_score += sum(
-                [report.total_net_gain for
-                 report in ordered_reports[algorithm]]
-            )
-            growth_score += sum(
-                [report.growth for report in
-                 ordered_reports[algorithm]]
-            )
-            score = weight_profit * profit_score + weight_growth * growth_score
+        scores = weight_profit * totals["total_net_gain"] \
+            + weight_growth * totals["growth"]
 
-            if score > best_score:
-                best_score = score
-                best_algorithm = algorithm
+        if scores.max() <= 0:
+            return None
 
-            profit_score = 0
-            growth_score = 0
-
-        return best_algorithm
+        return scores.idxmax()
 
     def get_reports(
         self, name: str = None, backtest_date_range: BacktestDateRange = None
@@ -208,20 +349,15 @@ class BacktestReportsEvaluation:
         :return: List of backtest reports
         """
 
-        if name is not None and backtest_date_range is not None:
-            return [
-                report for report in self.report_groupings[backtest_date_range]
-                if report.name == name
-            ]
+        if name is None and backtest_date_range is None:
+            return None
+
+        metrics = self.get_metrics(backtest_date_range)
 
         if name is not None:
-            return [
-                report for report in self.backtest_reports
-                if report.name == name
-            ]
+            metrics = metrics[metrics["name"] == name]
 
-        if backtest_date_range is not None:
-            return self.report_groupings[backtest_date_range]
+        return self.get_reports_for(metrics)
 
     def get_report(
         self, name: str, backtest_date_range: BacktestDateRange = None
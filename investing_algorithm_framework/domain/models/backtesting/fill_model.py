@@ -0,0 +1,213 @@
+import numpy as np
+
+from investing_algorithm_framework.domain.models.order import OrderSide
+
+
+class FeeModel:
+    """
+    Base class for fee models. A fee model calculates the fee, in the
+    trading symbol, for a (partial) fill of an order.
+    """
+    rate = None
+
+    def calculate(self, price, amount, previously_filled=0):
+        """
+        Function to calculate the fee of a fill.
+
+        Args:
+            price: The price of the fill
+            amount: The amount (in the target symbol) that is filled
+            previously_filled: The amount of the order that was already
+                filled before this fill
+
+        Returns:
+            float: The fee in the trading symbol
+        """
+        raise NotImplementedError()
+
+
+class FixedFee(FeeModel):
+    """
+    Fee model that charges a fixed fee, in the trading symbol, per order.
+    The fee is charged on the first fill of the order.
+    """
+
+    def __init__(self, fee):
+        self.fee = fee
+
+    def calculate(self, price, amount, previously_filled=0):
+
+        if previously_filled > 0:
+            return 0
+
+        return self.fee
+
+
+class PercentageFee(FeeModel):
+    """
+    Fee model that charges a percentage of the filled size. The rate is
+    given as a fraction, e.g. 0.001 for a 0.1% fee.
+    """
+
+    def __init__(self, rate):
+        self.rate = rate
+
+    def calculate(self, price, amount, previously_filled=0):
+        return price * amount * self.rate
+
+
+class SlippageModel:
+    """
+    Base class for slippage models. Only limit orders are modelled, the
+    framework has no market orders, and a limit order never fills worse
+    than its limit. Orders in a backtest are therefore filled at their
+    limit price, and slippage is modelled as the distance the market
+    needs to trade through the limit price before the order is filled,
+    e.g. a buy order is only filled if the low price of a candle drops
+    below the order price minus the offset. Slippage delays (or
+    prevents) fills, it doesn't change the fill price.
+    """
+
+    def get_offsets(self, price, high, low):
+        """
+        Function to calculate the price offset for each candle.
+
+        Args:
+            price: The price of the order
+            high: numpy array with the high prices of the candles
+            low: numpy array with the low prices of the candles
+
+        Returns:
+            numpy array (or scalar) with the offset for each candle
+        """
+        raise NotImplementedError()
+
+
+class SpreadSlippage(SlippageModel):
+    """
+    Slippage model with a fixed bid/ask spread, given as a fraction of the
+    price. The market needs to trade through the order price with half of
+    the spread before the order is filled.
+    """
+
+    def __init__(self, spread):
+        self.spread = spread
+
+    def get_offsets(self, price, high, low):
+        return price * self.spread / 2
+
+
+class CandleRangeSlippage(SlippageModel):
+    """
+    Slippage model that derives the offset from the range of each candle.
+    The offset is the given factor times the high - low range of the
+    candle, so volatile candles need to trade further through the order
+    price before the order is filled.
+    """
+
+    def __init__(self, factor):
+        self.factor = factor
+
+    def get_offsets(self, price, high, low):
+        return (high - low) * self.factor
+
+
+class FillModel:
+    """
+    Fill model that is used by the backtest order service to determine
+    how much of a pending order is filled by a set of candles, and
+    what fee is charged for it.
+
+    The default fill model fills an order completely at its limit price
+    as soon as a candle touches the price, without any fees.
+
+    Args:
+        fees: dict with a fee model per market, e.g.
+            {"binance": PercentageFee(0.001)}
+        default_fee: fee model that is used for markets without
+            an entry in the fees dict
+        slippage: slippage model (see SlippageModel)
+        max_volume_participation: the maximum fraction of the volume
+            of a candle that can be filled, e.g. 0.1 means that an
+            order can take at most 10% of the volume of a candle. If set,
+            orders can be partially filled.
+    """
+
+    def __init__(
+        self,
+        fees=None,
+        default_fee=None,
+        slippage=None,
+        max_volume_participation=None
+    ):
+        self.fees = {} if fees is None else \
+            {market.upper(): fee for market, fee in fees.items()}
+        self.default_fee = default_fee
+        self.slippage = slippage
+        self.max_volume_participation = max_volume_participation
+
+    def get_fee_model(self, market):
+
+        if market is not None and market.upper() in self.fees:
+            return self.fees[market.upper()]
+
+        return self.default_fee
+
+    def calculate_fee(self, market, price, amount, previously_filled=0):
+        """
+        Function to calculate the fee of a fill on the given market.
+
+        Returns:
+            float: The fee in the trading symbol, 0 if there is no
+                fee model for the market
+        """
+        fee_model = self.get_fee_model(market)
+
+        if fee_model is None:
+            return 0
+
+        return fee_model.calculate(price, amount, previously_filled)
+
+    def get_fillable_amount(
+        self, order_side, price, remaining, high, low, volume=None
+    ):
+        """
+        Function to calculate the amount of an order that is filled
+        by the given candles. All candle arguments are numpy arrays
+        of equal length, so the calculation is done in a single
+        vectorized pass.
+
+        Args:
+            order_side: The side of the order
+            price: The price of the order
+            remaining: The remaining amount of the order
+            high: numpy array with the high prices of the candles
+            low: numpy array with the low prices of the candles
+            volume: numpy array with the volumes of the candles, only
+                required when max_volume_participation is set
+
+        Returns:
+            float: The amount that is filled
+        """
+
+        if len(high) == 0 or remaining <= 0:
+            return 0
+
+        offsets = 0
+
+        if self.slippage is not None:
+            offsets = self.slippage.get_offsets(price, high, low)
+
+        if OrderSide.BUY.equals(order_side):
+            touched = low <= price - offsets
+        else:
+            touched = high >= price + offsets
+
+        if not touched.any():
+            return 0
+
+        if self.max_volume_participation is None:
+            return remaining
+
+        available = np.sum(volume[touched]) * self.max_volume_participation
+        return float(min(remaining, available))
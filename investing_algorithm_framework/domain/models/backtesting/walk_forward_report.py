@@ -0,0 +1,99 @@
+from typing import List
+
+import pandas as pd
+
+from investing_algorithm_framework.domain.metrics import \
+    get_equity_curve_metrics
+from .backtest_date_range import BacktestDateRange
+from .backtest_report import BacktestReport
+
+
+class WalkForwardWindow:
+    """
+    Represents a window of a walk-forward backtest, the algorithm that
+    was selected on the in-sample backtests and the backtest report
+    of the selected algorithm on the out-of-sample date range.
+    """
+
+    def __init__(
+        self,
+        in_sample_date_range: BacktestDateRange,
+        out_of_sample_date_range: BacktestDateRange,
+        selected_algorithm: str,
+        in_sample_metrics: pd.DataFrame,
+        out_of_sample_report: BacktestReport
+    ):
+        self.in_sample_date_range = in_sample_date_range
+        self.out_of_sample_date_range = out_of_sample_date_range
+        self.selected_algorithm = selected_algorithm
+        self.in_sample_metrics = in_sample_metrics
+        self.out_of_sample_report = out_of_sample_report
+
+    def __repr__(self):
+        return f"{self.out_of_sample_date_range}: {self.selected_algorithm}"
+
+
+class WalkForwardReport:
+    """
+    Represents the result of a walk-forward backtest.
+
+    Every out-of-sample backtest starts with the total value at the end
+    of the previous out-of-sample backtest, so the equity curves of the
+    out-of-sample backtests are stitched into a single equity curve.
+    The summary of the walk-forward backtest is calculated from this
+    equity curve.
+    """
+
+    def __init__(self, windows: List[WalkForwardWindow], metric: str):
+        self.windows = windows
+        self.metric = metric
+        reports = [window.out_of_sample_report for window in windows]
+        self.initial_value = reports[0].initial_unallocated
+        self.total_value = reports[-1].total_value
+        self.total_net_gain = self.total_value - self.initial_value
+        self.total_net_gain_percentage = \
+            self.total_net_gain / self.initial_value * 100 \
+            if self.initial_value else 0.0
+        equity_curves = [
+            report.equity_curve for report in reports
+            if report.equity_curve is not None
+        ]
+        self.equity_curve = None
+
+        if len(equity_curves) > 0:
+            equity_curve = pd.concat(equity_curves)
+
+            # The end of a window is the start of the next window
+            self.equity_curve = equity_curve[
+                ~equity_curve.index.duplicated(keep="last")
+            ]
+
+    def get_selected_algorithms(self) -> List[str]:
+        return [window.selected_algorithm for window in self.windows]
+
+    def get_summary(self) -> dict:
+        """
+        Get the summary of the walk-forward backtest, with the risk
+        metrics of the stitched equity curve, see
+        get_equity_curve_metrics.
+
+        Returns:
+            dict: The summary of the walk-forward backtest
+        """
+        summary = {
+            "number_of_windows": len(self.windows),
+            "metric": self.metric,
+            "selected_algorithms": self.get_selected_algorithms(),
+            "start_date": self.windows[0].out_of_sample_date_range
+            .start_date,
+            "end_date": self.windows[-1].out_of_sample_date_range.end_date,
+            "initial_value": self.initial_value,
+            "total_value": self.total_value,
+            "total_net_gain": self.total_net_gain,
+            "total_net_gain_percentage": self.total_net_gain_percentage,
+        }
+
+        if self.equity_curve is not None:
+            summary.update(get_equity_curve_metrics(self.equity_curve))
+
+        return summary
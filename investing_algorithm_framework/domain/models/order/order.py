@@ -126,6 +126,9 @@ class Order(BaseModel):
     def set_status(self, status):
         self.status = OrderStatus.from_value(status).value
 
+    def get_cost(self):
+        return self.cost
+
     def get_order_type(self):
         return self.order_type
 
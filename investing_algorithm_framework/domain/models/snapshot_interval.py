@@ -0,0 +1,47 @@
+from enum import Enum
+
+
+class SnapshotInterval(Enum):
+    """
+    Policy that determines when portfolio snapshots are created.
+
+    - ON_ORDER: a snapshot is created for every order that is created
+        or updated.
+    - STRATEGY_ITERATION: a snapshot is created every N strategy runs,
+        where N is set with the SNAPSHOT_STRATEGY_ITERATIONS config key.
+    - TIME_INTERVAL: a snapshot is created on the first strategy run after
+        the interval set with the SNAPSHOT_TIME_INTERVAL config key
+        has passed.
+    - DAILY: a snapshot is created on the first strategy run of each day.
+    """
+    ON_ORDER = "ON_ORDER"
+    STRATEGY_ITERATION = "STRATEGY_ITERATION"
+    TIME_INTERVAL = "TIME_INTERVAL"
+    DAILY = "DAILY"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for entry in SnapshotInterval:
+
+                if value.upper() == entry.value:
+                    return entry
+
+        raise ValueError(f"Could not convert {value} to SnapshotInterval")
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, SnapshotInterval):
+            for entry in SnapshotInterval:
+
+                if value == entry:
+                    return entry
+        elif isinstance(value, str):
+            return SnapshotInterval.from_string(value)
+
+        raise ValueError(f"Could not convert {value} to SnapshotInterval")
+
+    def equals(self, other):
+        return SnapshotInterval.from_value(other) == self
@@ -0,0 +1,47 @@
+from enum import Enum
+
+
+class SQLitePoolMode(Enum):
+    """
+    Connection pool mode for the SQLite database, selected with the
+    SQLITE_POOL_MODE config key.
+
+    - STATIC: all threads share a single connection. This is the
+        fastest mode for a single threaded app and the only mode that
+        works for in memory databases.
+    - THREADED: every session checks out its own connection from a
+        pool. The database runs in write-ahead logging mode, so readers
+        (e.g. the web API) never wait on the strategies, while writers
+        are serialized by the app instead of failing with
+        "database is locked" errors. This is the default for file
+        databases when the app runs in web mode.
+    """
+    STATIC = "STATIC"
+    THREADED = "THREADED"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for entry in SQLitePoolMode:
+
+                if value.upper() == entry.value:
+                    return entry
+
+        raise ValueError(f"Could not convert {value} to SQLitePoolMode")
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, SQLitePoolMode):
+            for entry in SQLitePoolMode:
+
+                if value == entry:
+                    return entry
+        elif isinstance(value, str):
+            return SQLitePoolMode.from_string(value)
+
+        raise ValueError(f"Could not convert {value} to SQLitePoolMode")
+
+    def equals(self, other):
+        return SQLitePoolMode.from_value(other) == self
@@ -0,0 +1,46 @@
+from enum import Enum
+
+
+class SQLiteProfile(Enum):
+    """
+    Performance profile for the SQLite database, selected with the
+    SQLITE_PROFILE config key.
+
+    - DEFAULT: the SQLite defaults are used.
+    - LIVE: write-ahead logging with synchronous NORMAL, which is still
+        safe against corruption but avoids an fsync on every commit. A
+        larger page cache and memory mapped IO are used for reads.
+    - BACKTEST: durability is turned off completely (in memory journal,
+        synchronous OFF). A crash during a backtest only loses the
+        backtest database, which is recreated on every run.
+    """
+    DEFAULT = "DEFAULT"
+    LIVE = "LIVE"
+    BACKTEST = "BACKTEST"
+
+    @staticmethod
+    def from_string(value: str):
+
+        if isinstance(value, str):
+            for entry in SQLiteProfile:
+
+                if value.upper() == entry.value:
+                    return entry
+
+        raise ValueError(f"Could not convert {value} to SQLiteProfile")
+
+    @staticmethod
+    def from_value(value):
+
+        if isinstance(value, SQLiteProfile):
+            for entry in SQLiteProfile:
+
+                if value == entry:
+                    return entry
+        elif isinstance(value, str):
+            return SQLiteProfile.from_string(value)
+
+        raise ValueError(f"Could not convert {value} to SQLiteProfile")
+
+    def equals(self, other):
+        return SQLiteProfile.from_value(other) == self
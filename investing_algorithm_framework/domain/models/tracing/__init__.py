@@ -0,0 +1,4 @@
+from .trace import Trace
+from .trace_store import TraceStore
+
+__all__ = ["Trace", "TraceStore"]
@@ -0,0 +1,147 @@
+import pandas as pd
+
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+
+# Minimum number of buffered rows of a symbol before the buffer is
+# consolidated while traces are added
+MINIMUM_CONSOLIDATION_ROWS = 10000
+
+
+class _SymbolTrace:
+
+    def __init__(self):
+        self.data = None
+        self.chunks = []
+        self.buffered_rows = 0
+        self.drop_duplicates = True
+
+
+class TraceStore:
+    """
+    Store of the traces of a trading strategy by symbol.
+
+    Added trace data is appended to a buffer of chunks per symbol. The
+    buffer is only consolidated into a single DataFrame, with one
+    concatenation and de-duplication of the index, when the traces
+    are read, or when the buffer has grown as large as the consolidated
+    data. Adding a trace on every run of a strategy therefore copies
+    every row a constant number of times on average, instead of copying
+    all the accumulated rows on every run.
+
+    The memory of the store can be bounded with a row budget, the
+    most recent max_rows rows of a symbol are kept, and a column
+    budget, only the first max_columns columns of added data are kept.
+    """
+
+    def __init__(self, max_rows: int = None, max_columns: int = None):
+
+        if max_rows is not None and max_rows < 1:
+            raise OperationalException("max_rows of traces must be positive")
+
+        if max_columns is not None and max_columns < 1:
+            raise OperationalException(
+                "max_columns of traces must be positive"
+            )
+
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+        self._symbols = {}
+
+    def add(self, symbol: str, data, drop_duplicates=True) -> None:
+        """
+        Add data to the traces of a symbol.
+
+        Args:
+            symbol (str): The symbol
+            data (pd.DataFrame): The data with a datetime index
+            drop_duplicates (bool): Drop rows with an index that is
+                already traced, the first traced row is kept
+
+        Returns:
+            None
+        """
+
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError(
+                "Currently only pandas DataFrames are "
+                "supported as tracing data objects."
+            )
+
+        if not isinstance(data.index, pd.DatetimeIndex):
+            raise ValueError("Dataframe Index must be a datetime object.")
+
+        if self.max_columns is not None \
+                and len(data.columns) > self.max_columns:
+            data = data.iloc[:, :self.max_columns]
+
+        trace = self._symbols.setdefault(symbol, _SymbolTrace())
+
+        # Chunks in the buffer share the de-duplication of their
+        # consolidation, so the buffer is consolidated when it changes
+        if trace.chunks and trace.drop_duplicates != drop_duplicates:
+            self._consolidate(trace)
+
+        trace.drop_duplicates = drop_duplicates
+        trace.chunks.append(data)
+        trace.buffered_rows += len(data)
+        consolidated_rows = 0 if trace.data is None else len(trace.data)
+        threshold = max(consolidated_rows, MINIMUM_CONSOLIDATION_ROWS)
+
+        if self.max_rows is not None:
+            threshold = min(threshold, self.max_rows)
+
+        if trace.buffered_rows >= threshold:
+            self._consolidate(trace)
+
+    def get(self, symbol: str) -> pd.DataFrame:
+        """
+        Get the consolidated traces of a symbol.
+
+        Args:
+            symbol (str): The symbol
+
+        Returns:
+            pd.DataFrame: The traces, or None if the symbol has no traces
+        """
+        trace = self._symbols.get(symbol)
+
+        if trace is None:
+            return None
+
+        self._consolidate(trace)
+        return trace.data
+
+    def get_symbols(self):
+        return list(self._symbols)
+
+    def to_dict(self) -> dict:
+        """
+        Get the consolidated traces of all symbols.
+
+        Returns:
+            dict: The traces by symbol
+        """
+        return {symbol: self.get(symbol) for symbol in self._symbols}
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def _consolidate(self, trace):
+
+        if not trace.chunks:
+            return
+
+        frames = trace.chunks if trace.data is None \
+            else [trace.data, *trace.chunks]
+        combined = pd.concat(frames) if len(frames) > 1 else frames[0]
+
+        if trace.drop_duplicates:
+            combined = combined[~combined.index.duplicated(keep='first')]
+
+        if self.max_rows is not None and len(combined) > self.max_rows:
+            combined = combined.iloc[-self.max_rows:]
+
+        trace.data = combined.set_index(pd.DatetimeIndex(combined.index))
+        trace.chunks = []
+        trace.buffered_rows = 0
@@ -163,6 +163,24 @@ class TradeStopLoss(BaseModel):
             "sell_prices": self.sell_prices
         }
 
+    @staticmethod
+    def from_dict(data):
+        instance = TradeStopLoss(
+            trade_id=data["trade_id"],
+            trade_risk_type=data["trade_risk_type"],
+            percentage=data["percentage"],
+            open_price=data["open_price"],
+            total_amount_trade=0,
+            sell_percentage=data.get("sell_percentage", 100),
+            active=data.get("active", True),
+            sell_prices=data.get("sell_prices")
+        )
+
+        # The derived attributes (e.g. the sell amount) are restored
+        # as they were written
+        instance.update(data)
+        return instance
+
     def __repr__(self):
         return self.repr(
             trade_id=self.trade_id,
@@ -5,6 +5,10 @@ from typing import Dict
 
 from polars import DataFrame
 
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+from investing_algorithm_framework.domain.models import OrderType, OrderSide
+
 logger = logging.getLogger("investing_algorithm_framework")
 
 
@@ -95,6 +99,100 @@ class MarketService(ABC):
     def cancel_order(self, order, market):
         raise NotImplementedError()
 
+    def submit_order(self, order, market):
+        """
+        Function to submit a locally created order to the market. The
+        order type and side determine which market function is used.
+
+        Args:
+            order: Order object that needs to be submitted
+            market: The market to submit the order to
+
+        Returns:
+            Order: The order as registered by the market
+        """
+
+        if OrderType.LIMIT.equals(order.get_order_type()):
+
+            if OrderSide.BUY.equals(order.get_order_side()):
+                return self.create_limit_buy_order(
+                    target_symbol=order.get_target_symbol(),
+                    trading_symbol=order.get_trading_symbol(),
+                    amount=order.get_amount(),
+                    price=order.get_price(),
+                    market=market
+                )
+
+            return self.create_limit_sell_order(
+                target_symbol=order.get_target_symbol(),
+                trading_symbol=order.get_trading_symbol(),
+                amount=order.get_amount(),
+                price=order.get_price(),
+                market=market
+            )
+
+        if OrderSide.BUY.equals(order.get_order_side()):
+            raise OperationalException("Market buy order not supported")
+
+        return self.create_market_sell_order(
+            target_symbol=order.get_target_symbol(),
+            trading_symbol=order.get_trading_symbol(),
+            amount=order.get_amount(),
+            market=market
+        )
+
+    def create_orders(self, orders, market):
+        """
+        Function to submit a batch of independent orders to the market.
+        The default implementation submits the orders one by one,
+        market services can override this to submit them concurrently.
+
+        Args:
+            orders: List of Order objects that need to be submitted
+            market: The market to submit the orders to
+
+        Returns:
+            List with for each order, in the same order, the order
+            as registered by the market or the exception that was raised
+            when submitting the order.
+        """
+        results = []
+
+        for order in orders:
+            try:
+                results.append(self.submit_order(order, market))
+            except Exception as e:
+                logger.error(f"Error submitting order: {e}")
+                results.append(e)
+
+        return results
+
+    def cancel_orders(self, orders, market):
+        """
+        Function to cancel a batch of orders on the market. The default
+        implementation cancels the orders one by one, market services
+        can override this to cancel them concurrently.
+
+        Args:
+            orders: List of Order objects that need to be cancelled
+            market: The market of the orders
+
+        Returns:
+            List with for each order, in the same order, None if the
+            order was cancelled or the exception that was raised.
+        """
+        results = []
+
+        for order in orders:
+            try:
+                self.cancel_order(order, market)
+                results.append(None)
+            except Exception as e:
+                logger.error(f"Error cancelling order: {e}")
+                results.append(e)
+
+        return results
+
     @abstractmethod
     def get_open_orders(
         self, market, target_symbol: str = None, trading_symbol: str = None
@@ -103,7 +201,11 @@ class MarketService(ABC):
 
     @abstractmethod
     def get_closed_orders(
-        self, market, target_symbol: str = None, trading_symbol: str = None
+        self,
+        market,
+        target_symbol: str = None,
+        trading_symbol: str = None,
+        since: datetime = None
     ):
         raise NotImplementedError()
 
@@ -1,9 +1,18 @@
 from .backtesting import pretty_print_backtest, load_backtest_report, \
     pretty_print_backtest_reports_evaluation, load_backtest_reports, \
-    get_backtest_report
+    get_backtest_report, iterate_backtest_reports, \
+    load_backtest_reports_evaluation
+from .backtest_report_archive import write_backtest_report_archive, \
+    load_backtest_report_archive, read_backtest_report_archive_header, \
+    BACKTEST_REPORT_ARCHIVE_EXTENSION
+from .backtest_report_index import add_backtest_report_to_index, \
+    read_backtest_report_index, rebuild_backtest_report_index, \
+    BACKTEST_REPORT_INDEX_FILE_NAME, BACKTEST_REPORT_FILE_NAME_PATTERN
 from .csv import get_total_amount_of_rows, append_dict_as_row_to_csv, \
     add_column_headers_to_csv, csv_to_list, load_csv_into_dict
 from .random import random_string
+from .walk_forward import create_walk_forward_date_ranges, \
+    get_walk_forward_date_range
 from .stoppable_thread import StoppableThread
 from .synchronized import synchronized
 from .polars import convert_polars_to_pandas
@@ -21,6 +30,19 @@ __all__ = [
     'load_csv_into_dict',
     'load_backtest_report',
     'load_backtest_reports',
+    'iterate_backtest_reports',
+    'load_backtest_reports_evaluation',
     'convert_polars_to_pandas',
-    'get_backtest_report'
+    'get_backtest_report',
+    'write_backtest_report_archive',
+    'load_backtest_report_archive',
+    'read_backtest_report_archive_header',
+    'BACKTEST_REPORT_ARCHIVE_EXTENSION',
+    'add_backtest_report_to_index',
+    'read_backtest_report_index',
+    'rebuild_backtest_report_index',
+    'BACKTEST_REPORT_INDEX_FILE_NAME',
+    'BACKTEST_REPORT_FILE_NAME_PATTERN',
+    'create_walk_forward_date_ranges',
+    'get_walk_forward_date_range',
 ]
@@ -0,0 +1,330 @@
+import json
+import os
+import zipfile
+from io import BytesIO
+
+import polars
+
+from investing_algorithm_framework.domain.constants import DATETIME_FORMAT
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+from investing_algorithm_framework.domain.models.backtesting import \
+    BacktestReport
+from investing_algorithm_framework.domain.models.order import Order
+from investing_algorithm_framework.domain.models.position import Position
+from investing_algorithm_framework.domain.models.trade import Trade
+
+BACKTEST_REPORT_ARCHIVE_EXTENSION = ".zip"
+BACKTEST_REPORT_ARCHIVE_VERSION = 2
+HEADER_FILE_NAME = "header.json"
+ORDER_DATETIME_COLUMNS = ["created_at", "updated_at"]
+TRADE_DATETIME_COLUMNS = ["opened_at", "closed_at", "updated_at"]
+# Nested trade attributes are stored in their own sections, with a
+# trade_id column that refers to the id of the trade
+TRADE_SECTIONS = {
+    "orders": "trade_orders",
+    "stop_losses": "trade_stop_losses",
+    "take_profits": "trade_take_profits",
+}
+
+
+def is_backtest_report_archive(file_path: str) -> bool:
+    return file_path.endswith(BACKTEST_REPORT_ARCHIVE_EXTENSION)
+
+
+def write_backtest_report_archive(report: BacktestReport, file_path: str):
+    """
+    Function to write a backtest report to a compact archive. The
+    archive is a single zip file with a small json header that holds
+    the summary of the report, and a parquet file for each of the
+    orders, trades, positions, equity curve and traces sections. The
+    orders, stop losses and take profits of the trades are written
+    to their own sections, keyed by the id of their trade.
+
+    Args:
+        report: The backtest report to write
+        file_path: The path of the archive
+
+    Returns:
+        None
+    """
+    directory = os.path.dirname(file_path)
+
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    sections = {}
+    tables = {}
+
+    if report.orders is not None:
+        tables["orders"] = _to_table(
+            [
+                order.to_dict(datetime_format=DATETIME_FORMAT)
+                for order in report.orders
+            ],
+            datetime_columns=ORDER_DATETIME_COLUMNS
+        )
+
+    if report.trades is not None:
+        rows = []
+        nested_rows = {section: [] for section in TRADE_SECTIONS.values()}
+
+        for trade in report.trades:
+            row = trade.to_dict(datetime_format=DATETIME_FORMAT)
+
+            for column, section in TRADE_SECTIONS.items():
+                nested_rows[section].extend(
+                    {**nested_row, "trade_id": row["id"]}
+                    for nested_row in row.pop(column) or []
+                )
+
+            rows.append(row)
+
+        tables["trades"] = _to_table(
+            rows, datetime_columns=TRADE_DATETIME_COLUMNS
+        )
+
+        for section, section_rows in nested_rows.items():
+
+            if len(section_rows) > 0:
+                tables[section] = _to_table(
+                    section_rows,
+                    datetime_columns=ORDER_DATETIME_COLUMNS
+                    if section == TRADE_SECTIONS["orders"] else None
+                )
+
+    if report.positions is not None:
+        tables["positions"] = _to_table(
+            [_position_to_dict(position) for position in report.positions]
+        )
+
+    if report.equity_curve is not None:
+        tables["equity_curve"] = polars.from_pandas(
+            report.equity_curve.rename_axis("datetime").reset_index()
+        )
+
+    traces = []
+
+    for strategy_id, strategy_traces in (report.traces or {}).items():
+
+        for symbol, trace in (strategy_traces or {}).items():
+            path = f"traces/{len(traces)}.parquet"
+            index_name = trace.index.name or "index"
+            tables[path] = polars.from_pandas(
+                trace.rename_axis(index_name).reset_index()
+            )
+            traces.append(
+                {
+                    "strategy_id": strategy_id,
+                    "symbol": symbol,
+                    "index": index_name,
+                    "path": path,
+                }
+            )
+
+    for name in [
+        "orders",
+        "trades",
+        *TRADE_SECTIONS.values(),
+        "positions",
+        "equity_curve"
+    ]:
+
+        if name in tables:
+            sections[name] = f"{name}.parquet"
+            tables[sections[name]] = tables.pop(name)
+
+    sections["traces"] = traces
+    header = {
+        "version": BACKTEST_REPORT_ARCHIVE_VERSION,
+        "report": report.to_dict(include_sections=False),
+        "sections": sections,
+    }
+
+    # Write to a temporary file first, so an interrupted write never
+    # leaves a corrupt report behind
+    temporary_file_path = f"{file_path}.tmp"
+
+    with zipfile.ZipFile(temporary_file_path, "w") as archive:
+        archive.writestr(
+            HEADER_FILE_NAME,
+            json.dumps(header),
+            compress_type=zipfile.ZIP_DEFLATED
+        )
+
+        # Parquet files are already compressed
+        for path, table in tables.items():
+            buffer = BytesIO()
+            table.write_parquet(buffer)
+            archive.writestr(path, buffer.getvalue())
+
+    os.replace(temporary_file_path, file_path)
+
+
+def read_backtest_report_archive_header(file_path: str) -> dict:
+    """
+    Function to read only the header of a backtest report archive.
+
+    Args:
+        file_path: The path of the archive
+
+    Returns:
+        dict: The header with the summary of the report and
+            the sections of the archive
+    """
+
+    try:
+        with zipfile.ZipFile(file_path, "r") as archive:
+            return json.loads(archive.read(HEADER_FILE_NAME))
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise OperationalException(
+            f"File {file_path} is not a backtest report archive: {e}"
+        )
+
+
+def load_backtest_report_archive(file_path: str) -> BacktestReport:
+    """
+    Function to load a backtest report from a backtest report archive.
+    Only the header is read, the orders, trades, positions, equity curve
+    and traces sections are read when they are accessed for the
+    first time.
+
+    Args:
+        file_path: The path of the archive
+
+    Returns:
+        BacktestReport: The backtest report
+    """
+    header = read_backtest_report_archive_header(file_path)
+    report = BacktestReport.from_dict(header["report"])
+    sections = header["sections"]
+
+    if "orders" in sections:
+        report.set_section_loader(
+            "orders",
+            lambda: [
+                Order.from_dict(row) for row in _read_rows(
+                    file_path, sections["orders"], ORDER_DATETIME_COLUMNS
+                )
+            ]
+        )
+
+    if "trades" in sections:
+        report.set_section_loader(
+            "trades", lambda: _read_trades(file_path, sections)
+        )
+
+    if "positions" in sections:
+        report.set_section_loader(
+            "positions",
+            lambda: [
+                Position.from_dict(row)
+                for row in _read_rows(file_path, sections["positions"])
+            ]
+        )
+
+    if "equity_curve" in sections:
+        report.set_section_loader(
+            "equity_curve",
+            lambda: _read_table(file_path, sections["equity_curve"])
+            .to_pandas().set_index("datetime")
+        )
+
+    report.set_section_loader(
+        "traces", lambda: _read_traces(file_path, sections["traces"])
+    )
+    return report
+
+
+def _position_to_dict(position):
+
+    # Positions of a report loaded from json are plain models
+    if hasattr(position, "to_dict"):
+        return position.to_dict()
+
+    return dict(vars(position))
+
+
+def _to_table(rows, datetime_columns=None):
+    table = polars.DataFrame(rows, infer_schema_length=None)
+
+    for column in datetime_columns or []:
+
+        if column in table.columns:
+            table = table.with_columns(
+                polars.col(column).cast(polars.Utf8)
+                .str.strptime(polars.Datetime, DATETIME_FORMAT)
+            )
+
+    return table
+
+
+def _read_table(file_path, path):
+
+    with zipfile.ZipFile(file_path, "r") as archive:
+        return polars.read_parquet(BytesIO(archive.read(path)))
+
+
+def _read_rows(file_path, path, datetime_columns=None):
+    table = _read_table(file_path, path)
+
+    # The domain models parse the datetime attributes from strings
+    for column in datetime_columns or []:
+
+        if column in table.columns:
+            table = table.with_columns(
+                polars.col(column).dt.strftime(DATETIME_FORMAT)
+            )
+
+    return table.to_dicts()
+
+
+def _read_trades(file_path, sections):
+    nested_rows = {}
+
+    for column, section in TRADE_SECTIONS.items():
+        nested_rows[column] = {}
+
+        if section not in sections:
+            continue
+
+        datetime_columns = ORDER_DATETIME_COLUMNS if column == "orders" \
+            else None
+
+        for row in _read_rows(file_path, sections[section], datetime_columns):
+            trade_id = row["trade_id"] if column != "orders" \
+                else row.pop("trade_id")
+            nested_rows[column].setdefault(trade_id, []).append(row)
+
+    trades = []
+    rows = _read_rows(file_path, sections["trades"], TRADE_DATETIME_COLUMNS)
+
+    for row in rows:
+
+        for column in TRADE_SECTIONS:
+
+            # Archives of version 1 store the nested attributes of a
+            # trade as json encoded columns
+            if isinstance(row.get(column), str):
+                row[column] = json.loads(row[column])
+            elif column not in row:
+                row[column] = nested_rows[column].get(row["id"])
+
+        # Trades always have a list of orders
+        if row["orders"] is None:
+            row["orders"] = []
+
+        trades.append(Trade.from_dict(row))
+
+    return trades
+
+
+def _read_traces(file_path, traces):
+    result = {}
+
+    for trace in traces:
+        data = _read_table(file_path, trace["path"]).to_pandas()
+        result.setdefault(trace["strategy_id"], {})[trace["symbol"]] = \
+            data.set_index(trace["index"])
+
+    return result
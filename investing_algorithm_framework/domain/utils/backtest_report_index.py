@@ -0,0 +1,453 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from investing_algorithm_framework.domain.constants import DATETIME_FORMAT, \
+    DATETIME_FORMAT_BACKTESTING
+from investing_algorithm_framework.domain.models.backtesting import \
+    BacktestReport
+from .backtest_report_archive import is_backtest_report_archive, \
+    read_backtest_report_archive_header
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger("investing_algorithm_framework")
+BACKTEST_REPORT_INDEX_FILE_NAME = "backtest_report_index.json"
+BACKTEST_REPORT_INDEX_VERSION = 4
+BACKTEST_REPORT_FILE_NAME_PATTERN = (
+    r"^report_\w+_backtest-start-date_\d{4}-\d{2}-\d{2}[-:]\d{2}[-:]\d{2}_"
+    r"backtest-end-date_\d{4}-\d{2}-\d{2}[-:]\d{2}[-:]\d{2}_"
+    r"created-at_\d{4}-\d{2}-\d{2}[-:]\d{2}[-:]\d{2}\.(json|zip)$"
+)
+# Summary attributes of a report that are kept in the index, these are
+# all the attributes needed to create a summary of the report
+BACKTEST_REPORT_INDEX_FIELDS = [
+    "name",
+    "strategy_identifiers",
+    "backtest_date_range_identifier",
+    "backtest_start_date",
+    "backtest_end_date",
+    "created_at",
+    "number_of_runs",
+    "number_of_days",
+    "symbols",
+    "market",
+    "market_data_file",
+    "trading_symbol",
+    "initial_unallocated",
+    "total_value",
+    "total_net_gain",
+    "total_net_gain_percentage",
+    "growth",
+    "growth_rate",
+    "total_cost",
+    "number_of_orders",
+    "number_of_positions",
+    "number_of_trades_closed",
+    "number_of_trades_open",
+    "percentage_positive_trades",
+    "percentage_negative_trades",
+    "average_trade_duration",
+    "average_trade_size",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "volatility",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "exposure",
+]
+# The parsed indexes of this process by directory, see _get_index
+_index_cache = {}
+_index_lock = threading.RLock()
+# Modification times that are this close to the time a directory was
+# scanned are not trusted, files written in the same clock tick would
+# not change them (e.g. a 2 second resolution on FAT)
+_MTIME_RESOLUTION_NS = 2 * 10 ** 9
+
+
+def get_backtest_report_index_path(directory: str) -> str:
+    return os.path.join(directory, BACKTEST_REPORT_INDEX_FILE_NAME)
+
+
+def create_backtest_report_index_key(
+    algorithm_name: str, start_date: datetime, end_date: datetime
+) -> str:
+    return f"{algorithm_name}" \
+        f"_{start_date.strftime(DATETIME_FORMAT_BACKTESTING)}" \
+        f"_{end_date.strftime(DATETIME_FORMAT_BACKTESTING)}"
+
+
+def read_backtest_report_index(directory: str, rebuild=True) -> dict:
+    """
+    Function to read the index of the backtest reports in a directory.
+    When the directory has no (valid) index yet, the index is built from
+    the backtest report files in the directory.
+
+    The index is checked against the names of the report files in the
+    directory, so report files that are copied into the directory after
+    the index was written are added to it, and removed report files
+    are removed from it.
+
+    The parsed index is cached per process. The index file is only
+    parsed again when it was replaced by another process, and the
+    directory is only scanned again when the modification time of one
+    of its (sub)directories changed. The returned entries are shared
+    with the cache and must not be modified.
+
+    Args:
+        directory: The directory of the backtest reports
+        rebuild: Build or update the index if the directory has no
+            valid index or the index is out of date, if False the
+            index is returned as written
+
+    Returns:
+        dict: The index entries by algorithm name and backtest date range
+    """
+
+    if directory is None or not os.path.isdir(directory):
+        return {}
+
+    if not rebuild:
+        index = _load_index(directory)
+        return {} if index is None else index["reports"]
+
+    return _get_index(directory)["entries"]
+
+
+def rebuild_backtest_report_index(directory: str) -> dict:
+    """
+    Function to build the index of the backtest reports in a directory
+    from the backtest report files in the directory, and write it.
+
+    Args:
+        directory: The directory of the backtest reports
+
+    Returns:
+        dict: The index entries by algorithm name and backtest date range
+    """
+
+    with _index_lock, _index_file_lock(directory):
+        _index_cache.pop(os.path.abspath(directory), None)
+        return _update_index(directory, None, rebuild=True)["entries"]
+
+
+def add_backtest_report_to_index(
+    directory: str, report: BacktestReport, path: str
+) -> None:
+    """
+    Function to add a backtest report to the index of the directory
+    it is written to. The index is replaced atomically, so readers
+    never see a partially written index.
+
+    The read, update and replace of the index file happen under a lock
+    of the directory (flock), so processes that write reports to the
+    same directory don't lose each other's updates. On platforms
+    without flock (Windows) only one process may write reports to
+    a directory at a time.
+
+    Args:
+        directory: The directory of the backtest reports
+        report: The backtest report
+        path: The path of the backtest report file
+
+    Returns:
+        None
+    """
+    data = report.to_dict(include_sections=False)
+
+    with _index_lock, _index_file_lock(directory):
+        index = _index_cache.get(os.path.abspath(directory))
+
+        # The directory is only scanned when the index was changed by
+        # another process, the report file is added to the index below
+        if index is None or index["index"] != _stat_index(directory):
+            index = _update_index(directory, index)
+
+        _add_entry(index["entries"], directory, data, path)
+
+        if re.match(BACKTEST_REPORT_FILE_NAME_PATTERN, os.path.basename(path)):
+            index["files"].add(os.path.relpath(path, directory))
+
+        _write_index(directory, index["entries"], index["files"])
+        index["index"] = _stat_index(directory)
+
+
+def get_backtest_report_index_entry(
+    directory: str, algorithm_name: str, backtest_date_range=None
+):
+    """
+    Function to look up the index entry of a backtest report by
+    algorithm name and backtest date range.
+
+    Args:
+        directory: The directory of the backtest reports
+        algorithm_name: The name of the algorithm
+        backtest_date_range: The backtest date range, if None the
+            latest report of the algorithm is returned
+
+    Returns:
+        dict: The index entry with the absolute path of the report
+            file, or None if there is no such report
+    """
+    entries = read_backtest_report_index(directory)
+
+    if backtest_date_range is not None:
+        entry = entries.get(
+            create_backtest_report_index_key(
+                algorithm_name,
+                backtest_date_range.start_date,
+                backtest_date_range.end_date
+            )
+        )
+    else:
+        matches = [
+            entry for entry in entries.values()
+            if entry["name"] == algorithm_name
+        ]
+        entry = max(
+            matches,
+            key=lambda match: match["created_at"] or "",
+            default=None
+        )
+
+    if entry is None:
+        return None
+
+    path = os.path.join(directory, entry["path"])
+
+    # The report file was removed after it was indexed
+    if not os.path.isfile(path):
+        return None
+
+    return {**entry, "path": path}
+
+
+def _get_index(directory):
+    """
+    Get the index of a directory from the cache of this process, and
+    update it when the index file was replaced or a (sub)directory of
+    the reports was modified since the index was cached.
+    """
+    with _index_lock:
+        index = _index_cache.get(os.path.abspath(directory))
+
+        if index is not None \
+                and index["index"] == _stat_index(directory) \
+                and not _directories_modified(directory, index):
+            return index
+
+        with _index_file_lock(directory):
+            return _update_index(directory, index)
+
+
+def _update_index(directory, index, rebuild=False):
+    """
+    Bring the index of a directory up to date with the report files in
+    the directory and cache it. The index file is only parsed when the
+    cached index is not the index on disk. Must be called with the
+    index locks held.
+    """
+    if rebuild:
+        entries = None
+    elif index is not None and index["index"] == _stat_index(directory):
+        entries = index["entries"]
+        indexed_files = index["files"]
+    else:
+        loaded = _load_index(directory)
+        entries = None if loaded is None else loaded["reports"]
+        indexed_files = None if loaded is None else set(loaded["files"])
+
+    scanned_at = time.time_ns()
+    files, directories = _scan_directory(directory)
+
+    # Report files were removed, so superseded reports may have to
+    # take their place
+    rebuilt = entries is None or not indexed_files.issubset(files)
+
+    if rebuilt:
+        entries = {}
+        new_files = files
+    else:
+        new_files = files - indexed_files
+
+    for file in sorted(new_files):
+        path = os.path.join(directory, file)
+        _add_entry(entries, directory, _read_report_data(path), path)
+
+    if rebuilt or len(new_files) > 0:
+        _write_index(directory, entries, files)
+
+    index = {
+        "entries": entries,
+        "files": files,
+        "directories": directories,
+        "scanned_at": scanned_at,
+        "index": _stat_index(directory),
+    }
+    _index_cache[os.path.abspath(directory)] = index
+    return index
+
+
+def _stat_index(directory):
+    """
+    The identity of the index file on disk. The index is replaced with
+    os.replace, so every write gives it a new inode.
+    """
+
+    try:
+        stat = os.stat(get_backtest_report_index_path(directory))
+    except OSError:
+        return None
+
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _directories_modified(directory, index):
+
+    for sub_directory, mtime in index["directories"].items():
+
+        try:
+            current = os.stat(os.path.join(directory, sub_directory))
+        except OSError:
+            return True
+
+        if current.st_mtime_ns != mtime \
+                or mtime >= index["scanned_at"] - _MTIME_RESOLUTION_NS:
+            return True
+
+    return False
+
+
+@contextmanager
+def _index_file_lock(directory):
+    """
+    Lock the directory of an index for the other processes. Without
+    flock, or when the directory can't be opened, only the lock of
+    this process is held.
+    """
+
+    try:
+        descriptor = None if fcntl is None \
+            else os.open(directory, os.O_RDONLY)
+    except OSError:
+        descriptor = None
+
+    if descriptor is None:
+        yield
+        return
+
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(descriptor)
+
+
+def _add_entry(entries, directory, data, path):
+    key = create_backtest_report_index_key(
+        data["name"],
+        datetime.strptime(data["backtest_start_date"], DATETIME_FORMAT),
+        datetime.strptime(data["backtest_end_date"], DATETIME_FORMAT)
+    )
+
+    # Keep the latest report of an algorithm and backtest date range,
+    # created_at is formatted with DATETIME_FORMAT so it sorts as a string
+    if key in entries and (entries[key]["created_at"] or "") \
+            > (data.get("created_at") or ""):
+        return
+
+    entry = {field: data.get(field) for field in BACKTEST_REPORT_INDEX_FIELDS}
+    entry["path"] = os.path.relpath(path, directory)
+    entries[key] = entry
+
+
+def _load_index(directory):
+    path = get_backtest_report_index_path(directory)
+
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "r") as index_file:
+            index = json.load(index_file)
+    except ValueError:
+        return None
+
+    if index.get("version") != BACKTEST_REPORT_INDEX_VERSION:
+        return None
+
+    return index
+
+
+def _scan_directory(directory):
+    """
+    Get the report files of a directory and the modification times
+    of the directory and its sub directories.
+    """
+    files = set()
+    directories = {}
+
+    for root, _, names in os.walk(directory):
+        directories[os.path.relpath(root, directory)] = \
+            os.stat(root).st_mtime_ns
+        files.update(
+            os.path.relpath(os.path.join(root, name), directory)
+            for name in names
+            if re.match(BACKTEST_REPORT_FILE_NAME_PATTERN, name)
+        )
+
+    return files, directories
+
+
+def _read_report_data(path):
+
+    if is_backtest_report_archive(path):
+        return read_backtest_report_archive_header(path)["report"]
+
+    with open(path, "r") as json_file:
+        return json.load(json_file)
+
+
+def _write_index(directory, entries, files):
+    """
+    Write the index of a directory. The index is only an accelerator
+    of lookups, so if it can't be written (e.g. the directory is read
+    only) the lookup continues with the index in memory.
+    """
+    path = get_backtest_report_index_path(directory)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(temporary_path, "w") as index_file:
+            json.dump(
+                {
+                    "version": BACKTEST_REPORT_INDEX_VERSION,
+                    "files": sorted(files),
+                    "reports": entries
+                },
+                index_file,
+                indent=4
+            )
+
+        os.replace(temporary_path, path)
+    except OSError as e:
+
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)
+
+        logger.warning(
+            f"Could not write the backtest report index of {directory}: {e}"
+        )
@@ -1,8 +1,14 @@
 import os
 import re
+import csv
 import json
+import heapq
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
-from typing import List
+from html import escape
+from itertools import islice
+from typing import List, Iterator
 
 from tabulate import tabulate
 
@@ -14,17 +20,22 @@ from investing_algorithm_framework.domain.models.backtesting import \
     BacktestReportsEvaluation, BacktestReport
 from investing_algorithm_framework.domain.constants import \
     DATETIME_FORMAT_BACKTESTING
+from .backtest_report_archive import load_backtest_report_archive, \
+    is_backtest_report_archive, read_backtest_report_archive_header
+from .backtest_report_index import BACKTEST_REPORT_FILE_NAME_PATTERN, \
+    BACKTEST_REPORT_INDEX_FILE_NAME, get_backtest_report_index_entry, \
+    read_backtest_report_index
 
 COLOR_RED = '\033[91m'
 COLOR_PURPLE = '\033[95m'
 COLOR_RESET = '\033[0m'
 COLOR_GREEN = '\033[92m'
 COLOR_YELLOW = '\033[93m'
-BACKTEST_REPORT_FILE_NAME_PATTERN = (
-    r"^report_\w+_backtest-start-date_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}_"
-    r"backtest-end-date_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}_"
-    r"created-at_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}\.json$"
-)
+
+# Number of rows that are rendered at once, large tables are rendered
+# in chunks of this size
+RENDER_CHUNK_SIZE = 1000
+TABLE_VIEWS = ["last", "first", "top"]
 
 def is_positive(number) -> bool:
     """
@@ -89,244 +100,308 @@ def pretty_print_growth_evaluation(reports, precision=4):
         tabulate(growth_table, headers="keys", tablefmt="rounded_grid")
     )
 
+def _render_table(title, rows, output_file=None):
+    """
+    Render a table of rows (dicts with the same keys) to the console or
+    to a file. Rows are consumed and rendered in chunks of
+    RENDER_CHUNK_SIZE, so large tables are never built in one piece.
+
+    A file is written as csv or html, depending on its extension.
+
+    Args:
+        title: str - the title of the table
+        rows: iterable of dicts - the rows of the table
+        output_file: str - the csv or html file to write the table to,
+            if None the table is printed to the console
+
+    Returns:
+        int - the number of rendered rows
+    """
+    rows = iter(rows)
+    number_of_rows = 0
+
+    if output_file is None:
+        print(f"{COLOR_YELLOW}{title}{COLOR_RESET}")
+
+        while True:
+            chunk = list(islice(rows, RENDER_CHUNK_SIZE))
+
+            if len(chunk) == 0 and number_of_rows > 0:
+                break
+
+            print(tabulate(chunk, headers="keys", tablefmt="rounded_grid"))
+            number_of_rows += len(chunk)
+
+            if len(chunk) < RENDER_CHUNK_SIZE:
+                break
+
+        return number_of_rows
+
+    extension = os.path.splitext(output_file)[1].lower()
+
+    if extension not in (".csv", ".html"):
+        raise OperationalException(
+            f"Unsupported output file {output_file}, "
+            "supported extensions are .csv and .html"
+        )
+
+    directory = os.path.dirname(output_file)
+
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    with open(output_file, "w", newline="") as file:
+
+        if extension == ".csv":
+            writer = None
+
+            for row in rows:
+
+                if writer is None:
+                    writer = csv.DictWriter(file, fieldnames=list(row))
+                    writer.writeheader()
+
+                writer.writerow(row)
+                number_of_rows += 1
+
+            return number_of_rows
+
+        file.write(
+            f"<html>\n<head><title>{escape(title)}</title></head>\n"
+            f"<body>\n<h2>{escape(title)}</h2>\n"
+        )
+
+        while True:
+            chunk = list(islice(rows, RENDER_CHUNK_SIZE))
+
+            if len(chunk) == 0:
+                break
+
+            file.write(tabulate(chunk, headers="keys", tablefmt="html"))
+            file.write("\n")
+            number_of_rows += len(chunk)
+
+        file.write("</body>\n</html>\n")
+
+    return number_of_rows
+
+
+def _select_rows(items, max_rows=None, view="last", key=None):
+    """
+    Select the items of a detail table, without sorting or copying
+    all items.
+
+    Args:
+        items: iterable - the items
+        max_rows: int - the maximum number of items, if None all items
+            are selected
+        view: str - "first" or "last" for the first or last max_rows
+            items, or "top" for the max_rows items with the largest key
+        key: function - the key of the top view
+
+    Returns:
+        iterable of the selected items
+    """
+
+    if view not in TABLE_VIEWS:
+        raise OperationalException(
+            f"Unknown table view {view}, "
+            f"supported views are {', '.join(TABLE_VIEWS)}"
+        )
+
+    if max_rows is None:
+        return items
+
+    if view == "first":
+        return islice(items, max_rows)
+
+    if view == "last":
+        return deque(items, maxlen=max_rows)
+
+    return heapq.nlargest(max_rows, items, key=key)
+
+
+def _print_table_summary(summary):
+    print(
+        ", ".join(
+            f"{COLOR_YELLOW}{label}:{COLOR_RESET} "
+            f"{COLOR_GREEN}{value}{COLOR_RESET}"
+            for label, value in summary.items()
+        )
+    )
+
+
+def _get_trade_risk_status(trade_risk):
+
+    if trade_risk.sold_amount == 0:
+        return "NOT TRIGGERED"
+
+    if trade_risk.sold_amount == trade_risk.sell_amount:
+        return "TRIGGERED"
+
+    if trade_risk.sold_amount < trade_risk.sell_amount:
+        return "PARTIALLY TRIGGERED"
+
+
+def _has_triggered(trade_risks):
+
+    if trade_risks is None:
+        return False
+
+    return any(trade_risk.sold_amount != 0 for trade_risk in trade_risks)
+
+
+def _pretty_print_trade_risks(
+    backtest_report,
+    attribute,
+    price_attribute,
+    title,
+    price_label,
+    precision=4,
+    triggered_only=False,
+    max_rows=None,
+    view="last",
+    output_file=None
+):
+    summary = {"Total": 0, "Triggered": 0}
+
+    def iterate_trade_risks():
+
+        for trade in backtest_report.trades:
+            trade_risks = getattr(trade, attribute)
+
+            if trade_risks is None:
+                continue
+
+            for trade_risk in trade_risks:
+                summary["Total"] += 1
+
+                if trade_risk.sold_amount > 0:
+                    summary["Triggered"] += 1
+                elif triggered_only:
+                    continue
+
+                yield trade, trade_risk
+
+    def to_row(trade, trade_risk):
+        open_price = ""
+
+        if trade_risk.open_price is not None:
+            open_price = f"{float(trade_risk.open_price):.{precision}f} " \
+                f"{trade.trading_symbol}"
+
+        return {
+            "Trade (Trade id)": f"{trade.symbol} ({trade_risk.trade_id})",
+            "Status": _get_trade_risk_status(trade_risk),
+            "Active": f"{trade_risk.active}",
+            "Type": f"{trade_risk.trade_risk_type}",
+            price_label:
+                f"{float(getattr(trade_risk, price_attribute)):.{precision}f}"
+                f"({trade_risk.percentage}%) {trade.trading_symbol}",
+            "Open price": open_price,
+            "Sell price's": f"{trade_risk.sell_prices}",
+            "High water mark": float(trade_risk.high_water_mark)
+            if trade_risk.high_water_mark is not None else "",
+            "Percentage": f"{float(trade_risk.sell_percentage)}%",
+            "Size": f"{float(trade_risk.sell_amount):.{precision}f} "
+                    f"{trade.target_symbol}",
+            "Sold amount": float(trade_risk.sold_amount)
+            if trade_risk.sold_amount > 0 else "",
+        }
+
+    trade_risks = iterate_trade_risks()
+    selection = _select_rows(
+        trade_risks,
+        max_rows=max_rows,
+        view=view,
+        key=lambda item: item[1].sold_amount
+    )
+    shown = _render_table(
+        title,
+        (to_row(trade, trade_risk) for trade, trade_risk in selection),
+        output_file=output_file
+    )
+
+    # Complete the summary when only the first rows were selected
+    deque(trade_risks, maxlen=0)
+    summary["Shown"] = shown
+    _print_table_summary(summary)
+
+
 def pretty_print_stop_losses(
     backtest_report,
     precision=4,
-    triggered_only=False
+    triggered_only=False,
+    max_rows=None,
+    view="last",
+    output_file=None
 ):
-    print(f"{COLOR_YELLOW}Stop losses overview{COLOR_RESET}")
-    stop_loss_table = {}
-    trades = backtest_report.trades
-    selection = []
-
-    def get_sold_amount(stop_loss):
-        if stop_loss["sold_amount"] > 0:
-            return float(stop_loss["sold_amount"])
-
-        return ""
-
-    def get_status(stop_loss):
-
-        if stop_loss.sold_amount == 0:
-            return "NOT TRIGGERED"
-
-        if stop_loss.sold_amount == stop_loss.sell_amount:
-            return "TRIGGERED"
-
-        if stop_loss.sold_amount < stop_loss.sell_amount:
-            return "PARTIALLY TRIGGERED"
-
-    def get_high_water_mark(stop_loss):
-        if stop_loss["high_water_mark"] is not None:
-            return float(stop_loss["high_water_mark"])
-
-        return ""
-
-    if triggered_only:
-        for trade in trades:
-
-            if trade.stop_losses is not None:
-                selection += [
-                    {
-                        "symbol": trade.symbol,
-                        "target_symbol": trade.target_symbol,
-                        "trading_symbol": trade.trading_symbol,
-                        "status": get_status(stop_loss),
-                        "trade_id": stop_loss.trade_id,
-                        "trade_risk_type": stop_loss.trade_risk_type,
-                        "percentage": stop_loss.percentage,
-                        "open_price": stop_loss.open_price,
-                        "sell_percentage": stop_loss.sell_percentage,
-                        "high_water_mark": stop_loss.high_water_mark,
-                        "stop_loss_price": stop_loss.stop_loss_price,
-                        "sell_amount": stop_loss.sell_amount,
-                        "sold_amount": stop_loss.sold_amount,
-                        "active": stop_loss.active,
-                        "sell_prices": stop_loss.sell_prices
-                    } for stop_loss in trade.stop_losses if stop_loss.sold_amount > 0
-                ]
-    else:
-        for trade in trades:
-
-            if trade.stop_losses is not None:
-                for stop_loss in trade.stop_losses:
-
-                    selection += [
-                        {
-                            "symbol": trade.symbol,
-                            "target_symbol": trade.target_symbol,
-                            "trading_symbol": trade.trading_symbol,
-                            "status": get_status(stop_loss),
-                            "trade_id": stop_loss.trade_id,
-                            "trade_risk_type": stop_loss.trade_risk_type,
-                            "percentage": stop_loss.percentage,
-                            "open_price": stop_loss.open_price,
-                            "sell_percentage": stop_loss.sell_percentage,
-                            "high_water_mark": stop_loss.high_water_mark,
-                            "stop_loss_price": stop_loss.stop_loss_price,
-                            "sell_amount": stop_loss.sell_amount,
-                            "sold_amount": stop_loss.sold_amount,
-                            "active": stop_loss.active,
-                            "sell_prices": stop_loss.sell_prices
-                        } for stop_loss in trade.stop_losses
-                    ]
-
-    stop_loss_table["Trade (Trade id)"] = [
-        f"{stop_loss['symbol'] + ' (' + str(stop_loss['trade_id']) + ')'}"
-        for stop_loss in selection
-    ]
-    stop_loss_table["Status"] = [
-        f"{stop_loss['status']}"
-        for stop_loss in selection
-    ]
-    stop_loss_table["Active"] = [
-        f"{stop_loss['active']}"
-        for stop_loss in selection
-    ]
-    stop_loss_table["Type"] = [
-        f"{stop_loss['trade_risk_type']}" for stop_loss in selection
-    ]
-    stop_loss_table["stop loss"] = [
-        f"{float(stop_loss['stop_loss_price']):.{precision}f}({stop_loss['percentage']}%) {stop_loss['trading_symbol']}" for stop_loss in selection
-    ]
-    stop_loss_table["Open price"] = [
-        f"{float(stop_loss['open_price']):.{precision}f} {stop_loss['trading_symbol']}" for stop_loss in selection if stop_loss['open_price'] is not None
-    ]
-    stop_loss_table["Sell price's"] = [
-        f"{stop_loss['sell_prices']}" for stop_loss in selection
-    ]
-    stop_loss_table["High water mark"] = [
-        get_high_water_mark(stop_loss) for stop_loss in selection
-    ]
-    stop_loss_table["Percentage"] = [
-        f"{float(stop_loss['sell_percentage'])}%" for stop_loss in selection
-    ]
-    stop_loss_table["Size"] = [
-        f"{float(stop_loss['sell_amount']):.{precision}f} {stop_loss['target_symbol']}" for stop_loss in selection
-    ]
-    stop_loss_table["Sold amount"] = [
-        get_sold_amount(stop_loss) for stop_loss in selection
-    ]
-    print(tabulate(stop_loss_table, headers="keys", tablefmt="rounded_grid"))
+    """
+    Pretty print the stop losses of the backtest report.
+
+    Args:
+        backtest_report: BacktestReport - the backtest report
+        precision: int - the precision of the floats
+        triggered_only: bool - show only the triggered stop losses
+        max_rows: int - the maximum number of stop losses to show
+        view: str - "first", "last" or "top" (largest sold amount)
+            max_rows stop losses
+        output_file: str - write the table to a csv or html file
+            instead of the console
+
+    Returns:
+        None
+    """
+    _pretty_print_trade_risks(
+        backtest_report,
+        attribute="stop_losses",
+        price_attribute="stop_loss_price",
+        title="Stop losses overview",
+        price_label="stop loss",
+        precision=precision,
+        triggered_only=triggered_only,
+        max_rows=max_rows,
+        view=view,
+        output_file=output_file
+    )
 
 
 def pretty_print_take_profits(
-    backtest_report, precision=4, triggered_only=False
+    backtest_report,
+    precision=4,
+    triggered_only=False,
+    max_rows=None,
+    view="last",
+    output_file=None
 ):
-    print(f"{COLOR_YELLOW}Take profits overview{COLOR_RESET}")
-    take_profit_table = {}
-    trades = backtest_report.trades
-    selection = []
-
-    def get_high_water_mark(take_profit):
-        if take_profit["high_water_mark"] is not None:
-            return float(take_profit["high_water_mark"])
-
-        return ""
-
-    def get_sold_amount(take_profit):
-        if take_profit["sold_amount"] > 0:
-            return float(take_profit["sold_amount"])
-
-        return ""
-
-    def get_status(take_profit):
-
-        if take_profit.sold_amount == 0:
-            return "NOT TRIGGERED"
-
-        if take_profit.sold_amount == take_profit.sell_amount:
-            return "TRIGGERED"
-
-        if take_profit.sold_amount < take_profit.sell_amount:
-            return "PARTIALLY TRIGGERED"
-
-    if triggered_only:
-        for trade in trades:
-
-            if trade.take_profits is not None:
-                selection += [
-                    {
-                        "symbol": trade.symbol,
-                        "target_symbol": trade.target_symbol,
-                        "trading_symbol": trade.trading_symbol,
-                        "status": get_status(take_profit),
-                        "trade_id": take_profit.trade_id,
-                        "trade_risk_type": take_profit.trade_risk_type,
-                        "percentage": take_profit.percentage,
-                        "open_price": take_profit.open_price,
-                        "sell_percentage": take_profit.sell_percentage,
-                        "high_water_mark": take_profit.high_water_mark,
-                        "take_profit_price": take_profit.take_profit_price,
-                        "sell_amount": take_profit.sell_amount,
-                        "sold_amount": take_profit.sold_amount,
-                        "active": take_profit.active,
-                        "sell_prices": take_profit.sell_prices
-                    } for take_profit in trade.take_profits if take_profit.sold_amount > 0
-                ]
-    else:
-        for trade in trades:
-
-            if trade.take_profits is not None:
-                selection += [
-                    {
-                        "symbol": trade.symbol,
-                        "target_symbol": trade.target_symbol,
-                        "trading_symbol": trade.trading_symbol,
-                        "status": get_status(take_profit),
-                        "trade_id": take_profit.trade_id,
-                        "trade_risk_type": take_profit.trade_risk_type,
-                        "percentage": take_profit.percentage,
-                        "open_price": take_profit.open_price,
-                        "sell_percentage": take_profit.sell_percentage,
-                        "high_water_mark": take_profit.high_water_mark,
-                        "take_profit_price": take_profit.take_profit_price,
-                        "sell_amount": take_profit.sell_amount,
-                        "sold_amount": take_profit.sold_amount,
-                        "active": take_profit.active,
-                        "sell_prices": take_profit.sell_prices
-                    } for take_profit in trade.take_profits
-                ]
-
-    take_profit_table["Trade (Trade id)"] = [
-        f"{stop_loss['symbol'] + ' (' + str(stop_loss['trade_id']) + ')'}"
-        for stop_loss in selection
-    ]
-    take_profit_table["Status"] = [
-        f"{stop_loss['status']}"
-        for stop_loss in selection
-    ]
-    take_profit_table["Active"] = [
-        f"{stop_loss['active']}"
-        for stop_loss in selection
-    ]
-    take_profit_table["Type"] = [
-        f"{stop_loss['trade_risk_type']}" for stop_loss
-        in selection
-    ]
-    take_profit_table["Take profit"] = [
-        f"{float(take_profit['take_profit_price']):.{precision}f}({take_profit['percentage']})% {take_profit['trading_symbol']}" for take_profit in selection
-    ]
-    take_profit_table["Open price"] = [
-        f"{float(stop_loss['open_price']):.{precision}f} {stop_loss['trading_symbol']}" for stop_loss in selection if stop_loss['open_price'] is not None
-    ]
-    take_profit_table["Sell price's"] = [
-        f"{stop_loss['sell_prices']}" for stop_loss in selection
-    ]
-    # Print nothing if high water mark is None
-    take_profit_table["High water mark"] = [
-        get_high_water_mark(stop_loss) for stop_loss in selection
-    ]
-    take_profit_table["Percentage"] = [
-        f"{float(stop_loss['sell_percentage'])}%" for stop_loss in selection
-    ]
-    take_profit_table["Size"] = [
-        f"{float(stop_loss['sell_amount']):.{precision}f} {stop_loss['target_symbol']}" for stop_loss in selection
-    ]
-    take_profit_table["Sold amount"] = [
-        get_sold_amount(stop_loss) for stop_loss in selection
-    ]
-    print(tabulate(take_profit_table, headers="keys", tablefmt="rounded_grid"))
+    """
+    Pretty print the take profits of the backtest report.
+
+    Args:
+        backtest_report: BacktestReport - the backtest report
+        precision: int - the precision of the floats
+        triggered_only: bool - show only the triggered take profits
+        max_rows: int - the maximum number of take profits to show
+        view: str - "first", "last" or "top" (largest sold amount)
+            max_rows take profits
+        output_file: str - write the table to a csv or html file
+            instead of the console
+
+    Returns:
+        None
+    """
+    _pretty_print_trade_risks(
+        backtest_report,
+        attribute="take_profits",
+        price_attribute="take_profit_price",
+        title="Take profits overview",
+        price_label="Take profit",
+        precision=precision,
+        triggered_only=triggered_only,
+        max_rows=max_rows,
+        view=view,
+        output_file=output_file
+    )
 
 
 def pretty_print_percentage_positive_trades_evaluation(
@@ -491,98 +566,102 @@ def pretty_print_percentage_positive_trades(
     print(f"{COLOR_YELLOW}Most positive trades:{COLOR_RESET} {COLOR_GREEN}Algorithm {percentages.name} {float(percentages.percentage_positive_trades):.{precision}f}%{COLOR_RESET}")
 
 
-def pretty_print_trades(backtest_report, precision=4):
-
-    def get_status(trade):
-        status = "OPEN"
-
-        if TradeStatus.CLOSED.equals(trade.status):
-            status = "CLOSED"
-
-        if has_triggered_stop_losses(trade):
-            status += ", SL"
-
-        if has_triggered_take_profits(trade):
-            status += ", TP"
-
-        return status
-
-    def get_close_prices(trade):
+def pretty_print_trades(
+    backtest_report,
+    precision=4,
+    max_rows=None,
+    view="last",
+    output_file=None
+):
+    """
+    Pretty print the trades of the backtest report. Every trade is
+    formatted once, and a summary of all trades is calculated in the
+    same pass.
 
-        sell_orders = [
-            order for order in trade.orders
-            if OrderSide.SELL.equals(order.order_side)
-        ]
-        text = ""
-        number_of_sell_orders = 0
+    Args:
+        backtest_report: BacktestReport - the backtest report
+        precision: int - the precision of the floats
+        max_rows: int - the maximum number of trades to show
+        view: str - "first", "last" or "top" (largest net gain)
+            max_rows trades
+        output_file: str - write the table to a csv or html file
+            instead of the console
 
-        for sell_order in sell_orders:
+    Returns:
+        None
+    """
+    trading_symbol = backtest_report.trading_symbol
+    summary = {"Total": 0, "Closed": 0, "Open": 0, "SL": 0, "TP": 0}
+    net_gain = 0
 
-            if number_of_sell_orders > 0:
-                text += ", "
+    def iterate_trades():
+        nonlocal net_gain
 
-            text += f"{sell_order.price}"
-            number_of_sell_orders += 1
+        for trade in backtest_report.trades:
+            summary["Total"] += 1
+            net_gain += trade.net_gain_absolute
 
-        return text
+            if TradeStatus.CLOSED.equals(trade.status):
+                summary["Closed"] += 1
+            else:
+                summary["Open"] += 1
 
-    def has_triggered_take_profits(trade):
+            if _has_triggered(trade.stop_losses):
+                summary["SL"] += 1
 
-        if trade.take_profits is None:
-            return False
+            if _has_triggered(trade.take_profits):
+                summary["TP"] += 1
 
-        triggered = [
-            take_profit for take_profit in trade.take_profits if take_profit.sold_amount != 0
-        ]
+            yield trade
 
-        return len(triggered) > 0
+    def to_row(trade):
+        closed = TradeStatus.CLOSED.equals(trade.status)
+        status = "CLOSED" if closed else "OPEN"
 
-    def has_triggered_stop_losses(trade):
+        if _has_triggered(trade.stop_losses):
+            status += ", SL"
 
-        if trade.stop_losses is None:
-            return False
+        if _has_triggered(trade.take_profits):
+            status += ", TP"
 
-        triggered = [
-            stop_loss for stop_loss in trade.stop_losses if stop_loss.sold_amount != 0
-        ]
-        return len(triggered) > 0
+        # Add (unrealized) to the net gain if the trade is still open
+        return {
+            "Pair (Trade id)":
+                f"{trade.target_symbol}/{trade.trading_symbol} ({trade.id})",
+            "Status": status,
+            f"Net gain ({trading_symbol})":
+                f"{float(trade.net_gain_absolute):.{precision}f} "
+                f"({float(trade.net_gain_percentage):.{precision}f}%)"
+                + ("" if closed else " (unrealized)"),
+            "Open date": trade.opened_at,
+            "Close date": trade.closed_at,
+            "Duration": f"{trade.duration} hours",
+            f"Open price ({trading_symbol})": trade.open_price,
+            f"Close price's ({trading_symbol})": ", ".join(
+                f"{order.price}" for order in trade.orders
+                if OrderSide.SELL.equals(order.order_side)
+            ),
+        }
+
+    trades = iterate_trades()
+    selection = _select_rows(
+        trades,
+        max_rows=max_rows,
+        view=view,
+        key=lambda trade: trade.net_gain_absolute
+    )
+    shown = _render_table(
+        "Trades overview",
+        (to_row(trade) for trade in selection),
+        output_file=output_file
+    )
 
-    print(f"{COLOR_YELLOW}Trades overview{COLOR_RESET}")
-    trades_table = {}
-    trades_table["Pair (Trade id)"] = [
-        f"{trade.target_symbol}/{trade.trading_symbol} ({trade.id})"
-        for trade in backtest_report.trades
-    ]
-    trades_table["Status"] = [
-        get_status(trade) for trade in backtest_report.trades
-    ]
-    trades_table[f"Net gain ({backtest_report.trading_symbol})"] = [
-        f"{float(trade.net_gain):.{precision}f}"
-        for trade in backtest_report.trades
-    ]
-    trades_table["Open date"] = [
-        trade.opened_at for trade in backtest_report.trades
-    ]
-    trades_table["Close date"] = [
-        trade.closed_at for trade in backtest_report.trades
-    ]
-    trades_table["Duration"] = [
-        f"{trade.duration} hours" for trade in backtest_report.trades
-    ]
-    # Add (unrealized) to the net gain if the trade is still open
-    trades_table[f"Net gain ({backtest_report.trading_symbol})"] = [
-        f"{float(trade.net_gain_absolute):.{precision}f} ({float(trade.net_gain_percentage):.{precision}f}%)" + (" (unrealized)" if not TradeStatus.CLOSED.equals(trade.status) else "")
-        for trade in backtest_report.trades
-    ]
-    trades_table[f"Open price ({backtest_report.trading_symbol})"] = [
-        trade.open_price for trade in backtest_report.trades
-    ]
-    trades_table[
-        f"Close price's ({backtest_report.trading_symbol})"
-    ] = [
-        get_close_prices(trade) for trade in backtest_report.trades
-    ]
-    print(tabulate(trades_table, headers="keys", tablefmt="rounded_grid"))
+    # Complete the summary when only the first rows were selected
+    deque(trades, maxlen=0)
+    summary[f"Net gain ({trading_symbol})"] = \
+        f"{float(net_gain):.{precision}f}"
+    summary["Shown"] = shown
+    _print_table_summary(summary)
 
 
 def pretty_print_backtest_reports_evaluation(
@@ -666,11 +745,19 @@ def pretty_print_backtest(
     show_triggered_stop_losses_only=False,
     show_take_profits=True,
     show_triggered_take_profits_only=False,
-    precision=4
+    precision=4,
+    max_rows=None,
+    view="last",
+    output_directory=None,
+    output_format="html"
 ):
     """
     Pretty print the backtest report to the console.
 
+    The detail tables of large reports can be capped with max_rows,
+    or written to files in the output_directory (positions, trades,
+    stop_losses and take_profits) instead of the console.
+
     Args:
         backtest_report: BacktestReport - the backtest report
         show_positions: bool - show the positions
@@ -680,11 +767,29 @@ def pretty_print_backtest(
         show_take_profits: bool - show the take profits
         show_triggered_take_profits_only: bool - show only the triggered take profits
         precision: int - the precision of the floats
+        max_rows: int - the maximum number of rows of the trades,
+            stop losses and take profits tables
+        view: str - "first", "last" or "top" max_rows of the tables
+        output_directory: str - directory to write the tables to
+        output_format: str - the file format of the tables, html or csv
 
     Returns:
         None
     """
 
+    if output_format not in ("html", "csv"):
+        raise OperationalException(
+            f"Unsupported output format {output_format}, "
+            "supported formats are html and csv"
+        )
+
+    def get_output_file(name):
+
+        if output_directory is None:
+            return None
+
+        return os.path.join(output_directory, f"{name}.{output_format}")
+
     ascii_art = f"""
                   :%%%#+-          .=*#%%%        {COLOR_GREEN}Backtest report{COLOR_RESET}
                   *%%%%%%%+------=*%%%%%%%-       {COLOR_GREEN}---------------------------{COLOR_RESET}
@@ -712,103 +817,217 @@ def pretty_print_backtest(
     # pretty_print_price_efficiency([backtest_report], precision=precision)
 
     if show_positions:
-        print(f"{COLOR_YELLOW}Positions overview{COLOR_RESET}")
-        position_table = {}
-        position_table["Position"] = [
-            position.symbol for position in backtest_report.positions
-        ]
-        position_table["Amount"] = [
-            f"{float(position.amount):.{precision}f}" for position in
-            backtest_report.positions
-        ]
-        position_table["Pending buy amount"] = [
-            f"{float(position.amount_pending_buy):.{precision}f}"
-            for position in backtest_report.positions
-        ]
-        position_table["Pending sell amount"] = [
-            f"{float(position.amount_pending_sell):.{precision}f}"
-            for position in backtest_report.positions
-        ]
-        position_table[f"Cost ({backtest_report.trading_symbol})"] = [
-            f"{float(position.cost):.{precision}f}"
-            for position in backtest_report.positions
-        ]
-        position_table[f"Value ({backtest_report.trading_symbol})"] = [
-            f"{float(position.value):.{precision}f}"
-            for position in backtest_report.positions
-        ]
-        position_table["Percentage of portfolio"] = [
-            f"{float(position.percentage_of_portfolio):.{precision}f}%"
-            for position in backtest_report.positions
-        ]
-        position_table[f"Growth ({backtest_report.trading_symbol})"] = [
-            f"{float(position.growth):.{precision}f}"
-            for position in backtest_report.positions
-        ]
-        position_table["Growth_rate"] = [
-            f"{float(position.growth_rate):.{precision}f}%"
-            for position in backtest_report.positions
-        ]
-        print(
-            tabulate(position_table, headers="keys", tablefmt="rounded_grid")
+        trading_symbol = backtest_report.trading_symbol
+        _render_table(
+            "Positions overview",
+            (
+                {
+                    "Position": position.symbol,
+                    "Amount": f"{float(position.amount):.{precision}f}",
+                    "Pending buy amount":
+                        f"{float(position.amount_pending_buy):.{precision}f}",
+                    "Pending sell amount":
+                        f"{float(position.amount_pending_sell):.{precision}f}",
+                    f"Cost ({trading_symbol})":
+                        f"{float(position.cost):.{precision}f}",
+                    f"Value ({trading_symbol})":
+                        f"{float(position.value):.{precision}f}",
+                    "Percentage of portfolio": "{:.{}f}%".format(
+                        float(position.percentage_of_portfolio), precision
+                    ),
+                    f"Growth ({trading_symbol})":
+                        f"{float(position.growth):.{precision}f}",
+                    "Growth_rate":
+                        f"{float(position.growth_rate):.{precision}f}%",
+                } for position in backtest_report.positions
+            ),
+            output_file=get_output_file("positions")
         )
 
-    def has_triggered_stop_losses(trade):
-
-        if trade.stop_losses is None:
-            return False
-
-        triggered = [
-            stop_loss for stop_loss in trade.stop_losses if stop_loss.sold_amount != 0
-        ]
-        return len(triggered) > 0
-
     if show_trades:
-        pretty_print_trades(backtest_report, precision=precision)
+        pretty_print_trades(
+            backtest_report,
+            precision=precision,
+            max_rows=max_rows,
+            view=view,
+            output_file=get_output_file("trades")
+        )
 
     if show_stop_losses:
         pretty_print_stop_losses(
             backtest_report=backtest_report,
             precision=precision,
-            triggered_only=show_triggered_stop_losses_only
+            triggered_only=show_triggered_stop_losses_only,
+            max_rows=max_rows,
+            view=view,
+            output_file=get_output_file("stop_losses")
         )
 
     if show_take_profits:
         pretty_print_take_profits(
             backtest_report=backtest_report,
             precision=precision,
-            triggered_only=show_triggered_take_profits_only
+            triggered_only=show_triggered_take_profits_only,
+            max_rows=max_rows,
+            view=view,
+            output_file=get_output_file("take_profits")
         )
 
 
-def load_backtest_report(file_path: str) -> BacktestReport:
+def load_backtest_report(
+    file_path: str, summary_only=False
+) -> BacktestReport:
     """
-    Load a backtest report from a file.
+    Load a backtest report from a file. Both json reports and
+    backtest report archives are supported. The sections of a
+    backtest report archive are loaded when they are accessed.
 
     param file_path: The file path
+    param summary_only: Only load the summary of the report, without
+        the positions, trades, orders and traces sections. Only the
+        header of an archive is read, a json report has no header
+        so it is parsed in full and the sections are dropped
     :return: The backtest report
     """
 
     if not os.path.isfile(file_path):
         raise OperationalException("File does not exist")
 
+    if is_backtest_report_archive(file_path):
+
+        if summary_only:
+            return BacktestReport.from_dict(
+                read_backtest_report_archive_header(file_path)["report"]
+            )
+
+        return load_backtest_report_archive(file_path)
+
     if not file_path.endswith(".json"):
         raise OperationalException("File is not a json file")
 
-    with open(file_path, 'r') as json_file:
-        data = json.load(json_file)
-
-    return BacktestReport.from_dict(data)
+    return BacktestReport.from_dict(
+        _read_backtest_report_data(file_path, summary_only)
+    )
 
 
-def load_backtest_reports(folder_path: str) -> List[BacktestReport]:
+def load_backtest_reports(
+    folder_path: str, summary_only=False, max_workers=None, use_processes=False
+) -> List[BacktestReport]:
     """
-    Load backtest reports from a folder.
+    Load backtest reports from a folder. The report files are parsed
+    in parallel, see iterate_backtest_reports.
 
     param folder_path: The folder path
+    param summary_only: Only load the summaries of the reports
+    param max_workers: The maximum number of workers that parse reports
+    param use_processes: Parse the json reports in separate processes
     :return: The backtest reports
     """
-    backtest_reports = []
+    return list(
+        iterate_backtest_reports(
+            folder_path,
+            summary_only=summary_only,
+            max_workers=max_workers,
+            use_processes=use_processes
+        )
+    )
+
+
+def iterate_backtest_reports(
+    folder_path: str, summary_only=False, max_workers=None, use_processes=False
+) -> Iterator[BacktestReport]:
+    """
+    Iterate over the backtest reports in a folder. Reports are yielded
+    in the order of the files in the folder while they are loaded, so
+    only a few reports are kept in memory at a time.
+
+    With summary_only, reports are created from the backtest report
+    index of the folder when it has one, and only the files that are
+    not in the index are read. Of an archive only the header is read.
+    A json report that is not in the index is parsed in full, json
+    has no header to read the summary from, and the positions, trades,
+    orders and traces sections are dropped after parsing. Use
+    rebuild_backtest_report_index to index a folder of json reports
+    once, so later summaries don't parse them.
+
+    The report files are parsed by a pool of threads, or by a pool of
+    processes if use_processes is set. Parsing json is cpu bound, so
+    processes are faster for large json reports.
+
+    param folder_path: The folder path
+    param summary_only: Only load the summaries of the reports
+    param max_workers: The maximum number of workers that parse reports
+    param use_processes: Parse the json reports in separate processes
+    :return: Iterator of backtest reports
+    """
+
+    files = _get_backtest_report_files(folder_path)
+    indexed = {}
+
+    if summary_only:
+        indexed = {
+            entry["path"]: entry for entry in read_backtest_report_index(
+                folder_path, rebuild=False
+            ).values()
+        }
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    executor_class = ProcessPoolExecutor if use_processes \
+        else ThreadPoolExecutor
+
+    with executor_class(max_workers=max_workers) as executor:
+        # Only a bounded number of files is parsed ahead of the consumer
+        pending = deque()
+
+        for file in files:
+            pending.append(
+                _submit_backtest_report(
+                    executor,
+                    os.path.join(folder_path, file),
+                    summary_only,
+                    indexed.get(file)
+                )
+            )
+
+            if len(pending) >= max_workers * 2:
+                yield _get_backtest_report(pending.popleft())
+
+        while pending:
+            yield _get_backtest_report(pending.popleft())
+
+
+def load_backtest_reports_evaluation(
+    folder_path: str, max_workers=None, use_processes=False
+) -> BacktestReportsEvaluation:
+    """
+    Load a backtest reports evaluation of the backtest reports in a
+    folder. Only the summaries of the reports are loaded for the
+    evaluation, a full report is loaded when it is requested from
+    the evaluation.
+
+    param folder_path: The folder path
+    param max_workers: The maximum number of workers that parse reports
+    param use_processes: Parse the json reports in separate processes
+    :return: The backtest reports evaluation
+    """
+    files = _get_backtest_report_files(folder_path)
+    reports = load_backtest_reports(
+        folder_path,
+        summary_only=True,
+        max_workers=max_workers,
+        use_processes=use_processes
+    )
+    return BacktestReportsEvaluation(
+        reports,
+        report_loader=lambda index: load_backtest_report(
+            os.path.join(folder_path, files[index])
+        )
+    )
+
+
+def _get_backtest_report_files(folder_path):
 
     if not os.path.exists(folder_path):
         raise OperationalException(f"Folder {folder_path} does not exist")
@@ -818,14 +1037,63 @@ def load_backtest_reports(folder_path: str) -> List[BacktestReport]:
     if not list_of_files:
         raise OperationalException(f"Folder {folder_path} is empty")
 
+    files = []
+
     for file in list_of_files:
-        if not file.endswith(".json"):
+        if not file.endswith(".json") \
+                and not is_backtest_report_archive(file):
             continue
-        file_path = os.path.join(folder_path, file)
-        report = load_backtest_report(file_path)
-        backtest_reports.append(report)
 
-    return backtest_reports
+        if file == BACKTEST_REPORT_INDEX_FILE_NAME:
+            continue
+
+        files.append(file)
+
+    return files
+
+
+def _read_backtest_report_data(file_path, summary_only=False):
+    """
+    Read the data of a json report. The whole file is parsed, also
+    with summary_only, the sections are dropped afterwards so they
+    are not kept in memory or sent back from a worker process.
+    """
+
+    with open(file_path, 'r') as json_file:
+        data = json.load(json_file)
+
+    if summary_only:
+
+        for section in [
+            "positions", "trades", "orders", "traces", "equity_curve"
+        ]:
+            data.pop(section, None)
+
+    return data
+
+
+def _submit_backtest_report(executor, file_path, summary_only, entry):
+
+    # The summary of the report is in the index
+    if entry is not None:
+        return entry
+
+    # Reading an archive only reads its header
+    if is_backtest_report_archive(file_path):
+        return load_backtest_report(file_path, summary_only)
+
+    return executor.submit(_read_backtest_report_data, file_path, summary_only)
+
+
+def _get_backtest_report(pending):
+
+    if isinstance(pending, BacktestReport):
+        return pending
+
+    if isinstance(pending, dict):
+        return BacktestReport.from_dict(pending)
+
+    return BacktestReport.from_dict(pending.result())
 
 
 def get_backtest_report(
@@ -835,7 +1103,8 @@ def get_backtest_report(
 ) -> BacktestReport:
     """
     Function to get a report based on the algorithm name and
-    backtest date range if it exists.
+    backtest date range if it exists. The report is looked up in the
+    backtest report index of the directory.
 
     Args:
         algorithm_name (str): The name of the algorithm
@@ -846,49 +1115,16 @@ def get_backtest_report(
         BacktestReport: The backtest report if it exists, otherwise None
     """
 
-    # Loop through all files in the output directory
-    for root, _, files in os.walk(directory):
-        for file in files:
-            # Check if the file contains the algorithm name
-            # and backtest date range
-            if is_backtest_report(os.path.join(root, file)):
-                # Read the file
-                with open(os.path.join(root, file), "r") as json_file:
-
-                    name = \
-                        get_algorithm_name_from_backtest_report_file(
-                            os.path.join(root, file)
-                        )
-
-                    if name == algorithm_name:
-
-                        if backtest_date_range is None:
-                            # Parse the JSON file
-                            report = json.load(json_file)
-                            # Convert the JSON file to a
-                            # BacktestReport object
-                            return BacktestReport.from_dict(report)
-
-                        backtest_start_date = \
-                            get_start_date_from_backtest_report_file(
-                                os.path.join(root, file)
-                            )
-                        backtest_end_date = \
-                            get_end_date_from_backtest_report_file(
-                                os.path.join(root, file)
-                            )
-
-                        if backtest_start_date == \
-                                backtest_date_range.start_date \
-                                and backtest_end_date == \
-                                backtest_date_range.end_date:
-                            # Parse the JSON file
-                            report = json.load(json_file)
-                            # Convert the JSON file to a
-                            # BacktestReport object
-                            return BacktestReport.from_dict(report)
-
-    return None
+    # The index of the directory maps the algorithm name and backtest
+    # date range to the report file, so no report files are scanned
+    entry = get_backtest_report_index_entry(
+        directory, algorithm_name, backtest_date_range
+    )
+
+    if entry is None:
+        return None
+
+    return load_backtest_report(entry["path"])
 
 
 def get_start_date_from_backtest_report_file(path: str) -> datetime:
@@ -957,8 +1193,8 @@ def is_backtest_report(path: str) -> bool:
         bool: True if the file is a backtest report file, otherwise False
     """
 
-    # Check if the file is a JSON file
-    if path.endswith(".json"):
+    # Check if the file is a JSON file or a backtest report archive
+    if path.endswith(".json") or is_backtest_report_archive(path):
 
         # Check if the file name matches the backtest
         # report file name pattern
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from dateutil.parser import parse
+
+from investing_algorithm_framework.domain.exceptions import \
+    OperationalException
+from investing_algorithm_framework.domain.models.backtesting import \
+    BacktestDateRange
+
+
+def create_walk_forward_date_ranges(
+    start_date,
+    end_date,
+    in_sample_window: timedelta,
+    out_of_sample_window: timedelta,
+    step: timedelta = None,
+    anchored: bool = False
+) -> List[Tuple[BacktestDateRange, BacktestDateRange]]:
+    """
+    Function to create the date ranges of a walk-forward backtest. Every
+    window is an in-sample date range, followed by an out-of-sample date
+    range that starts at the end of the in-sample date range.
+
+    Args:
+        start_date: The start date of the first in-sample date range
+        end_date: The latest end date of an out-of-sample date range
+        in_sample_window: The length of the in-sample date ranges
+        out_of_sample_window: The length of the out-of-sample date ranges
+        step: The time between the windows, defaults to the
+            out_of_sample_window, so the out-of-sample date ranges follow
+            each other
+        anchored: Let all in-sample date ranges start at the start_date,
+            so the in-sample date ranges grow with every window
+
+    Returns:
+        List of tuples with the in-sample and out-of-sample date range
+    """
+
+    if isinstance(start_date, str):
+        start_date = parse(start_date)
+
+    if isinstance(end_date, str):
+        end_date = parse(end_date)
+
+    if step is None:
+        step = out_of_sample_window
+
+    if in_sample_window <= timedelta(0) \
+            or out_of_sample_window <= timedelta(0) \
+            or step <= timedelta(0):
+        raise OperationalException(
+            "The windows and step of a walk-forward backtest "
+            "must be positive"
+        )
+
+    date_ranges = []
+
+    while True:
+        offset = step * len(date_ranges)
+        in_sample_end_date = start_date + offset + in_sample_window
+        out_of_sample_end_date = in_sample_end_date + out_of_sample_window
+
+        if out_of_sample_end_date > end_date:
+            break
+
+        number = len(date_ranges) + 1
+        date_ranges.append((
+            BacktestDateRange(
+                start_date=start_date if anchored else start_date + offset,
+                end_date=in_sample_end_date,
+                name=f"in_sample_{number}"
+            ),
+            BacktestDateRange(
+                start_date=in_sample_end_date,
+                end_date=out_of_sample_end_date,
+                name=f"out_of_sample_{number}"
+            )
+        ))
+
+    if len(date_ranges) == 0:
+        raise OperationalException(
+            "The date range is too short for a single walk-forward window "
+            f"(start_date: {start_date}, end_date: {end_date})"
+        )
+
+    return date_ranges
+
+
+def get_walk_forward_date_range(
+    walk_forward_date_ranges: List[Tuple[BacktestDateRange, BacktestDateRange]]
+) -> BacktestDateRange:
+    """
+    Function to get the date range that spans all the in-sample and
+    out-of-sample date ranges of a walk-forward backtest.
+
+    Args:
+        walk_forward_date_ranges: List of tuples with the in-sample and
+            out-of-sample date range
+
+    Returns:
+        BacktestDateRange: The date range of the walk-forward backtest
+    """
+    start_date: datetime = min(
+        date_range.start_date
+        for window in walk_forward_date_ranges for date_range in window
+    )
+    end_date: datetime = max(
+        date_range.end_date
+        for window in walk_forward_date_ranges for date_range in window
+    )
+    return BacktestDateRange(
+        start_date=start_date, end_date=end_date, name="walk_forward"
+    )
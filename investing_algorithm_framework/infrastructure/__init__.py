@@ -1,5 +1,5 @@
 from .database import setup_sqlalchemy, Session, \
-    create_all_tables
+    create_all_tables, backup_database
 from .models import SQLPortfolio, SQLOrder, SQLPosition, \
     SQLPortfolioSnapshot, SQLPositionSnapshot, SQLTrade, \
     CCXTOHLCVBacktestMarketDataSource, CCXTOrderBookMarketDataSource, \
@@ -10,12 +10,13 @@ from .repositories import SQLOrderRepository, SQLPositionRepository, \
     SQLPortfolioRepository, SQLTradeRepository, \
     SQLPortfolioSnapshotRepository, SQLPositionSnapshotRepository, \
     SQLTradeTakeProfitRepository, SQLTradeStopLossRepository, \
-    SQLOrderMetadataRepository
+    SQLOrderMetadataRepository, SQLPortfolioSyncWatermarkRepository
 from .services import PerformanceService, CCXTMarketService, \
     AzureBlobStorageStateHandler
 
 __all__ = [
     "create_all_tables",
+    "backup_database",
     "SQLPositionRepository",
     "SQLPortfolioRepository",
     "SQLOrderRepository",
@@ -45,5 +46,6 @@ __all__ = [
     "SQLTradeStopLoss",
     "SQLTradeTakeProfitRepository",
     "SQLTradeStopLossRepository",
-    "SQLOrderMetadataRepository"
+    "SQLOrderMetadataRepository",
+    "SQLPortfolioSyncWatermarkRepository"
 ]
@@ -1,6 +1,22 @@
 from .sql_alchemy import Session, setup_sqlalchemy, SQLBaseModel, \
-    create_all_tables
+    create_all_tables, unit_of_work, session_scope, commit_session, \
+    rollback_session, get_unit_of_work_session, is_unit_of_work_session, \
+    backup_database, get_write_generation, acquire_write_lock, \
+    after_unit_of_work
 
 __all__ = [
-    "Session", "setup_sqlalchemy", "SQLBaseModel", "create_all_tables"
+    "Session",
+    "setup_sqlalchemy",
+    "SQLBaseModel",
+    "create_all_tables",
+    "unit_of_work",
+    "session_scope",
+    "commit_session",
+    "rollback_session",
+    "get_unit_of_work_session",
+    "is_unit_of_work_session",
+    "backup_database",
+    "get_write_generation",
+    "acquire_write_lock",
+    "after_unit_of_work",
 ]
@@ -0,0 +1,69 @@
+import logging
+
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+
+def _add_trade_portfolio_id_and_market(connection):
+    """
+    Migration that adds the denormalized portfolio_id and market
+    columns to the trades table, and fills them for existing trades
+    based on the portfolio of the orders of the trade.
+    """
+    inspector = inspect(connection)
+
+    if "trades" not in inspector.get_table_names():
+        return
+
+    columns = [column["name"] for column in inspector.get_columns("trades")]
+
+    if "portfolio_id" not in columns:
+        connection.execute(text(
+            "ALTER TABLE trades ADD COLUMN portfolio_id INTEGER "
+            "REFERENCES portfolios(id)"
+        ))
+
+    if "market" not in columns:
+        connection.execute(
+            text("ALTER TABLE trades ADD COLUMN market VARCHAR")
+        )
+
+    connection.execute(text(
+        "UPDATE trades SET portfolio_id = ("
+        "SELECT positions.portfolio_id FROM order_trade "
+        "JOIN orders ON orders.id = order_trade.order_id "
+        "JOIN positions ON positions.id = orders.position_id "
+        "WHERE order_trade.trade_id = trades.id LIMIT 1"
+        ") WHERE portfolio_id IS NULL"
+    ))
+    connection.execute(text(
+        "UPDATE trades SET market = ("
+        "SELECT portfolios.market FROM portfolios "
+        "WHERE portfolios.id = trades.portfolio_id"
+        ") WHERE market IS NULL"
+    ))
+
+
+MIGRATIONS = [
+    _add_trade_portfolio_id_and_market,
+]
+
+
+def run_migrations(bind):
+    """
+    Function to migrate a database that has been created by an earlier
+    version of the framework to the current schema. All migrations
+    are idempotent, so they can be run on every startup.
+
+    Args:
+        bind: The engine or connection of the database
+
+    Returns:
+        None
+    """
+
+    with bind.begin() as connection:
+        for migration in MIGRATIONS:
+            logger.debug(f"Running migration {migration.__name__}")
+            migration(connection)
@@ -1,13 +1,48 @@
 import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 
-from sqlalchemy import create_engine, StaticPool
+from sqlalchemy import create_engine, StaticPool, QueuePool, event, \
+    make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI, \
-    OperationalException
+    OperationalException, SQLITE_PROFILE, SQLiteProfile, ENVIRONMENT, \
+    Environment, SQLITE_POOL_MODE, SQLitePoolMode, APP_MODE, AppMode
+from .migrations import run_migrations
 
 Session = sessionmaker()
 logger = logging.getLogger("investing_algorithm_framework")
+_unit_of_work_session = ContextVar("unit_of_work_session", default=None)
+_write_generation = 0
+# Lock that serializes the writing sessions in the threaded pool mode
+_write_lock = None
+# Seconds a connection waits for a lock of another connection
+SQLITE_BUSY_TIMEOUT = 30
+SQLITE_POOL_SIZE = 5
+SQLITE_POOL_MAX_OVERFLOW = 10
+SQLITE_PROFILE_PRAGMAS = {
+    SQLiteProfile.DEFAULT: {},
+    SQLiteProfile.LIVE: {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        # Negative values are in KiB, 64 MiB page cache
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+    },
+    SQLiteProfile.BACKTEST: {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "temp_store": "MEMORY",
+        "cache_size": -256000,
+        "mmap_size": 268435456,
+    },
+}
 
 
 class SQLAlchemyAdapter:
@@ -18,15 +53,128 @@ class SQLAlchemyAdapter:
                 or app.config[SQLALCHEMY_DATABASE_URI] is None:
             raise OperationalException("SQLALCHEMY_DATABASE_URI not set")
 
-        global Session
-        engine = create_engine(
-            app.config[SQLALCHEMY_DATABASE_URI],
-            connect_args={'check_same_thread': False},
-            poolclass=StaticPool
-        )
+        global Session, _write_lock
+        database_uri = app.config[SQLALCHEMY_DATABASE_URI]
+        pool_mode = get_sqlite_pool_mode(app.config)
+        profile = app.config.get(SQLITE_PROFILE)
+
+        if SQLitePoolMode.THREADED.equals(pool_mode):
+
+            if is_in_memory_database(database_uri):
+                raise OperationalException(
+                    "The THREADED sqlite pool mode is not supported for "
+                    "in memory databases"
+                )
+
+            engine = create_engine(
+                database_uri,
+                connect_args={
+                    'check_same_thread': False,
+                    'timeout': SQLITE_BUSY_TIMEOUT
+                },
+                poolclass=QueuePool,
+                pool_size=SQLITE_POOL_SIZE,
+                max_overflow=SQLITE_POOL_MAX_OVERFLOW
+            )
+            _write_lock = threading.RLock()
+
+            # Concurrent readers require write-ahead logging
+            if profile is None:
+                profile = SQLiteProfile.LIVE
+
+            set_sqlite_pragmas(engine, {"journal_mode": "WAL"})
+        else:
+            engine = create_engine(
+                database_uri,
+                connect_args={'check_same_thread': False},
+                poolclass=StaticPool
+            )
+            _write_lock = None
+
+        # Backtest databases are recreated on every run, so they
+        # don't need durability by default
+        if profile is None and app.config.get(ENVIRONMENT) is not None \
+                and Environment.BACKTEST.equals(app.config[ENVIRONMENT]):
+            profile = SQLiteProfile.BACKTEST
+
+        if profile is not None:
+            profile = SQLiteProfile.from_value(profile)
+            pragmas = SQLITE_PROFILE_PRAGMAS[profile]
+
+            if _write_lock is not None:
+                pragmas = {
+                    key: value for key, value in pragmas.items()
+                    if key != "journal_mode"
+                }
+
+            set_sqlite_pragmas(engine, pragmas)
+
         Session.configure(bind=engine)
 
 
+def get_sqlite_pool_mode(config):
+    """
+    Function to get the sqlite pool mode of the app. If the
+    SQLITE_POOL_MODE config key is not set, the THREADED mode is used
+    for file databases when the app runs in web mode, so that the web
+    API and the strategies don't share a single connection.
+
+    Args:
+        config: The config of the app
+
+    Returns:
+        SQLitePoolMode: The pool mode
+    """
+    pool_mode = config.get(SQLITE_POOL_MODE)
+
+    if pool_mode is not None:
+        return SQLitePoolMode.from_value(pool_mode)
+
+    if config.get(APP_MODE) is not None \
+            and AppMode.WEB.equals(config[APP_MODE]) \
+            and not is_in_memory_database(config[SQLALCHEMY_DATABASE_URI]):
+        return SQLitePoolMode.THREADED
+
+    return SQLitePoolMode.STATIC
+
+
+def is_in_memory_database(database_uri):
+    url = make_url(database_uri)
+    return url.get_backend_name() == "sqlite" \
+        and url.database in (None, "", ":memory:")
+
+
+def set_sqlite_pragmas(engine, profile):
+    """
+    Function to apply the pragmas of a SQLite profile to every
+    connection that is created by the engine.
+
+    Args:
+        engine: The SQLAlchemy engine
+        profile: The SQLiteProfile to apply, or a dict of pragmas
+
+    Returns:
+        None
+    """
+
+    if isinstance(profile, dict):
+        pragmas = profile
+    else:
+        pragmas = SQLITE_PROFILE_PRAGMAS[SQLiteProfile.from_value(profile)]
+
+    if engine.dialect.name != "sqlite" or len(pragmas) == 0:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+
+        for key, value in pragmas.items():
+            cursor.execute(f"PRAGMA {key}={value}")
+
+        cursor.close()
+
+
 def setup_sqlalchemy(app, throw_exception_if_not_set=True):
 
     try:
@@ -43,4 +191,294 @@ class SQLBaseModel(DeclarativeBase):
 
 
 def create_all_tables():
-    SQLBaseModel.metadata.create_all(bind=Session().bind)
+    bind = Session().bind
+    SQLBaseModel.metadata.create_all(bind=bind)
+
+    # create_all does not add new columns or indexes to tables that
+    # already exist, so make sure databases created by an earlier
+    # version get them as well
+    run_migrations(bind)
+
+    for table in SQLBaseModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+def backup_database(path):
+    """
+    Function to copy the current SQLite database to a file with the
+    SQLite online backup API, e.g. to inspect a backtest that has been
+    run against an in-memory database. An existing file at the
+    path is replaced.
+
+    Args:
+        path: The path of the file to write the database to
+
+    Returns:
+        None
+    """
+    engine = Session().bind
+
+    if engine.dialect.name != "sqlite":
+        raise OperationalException("Only SQLite databases can be backed up")
+
+    directory = os.path.dirname(path)
+
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    if os.path.exists(path):
+        os.remove(path)
+
+    target = sqlite3.connect(path)
+
+    try:
+        with engine.connect() as connection:
+            connection.connection.driver_connection.backup(target)
+    finally:
+        target.close()
+
+
+@event.listens_for(Session, "after_flush")
+def _register_write(session, flush_context):
+    global _write_generation
+    _write_generation += 1
+
+
+@event.listens_for(Session, "before_flush")
+def _acquire_write_lock(session, flush_context, instances):
+    acquire_write_lock(session)
+
+
+def acquire_write_lock(session):
+    """
+    Function to let a session take the write lock of the threaded pool
+    mode. Sessions take the lock at their first flush, this function
+    takes it earlier, e.g. to re-read a row before it is updated based
+    on its current value.
+
+    The lock is held by the session until its transaction ends, so
+    only one session at a time has uncommitted writes. Sessions that
+    only read never take the lock.
+
+    Args:
+        session: The session that takes the lock
+
+    Returns:
+        bool: True if the session holds the write lock, False if the
+            app does not use a write lock
+    """
+    lock = _write_lock
+
+    if lock is None:
+        return False
+
+    if "write_lock" not in session.info:
+        lock.acquire()
+        session.info["write_lock"] = lock
+
+    return True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _release_write_lock(session, transaction):
+
+    if transaction.parent is not None:
+        return
+
+    lock = session.info.pop("write_lock", None)
+
+    if lock is not None:
+        lock.release()
+
+
+def get_write_generation():
+    """
+    Function to get the write generation of the database. The write
+    generation is incremented every time a session flushes changes,
+    so read caches can use it to detect that cached objects
+    may be stale.
+
+    Returns:
+        int: The current write generation
+    """
+    return _write_generation
+
+
+def get_unit_of_work_session():
+    """
+    Function to get the session of the active unit of work.
+
+    Returns:
+        Session: The ambient session, None if there is no active
+            unit of work
+    """
+    return _unit_of_work_session.get()
+
+
+def after_unit_of_work(callback):
+    """
+    Function to run a callback once the active unit of work has
+    committed, e.g. to submit an order to an exchange only after the
+    order is stored. The callback runs after the session of the unit
+    of work is closed and its write lock is released, and it is
+    discarded if the unit of work rolls back. Without an active unit
+    of work, the callback runs immediately.
+
+    Args:
+        callback: Callable without arguments
+
+    Returns:
+        The result of the callback if it ran immediately, otherwise None
+    """
+    db = _unit_of_work_session.get()
+
+    if db is None:
+        return callback()
+
+    db.info.setdefault("after_commit", []).append(callback)
+    return None
+
+
+def _run_after_commit_callbacks(callbacks):
+
+    # A failing callback must not prevent the other callbacks from
+    # running, their changes are already committed
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(
+                f"Error running a callback after the unit of work: {e}"
+            )
+
+
+@contextmanager
+def unit_of_work(commit_on_error=False):
+    """
+    Context manager that runs a block of repository calls in a single
+    session. All repository calls inside the block join the ambient
+    session, share one identity map and are committed once when the
+    block exits. Nested units of work join the outer unit of work.
+
+    In the threaded pool mode the unit of work takes the write lock at
+    its first write and holds it until it exits, units of work that
+    only read never take it. Work that should not run inside the
+    transaction (e.g. network requests) can be scheduled to run after
+    the commit with after_unit_of_work. Updates that are based on the current
+    value of a row (e.g. the unallocated amount of a portfolio) re-read
+    the row under the write lock, see Repository.get_for_update.
+
+    Args:
+        commit_on_error: If set to True, the changes are committed
+            when the block raises an exception that is not a database
+            error, e.g. so that orders that are already submitted to an
+            exchange are not lost when a strategy raises an exception.
+
+    Returns:
+        Session: The ambient session
+    """
+    db = _unit_of_work_session.get()
+
+    if db is not None:
+        yield db
+        return
+
+    db = Session(expire_on_commit=False)
+    token = _unit_of_work_session.set(db)
+    rolled_back = False
+    committed = False
+
+    try:
+        yield db
+
+        # A database operation inside the block failed, but its error
+        # was handled by the block
+        if db.info.pop("rollback_only", False):
+            db.rollback()
+            rolled_back = True
+        else:
+            db.commit()
+            committed = True
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+    except Exception:
+
+        if commit_on_error and not db.info.pop("rollback_only", False):
+            try:
+                db.commit()
+                committed = True
+            except SQLAlchemyError as e:
+                logger.error(e)
+                db.rollback()
+        else:
+            db.rollback()
+
+        raise
+    finally:
+        _unit_of_work_session.reset(token)
+        callbacks = db.info.pop("after_commit", [])
+        db.close()
+        lock = db.info.pop("write_lock", None)
+
+        # The lock is already released if the session committed
+        # or rolled back a transaction
+        if lock is not None:
+            lock.release()
+
+        if committed:
+            _run_after_commit_callbacks(callbacks)
+
+    if rolled_back:
+        message = "The unit of work has been rolled back, because a " \
+            "database operation inside it failed"
+        logger.error(message)
+        raise OperationalException(message)
+
+
+@contextmanager
+def session_scope():
+    """
+    Context manager that yields the session of the active unit of work,
+    or a new session if there is no active unit of work.
+    """
+    db = _unit_of_work_session.get()
+
+    if db is not None:
+        yield db
+    else:
+        with Session() as db:
+            yield db
+
+
+def is_unit_of_work_session(db):
+    return db is not None and db is _unit_of_work_session.get()
+
+
+def commit_session(db):
+    """
+    Function to commit a session. The session of an active unit of work
+    is only flushed, it is committed when the unit of work exits.
+    """
+
+    if is_unit_of_work_session(db):
+        db.flush()
+    else:
+        db.commit()
+
+
+def rollback_session(db):
+    """
+    Function to roll back a session. The session of an active unit of
+    work is marked as rollback only, so that the unit of work rolls back
+    all its changes when it exits. If the block of the unit of work
+    handles the error and exits normally, the unit of work raises an
+    OperationalException after the rollback, so the lost changes
+    don't go unnoticed.
+    """
+
+    if is_unit_of_work_session(db):
+        db.info["rollback_only"] = True
+    else:
+        db.rollback()
@@ -3,7 +3,8 @@ from .market_data_sources import CCXTOrderBookMarketDataSource, \
     CCXTOHLCVBacktestMarketDataSource, CSVOHLCVMarketDataSource, \
     CSVTickerMarketDataSource
 from .order import SQLOrder, SQLOrderMetadata
-from .portfolio import SQLPortfolio, SQLPortfolioSnapshot
+from .portfolio import SQLPortfolio, SQLPortfolioSnapshot, \
+    SQLPortfolioSyncWatermark
 from .position import SQLPosition, SQLPositionSnapshot
 from .trades import SQLTrade, SQLTradeStopLoss, SQLTradeTakeProfit
 
@@ -23,4 +24,5 @@ __all__ = [
     "SQLTradeStopLoss",
     "SQLTradeTakeProfit",
     "SQLOrderMetadata",
+    "SQLPortfolioSyncWatermark",
 ]
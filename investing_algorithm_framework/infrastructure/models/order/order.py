@@ -1,7 +1,8 @@
 import logging
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, \
+    Float, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import OrderType, \
@@ -20,6 +21,17 @@ class SQLOrder(Order, SQLBaseModel, SQLAlchemyModelExtension):
     SQLOrder model based on the Order domain model.
     """
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_position_id_status", "position_id", "status"),
+        Index(
+            "ix_orders_status_target_symbol_order_side",
+            "status",
+            "target_symbol",
+            "order_side"
+        ),
+        Index("ix_orders_external_id", "external_id"),
+        Index("ix_orders_created_at", "created_at"),
+    )
     id = Column(Integer, primary_key=True, unique=True)
     external_id = Column(Integer)
     target_symbol = Column(String)
@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import Column, Integer, ForeignKey, Float
+from sqlalchemy import Column, Integer, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.infrastructure.database import SQLBaseModel
@@ -12,6 +12,10 @@ logger = logging.getLogger("investing_algorithm_framework")
 
 class SQLOrderMetadata(SQLBaseModel, SQLAlchemyModelExtension):
     __tablename__ = "sql_order_metadata"
+    __table_args__ = (
+        Index("ix_sql_order_metadata_order_id", "order_id"),
+        Index("ix_sql_order_metadata_trade_id", "trade_id"),
+    )
     id = Column(Integer, primary_key=True, unique=True)
     order_id = Column(Integer, ForeignKey('orders.id'))
     order = relationship('SQLOrder', back_populates='order_metadata')
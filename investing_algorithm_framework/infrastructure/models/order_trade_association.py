@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index
 from investing_algorithm_framework.infrastructure.database import SQLBaseModel
 
 # Association table
@@ -6,5 +6,8 @@ order_trade_association = Table(
     'order_trade',  # Table name
     SQLBaseModel.metadata,
     Column('order_id', Integer, ForeignKey('orders.id'), primary_key=True),
-    Column('trade_id', Integer, ForeignKey('trades.id'), primary_key=True)
+    Column('trade_id', Integer, ForeignKey('trades.id'), primary_key=True),
+    # The primary key covers lookups by order, this index covers
+    # lookups of the orders of a trade
+    Index('ix_order_trade_trade_id', 'trade_id')
 )
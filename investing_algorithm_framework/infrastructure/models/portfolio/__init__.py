@@ -1,4 +1,5 @@
 from .sql_portfolio import SQLPortfolio
 from .portfolio_snapshot import SQLPortfolioSnapshot
+from .portfolio_sync_watermark import SQLPortfolioSyncWatermark
 
-__all__ = ['SQLPortfolio', "SQLPortfolioSnapshot"]
+__all__ = ['SQLPortfolio', "SQLPortfolioSnapshot", "SQLPortfolioSyncWatermark"]
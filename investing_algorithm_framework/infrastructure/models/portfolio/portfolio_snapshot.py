@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import PortfolioSnapshot
@@ -11,6 +11,13 @@ class SQLPortfolioSnapshot(
     PortfolioSnapshot, SQLBaseModel, SQLAlchemyModelExtension
 ):
     __tablename__ = "portfolio_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_portfolio_snapshots_portfolio_id_created_at",
+            "portfolio_id",
+            "created_at"
+        ),
+    )
     id = Column(Integer, primary_key=True)
     portfolio_id = Column(String, nullable=False)
     trading_symbol = Column(String, nullable=False)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, \
+    UniqueConstraint
+
+from investing_algorithm_framework.infrastructure.database import SQLBaseModel
+from investing_algorithm_framework.infrastructure.models.model_extension \
+    import SQLAlchemyModelExtension
+
+
+class SQLPortfolioSyncWatermark(SQLBaseModel, SQLAlchemyModelExtension):
+    """
+    Order sync watermark of a portfolio for a symbol. Orders of the
+    symbol that have been created before the watermark do not need to be
+    retrieved from the exchange again on the next sync.
+    """
+    __tablename__ = "portfolio_sync_watermarks"
+    __table_args__ = (UniqueConstraint("portfolio_id", "symbol"),)
+    id = Column(Integer, primary_key=True, unique=True)
+    portfolio_id = Column(Integer, ForeignKey('portfolios.id'))
+    symbol = Column(String, nullable=False)
+    synced_at = Column(DateTime, nullable=False)
+
+    def __init__(self, portfolio_id, symbol, synced_at):
+        self.portfolio_id = portfolio_id
+        self.symbol = symbol
+        self.synced_at = synced_at
+
+    def get_synced_at(self):
+        return self.synced_at
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Index
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.orm import relationship, validates
 
@@ -26,6 +26,7 @@ class SQLPosition(SQLBaseModel, Position, SQLAlchemyModelExtension):
         UniqueConstraint(
             'symbol', 'portfolio_id', name='_symbol_portfolio_uc'
         ),
+        Index("ix_positions_portfolio_id", "portfolio_id"),
     )
 
     def __init__(
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import PositionSnapshot
@@ -11,6 +11,12 @@ class SQLPositionSnapshot(
     SQLBaseModel, PositionSnapshot, SQLAlchemyModelExtension
 ):
     __tablename__ = "position_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_position_snapshots_portfolio_snapshot_id",
+            "portfolio_snapshot_id"
+        ),
+    )
     id = Column(Integer, primary_key=True, unique=True)
     symbol = Column(String)
     amount = Column(Float)
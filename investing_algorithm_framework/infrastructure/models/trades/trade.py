@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index, \
+    ForeignKey
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import Trade, TradeStatus
@@ -28,6 +29,8 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
     * orders: str, the id of the buy order
     * target_symbol: str, the target symbol of the trade
     * trading_symbol: str, the trading symbol of the trade
+    * portfolio_id: int, the id of the portfolio of the trade
+    * market: str, the market of the portfolio of the trade
     * closed_at: datetime, the datetime when the trade was closed
     * remaining: float, the remaining amount of the trade
     * net_gain: float, the net gain of the trade
@@ -40,15 +43,31 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
     """
 
     __tablename__ = "trades"
+    __table_args__ = (
+        Index(
+            "ix_trades_status_target_symbol_trading_symbol",
+            "status",
+            "target_symbol",
+            "trading_symbol"
+        ),
+        Index("ix_trades_portfolio_id_status", "portfolio_id", "status"),
+    )
     id = Column(Integer, primary_key=True, unique=True)
+    # Relationships are loaded with a separate SELECT ... IN query for
+    # all trades of a listing, instead of joining them into the trade
+    # query. The detail path (see SQLTradeRepository) joins them in.
     orders = relationship(
         'SQLOrder',
         secondary=order_trade_association,
         back_populates='trades',
-        lazy='joined'
+        lazy='selectin'
     )
     target_symbol = Column(String)
     trading_symbol = Column(String)
+    # Denormalized from the portfolio of the buy order, so that portfolio
+    # scoped trade queries don't need to join orders and positions
+    portfolio_id = Column(Integer, ForeignKey('portfolios.id'))
+    market = Column(String)
     closed_at = Column(DateTime, default=None)
     opened_at = Column(DateTime, default=None)
     open_price = Column(Float, default=None)
@@ -65,13 +84,13 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
     stop_losses = relationship(
         'SQLTradeStopLoss',
         back_populates='trade',
-        lazy='joined'
+        lazy='selectin'
     )
     # Take profits should be actively loaded
     take_profits = relationship(
         'SQLTradeTakeProfit',
         back_populates='trade',
-        lazy='joined'
+        lazy='selectin'
     )
 
     def __init__(
@@ -93,11 +112,15 @@ class SQLTrade(Trade, SQLBaseModel, SQLAlchemyModelExtension):
         sell_orders=[],
         stop_losses=[],
         take_profits=[],
+        portfolio_id=None,
+        market=None,
     ):
         self.orders = [buy_order]
         self.open_price = buy_order.price
         self.target_symbol = target_symbol
         self.trading_symbol = trading_symbol
+        self.portfolio_id = portfolio_id
+        self.market = market
         self.closed_at = closed_at
         self.amount = amount
         self.filled_amount = filled_amount
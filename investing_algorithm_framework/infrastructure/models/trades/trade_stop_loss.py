@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, \
+    Boolean, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import TradeStopLoss
@@ -23,6 +24,7 @@ class SQLTradeStopLoss(TradeStopLoss, SQLBaseModel, SQLAlchemyModelExtension):
     """
 
     __tablename__ = "trade_stop_losses"
+    __table_args__ = (Index("ix_trade_stop_losses_trade_id", "trade_id"),)
     id = Column(Integer, primary_key=True, unique=True)
     trade_id = Column(Integer, ForeignKey('trades.id'))
     trade = relationship('SQLTrade', back_populates='stop_losses')
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, \
+    Boolean, Index
 from sqlalchemy.orm import relationship
 
 from investing_algorithm_framework.domain import TradeTakeProfit
@@ -24,6 +25,7 @@ class SQLTradeTakeProfit(
     """
 
     __tablename__ = "trade_take_profits"
+    __table_args__ = (Index("ix_trade_take_profits_trade_id", "trade_id"),)
     id = Column(Integer, primary_key=True, unique=True)
     trade_id = Column(Integer, ForeignKey('trades.id'))
     trade = relationship('SQLTrade', back_populates='take_profits')
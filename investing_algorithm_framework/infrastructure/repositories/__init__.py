@@ -2,6 +2,8 @@ from .order_repository import SQLOrderRepository
 from .order_metadata_repository import SQLOrderMetadataRepository
 from .portfolio_repository import SQLPortfolioRepository
 from .portfolio_snapshot_repository import SQLPortfolioSnapshotRepository
+from .portfolio_sync_watermark_repository import \
+    SQLPortfolioSyncWatermarkRepository
 from .position_repository import SQLPositionRepository
 from .position_snapshot_repository import SQLPositionSnapshotRepository
 from .trade_repository import SQLTradeRepository
@@ -17,5 +19,6 @@ __all__ = [
     "SQLTradeRepository",
     "SQLTradeTakeProfitRepository",
     "SQLTradeStopLossRepository",
-    "SQLOrderMetadataRepository"
+    "SQLOrderMetadataRepository",
+    "SQLPortfolioSyncWatermarkRepository",
 ]
@@ -1,7 +1,11 @@
+from sqlalchemy import func
+
 from investing_algorithm_framework.domain import OrderStatus, OrderType, \
     OrderSide
+from investing_algorithm_framework.infrastructure.database import \
+    session_scope
 from investing_algorithm_framework.infrastructure.models import SQLOrder, \
-    SQLPosition, SQLPortfolio
+    SQLPosition
 from .repository import Repository
 
 
@@ -33,20 +37,20 @@ class SQLOrderRepository(Repository):
         order_by_created_at_asc = self.get_query_param(
             "order_by_created_at_asc", query_params
         )
+        created_at_gte_query_param = self.get_query_param(
+            "created_at_gte", query_params
+        )
+        created_at_lte_query_param = self.get_query_param(
+            "created_at_lte", query_params
+        )
 
         if portfolio_query_param is not None:
-            portfolio = db.query(SQLPortfolio).filter_by(
-                id=portfolio_query_param
-            ).first()
-
-            if portfolio:
-                positions = db.query(SQLPosition).filter_by(
-                    portfolio_id=portfolio.id
-                ).all()
-                position_ids = [p.id for p in positions]
-                query = query.filter(SQLOrder.position_id.in_(position_ids))
-            else:
-                query = query.filter_by(id=None)
+            # Only select the ids of the positions, instead of loading
+            # the portfolio and its positions
+            position_ids = db.query(SQLPosition.id).filter_by(
+                portfolio_id=portfolio_query_param
+            )
+            query = query.filter(SQLOrder.position_id.in_(position_ids))
 
         if external_id_query_param:
             query = query.filter_by(external_id=external_id_query_param)
@@ -84,9 +88,56 @@ class SQLOrderRepository(Repository):
                 SQLOrder.trading_symbol == trading_symbol_query_param
             )
 
+        if created_at_gte_query_param is not None:
+            query = query.filter(
+                SQLOrder.created_at >= created_at_gte_query_param
+            )
+
+        if created_at_lte_query_param is not None:
+            query = query.filter(
+                SQLOrder.created_at <= created_at_lte_query_param
+            )
+
         if order_by_created_at_asc:
             query = query.order_by(SQLOrder.created_at.asc())
         else:
             query = query.order_by(SQLOrder.created_at.desc())
 
         return query
+
+    def get_pending_amounts(self, portfolio_id):
+        """
+        Function to get the total amount of all open orders of a
+        portfolio, grouped by symbol and order side in a single
+        aggregate query.
+
+        Args:
+            portfolio_id: The id of the portfolio
+
+        Returns:
+            dict: Mapping of (target_symbol, trading_symbol, order_side)
+                to the summed amount of the open orders
+        """
+
+        with session_scope() as db:
+            position_ids = db.query(SQLPosition.id).filter_by(
+                portfolio_id=portfolio_id
+            )
+            rows = db.query(
+                SQLOrder.target_symbol,
+                SQLOrder.trading_symbol,
+                SQLOrder.order_side,
+                func.sum(SQLOrder.amount),
+            ).filter(
+                SQLOrder.position_id.in_(position_ids),
+                SQLOrder.status == OrderStatus.OPEN.value,
+            ).group_by(
+                SQLOrder.target_symbol,
+                SQLOrder.trading_symbol,
+                SQLOrder.order_side,
+            ).all()
+
+        return {
+            (target_symbol, trading_symbol, order_side): amount or 0
+            for target_symbol, trading_symbol, order_side, amount in rows
+        }
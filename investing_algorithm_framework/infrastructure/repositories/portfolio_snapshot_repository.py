@@ -26,6 +26,9 @@ class SQLPortfolioSnapshotRepository(Repository):
         created_at_lte_query_param = self.get_query_param(
             "created_at_lte", query_params
         )
+        order_by_created_at_asc = self.get_query_param(
+            "order_by_created_at_asc", query_params
+        )
 
         if portfolio_id_query_param is not None:
             query = query.filter_by(portfolio_id=portfolio_id_query_param)
@@ -40,7 +43,7 @@ class SQLPortfolioSnapshotRepository(Repository):
 
         if created_at_gte_query_param is not None:
             query = query.filter(
-                SQLPortfolioSnapshot.created_at >= created_at_gt_query_param
+                SQLPortfolioSnapshot.created_at >= created_at_gte_query_param
             )
 
         if created_at_lt_query_param is not None:
@@ -53,4 +56,11 @@ class SQLPortfolioSnapshotRepository(Repository):
                 SQLPortfolioSnapshot.created_at <= created_at_lte_query_param
             )
 
+        if order_by_created_at_asc is not None:
+
+            if order_by_created_at_asc:
+                query = query.order_by(SQLPortfolioSnapshot.created_at.asc())
+            else:
+                query = query.order_by(SQLPortfolioSnapshot.created_at.desc())
+
         return query
@@ -0,0 +1,22 @@
+from investing_algorithm_framework.infrastructure.models import \
+    SQLPortfolioSyncWatermark
+from .repository import Repository
+
+
+class SQLPortfolioSyncWatermarkRepository(Repository):
+    base_class = SQLPortfolioSyncWatermark
+    DEFAULT_NOT_FOUND_MESSAGE = "Portfolio sync watermark not found"
+
+    def _apply_query_params(self, db, query, query_params):
+        portfolio_id_query_param = self.get_query_param(
+            "portfolio_id", query_params
+        )
+        symbol_query_param = self.get_query_param("symbol", query_params)
+
+        if portfolio_id_query_param is not None:
+            query = query.filter_by(portfolio_id=portfolio_id_query_param)
+
+        if symbol_query_param is not None:
+            query = query.filter_by(symbol=symbol_query_param)
+
+        return query
@@ -1,15 +1,32 @@
 import logging
+import os
 from abc import ABC, abstractmethod
+from datetime import date, datetime
 from typing import Callable
 
+import polars
+from sqlalchemy import create_engine
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session as SQLAlchemySession
 from werkzeug.datastructures import MultiDict
 
 from investing_algorithm_framework.domain import ApiException, \
-    DEFAULT_PAGE_VALUE, DEFAULT_PER_PAGE_VALUE
-from investing_algorithm_framework.infrastructure.database import Session
+    OperationalException, DEFAULT_PAGE_VALUE, DEFAULT_PER_PAGE_VALUE, \
+    PAGE, PER_PAGE
+from investing_algorithm_framework.infrastructure.database import \
+    session_scope, commit_session, rollback_session, unit_of_work, \
+    is_unit_of_work_session, get_write_generation, acquire_write_lock, \
+    get_unit_of_work_session, after_unit_of_work
 
 logger = logging.getLogger("investing_algorithm_framework")
+EXPORT_COLUMN_TYPES = {
+    int: polars.Int64,
+    float: polars.Float64,
+    str: polars.Utf8,
+    bool: polars.Boolean,
+    datetime: polars.Datetime,
+    date: polars.Date,
+}
 
 
 class Repository(ABC):
@@ -17,37 +34,137 @@ class Repository(ABC):
     DEFAULT_NOT_FOUND_MESSAGE = "The requested resource was not found"
     DEFAULT_PER_PAGE = DEFAULT_PER_PAGE_VALUE
     DEFAULT_PAGE = DEFAULT_PAGE_VALUE
+    DEFAULT_EXPORT_BATCH_SIZE = 10000
+    DEFAULT_STREAM_BATCH_SIZE = 1000
+    # Loader options (e.g. joinedload) that are used when a single
+    # object is retrieved with get
+    detail_load_options = ()
+
+    def unit_of_work(self, commit_on_error=False):
+        """
+        Function to start a unit of work. All repository calls inside
+        the unit of work share a single session and are committed
+        once when the unit of work exits.
+
+        Args:
+            commit_on_error: Commit the changes if the unit of work
+                exits with an exception that is not a database error
+
+        Returns:
+            Context manager that yields the ambient session
+        """
+        return unit_of_work(commit_on_error=commit_on_error)
+
+    def after_unit_of_work(self, callback):
+        """
+        Function to run a callback once the active unit of work has
+        committed, see after_unit_of_work in the database module.
+
+        Args:
+            callback: Callable without arguments
+
+        Returns:
+            The result of the callback if it ran immediately, otherwise None
+        """
+        return after_unit_of_work(callback)
+
+    def get_write_generation(self):
+        """
+        Function to get the write generation of the database, see
+        get_write_generation in the database module.
+        """
+        return get_write_generation()
+
+    def get_read_cache(self):
+        """
+        Function to get the read cache of the active unit of work. The
+        cache is stored in the session of the unit of work, so cached
+        objects are only served to the unit of work that loaded them,
+        and the cache is discarded when the unit of work exits. The cache
+        is emptied whenever a session flushes changes.
+
+        Returns:
+            dict: The read cache, None if there is no active unit of work
+        """
+        db = get_unit_of_work_session()
+
+        if db is None:
+            return None
+
+        generation = get_write_generation()
+
+        if db.info.get("read_cache_generation") != generation:
+            db.info["read_cache"] = {}
+            db.info["read_cache_generation"] = generation
+
+        return db.info["read_cache"]
 
     def create(self, data):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 created_object = self.base_class(**data)
                 db.add(created_object)
-                db.commit()
+                commit_session(db)
                 return self.get(created_object.id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error creating object")
 
+    def create_all(self, data_list):
+        """
+        Function to create multiple objects in a single transaction. All
+        objects are added to one session and flushed together, so that
+        the insert statements are executed as a batch instead of
+        one commit per object.
+
+        Args:
+            data_list: list of dicts with the data of the objects to create
+
+        Returns:
+            List of the created objects
+        """
+
+        with session_scope() as db:
+            try:
+                created_objects = [
+                    self.base_class(**data) for data in data_list
+                ]
+                db.add_all(created_objects)
+                db.flush()
+
+                # Detach the objects so their state (including the
+                # generated ids) remains available after the commit.
+                # Inside a unit of work the objects stay attached to
+                # the ambient session.
+                if not is_unit_of_work_session(db):
+                    db.expunge_all()
+
+                commit_session(db)
+                return created_objects
+            except SQLAlchemyError as e:
+                logger.error(e)
+                rollback_session(db)
+                raise ApiException("Error creating objects")
+
     def update(self, object_id, data):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 update_object = self.get(object_id)
                 update_object.update(data)
                 db.add(update_object)
-                db.commit()
+                commit_session(db)
                 return self.get(object_id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error updating object")
 
     def update_all(self, query_params, data):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 selection = self.get_all(query_params)
 
@@ -56,31 +173,31 @@ class Repository(ABC):
                         item.update(db, data)
                     except SQLAlchemyError as e:
                         logger.error(e)
-                        db.rollback()
+                        rollback_session(db)
 
-                db.commit()
+                commit_session(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error updating object")
 
     def delete(self, object_id):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 delete_object = self.get(object_id)
                 db.delete(delete_object)
-                db.commit()
+                commit_session(db)
                 return delete_object
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error deleting object")
 
     def delete_all(self, query_params):
 
-        with Session() as db:
+        with session_scope() as db:
             if query_params is None:
                 raise ApiException("No parameters are required")
 
@@ -92,32 +209,235 @@ class Repository(ABC):
 
                 for item in query_set.all():
                     item.delete(db)
-                    db.commit()
+                    commit_session(db)
 
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error deleting all objects")
 
     def get_all(self, query_params=None):
+        """
+        Function to get all objects that match the query params. The
+        selection can be limited with the pagination query params,
+        see apply_pagination.
+
+        Args:
+            query_params: The query params to filter the objects on
+
+        Returns:
+            List of the selected objects
+        """
         query_params = MultiDict(query_params)
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query_set = db.query(self.base_class)
                 query_set = self.apply_query_params(
                     db, query_set, query_params
                 )
+                query_set = self.apply_pagination(query_set, query_params)
                 return query_set.all()
             except SQLAlchemyError as e:
                 logger.error(e)
                 raise ApiException("Error getting all objects")
 
+    def paginate(self, query_params=None):
+        """
+        Function to get a single page of the objects that match the
+        query params. The page is selected with the page and per_page
+        query params, which default to the first page of
+        DEFAULT_PER_PAGE objects.
+
+        Args:
+            query_params: The query params to filter the objects on
+
+        Returns:
+            dict: The items of the page, the total number of matching
+                objects, the page and the number of items per page
+        """
+        query_params = MultiDict(query_params)
+        page = self._get_int_query_param(PAGE, query_params)
+        per_page = self._get_int_query_param(PER_PAGE, query_params)
+        page = self.DEFAULT_PAGE if page is None else page
+        per_page = self.DEFAULT_PER_PAGE if per_page is None else per_page
+        query_params[PAGE] = page
+        query_params[PER_PAGE] = per_page
+
+        with session_scope() as db:
+            try:
+                query_set = db.query(self.base_class)
+                query_set = self.apply_query_params(
+                    db, query_set, query_params
+                )
+                total = query_set.enable_eagerloads(False) \
+                    .order_by(None).count()
+                query_set = self.apply_pagination(query_set, query_params)
+                return {
+                    "items": query_set.all(),
+                    "total": total,
+                    PAGE: page,
+                    PER_PAGE: per_page,
+                }
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise ApiException("Error getting all objects")
+
+    def stream(self, query_params=None, batch_size=None):
+        """
+        Function to iterate over all objects that match the query
+        params without loading them all into memory. The rows are
+        fetched from the database in batches of batch_size.
+
+        Args:
+            query_params: The query params to filter the objects on
+            batch_size: The number of rows that are fetched at once
+
+        Returns:
+            Iterator of the selected objects
+        """
+        query_params = MultiDict(query_params)
+
+        if batch_size is None:
+            batch_size = self.DEFAULT_STREAM_BATCH_SIZE
+
+        with session_scope() as db:
+            try:
+                query_set = db.query(self.base_class)
+                query_set = self.apply_query_params(
+                    db, query_set, query_params
+                )
+                query_set = self.apply_pagination(query_set, query_params)
+                yield from query_set.yield_per(batch_size)
+            except SQLAlchemyError as e:
+                logger.error(e)
+                raise ApiException("Error streaming objects")
+
+    def apply_pagination(self, query, query_params):
+        """
+        Function to limit a query with the pagination query params.
+
+        The following query params are supported:
+            page and per_page: offset pagination by page number
+            limit and offset: offset pagination by row number
+            after_id: keyset pagination, only objects with an id larger
+                than after_id are selected, ordered by id. This stays
+                fast for pages deep into the history.
+
+        Args:
+            query: The query to limit
+            query_params: The query params
+
+        Returns:
+            The limited query
+        """
+
+        if query_params is None:
+            return query
+
+        page = self._get_int_query_param(PAGE, query_params)
+        per_page = self._get_int_query_param(PER_PAGE, query_params)
+        limit = self._get_int_query_param("limit", query_params)
+        offset = self._get_int_query_param("offset", query_params)
+        after_id = self._get_int_query_param("after_id", query_params)
+
+        if after_id is not None:
+            query = query.filter(self.base_class.id > after_id)\
+                .order_by(None).order_by(self.base_class.id.asc())
+
+        if page is not None or per_page is not None:
+            page = self.DEFAULT_PAGE if page is None else page
+            per_page = self.DEFAULT_PER_PAGE if per_page is None \
+                else per_page
+
+            if page < 1 or per_page < 1:
+                raise ApiException(
+                    "Page and per page must be positive numbers",
+                    status_code=400
+                )
+
+            limit = per_page
+            offset = (page - 1) * per_page
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        if offset is not None:
+            query = query.offset(offset)
+
+        return query
+
+    def _get_int_query_param(self, key, query_params):
+        value = self.get_query_param(key, query_params)
+
+        if value is None:
+            return None
+
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ApiException(
+                f"Query parameter {key} must be a number", status_code=400
+            )
+
     def get(self, object_id):
 
-        with Session() as db:
-            match = db.query(self.base_class).filter_by(id=object_id) \
-                .first()
+        with session_scope() as db:
+            # Session.get first checks the identity map, so objects
+            # that are already loaded in a unit of work are not queried
+            # again
+            match = None if object_id is None else db.get(
+                self.base_class,
+                object_id,
+                options=self.detail_load_options
+            )
+
+            if not match:
+                raise ApiException(
+                    self.DEFAULT_NOT_FOUND_MESSAGE, status_code=404
+                )
+
+            return match
+
+    def get_for_update(self, object_id):
+        """
+        Function to get an object that is updated based on its current
+        values, e.g. a balance that is increased. In the threaded pool
+        mode the session first takes the write lock and the object is
+        re-read from the database, so concurrent units of work can't
+        overwrite each other's updates. Without a write lock this
+        is the same as get.
+
+        The write lock is held until the unit of work exits, so the read
+        and the update must run in the same unit of work. Outside a unit
+        of work the lock would be released before the update, so an
+        OperationalException is raised.
+
+        Args:
+            object_id: The id of the object
+
+        Returns:
+            The object
+        """
+        if get_unit_of_work_session() is None:
+            raise OperationalException(
+                "get_for_update must be called inside a unit of work"
+            )
+
+        with session_scope() as db:
+
+            if not acquire_write_lock(db):
+                return self.get(object_id)
+
+            # Flush pending changes first, so they are not overwritten
+            # by the re-read
+            db.flush()
+            match = None if object_id is None else db.get(
+                self.base_class,
+                object_id,
+                options=self.detail_load_options,
+                populate_existing=True
+            )
 
             if not match:
                 raise ApiException(
@@ -126,6 +446,138 @@ class Repository(ABC):
 
             return match
 
+    def find_for_update(self, query_params):
+        """
+        Function to find an object that is updated based on its current
+        values, see get_for_update.
+        """
+        return self.get_for_update(self.find(query_params).id)
+
+    def get_export_schema(self):
+        """
+        Function to get the polars schema of the exported table. The
+        column types are derived from the column types of the table.
+
+        Returns:
+            dict: Mapping of column name to polars data type
+        """
+        schema = {}
+
+        for column in self.base_class.__table__.columns:
+
+            try:
+                python_type = column.type.python_type
+            except NotImplementedError:
+                python_type = str
+
+            schema[column.name] = EXPORT_COLUMN_TYPES.get(
+                python_type, polars.Utf8
+            )
+
+        return schema
+
+    def export(self, query_params=None, batch_size=None, database_path=None):
+        """
+        Function to export the table of the repository as typed polars
+        data frames. The rows are selected with the query params of the
+        repository and are read in batches directly from the database
+        cursor, without creating ORM objects.
+
+        Args:
+            query_params: The query params to filter the rows on
+            batch_size: The number of rows of each batch
+            database_path: Path of an sqlite database to export from
+                (e.g. the database of a finished backtest). If not set,
+                the database of the app is used.
+
+        Returns:
+            Iterator of polars DataFrames
+        """
+
+        if batch_size is None:
+            batch_size = self.DEFAULT_EXPORT_BATCH_SIZE
+
+        schema = self.get_export_schema()
+
+        if database_path is None:
+            with session_scope() as db:
+                yield from self._read_export_batches(
+                    db, query_params, batch_size, schema
+                )
+            return
+
+        if not os.path.isfile(database_path):
+            raise ApiException(f"Database {database_path} does not exist")
+
+        engine = create_engine(f"sqlite:///{database_path}")
+
+        try:
+            # Build the query on a session of the exported database, so
+            # the sub-queries of the query params are run against it
+            # instead of against the database of the app.
+            with SQLAlchemySession(bind=engine) as db:
+                yield from self._read_export_batches(
+                    db, query_params, batch_size, schema
+                )
+        finally:
+            engine.dispose()
+
+    def _read_export_batches(self, db, query_params, batch_size, schema):
+        query = db.query(self.base_class).enable_eagerloads(False)
+        query = self.apply_query_params(db, query, query_params)
+        statement = query.with_entities(
+            *self.base_class.__table__.columns
+        ).statement
+        yield from polars.read_database(
+            statement,
+            db.connection(),
+            iter_batches=True,
+            batch_size=batch_size,
+            schema_overrides=schema,
+        )
+
+    def export_to_parquet(
+        self,
+        directory,
+        query_params=None,
+        batch_size=None,
+        database_path=None
+    ):
+        """
+        Function to export the table of the repository to a parquet
+        dataset. Each batch is written to its own part file, so the
+        export never holds more than one batch in memory. The dataset
+        can be read with polars.scan_parquet(f"{directory}/*.parquet").
+
+        Args:
+            directory: The directory to write the part files to
+            query_params: The query params to filter the rows on
+            batch_size: The number of rows of each part file
+            database_path: Path of an sqlite database to export from
+
+        Returns:
+            List of the paths of the written part files
+        """
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+
+        for index, batch in enumerate(
+            self.export(query_params, batch_size, database_path)
+        ):
+            path = os.path.join(directory, f"part-{index:05d}.parquet")
+            batch.write_parquet(path)
+            paths.append(path)
+
+        # Write an empty part with the schema, so readers still
+        # get the typed columns
+        if len(paths) == 0:
+            path = os.path.join(directory, "part-00000.parquet")
+            polars.DataFrame(schema=self.get_export_schema()) \
+                .write_parquet(path)
+            paths.append(path)
+
+        return paths
+
     @abstractmethod
     def _apply_query_params(self, db, query, query_params):
         raise NotImplementedError()
@@ -139,9 +591,10 @@ class Repository(ABC):
         return query
 
     def exists(self, query_params):
-        with Session() as db:
+        with session_scope() as db:
             try:
-                query = db.query(self.base_class)
+                # Existence checks don't need any relationships
+                query = db.query(self.base_class).enable_eagerloads(False)
                 query = self.apply_query_params(db, query, query_params)
                 return query.first() is not None
             except SQLAlchemyError as e:
@@ -153,7 +606,7 @@ class Repository(ABC):
         if query_params is None or len(query_params) == 0:
             raise ApiException("Find requires query parameters")
 
-        with Session() as db:
+        with session_scope() as db:
             try:
                 query = db.query(self.base_class)
                 query = self.apply_query_params(db, query, query_params)
@@ -169,9 +622,10 @@ class Repository(ABC):
 
     def count(self, query_params=None):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
-                query = db.query(self.base_class)
+                # Counts don't need any relationships
+                query = db.query(self.base_class).enable_eagerloads(False)
                 query = self.apply_query_params(db, query, query_params)
                 return query.count()
             except SQLAlchemyError as e:
@@ -250,25 +704,34 @@ class Repository(ABC):
 
     def save(self, object):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
-                db.add(object)
-                db.commit()
+
+                if is_unit_of_work_session(db):
+                    object = db.merge(object)
+                else:
+                    db.add(object)
+
+                commit_session(db)
                 return self.get(object.id)
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error saving object")
 
     def save_objects(self, objects):
 
-        with Session() as db:
+        with session_scope() as db:
             try:
-                for object in objects:
-                    db.add(object)
-                db.commit()
+
+                if is_unit_of_work_session(db):
+                    objects = [db.merge(object) for object in objects]
+                else:
+                    db.add_all(objects)
+
+                commit_session(db)
                 return objects
             except SQLAlchemyError as e:
                 logger.error(e)
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error saving objects")
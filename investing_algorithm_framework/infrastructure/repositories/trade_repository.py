@@ -1,10 +1,13 @@
 import logging
+from sqlalchemy import func, case, and_
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 
-from investing_algorithm_framework.domain import OrderStatus, ApiException
-from investing_algorithm_framework.infrastructure.models import SQLPosition, \
-    SQLPortfolio, SQLTrade, SQLOrder
-from investing_algorithm_framework.infrastructure.database import Session
+from investing_algorithm_framework.domain import OrderStatus, ApiException, \
+    TradeStatus
+from investing_algorithm_framework.infrastructure.models import SQLTrade
+from investing_algorithm_framework.infrastructure.database import \
+    session_scope, commit_session, rollback_session, is_unit_of_work_session
 
 from .repository import Repository
 
@@ -14,6 +17,11 @@ logger = logging.getLogger("investing_algorithm_framework")
 class SQLTradeRepository(Repository):
     base_class = SQLTrade
     DEFAULT_NOT_FOUND_MESSAGE = "The requested trade was not found"
+    detail_load_options = (
+        joinedload(SQLTrade.orders),
+        joinedload(SQLTrade.stop_losses),
+        joinedload(SQLTrade.take_profits),
+    )
 
     def _apply_query_params(self, db, query, query_params):
         portfolio_query_param = self.get_query_param(
@@ -25,22 +33,34 @@ class SQLTradeRepository(Repository):
         )
         trading_symbol = self.get_query_param("trading_symbol", query_params)
         order_id_query_param = self.get_query_param("order_id", query_params)
+        market_query_param = self.get_query_param("market", query_params)
+        opened_at_gte_query_param = self.get_query_param(
+            "opened_at_gte", query_params
+        )
+        opened_at_lte_query_param = self.get_query_param(
+            "opened_at_lte", query_params
+        )
 
         if order_id_query_param:
             query = query.filter(SQLTrade.orders.any(id=order_id_query_param))
 
         if portfolio_query_param is not None:
-            portfolio = db.query(SQLPortfolio).filter_by(
-                id=portfolio_query_param
-            ).first()
+            query = query.filter(
+                SQLTrade.portfolio_id == portfolio_query_param
+            )
+
+        if market_query_param:
+            query = query.filter(SQLTrade.market == market_query_param)
 
-            if portfolio is None:
-                raise ApiException("Portfolio not found")
+        if opened_at_gte_query_param is not None:
+            query = query.filter(
+                SQLTrade.opened_at >= opened_at_gte_query_param
+            )
 
-            # Query trades belonging to the portfolio
-            query = db.query(SQLTrade).join(SQLOrder, SQLTrade.orders) \
-                .join(SQLPosition, SQLOrder.position_id == SQLPosition.id) \
-                .filter(SQLPosition.portfolio_id == portfolio.id)
+        if opened_at_lte_query_param is not None:
+            query = query.filter(
+                SQLTrade.opened_at <= opened_at_lte_query_param
+            )
 
         if status_query_param:
             status = OrderStatus.from_value(status_query_param)
@@ -58,14 +78,76 @@ class SQLTradeRepository(Repository):
         return query
 
     def add_order_to_trade(self, trade, order):
-        with Session() as db:
+        with session_scope() as db:
             try:
-                db.add(order)
-                db.add(trade)
-                trade.orders.append(order)
-                db.commit()
+
+                if is_unit_of_work_session(db):
+                    order = db.merge(order)
+                    trade = db.merge(trade)
+                else:
+                    db.add(order)
+                    db.add(trade)
+
+                if order not in trade.orders:
+                    trade.orders.append(order)
+
+                commit_session(db)
                 return trade
             except SQLAlchemyError as e:
                 logger.error(f"Error saving trade: {e}")
-                db.rollback()
+                rollback_session(db)
                 raise ApiException("Error saving trade")
+
+    def get_statistics(self, portfolio_id):
+        """
+        Function to get the aggregated trade statistics of a portfolio.
+        All statistics are calculated in a single aggregate query
+        over the trades table, instead of loading the trades.
+
+        Args:
+            portfolio_id: The id of the portfolio
+
+        Returns:
+            dict: The number of trades, open trades, closed trades,
+                positive and negative closed trades, the total duration
+                in hours of the closed trades and the total size of
+                all trades
+        """
+        closed = SQLTrade.status == TradeStatus.CLOSED.value
+        opened = SQLTrade.status == TradeStatus.OPEN.value
+
+        with session_scope() as db:
+            row = db.query(
+                func.count(SQLTrade.id),
+                func.sum(case((opened, 1), else_=0)),
+                func.sum(case((closed, 1), else_=0)),
+                func.sum(
+                    case((and_(closed, SQLTrade.net_gain > 0), 1), else_=0)
+                ),
+                func.sum(
+                    case((and_(closed, SQLTrade.net_gain < 0), 1), else_=0)
+                ),
+                func.sum(
+                    case(
+                        (
+                            closed,
+                            (
+                                func.julianday(SQLTrade.closed_at)
+                                - func.julianday(SQLTrade.opened_at)
+                            ) * 24
+                        ),
+                        else_=0
+                    )
+                ),
+                func.sum(SQLTrade.amount * SQLTrade.open_price),
+            ).filter(SQLTrade.portfolio_id == portfolio_id).one()
+
+        return {
+            "number_of_trades": row[0] or 0,
+            "number_of_trades_open": row[1] or 0,
+            "number_of_trades_closed": row[2] or 0,
+            "number_of_positive_trades": row[3] or 0,
+            "number_of_negative_trades": row[4] or 0,
+            "total_duration": row[5] or 0,
+            "total_size": row[6] or 0,
+        }
@@ -1,14 +1,17 @@
+import asyncio
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from time import sleep
 from typing import Dict
 
 import ccxt
+import ccxt.async_support as ccxt_async
 import polars as pl
 from dateutil import parser
 
 from investing_algorithm_framework.domain import OperationalException, Order, \
-    MarketService, DATETIME_FORMAT
+    MarketService, DATETIME_FORMAT, OrderType, OrderSide
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +19,15 @@ logger = logging.getLogger(__name__)
 class CCXTMarketService(MarketService):
     """
     Market service implementation using the CCXT library
+
+    Batches of orders (create_orders and cancel_orders) are submitted
+    concurrently with the async version of the CCXT exchange. CCXT
+    throttles the requests to the rate limit of the exchange, and at
+    most max_concurrent_requests requests are in flight at the same time.
     """
     msec = 1000
     minute = 60 * msec
+    max_concurrent_requests = 10
 
     def __init__(self, market_credential_service):
         super(CCXTMarketService, self).__init__(
@@ -57,6 +66,23 @@ class CCXTMarketService(MarketService):
 
         return exchange
 
+    def initialize_async_exchange(self, market, market_credential):
+        market = market.lower()
+        exchange_class = getattr(ccxt_async, market, None)
+
+        if exchange_class is None:
+            raise OperationalException(
+                f"No market service found for market id {market}"
+            )
+
+        config = {"enableRateLimit": True}
+
+        if market_credential is not None:
+            config["apiKey"] = market_credential.api_key
+            config["secret"] = market_credential.secret_key
+
+        return exchange_class(config)
+
     def pair_exists(self, target_symbol: str, trading_symbol: str, market):
         market_credential = self.get_market_credential(market)
         exchange = self.initialize_exchange(market, market_credential)
@@ -162,33 +188,20 @@ class CCXTMarketService(MarketService):
         market_credential = self.get_market_credential(market)
         exchange = self.initialize_exchange(market, market_credential)
 
-        if self.config is not None and "DATETIME_FORMAT" in self.config:
-            datetime_format = self.config["DATETIME_FORMAT"]
-        else:
-            datetime_format = DATETIME_FORMAT
-
         if not exchange.has['fetchOrders']:
             raise OperationalException(
                 f"Market service {market} does not support "
                 f"functionality get_orders"
             )
 
-        if since is not None:
-            since = exchange.parse8601(datetime_format)
+        since = self._to_timestamp(since)
 
-            try:
-                ccxt_orders = exchange.fetchOrders(symbol, since=since)
-                return [Order.from_ccxt_order(order) for order in ccxt_orders]
-            except Exception as e:
-                logger.exception(e)
-                raise OperationalException("Could not retrieve orders")
-        else:
-            try:
-                ccxt_orders = exchange.fetchOrders(symbol)
-                return [Order.from_ccxt_order(order) for order in ccxt_orders]
-            except Exception as e:
-                logger.exception(e)
-                raise OperationalException("Could not retrieve orders")
+        try:
+            ccxt_orders = exchange.fetchOrders(symbol, since=since)
+            return [Order.from_ccxt_order(order) for order in ccxt_orders]
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException("Could not retrieve orders")
 
     def get_balance(self, market) -> Dict[str, float]:
         market_credential = self.get_market_credential(market)
@@ -308,9 +321,148 @@ class CCXTMarketService(MarketService):
             )
 
         exchange.cancelOrder(
-            order.get_order_reference(),
+            order.get_external_id(),
             f"{order.get_target_symbol()}/{order.get_trading_symbol()}")
 
+    def create_orders(self, orders, market):
+        """
+        Function to submit a batch of independent orders concurrently.
+        A single exchange instance is used for the whole batch.
+
+        Args:
+            orders: List of Order objects that need to be submitted
+            market: The market to submit the orders to
+
+        Returns:
+            List with for each order, in the same order, the order
+            as registered by the market or the exception that was raised
+            when submitting the order.
+        """
+
+        if len(orders) == 0:
+            return []
+
+        return self._run_async(
+            self._run_batch(market, orders, self._submit_order_async)
+        )
+
+    def cancel_orders(self, orders, market):
+        """
+        Function to cancel a batch of orders concurrently.
+
+        Args:
+            orders: List of Order objects that need to be cancelled
+            market: The market of the orders
+
+        Returns:
+            List with for each order, in the same order, None if the
+            order was cancelled or the exception that was raised.
+        """
+
+        if len(orders) == 0:
+            return []
+
+        return self._run_async(
+            self._run_batch(market, orders, self._cancel_order_async)
+        )
+
+    async def _run_batch(self, market, orders, function):
+        market_credential = self.get_market_credential(market)
+        exchange = self.initialize_async_exchange(market, market_credential)
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def run(order):
+            async with semaphore:
+                return await function(exchange, order, market)
+
+        try:
+            return await asyncio.gather(
+                *[run(order) for order in orders], return_exceptions=True
+            )
+        finally:
+            await exchange.close()
+
+    async def _submit_order_async(self, exchange, order, market):
+        symbol = f"{order.get_target_symbol().upper()}/" \
+                 f"{order.get_trading_symbol().upper()}"
+
+        if OrderType.LIMIT.equals(order.get_order_type()):
+            args = (symbol, order.get_amount(), order.get_price())
+
+            if OrderSide.BUY.equals(order.get_order_side()):
+                functionality = "createLimitBuyOrder"
+            else:
+                functionality = "createLimitSellOrder"
+        else:
+
+            if OrderSide.BUY.equals(order.get_order_side()):
+                raise OperationalException("Market buy order not supported")
+
+            functionality = "createMarketSellOrder"
+            args = (symbol, order.get_amount())
+
+        if not exchange.has[functionality]:
+            raise OperationalException(
+                f"Market service {market} does not support "
+                f"functionality {functionality}"
+            )
+
+        try:
+            ccxt_order = await getattr(exchange, functionality)(*args)
+            return Order.from_ccxt_order(ccxt_order)
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException(
+                f"Could not create order for symbol {symbol}"
+            )
+
+    async def _cancel_order_async(self, exchange, order, market):
+
+        if not exchange.has['cancelOrder']:
+            raise OperationalException(
+                f"Market service {market} does not support "
+                f"functionality cancel_order"
+            )
+
+        try:
+            await exchange.cancelOrder(
+                order.get_external_id(),
+                f"{order.get_target_symbol()}/{order.get_trading_symbol()}"
+            )
+        except Exception as e:
+            logger.exception(e)
+            raise OperationalException(
+                f"Could not cancel order {order.get_external_id()}"
+            )
+
+    @staticmethod
+    def _to_timestamp(value):
+        """
+        Function to convert a datetime to a CCXT millisecond timestamp.
+        Naive datetimes are expected to be in UTC.
+        """
+
+        if value is None:
+            return None
+
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+
+        return int(value.timestamp() * 1000)
+
+    @staticmethod
+    def _run_async(coroutine):
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        # An event loop is already running in this thread (e.g. in a
+        # notebook), so run the coroutine in its own thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
     def get_open_orders(
         self, market, target_symbol: str = None, trading_symbol: str = None
     ):
@@ -335,7 +487,11 @@ class CCXTMarketService(MarketService):
             raise OperationalException("Could not retrieve open orders")
 
     def get_closed_orders(
-        self, market, target_symbol: str = None, trading_symbol: str = None
+        self,
+        market,
+        target_symbol: str = None,
+        trading_symbol: str = None,
+        since: datetime = None
     ):
         market_credential = self.get_market_credential(market)
         exchange = self.initialize_exchange(market, market_credential)
@@ -346,12 +502,14 @@ class CCXTMarketService(MarketService):
                 f"functionality get_closed_orders"
             )
 
+        since = self._to_timestamp(since)
+
         try:
             if target_symbol is None or trading_symbol is None:
-                return exchange.fetchClosedOrders()
+                return exchange.fetchClosedOrders(since=since)
 
             symbol = f"{target_symbol.upper()}/{trading_symbol.upper()}"
-            ccxt_orders = exchange.fetchClosedOrders(symbol)
+            ccxt_orders = exchange.fetchClosedOrders(symbol, since=since)
             return [Order.from_ccxt_order(order) for order in ccxt_orders]
         except Exception as e:
             logger.exception(e)
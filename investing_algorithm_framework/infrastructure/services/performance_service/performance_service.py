@@ -1,7 +1,6 @@
 import logging
 
-from investing_algorithm_framework.domain import OrderStatus, OrderSide, \
-    TradeStatus
+from investing_algorithm_framework.domain import OrderSide
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +34,97 @@ class PerformanceService:
     def get_total_cost(self, portfolio_id):
         pass
 
+    def get_backtest_statistics(
+        self, portfolio_id, tickers, backtest_profile
+    ):
+        """
+        Get all statistics of a backtest report. This function will
+        collect the trade statistics and the pending order amounts
+        with a single aggregate query each, and calculate all metrics
+        from these aggregates. The number of queries is therefore
+        independent of the number of metrics and positions.
+
+        param portfolio_id: The id of the portfolio
+        type portfolio_id: str
+        param tickers: The tickers of the market
+        type tickers: dict
+        param backtest_profile: The backtest profile
+        type backtest_profile: BacktestProfile
+
+        return: dict with the statistics of the backtest, the
+            pending amounts are keyed by (target_symbol, order_side)
+        """
+        portfolio = self.portfolio_repository.find({"id": portfolio_id})
+        positions = self.position_repository.get_all(
+            {"portfolio_id": portfolio.id}
+        )
+        trade_statistics = self.trade_repository.get_statistics(portfolio.id)
+        pending_amounts = self.order_repository.get_pending_amounts(
+            portfolio.id
+        )
+        total_value = self._calculate_total_value(
+            portfolio, positions, pending_amounts, tickers
+        )
+        initial_unallocated = backtest_profile.initial_unallocated
+        growth = total_value - initial_unallocated
+
+        if portfolio.total_net_gain == 0:
+            total_net_gain_percentage = 0
+        else:
+            total_net_gain_percentage = portfolio.total_net_gain \
+                / initial_unallocated * 100
+
+        return {
+            **self._calculate_trade_statistics(trade_statistics),
+            "total_value": total_value,
+            "growth": growth,
+            "growth_rate": growth / initial_unallocated * 100,
+            "total_net_gain_percentage": total_net_gain_percentage,
+            "pending_amounts": {
+                (target_symbol, order_side): amount
+                for (target_symbol, _, order_side), amount
+                in pending_amounts.items()
+            },
+        }
+
+    def _calculate_trade_statistics(self, trade_statistics):
+        number_of_trades = trade_statistics["number_of_trades"]
+        number_of_trades_closed = trade_statistics["number_of_trades_closed"]
+        percentage_positive_trades = 0.0
+        percentage_negative_trades = 0.0
+        average_trade_duration = 0
+        average_trade_size = 0
+
+        if number_of_trades_closed > 0:
+            percentage_positive_trades = \
+                trade_statistics["number_of_positive_trades"] \
+                / number_of_trades_closed * 100
+            percentage_negative_trades = \
+                trade_statistics["number_of_negative_trades"] \
+                / number_of_trades_closed * 100
+            average_trade_duration = \
+                trade_statistics["total_duration"] / number_of_trades_closed
+
+        if number_of_trades > 0:
+            average_trade_size = \
+                trade_statistics["total_size"] / number_of_trades
+
+        return {
+            "number_of_trades_closed": number_of_trades_closed,
+            "number_of_trades_open":
+                trade_statistics["number_of_trades_open"],
+            "percentage_positive_trades": percentage_positive_trades,
+            "percentage_negative_trades": percentage_negative_trades,
+            "average_trade_duration": average_trade_duration,
+            "average_trade_size": average_trade_size,
+        }
+
+    def _get_trade_statistics(self, portfolio_id):
+        portfolio = self.portfolio_repository.find({"id": portfolio_id})
+        return self._calculate_trade_statistics(
+            self.trade_repository.get_statistics(portfolio.id)
+        )
+
     def get_number_of_trades_closed(self, portfolio_id):
         """"
         Get the number of trades closed. This function will
@@ -45,10 +135,9 @@ class PerformanceService:
 
         return: The number of trades closed
         """
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        return self.trade_repository.count(
-            {"portfolio_id": portfolio.id, "status": TradeStatus.OPEN.value}
-        )
+        return self._get_trade_statistics(portfolio_id)[
+            "number_of_trades_closed"
+        ]
 
     def get_number_of_trades_open(self, portfolio_id):
         """
@@ -60,10 +149,9 @@ class PerformanceService:
 
         return: The number of trades open
         """
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        return self.trade_repository.count(
-            {"portfolio_id": portfolio.id, "status": TradeStatus.OPEN.value}
-        )
+        return self._get_trade_statistics(portfolio_id)[
+            "number_of_trades_open"
+        ]
 
     def get_percentage_positive_trades(self, portfolio_id):
         """
@@ -77,20 +165,9 @@ class PerformanceService:
 
         return: The percentage of positive trades
         """
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        trades = self.trade_repository.get_all(
-            {"portfolio_id": portfolio.id, "status": OrderStatus.CLOSED.value}
-        )
-        total_number_of_trades = len(trades)
-
-        if total_number_of_trades == 0:
-            return 0.0
-
-        positive_trades = [
-            trade for trade in trades if trade.net_gain > 0
+        return self._get_trade_statistics(portfolio_id)[
+            "percentage_positive_trades"
         ]
-        total_number_of_positive_trades = len(positive_trades)
-        return total_number_of_positive_trades / total_number_of_trades * 100
 
     def get_percentage_negative_trades(self, portfolio_id):
         """
@@ -104,21 +181,9 @@ class PerformanceService:
 
         return: The percentage of negative trades
         """
-
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        trades = self.trade_repository.get_all(
-            {"portfolio_id": portfolio.id, "status": TradeStatus.CLOSED.value}
-        )
-        total_number_of_trades = len(trades)
-
-        if total_number_of_trades == 0:
-            return 0.0
-
-        negative_trades = [
-            trade for trade in trades if trade.net_gain < 0
+        return self._get_trade_statistics(portfolio_id)[
+            "percentage_negative_trades"
         ]
-        total_number_of_negative_trades = len(negative_trades)
-        return total_number_of_negative_trades / total_number_of_trades * 100
 
     def get_growth_rate_of_backtest(
         self, portfolio_id, tickers, backtest_profile
@@ -206,6 +271,16 @@ class PerformanceService:
         positions = self.position_repository.get_all(
             {"portfolio_id": portfolio.id}
         )
+        pending_amounts = self.order_repository.get_pending_amounts(
+            portfolio.id
+        )
+        return self._calculate_total_value(
+            portfolio, positions, pending_amounts, tickers
+        )
+
+    def _calculate_total_value(
+        self, portfolio, positions, pending_amounts, tickers
+    ):
         allocated = 0
 
         for position in positions:
@@ -224,46 +299,24 @@ class PerformanceService:
 
             allocated += position.amount * tickers[ticker_symbol]["bid"]
 
-        # Calculate the pending sell value
-        pending_sell_orders = self.order_repository.get_all(
-            {
-                "portfolio_id": portfolio.id,
-                "status": OrderStatus.OPEN.value,
-                "order_side": OrderSide.SELL.value,
-            }
-        )
+        # Calculate the pending sell value, and the unallocated value
+        # by summing the unallocated and pending buy value
+        unallocated = portfolio.unallocated
 
-        for order in pending_sell_orders:
+        for (target_symbol, trading_symbol, order_side), amount \
+                in pending_amounts.items():
+            symbol = f"{target_symbol}/{trading_symbol}"
 
-            if order.get_symbol() in tickers:
-                allocated += order.get_amount() \
-                             * tickers[order.get_symbol()]["bid"]
-            else:
+            if symbol not in tickers:
                 logger.warning(
-                    f"Symbol {order.get_symbol()} not found in tickers, "
-                    f"cannot calculate the total value of sell orders"
+                    f"Symbol {symbol} not found in tickers, "
+                    f"cannot calculate the total value of "
+                    f"{order_side.lower()} orders"
                 )
-
-        # Calculate the unallocated value by summing the unallocated and
-        # pending buy value
-        unallocated = portfolio.unallocated
-        pending_buy_orders = self.order_repository.get_all(
-            {
-                "portfolio_id": portfolio.id,
-                "status": OrderStatus.OPEN.value,
-                "order_side": OrderSide.BUY.value,
-            }
-        )
-
-        for order in pending_buy_orders:
-            if order.get_symbol() in tickers:
-                unallocated += order.get_amount() \
-                             * tickers[order.get_symbol()]["ask"]
+            elif OrderSide.SELL.equals(order_side):
+                allocated += amount * tickers[symbol]["bid"]
             else:
-                logger.warning(
-                    f"Symbol {order.get_symbol()} not found in tickers, "
-                    f"cannot calculate the total value of buy orders"
-                )
+                unallocated += amount * tickers[symbol]["ask"]
 
         # Add everything together
         return allocated + unallocated
@@ -280,21 +333,9 @@ class PerformanceService:
 
         return: The average trade duration
         """
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        trades = self.trade_repository.get_all(
-            {"portfolio_id": portfolio.id, "status": TradeStatus.CLOSED.value}
-        )
-
-        if len(trades) == 0:
-            return 0
-
-        total_duration = 0
-
-        for trade in trades:
-            duration = trade.closed_at - trade.opened_at
-            total_duration += duration.total_seconds() / 3600
-
-        return total_duration / len(trades)
+        return self._get_trade_statistics(portfolio_id)[
+            "average_trade_duration"
+        ]
 
     def get_average_trade_size(self, portfolio_id):
         """
@@ -307,16 +348,6 @@ class PerformanceService:
 
         return: The average trade size
         """
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        portfolio = self.portfolio_repository.find({"id": portfolio_id})
-        trades = self.trade_repository.get_all({"portfolio_id": portfolio.id})
-
-        if len(trades) == 0:
-            return 0
-
-        total_size = 0
-
-        for trade in trades:
-            total_size += trade.amount * trade.open_price
-
-        return total_size / len(trades)
+        return self._get_trade_statistics(portfolio_id)[
+            "average_trade_size"
+        ]
@@ -3,7 +3,8 @@ from .configuration_service import ConfigurationService
 from .market_credential_service import MarketCredentialService
 from .market_data_source_service import MarketDataSourceService, \
     BacktestMarketDataSourceService
-from .order_service import OrderService, OrderBacktestService
+from .order_service import OrderService, OrderBacktestService, \
+    OrderPoller
 from .portfolios import PortfolioService, BacktestPortfolioService, \
     PortfolioConfigurationService, PortfolioSyncService, \
     PortfolioSnapshotService
@@ -23,6 +24,7 @@ __all__ = [
     "MarketDataSourceService",
     "BacktestService",
     "OrderBacktestService",
+    "OrderPoller",
     "ConfigurationService",
     "PortfolioSyncService",
     "PortfolioSnapshotService",
@@ -9,18 +9,17 @@ import logging
 
 from investing_algorithm_framework.domain import BacktestReport, \
     BACKTESTING_INDEX_DATETIME, TimeUnit, BacktestPosition, \
-    TradingDataType, OrderStatus, OperationalException, MarketDataSource, \
-    OrderSide, SYMBOLS, BacktestDateRange, DATETIME_FORMAT_BACKTESTING
+    TradingDataType, OperationalException, MarketDataSource, \
+    OrderSide, SYMBOLS, BacktestDateRange, DATETIME_FORMAT_BACKTESTING, \
+    BacktestReportFormat, write_backtest_report_archive, \
+    BACKTEST_REPORT_ARCHIVE_EXTENSION, get_backtest_report, \
+    add_backtest_report_to_index, BACKTESTING_EQUITY_CURVE_RESOLUTION, \
+    BACKTEST_REPORT_FILE_NAME_PATTERN
 from investing_algorithm_framework.services.market_data_source_service import \
     MarketDataSourceService
 
 
 logger = logging.getLogger(__name__)
-BACKTEST_REPORT_FILE_NAME_PATTERN = (
-    r"^report_\w+_backtest-start-date_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}_"
-    r"backtest-end-date_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}_"
-    r"created-at_\d{4}-\d{2}-\d{2}:\d{2}:\d{2}\.json$"
-)
 
 
 def validate_algorithm_name(name, illegal_chars=r"[\/:*?\"<>|]"):
@@ -47,7 +46,14 @@ def validate_algorithm_name(name, illegal_chars=r"[\/:*?\"<>|]"):
 class BacktestService:
     """
     Service that facilitates backtests for algorithm objects.
+
+    While a backtest runs, the total value of the portfolios is sampled
+    into an equity curve at the resolution of the
+    BACKTESTING_EQUITY_CURVE_RESOLUTION config (a timedelta or a number
+    of seconds, 0 samples every strategy run). The risk metrics of the
+    backtest report are calculated from the equity curve.
     """
+    DEFAULT_EQUITY_CURVE_RESOLUTION = timedelta(days=1)
 
     def __init__(
         self,
@@ -59,6 +65,7 @@ class BacktestService:
         configuration_service,
         portfolio_configuration_service,
         strategy_orchestrator_service,
+        portfolio_snapshot_service,
     ):
         self._resource_directory = None
         self._order_service = order_service
@@ -75,6 +82,8 @@ class BacktestService:
         self._configuration_service = configuration_service
         self._portfolio_configuration_service = portfolio_configuration_service
         self._strategy_orchestrator_service = strategy_orchestrator_service
+        self._portfolio_snapshot_service = portfolio_snapshot_service
+        self._equity_curve = []
 
     @property
     def resource_directory(self):
@@ -114,6 +123,11 @@ class BacktestService:
             f"Running backtest for algorithm with name {algorithm.name}"
         )
 
+        # Reset the snapshot policy state of any previous backtest
+        self._portfolio_snapshot_service.reset()
+        self._equity_curve = []
+        equity_curve_resolution = self._get_equity_curve_resolution()
+
         # Create backtest portfolio
         portfolio_configurations = \
             self._portfolio_configuration_service.get_all()
@@ -171,10 +185,29 @@ class BacktestService:
             #     strategy=algorithm.get_strategy(strategy_profile.strategy_id),
             #     index_date=index_date,
             # )
-            self.run_backtest_v2(
-                context=algorithm.context,
-                strategy=algorithm.get_strategy(strategy_profile.strategy_id)
-            )
+
+            # Each tick runs in a single unit of work
+            with self._order_service.unit_of_work():
+                self.run_backtest_v2(
+                    context=algorithm.context,
+                    strategy=algorithm.get_strategy(
+                        strategy_profile.strategy_id
+                    )
+                )
+
+            if len(self._equity_curve) == 0 or index_date \
+                    - self._equity_curve[-1][0] >= equity_curve_resolution:
+                self._sample_equity_curve(index_date)
+
+        # Always snapshot the final state of the portfolios, and write
+        # all buffered snapshots to the database
+        for portfolio in self._portfolio_service.get_all():
+            self._order_service.create_snapshot(portfolio.id)
+
+        self._portfolio_snapshot_service.flush()
+
+        if len(schedule) > 0 and self._equity_curve[-1][0] != index_date:
+            self._sample_equity_curve(index_date)
 
         report = self.create_backtest_report(
             algorithm, len(schedule), backtest_date_range, initial_unallocated
@@ -358,39 +391,18 @@ class BacktestService:
                 created_at=datetime.utcnow(),
             )
             backtest_report.number_of_runs = number_of_runs
-            backtest_report.number_of_orders = self._order_service.count({
-                "portfolio": portfolio.id
-            })
-            backtest_report.number_of_positions = \
-                self._position_repository.count({
-                    "portfolio": portfolio.id,
-                    "amount_gt": 0
-                })
-            backtest_report.percentage_negative_trades = \
-                self._performance_service \
-                    .get_percentage_negative_trades(portfolio.id)
-            backtest_report.percentage_positive_trades = \
-                self._performance_service \
-                    .get_percentage_positive_trades(portfolio.id)
-            backtest_report.number_of_trades_closed = \
-                self._performance_service \
-                    .get_number_of_trades_closed(portfolio.id)
-            backtest_report.number_of_trades_open = \
-                self._performance_service \
-                    .get_number_of_trades_open(portfolio.id)
-            backtest_report.total_cost = portfolio.total_cost
-            backtest_report.total_net_gain = portfolio.total_net_gain
-            backtest_report.total_net_gain_percentage = \
-                self._performance_service \
-                    .get_total_net_gain_percentage_of_backtest(
-                        portfolio.id, backtest_report
-                    )
             positions = self._position_repository.get_all({
                 "portfolio": portfolio.id
             })
             orders = self._order_service.get_all({
                 "portfolio": portfolio.id
             })
+            backtest_report.number_of_orders = len(orders)
+            backtest_report.number_of_positions = len(
+                [position for position in positions if position.amount > 0]
+            )
+            backtest_report.total_cost = portfolio.total_cost
+            backtest_report.total_net_gain = portfolio.total_net_gain
             tickers = {}
 
             for position in positions:
@@ -418,24 +430,29 @@ class BacktestService:
                             market=portfolio.market
                         )
 
-            backtest_report.growth_rate = self._performance_service \
-                .get_growth_rate_of_backtest(
-                    portfolio.id, tickers, backtest_report
-                )
-            backtest_report.growth = self._performance_service \
-                .get_growth_of_backtest(
-                    portfolio.id, tickers, backtest_report
-                )
-            backtest_report.total_value = self._performance_service \
-                .get_total_value(portfolio.id, tickers, backtest_report)
+            # All statistics are calculated from a single set of
+            # aggregate queries
+            statistics = self._performance_service.get_backtest_statistics(
+                portfolio.id, tickers, backtest_report
+            )
+            pending_amounts = statistics["pending_amounts"]
+            backtest_report.percentage_negative_trades = \
+                statistics["percentage_negative_trades"]
+            backtest_report.percentage_positive_trades = \
+                statistics["percentage_positive_trades"]
+            backtest_report.number_of_trades_closed = \
+                statistics["number_of_trades_closed"]
+            backtest_report.number_of_trades_open = \
+                statistics["number_of_trades_open"]
+            backtest_report.total_net_gain_percentage = \
+                statistics["total_net_gain_percentage"]
+            backtest_report.growth_rate = statistics["growth_rate"]
+            backtest_report.growth = statistics["growth"]
+            backtest_report.total_value = statistics["total_value"]
             backtest_report.average_trade_duration = \
-                self._performance_service \
-                    .get_average_trade_duration(portfolio.id)
+                statistics["average_trade_duration"]
             backtest_report.average_trade_size = \
-                self._performance_service.get_average_trade_size(portfolio.id)
-            positions = self._position_repository.get_all({
-                "portfolio": portfolio.id
-            })
+                statistics["average_trade_size"]
             backtest_positions = []
 
             for position in positions:
@@ -448,43 +465,19 @@ class BacktestService:
                     )
                     backtest_position.price = 1
                 else:
-                    pending_buy_orders = self._order_service.get_all({
-                        "portfolio": portfolio.id,
-                        "target_symbol": position.symbol,
-                        "status": OrderStatus.OPEN.value,
-                        "order_side": OrderSide.BUY.value
-                    })
-                    amount_in_pending_buy_orders = 0
-
-                    for order in pending_buy_orders:
-                        amount_in_pending_buy_orders += order.amount
-
-                    pending_sell_orders = self._order_service.get_all({
-                        "portfolio": portfolio.id,
-                        "target_symbol": position.symbol,
-                        "status": OrderStatus.OPEN.value,
-                        "order_side": OrderSide.SELL.value
-                    })
-                    amount_in_pending_sell_orders = 0
-
-                    for order in pending_sell_orders:
-                        amount_in_pending_sell_orders += order.amount
-
                     backtest_position = BacktestPosition(
                         position,
-                        amount_pending_buy=amount_in_pending_buy_orders,
-                        amount_pending_sell=amount_in_pending_sell_orders,
+                        amount_pending_buy=pending_amounts.get(
+                            (position.symbol, OrderSide.BUY.value), 0
+                        ),
+                        amount_pending_sell=pending_amounts.get(
+                            (position.symbol, OrderSide.SELL.value), 0
+                        ),
                         total_value_portfolio=backtest_report.total_value
                     )
-
-                    # Probably not needed
-                    ticker = self._market_data_source_service \
-                        .get_ticker(
-                            symbol=f"{position.symbol}"
-                                   f"/{portfolio.trading_symbol}",
-                            market=portfolio.market
-                        )
-                    backtest_position.price = ticker["bid"]
+                    ticker_symbol = \
+                        f"{position.symbol}/{portfolio.trading_symbol}"
+                    backtest_position.price = tickers[ticker_symbol]["bid"]
                 backtest_positions.append(backtest_position)
             backtest_report.positions = backtest_positions
             backtest_report.trades = algorithm.context.get_trades()
@@ -497,11 +490,88 @@ class BacktestService:
                 traces[strategy.strategy_id] = strategy_traces
 
             backtest_report.traces = traces
+            backtest_report.equity_curve = self.get_equity_curve()
 
             # Calculate metrics for the backtest report
             backtest_report.calculate_metrics()
+            backtest_report.calculate_equity_curve_metrics()
             return backtest_report
 
+    def get_equity_curve(self):
+        """
+        Function to get the equity curve of the last backtest run.
+
+        Returns:
+            DataFrame with a datetime index and the total_value and
+            allocated columns, or None if no samples were taken
+        """
+
+        if len(self._equity_curve) == 0:
+            return None
+
+        equity_curve = pd.DataFrame(
+            self._equity_curve,
+            columns=["datetime", "total_value", "allocated"]
+        )
+        return equity_curve.set_index("datetime")
+
+    def _get_equity_curve_resolution(self):
+        resolution = self._configuration_service.config.get(
+            BACKTESTING_EQUITY_CURVE_RESOLUTION
+        )
+
+        if resolution is None:
+            return self.DEFAULT_EQUITY_CURVE_RESOLUTION
+
+        if not isinstance(resolution, timedelta):
+            resolution = timedelta(seconds=resolution)
+
+        return resolution
+
+    def _sample_equity_curve(self, index_date):
+        """
+        Function to add the total value and allocated value of all
+        portfolios at the given date to the equity curve. Positions
+        without a registered ticker market data source are not valued.
+        """
+        total_value = 0
+        allocated = 0
+
+        for portfolio in self._portfolio_service.get_all():
+            tickers = {}
+            symbols = {
+                position.symbol for position in
+                self._position_repository.get_all(
+                    {"portfolio": portfolio.id}
+                )
+                if position.amount > 0
+            }
+            symbols.update(
+                target_symbol for target_symbol, _, _ in
+                self._order_service.get_pending_amounts(portfolio.id)
+            )
+            symbols.discard(portfolio.trading_symbol)
+
+            for symbol in symbols:
+                ticker_symbol = f"{symbol}/{portfolio.trading_symbol}"
+
+                if self._market_data_source_service\
+                        .has_ticker_market_data_source(
+                            symbol=ticker_symbol, market=portfolio.market
+                        ):
+                    tickers[ticker_symbol] = \
+                        self._market_data_source_service.get_ticker(
+                            ticker_symbol, market=portfolio.market
+                        )
+
+            value = self._performance_service.get_total_value(
+                portfolio.id, tickers, None
+            )
+            total_value += value
+            allocated += value - portfolio.unallocated
+
+        self._equity_curve.append((index_date, total_value, allocated))
+
     def set_backtest_market_data_sources(self, market_data_sources):
         self._backtest_market_data_sources = market_data_sources
 
@@ -551,7 +621,8 @@ class BacktestService:
     ) -> BacktestReport:
         """
         Function to get a report based on the algorithm name and
-        backtest date range if it exists.
+        backtest date range if it exists. The report is looked up in
+        the backtest report index of the directory.
 
         Args:
             algorithm_name: str - The name of the algorithm
@@ -562,41 +633,9 @@ class BacktestService:
             BacktestReport - The backtest report if it exists, otherwise None
         """
 
-        # Loop through all files in the output directory
-        for root, _, files in os.walk(directory):
-            for file in files:
-                # Check if the file contains the algorithm name
-                # and backtest date range
-                if self._is_backtest_report(os.path.join(root, file)):
-                    # Read the file
-                    with open(os.path.join(root, file), "r") as json_file:
-
-                        name = \
-                            self._get_algorithm_name_from_backtest_report_file(
-                                os.path.join(root, file)
-                            )
-
-                        if name == algorithm_name:
-                            backtest_start_date = \
-                                self._get_start_date_from_backtest_report_file(
-                                    os.path.join(root, file)
-                                )
-                            backtest_end_date = \
-                                self._get_end_date_from_backtest_report_file(
-                                    os.path.join(root, file)
-                                )
-
-                            if backtest_start_date == \
-                                    backtest_date_range.start_date \
-                                    and backtest_end_date == \
-                                    backtest_date_range.end_date:
-                                # Parse the JSON file
-                                report = json.load(json_file)
-                                # Convert the JSON file to a
-                                # BacktestReport object
-                                return BacktestReport.from_dict(report)
-
-        return None
+        return get_backtest_report(
+            directory, algorithm_name, backtest_date_range
+        )
 
     def _get_start_date_from_backtest_report_file(self, path: str) -> datetime:
         """
@@ -671,8 +710,9 @@ class BacktestService:
             bool - True if the file is a backtest report file, otherwise False
         """
 
-        # Check if the file is a JSON file
-        if path.endswith(".json"):
+        # Check if the file is a JSON file or a backtest report archive
+        if path.endswith(".json") \
+                or path.endswith(BACKTEST_REPORT_ARCHIVE_EXTENSION):
 
             # Check if the file name matches the backtest
             # report file name pattern
@@ -683,6 +723,57 @@ class BacktestService:
 
         return False
 
+    def write_report(
+        self,
+        report: BacktestReport,
+        output_directory: str,
+        report_format=BacktestReportFormat.JSON
+    ) -> None:
+        """
+        Function to write a backtest report to a file in the given
+        report format.
+
+        Args:
+            - report: BacktestReport
+                The backtest report to write to a file.
+            - output_directory: str
+                The directory to store the backtest report file.
+            - report_format: BacktestReportFormat (default=JSON)
+                The file format of the backtest report.
+
+        Returns:
+            - None
+        """
+
+        if BacktestReportFormat.ARCHIVE.equals(report_format):
+            self.write_report_to_archive(report, output_directory)
+        else:
+            self.write_report_to_json(report, output_directory)
+
+    def write_report_to_archive(
+        self, report: BacktestReport, output_directory: str
+    ) -> None:
+        """
+        Function to write a backtest report to a backtest report
+        archive, see write_backtest_report_archive.
+
+        Args:
+            - report: BacktestReport
+                The backtest report to write to a file.
+            - output_directory: str
+                The directory to store the backtest report file.
+
+        Returns:
+            - None
+        """
+        file_path = self.create_report_file_path(
+            report,
+            output_directory,
+            extension=BACKTEST_REPORT_ARCHIVE_EXTENSION
+        )
+        write_backtest_report_archive(report, file_path)
+        add_backtest_report_to_index(output_directory, report, file_path)
+
     def write_report_to_json(
         self, report: BacktestReport, output_directory: str
     ) -> None:
@@ -714,6 +805,8 @@ class BacktestService:
         with open(json_file_path, "w") as json_file:
             json_file.write(json_data)
 
+        add_backtest_report_to_index(output_directory, report, json_file_path)
+
     @staticmethod
     def create_report_name(report, output_directory, extension=".json"):
         backtest_start_date = report.backtest_start_date \
@@ -28,13 +28,25 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
     The main difference between MarketDataSourceService and
     the BacktestMarketDataSourceService is that it will
     prepare the data for backtesting in the constructor.
+
+    When a backtest_data_date_range is given, the data is prepared for
+    that date range instead of the date range of the backtest, and the
+    prepared market data sources are kept in the given
+    prepared_market_data_sources dict. A later backtest within the same
+    date range (e.g. the windows of a walk-forward backtest) reuses the
+    prepared market data sources instead of preparing the data again.
+    Prepared market data sources are only reused for market data sources
+    with the same configuration, so e.g. candidates with different
+    window sizes each get their own warm-up data.
     """
     def __init__(
         self,
         market_service: MarketService,
         market_credential_service: MarketCredentialService,
         configuration_service: ConfigurationService,
-        market_data_sources: List[BacktestMarketDataSource] = None
+        market_data_sources: List[BacktestMarketDataSource] = None,
+        backtest_data_date_range=None,
+        prepared_market_data_sources: dict = None
     ):
         super().__init__(
             market_service=market_service,
@@ -43,6 +55,11 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
             configuration_service=configuration_service
         )
         self.market_data_sources = []
+        self._backtest_data_date_range = backtest_data_date_range
+        self._prepared_market_data_sources = prepared_market_data_sources
+
+        if self._prepared_market_data_sources is None:
+            self._prepared_market_data_sources = {}
 
         # Add all market data sources to the list
         if market_data_sources is not None:
@@ -53,20 +70,42 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
         config = self._configuration_service.get_config()
         backtest_start_date = config[BACKTESTING_START_DATE]
         backtest_end_date = config[BACKTESTING_END_DATE]
-        backtest_market_data_sources = [
-            market_data_source.to_backtest_market_data_source() for
-            market_data_source in self._market_data_sources
-        ]
-
-        # Filter out the None values
-        backtest_market_data_sources = [
-            market_data_source for market_data_source in
-            backtest_market_data_sources if market_data_source is not None
-        ]
-
-        for backtest_market_data_source in tqdm(
-            backtest_market_data_sources,
-            total=len(self._market_data_sources),
+        data_date_range = self._backtest_data_date_range
+        reuse = data_date_range is not None \
+            and data_date_range.start_date <= backtest_start_date \
+            and backtest_end_date <= data_date_range.end_date
+
+        if reuse:
+            backtest_start_date = data_date_range.start_date
+            backtest_end_date = data_date_range.end_date
+
+        backtest_market_data_sources = []
+        unprepared_market_data_sources = []
+
+        for market_data_source in self._market_data_sources:
+            key = self._get_preparation_key(market_data_source)
+
+            if reuse and key in self._prepared_market_data_sources:
+                backtest_market_data_sources.append(
+                    self._prepared_market_data_sources[key]
+                )
+                continue
+
+            backtest_market_data_source = \
+                market_data_source.to_backtest_market_data_source()
+
+            # Filter out the None values
+            if backtest_market_data_source is not None:
+                backtest_market_data_sources.append(
+                    backtest_market_data_source
+                )
+                unprepared_market_data_sources.append(
+                    (key, backtest_market_data_source)
+                )
+
+        for key, backtest_market_data_source in tqdm(
+            unprepared_market_data_sources,
+            total=len(unprepared_market_data_sources),
             desc="Preparing backtest market data",
             colour="GREEN"
         ):
@@ -78,8 +117,36 @@ class BacktestMarketDataSourceService(MarketDataSourceService):
                 backtest_end_date=backtest_end_date
             )
 
+            if reuse:
+                self._prepared_market_data_sources[key] = \
+                    backtest_market_data_source
+
         self.market_data_sources = backtest_market_data_sources
 
+    @staticmethod
+    def _get_preparation_key(market_data_source):
+        """
+        Function to get the key of the prepared data of a market data
+        source. Market data sources with the same identifier can differ
+        in e.g. their time frame or window size, which changes the
+        prepared data, so the key covers the full configuration.
+
+        Args:
+            market_data_source: The market data source
+
+        Returns:
+            Tuple with the configuration of the market data source
+        """
+        return (
+            type(market_data_source),
+            market_data_source.get_identifier(),
+            market_data_source.get_market(),
+            market_data_source.get_symbol(),
+            getattr(market_data_source, "time_frame", None),
+            getattr(market_data_source, "window_size", None),
+            getattr(market_data_source, "storage_path", None),
+        )
+
     def get_data(self, identifier):
         """
         This method is used to get the data for backtesting. It loops
@@ -1,7 +1,9 @@
 from .order_backtest_service import OrderBacktestService
 from .order_service import OrderService
+from .order_poller import OrderPoller
 
 __all__ = [
     "OrderService",
-    "OrderBacktestService"
+    "OrderBacktestService",
+    "OrderPoller",
 ]
@@ -3,7 +3,7 @@ import logging
 import polars as pl
 
 from investing_algorithm_framework.domain import BACKTESTING_INDEX_DATETIME, \
-    OrderStatus, OrderSide, Order, MarketDataType
+    OrderStatus, Order, MarketDataType, BACKTESTING_FILL_MODEL, FillModel
 from investing_algorithm_framework.services.market_data_source_service \
     import BacktestMarketDataSourceService
 from .order_service import OrderService
@@ -57,12 +57,16 @@ class OrderBacktestService(OrderService):
         )
         return order
 
+    def execute_orders(self, order_ids):
+        return [self.execute_order(order_id, None) for order_id in order_ids]
+
     def check_pending_orders(self, market_data):
         """
         Function to check if any pending orders have executed. It querys the
-        open orders and checks if the order has executed based on the OHLCV
-        data. If the order has executed, the order status is set to CLOSED
-        and the filled amount is set to the order amount.
+        open orders and determines, with the configured fill model
+        (see BACKTESTING_FILL_MODEL), how much of each order has been
+        filled based on the OHLCV data. If the order is completely filled,
+        the order status is set to CLOSED.
 
         Args:
             market_data (dict): Dictionary containing the market data
@@ -72,6 +76,8 @@ class OrderBacktestService(OrderService):
         """
         pending_orders = self.get_all({"status": OrderStatus.OPEN.value})
         meta_data = market_data["metadata"]
+        fill_model = self.get_fill_model()
+        markets = {}
 
         for order in pending_orders:
             ohlcv_meta_data = meta_data[MarketDataType.OHLCV]
@@ -86,18 +92,93 @@ class OrderBacktestService(OrderService):
                 ohlcv_meta_data[order.get_symbol()][most_granular_interval]
             )
             data = market_data[identifier]
+            filled_amount = self.get_fillable_amount(order, data, fill_model)
 
-            if self.has_executed(order, data):
-                self.update(
-                    order.id,
-                    {
-                        "status": OrderStatus.CLOSED.value,
-                        "filled": order.get_amount(),
-                        "remaining": 0,
-                        "updated_at": self.configuration_service
-                        .config[BACKTESTING_INDEX_DATETIME]
-                    }
+            if filled_amount <= 0:
+                continue
+
+            if order.position_id not in markets:
+                portfolio = self.portfolio_repository.find(
+                    {"position": order.position_id}
                 )
+                markets[order.position_id] = portfolio.get_market()
+
+            self._fill_order(
+                order, filled_amount, fill_model, markets[order.position_id]
+            )
+
+    def _fill_order(self, order, filled_amount, fill_model, market):
+        """
+        Function to record a fill of an order at its limit price. The
+        value of the fills is recorded as the cost of the order, and
+        the order fee rate is the effective rate of the fees over that
+        value, so it is also set for fee models without a rate
+        (e.g. FixedFee).
+        """
+        previously_filled = order.get_filled()
+        fee = fill_model.calculate_fee(
+            market, order.get_price(), filled_amount, previously_filled
+        )
+        cost = (order.get_cost() or 0) + filled_amount * order.get_price()
+        data = {
+            "cost": cost,
+            "updated_at": self.configuration_service
+            .config[BACKTESTING_INDEX_DATETIME]
+        }
+
+        if filled_amount >= order.get_remaining():
+            data["status"] = OrderStatus.CLOSED.value
+            data["filled"] = order.get_amount()
+            data["remaining"] = 0
+        else:
+            data["filled"] = previously_filled + filled_amount
+            data["remaining"] = order.get_amount() - data["filled"]
+
+        if fee > 0:
+            order_fee = order.get_order_fee()
+            data["order_fee"] = fee if order_fee is None else order_fee + fee
+            data["order_fee_currency"] = order.get_trading_symbol()
+            data["order_fee_rate"] = data["order_fee"] / cost \
+                if cost > 0 else None
+            self._sync_portfolio_with_order_fee(order, fee)
+
+        self.update(order.id, data)
+
+    def _sync_portfolio_with_order_fee(self, order, fee):
+        portfolio = self.portfolio_repository.find(
+            {"position": order.position_id}
+        )
+        self.portfolio_repository.update(
+            portfolio.id,
+            {
+                "unallocated": portfolio.get_unallocated() - fee,
+                "total_net_gain": portfolio.get_total_net_gain() - fee,
+            }
+        )
+        trading_symbol_position = self.position_repository.find(
+            {
+                "symbol": portfolio.trading_symbol,
+                "portfolio": portfolio.id
+            }
+        )
+        self.position_repository.update(
+            trading_symbol_position.id,
+            {"amount": trading_symbol_position.get_amount() - fee}
+        )
+
+    def get_fill_model(self) -> FillModel:
+        """
+        Function to get the configured fill model. If no fill model is
+        configured, the default fill model is used, which fills orders
+        completely at their limit price without fees.
+        """
+        fill_model = self.configuration_service.config\
+            .get(BACKTESTING_FILL_MODEL)
+
+        if fill_model is None:
+            return FillModel()
+
+        return fill_model
 
     def cancel_order(self, order):
         self.check_pending_orders()
@@ -116,9 +197,29 @@ class OrderBacktestService(OrderService):
                     }
                 )
 
+    def cancel_orders(self, orders):
+        cancelled_orders = []
+
+        for order in orders:
+            order = self.order_repository.get(order.id)
+
+            if order is not None and OrderStatus.OPEN.equals(order.status):
+                cancelled_orders.append(
+                    self.update(
+                        order.id,
+                        {
+                            "status": OrderStatus.CANCELED.value,
+                            "updated_at": self.configuration_service
+                            .config[BACKTESTING_INDEX_DATETIME]
+                        }
+                    )
+                )
+
+        return cancelled_orders
+
     def has_executed(self, order, ohlcv_data_frame):
         """
-        Check if the order has executed based on the OHLCV data.
+        Check if the order has (partially) executed based on the OHLCV data.
 
         A buy order is executed if the low price drops below or equals the
         order price. Example: If the order price is 1000 and the low price
@@ -132,40 +233,70 @@ class OrderBacktestService(OrderService):
         situation where a seller is willing to accept a higher price for its
         sell order.
 
+        If the configured fill model has a slippage model, the price
+        needs to move through the order price by the slippage offset.
+
         :param order: Order object
         :param ohlcv_data_frame: OHLCV data frame
         :return: True if the order has executed, False otherwise
         """
+        return self.get_fillable_amount(order, ohlcv_data_frame) > 0
 
-        # Extract attributes from the order object
-        created_at = order.get_created_at()
-        order_side = order.get_order_side()
-        order_price = order.get_price()
-        column_type = ohlcv_data_frame['Datetime'].dtype
+    def get_fillable_amount(self, order, ohlcv_data_frame, fill_model=None):
+        """
+        Function to get the amount of the order that is filled by the
+        candles in the OHLCV data frame. Only candles after the order
+        has been created are considered. For a partially filled order
+        only candles after the last fill are considered.
+
+        Args:
+            order: Order object
+            ohlcv_data_frame: OHLCV polars data frame
+            fill_model: The fill model to use, defaults to the
+                configured fill model
 
-        if isinstance(column_type, pl.Datetime):
-            ohlcv_data_after_order = ohlcv_data_frame.filter(
-                pl.col('Datetime') >= created_at
+        Returns:
+            float: The filled amount
+        """
+
+        if fill_model is None:
+            fill_model = self.get_fill_model()
+
+        if order.get_filled() > 0 and order.get_updated_at() is not None:
+            ohlcv_data_after_order = self._filter_candles(
+                ohlcv_data_frame, order.get_updated_at(), inclusive=False
             )
         else:
-            ohlcv_data_after_order = ohlcv_data_frame.filter(
-                pl.col('Datetime') >= created_at.strftime(
-                    self.configuration_service.config["DATETIME_FORMAT"]
-                )
+            ohlcv_data_after_order = self._filter_candles(
+                ohlcv_data_frame, order.get_created_at()
+            )
+
+        volume = None
+
+        if fill_model.max_volume_participation is not None:
+            volume = ohlcv_data_after_order['Volume'].to_numpy()
+
+        return fill_model.get_fillable_amount(
+            order_side=order.get_order_side(),
+            price=order.get_price(),
+            remaining=order.get_remaining(),
+            high=ohlcv_data_after_order['High'].to_numpy(),
+            low=ohlcv_data_after_order['Low'].to_numpy(),
+            volume=volume,
+        )
+
+    def _filter_candles(self, ohlcv_data_frame, start, inclusive=True):
+        column_type = ohlcv_data_frame['Datetime'].dtype
+
+        if not isinstance(column_type, pl.Datetime):
+            start = start.strftime(
+                self.configuration_service.config["DATETIME_FORMAT"]
             )
 
-        # Check if the order execution conditions are met
-        if OrderSide.BUY.equals(order_side):
-            # Check if the low price drops below or equals the order price
-            if (ohlcv_data_after_order['Low'] <= order_price).any():
-                return True
-        elif OrderSide.SELL.equals(order_side):
-            # Check if the high price goes above or equals the order price
-            if (ohlcv_data_after_order['High'] >= order_price).any():
-                return True
+        if inclusive:
+            return ohlcv_data_frame.filter(pl.col('Datetime') >= start)
 
-        # If conditions are not met, return False
-        return False
+        return ohlcv_data_frame.filter(pl.col('Datetime') > start)
 
     def create_snapshot(self, portfolio_id, created_at=None):
 
@@ -173,5 +304,5 @@ class OrderBacktestService(OrderService):
             created_at = self.configuration_service \
                 .config[BACKTESTING_INDEX_DATETIME]
 
-        super(OrderBacktestService, self)\
+        return super(OrderBacktestService, self)\
             .create_snapshot(portfolio_id, created_at=created_at)
@@ -0,0 +1,118 @@
+import logging
+import threading
+from time import monotonic
+
+from investing_algorithm_framework.domain import ORDER_POLL_CACHE_TTL
+
+logger = logging.getLogger("investing_algorithm_framework")
+
+
+class OrderPoller:
+    """
+    Poller that retrieves the state of the orders of a symbol from the
+    market, with one request for the open orders and one for the
+    closed orders of the symbol.
+
+    The result is cached for ORDER_POLL_CACHE_TTL seconds (default
+    1 second), so that multiple strategies that check their pending
+    orders at the same time share a single poll of the market. Polls
+    of different symbols and markets run concurrently, only callers
+    of the same symbol wait for each other's poll. A failed poll is
+    not cached, so the next caller polls the market again.
+    """
+    DEFAULT_TTL = 1
+
+    def __init__(self, market_service, configuration_service):
+        self.market_service = market_service
+        self.configuration_service = configuration_service
+        self._cache = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def get_orders(self, market, target_symbol, trading_symbol, since=None):
+        """
+        Function to get the open and closed orders of a symbol.
+
+        Args:
+            market: The market of the orders
+            target_symbol: The target symbol of the orders
+            trading_symbol: The trading symbol of the orders
+            since: Only closed orders since this datetime are retrieved
+
+        Returns:
+            dict with the orders by their external id, empty if the
+            orders could not be polled
+        """
+        key = (market.upper(), target_symbol.upper(), trading_symbol.upper())
+
+        # The global lock only guards the dicts, the poll of a key runs
+        # under the lock of the key
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+
+            with self._lock:
+                entry = self._cache.get(key)
+
+            if entry is not None:
+                polled_at, polled_since, orders = entry
+
+                if monotonic() - polled_at < self._get_ttl() and (
+                    polled_since is None
+                    or (since is not None and polled_since <= since)
+                ):
+                    return orders
+
+            orders = self._poll(market, target_symbol, trading_symbol, since)
+
+            if orders is None:
+                return {}
+
+            with self._lock:
+                self._cache[key] = (monotonic(), since, orders)
+
+            return orders
+
+    def clear(self):
+        """
+        Function to clear the cached polls
+        """
+
+        with self._lock:
+            self._cache = {}
+
+    def _poll(self, market, target_symbol, trading_symbol, since):
+        orders = {}
+
+        try:
+            open_orders = self.market_service.get_open_orders(
+                market=market,
+                target_symbol=target_symbol,
+                trading_symbol=trading_symbol,
+            )
+            closed_orders = self.market_service.get_closed_orders(
+                market=market,
+                target_symbol=target_symbol,
+                trading_symbol=trading_symbol,
+                since=since,
+            )
+        except Exception as e:
+            logger.error(
+                f"Could not poll orders for {target_symbol}/"
+                f"{trading_symbol}: {e}"
+            )
+            return None
+
+        for order in (open_orders or []) + (closed_orders or []):
+            orders[str(order.get_external_id())] = order
+
+        return orders
+
+    def _get_ttl(self):
+        ttl = self.configuration_service.config.get(ORDER_POLL_CACHE_TTL)
+
+        if ttl is None:
+            return self.DEFAULT_TTL
+
+        return ttl
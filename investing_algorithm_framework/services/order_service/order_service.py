@@ -24,6 +24,7 @@ class OrderService(RepositoryService):
         portfolio_snapshot_service,
         market_credential_service,
         trade_service,
+        order_poller,
     ):
         super(OrderService, self).__init__(order_repository)
         self.configuration_service = configuration_service
@@ -35,6 +36,7 @@ class OrderService(RepositoryService):
         self.portfolio_snapshot_service = portfolio_snapshot_service
         self.market_credential_service = market_credential_service
         self.trade_service = trade_service
+        self.order_poller = order_poller
 
     def create(self, data, execute=True, validate=True, sync=True) -> Order:
         """
@@ -108,6 +110,27 @@ class OrderService(RepositoryService):
         Returns:
             Order: Order object
         """
+
+        portfolio_id = data["portfolio_id"]
+
+        # All repository calls of the order creation run in a single
+        # unit of work, so the order, position, trade and portfolio
+        # changes are committed together
+        with self.unit_of_work():
+            order = self._create(data, validate, sync)
+
+        # The order is submitted to the market after it is committed, so
+        # a failing database operation can't roll back an order that the
+        # market has already accepted
+        if execute:
+            portfolio = self.portfolio_repository.get(portfolio_id)
+            portfolio.configuration = self.portfolio_configuration_service\
+                .get(portfolio.identifier)
+            order = self.execute_order(order.id, portfolio)
+
+        return order
+
+    def _create(self, data, validate, sync):
         portfolio_id = data["portfolio_id"]
         portfolio = self.portfolio_repository.get(portfolio_id)
         trades = data.get("trades", [])
@@ -170,7 +193,10 @@ class OrderService(RepositoryService):
             else:
                 self._sync_portfolio_with_created_sell_order(order)
 
-        self.create_snapshot(portfolio.id, created_at=created_at)
+        if self.portfolio_snapshot_service.should_create_snapshot(
+            portfolio.id, created_at
+        ):
+            self.create_snapshot(portfolio.id, created_at=created_at)
 
         if sync:
 
@@ -196,13 +222,7 @@ class OrderService(RepositoryService):
                     }
                 )
 
-        if execute:
-            portfolio.configuration = self.portfolio_configuration_service\
-                .get(portfolio.identifier)
-            self.execute_order(order_id, portfolio)
-
-        order = self.get(order_id)
-        return order
+        return self.get(order_id)
 
     def update(self, object_id, data):
         """
@@ -226,6 +246,14 @@ class OrderService(RepositoryService):
         Returns:
             Order: Order object that has been updated
         """
+
+        # The order, position, trade and portfolio changes are committed
+        # together, and the rows that are updated based on their current
+        # values are read under the write lock of the unit of work
+        with self.unit_of_work():
+            return self._update(object_id, data)
+
+    def _update(self, object_id, data):
         previous_order = self.order_repository.get(object_id)
         trading_symbol_position = self.position_repository.find(
             {
@@ -236,15 +264,19 @@ class OrderService(RepositoryService):
         portfolio = self.portfolio_repository.get(
             trading_symbol_position.portfolio_id
         )
+        # Read the previous filled amount before updating, inside a unit of
+        # work the previous and the updated order are the same object
+        previous_filled = previous_order.get_filled()
         new_order = self.order_repository.update(object_id, data)
-        filled_difference = new_order.get_filled() \
-            - previous_order.get_filled()
+        filled_difference = new_order.get_filled() - previous_filled
 
         if filled_difference:
             if OrderSide.BUY.equals(new_order.get_order_side()):
-                self._sync_with_buy_order_filled(previous_order, new_order)
+                self._sync_with_buy_order_filled(filled_difference, new_order)
             else:
-                self._sync_with_sell_order_filled(previous_order, new_order)
+                self._sync_with_sell_order_filled(
+                    filled_difference, new_order
+                )
 
         if "status" in data:
 
@@ -273,53 +305,112 @@ class OrderService(RepositoryService):
         else:
             created_at = datetime.now(tz=tzutc())
 
-        self.create_snapshot(portfolio.id, created_at=created_at)
+        if self.portfolio_snapshot_service.should_create_snapshot(
+            portfolio.id, created_at
+        ):
+            self.create_snapshot(portfolio.id, created_at=created_at)
+
         return new_order
 
     def execute_order(self, order_id, portfolio):
+        """
+        Function to submit a created order to the market. The order is
+        never submitted inside a database transaction: inside a unit of
+        work (e.g. a strategy run) the order is submitted once the unit
+        of work has committed, and the created order is returned. The
+        response of the market is recorded in its own unit of work.
+
+        Args:
+            order_id: int - the id of the order to execute
+            portfolio: Portfolio - the portfolio of the order
+
+        Returns:
+            Order: The executed order, or the created order if the
+                order is submitted after the active unit of work
+        """
+        order = self.after_unit_of_work(
+            lambda: self._execute_order(order_id, portfolio)
+        )
+
+        if order is None:
+            order = self.get(order_id)
+
+        return order
+
+    def _execute_order(self, order_id, portfolio):
         order = self.get(order_id)
 
         try:
-            if OrderType.LIMIT.equals(order.get_order_type()):
-
-                if OrderSide.BUY.equals(order.get_order_side()):
-                    external_order = self.market_service\
-                        .create_limit_buy_order(
-                            target_symbol=order.get_target_symbol(),
-                            trading_symbol=order.get_trading_symbol(),
-                            amount=order.get_amount(),
-                            price=order.get_price(),
-                            market=portfolio.get_market()
-                        )
-                else:
-                    external_order = self.market_service\
-                        .create_limit_sell_order(
-                            target_symbol=order.get_target_symbol(),
-                            trading_symbol=order.get_trading_symbol(),
-                            amount=order.get_amount(),
-                            price=order.get_price(),
-                            market=portfolio.get_market()
-                        )
-            else:
-                if OrderSide.BUY.equals(order.get_order_side()):
-                    raise OperationalException(
-                        "Market buy order not supported"
-                    )
-                else:
-                    external_order = self.market_service\
-                        .create_market_sell_order(
-                            target_symbol=order.get_target_symbol(),
-                            trading_symbol=order.get_trading_symbol(),
-                            amount=order.get_amount(),
-                            market=portfolio.get_market()
+            external_order = self.market_service.submit_order(
+                order, market=portfolio.get_market()
+            )
+        except Exception as e:
+            external_order = e
+
+        with self.unit_of_work():
+            return self._sync_with_external_order(order_id, external_order)
+
+    def execute_orders(self, order_ids):
+        """
+        Function to execute a batch of created orders. The orders are
+        submitted per market in a single batch, which allows the market
+        service to submit them concurrently. The responses of the market
+        are synced back into the orders once the whole batch is submitted.
+
+        Like execute_order, inside a unit of work the orders are
+        submitted once the unit of work has committed.
+
+        Args:
+            order_ids: List of ids of the orders to execute
+
+        Returns:
+            List of the executed orders, in the same order as the given ids
+        """
+        orders = self.after_unit_of_work(
+            lambda: self._execute_orders(order_ids)
+        )
+
+        if orders is None:
+            orders = [self.get(order_id) for order_id in order_ids]
+
+        return orders
+
+    def _execute_orders(self, order_ids):
+        orders_per_market = {}
+
+        for order_id in order_ids:
+            order = self.get(order_id)
+            portfolio = self.portfolio_repository\
+                .find({"position": order.position_id})
+            orders_per_market.setdefault(portfolio.get_market(), [])\
+                .append(order)
+
+        executed_orders = {}
+
+        for market, orders in orders_per_market.items():
+            external_orders = self.market_service.create_orders(
+                orders, market=market
+            )
+
+            with self.unit_of_work():
+
+                for order, external_order in zip(orders, external_orders):
+                    executed_orders[order.id] = \
+                        self._sync_with_external_order(
+                            order.id, external_order
                         )
 
-            data = external_order.to_dict()
-            data["status"] = OrderStatus.OPEN.value
-            data["updated_at"] = datetime.now(tz=tzutc())
-            return self.update(order_id, data)
-        except Exception as e:
-            logger.error("Error executing order: {}".format(e))
+        return [executed_orders[order_id] for order_id in order_ids]
+
+    def _sync_with_external_order(self, order_id, external_order):
+        """
+        Function to sync an order with the response of the market after
+        submitting it. If submitting the order failed (external_order is
+        an exception), the order is rejected.
+        """
+
+        if isinstance(external_order, Exception):
+            logger.error("Error executing order: {}".format(external_order))
             return self.update(
                 order_id,
                 {
@@ -328,6 +419,11 @@ class OrderService(RepositoryService):
                 }
             )
 
+        data = external_order.to_dict()
+        data["status"] = OrderStatus.OPEN.value
+        data["updated_at"] = datetime.now(tz=tzutc())
+        return self.update(order_id, data)
+
     def validate_order(self, order_data, portfolio):
 
         if OrderSide.BUY.equals(order_data["order_side"]):
@@ -462,9 +558,33 @@ class OrderService(RepositoryService):
                     "Sell order amount larger then position size"
                 )
 
+    def get_pending_amounts(self, portfolio_id):
+        """
+        Function to get the total amount of all open orders of a
+        portfolio, grouped by symbol and order side.
+
+        Args:
+            portfolio_id: The id of the portfolio
+
+        Returns:
+            dict: Mapping of (target_symbol, trading_symbol, order_side)
+                to the summed amount of the open orders
+        """
+        return self.repository.get_pending_amounts(portfolio_id)
+
     def check_pending_orders(self, portfolio=None):
         """
-        Function to check if
+        Function to check if the pending (open) orders have changed on
+        the market. The orders are polled per symbol with the order
+        poller, which retrieves the open and closed orders of a symbol
+        in one poll. Only orders of which the status or filled amount
+        has changed are updated.
+
+        Args:
+            portfolio (optional): Only check the orders of this portfolio
+
+        Returns:
+            None
         """
 
         if portfolio is not None:
@@ -477,13 +597,70 @@ class OrderService(RepositoryService):
         else:
             pending_orders = self.get_all({"status": OrderStatus.OPEN.value})
 
+        markets = {}
+        orders_per_symbol = {}
+
         for order in pending_orders:
-            position = self.position_repository.get(order.position_id)
-            portfolio = self.portfolio_repository.get(position.portfolio_id)
-            external_order = self.market_service\
-                .get_order(order, market=portfolio.get_market())
+
+            if order.position_id not in markets:
+                markets[order.position_id] = self.portfolio_repository\
+                    .find({"position": order.position_id}).get_market()
+
+            key = (
+                markets[order.position_id],
+                order.get_target_symbol(),
+                order.get_trading_symbol()
+            )
+            orders_per_symbol.setdefault(key, []).append(order)
+
+        for (market, target_symbol, trading_symbol), orders \
+                in orders_per_symbol.items():
+            external_orders = self.order_poller.get_orders(
+                market=market,
+                target_symbol=target_symbol,
+                trading_symbol=trading_symbol,
+                since=min(order.created_at for order in orders)
+            )
+            self.sync_with_external_orders(orders, external_orders, market)
+
+    def sync_with_external_orders(self, orders, external_orders, market):
+        """
+        Function to update local orders with their state on the market.
+        Orders that are not part of the given external orders are
+        retrieved individually. Orders of which the status and filled
+        amount did not change are skipped.
+
+        Args:
+            orders: List of local orders
+            external_orders: dict with the orders on the market by
+                their external id
+            market: The market of the orders
+
+        Returns:
+            List of the orders that are still open on the market
+        """
+        still_open = []
+
+        for order in orders:
+            external_order = external_orders.get(str(order.external_id))
+
+            if external_order is None:
+                external_order = self.market_service.get_order(
+                    order, market=market
+                )
+
+            if OrderStatus.OPEN.equals(external_order.get_status()):
+                still_open.append(order)
+
+            if OrderStatus.from_value(external_order.get_status()).equals(
+                order.get_status()
+            ) and external_order.get_filled() == order.get_filled():
+                continue
+
             self.update(order.id, external_order.to_dict())
 
+        return still_open
+
     def _create_position_if_not_exists(self, symbol, portfolio):
         if not self.position_repository.exists(
             {"portfolio": portfolio.id, "symbol": symbol}
@@ -499,10 +676,12 @@ class OrderService(RepositoryService):
         return position
 
     def _sync_portfolio_with_created_buy_order(self, order):
-        position = self.position_repository.get(order.position_id)
-        portfolio = self.portfolio_repository.get(position.portfolio_id)
+        position = self.position_repository.get_for_update(order.position_id)
+        portfolio = self.portfolio_repository.get_for_update(
+            position.portfolio_id
+        )
         size = order.get_amount() * order.get_price()
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "portfolio": portfolio.id,
                 "symbol": portfolio.trading_symbol
@@ -535,7 +714,7 @@ class OrderService(RepositoryService):
         Returns:
             None
         """
-        position = self.position_repository.get(order.position_id)
+        position = self.position_repository.get_for_update(order.position_id)
         self.position_repository.update(
             position.id,
             {
@@ -556,16 +735,71 @@ class OrderService(RepositoryService):
                     order, market=portfolio.get_market()
                 )
 
-    def _sync_with_buy_order_filled(self, previous_order, current_order):
-        filled_difference = current_order.get_filled() - \
-                            previous_order.get_filled()
+    def cancel_orders(self, orders):
+        """
+        Function to cancel a batch of open orders. The cancellations are
+        sent per market in a single batch, which allows the market service
+        to send them concurrently. Orders that are cancelled by the market
+        are synced as cancelled, failed cancellations are logged.
+
+        Args:
+            orders: List of orders to cancel
+
+        Returns:
+            List of the orders that have been cancelled
+        """
+        orders_per_market = {}
+
+        for order in orders:
+            order = self.order_repository.get(order.id)
+
+            if order is None or not OrderStatus.OPEN.equals(order.status):
+                continue
+
+            portfolio = self.portfolio_repository\
+                .find({"position": order.position_id})
+            orders_per_market.setdefault(portfolio.get_market(), [])\
+                .append(order)
+
+        cancelled_orders = []
+
+        for market, market_orders in orders_per_market.items():
+            results = self.market_service.cancel_orders(
+                market_orders, market=market
+            )
+
+            for order, result in zip(market_orders, results):
+
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Error cancelling order {order.id}: {result}"
+                    )
+                    continue
+
+                cancelled_orders.append(
+                    self.update(
+                        order.id,
+                        {
+                            "status": OrderStatus.CANCELED.value,
+                            "updated_at": datetime.now(tz=tzutc())
+                        }
+                    )
+                )
+
+        return cancelled_orders
+
+    def _sync_with_buy_order_filled(
+        self, filled_difference, current_order
+    ):
         filled_size = filled_difference * current_order.get_price()
 
         if filled_difference <= 0:
             return
 
         # Update position
-        position = self.position_repository.get(current_order.position_id)
+        position = self.position_repository.get_for_update(
+            current_order.position_id
+        )
 
         self.position_repository.update(
             position.id,
@@ -576,7 +810,9 @@ class OrderService(RepositoryService):
         )
 
         # Update portfolio
-        portfolio = self.portfolio_repository.get(position.portfolio_id)
+        portfolio = self.portfolio_repository.get_for_update(
+            position.portfolio_id
+        )
         self.portfolio_repository.update(
             portfolio.id,
             {
@@ -590,19 +826,23 @@ class OrderService(RepositoryService):
             filled_difference, current_order
         )
 
-    def _sync_with_sell_order_filled(self, previous_order, current_order):
-        filled_difference = current_order.get_filled() - \
-                            previous_order.get_filled()
+    def _sync_with_sell_order_filled(
+        self, filled_difference, current_order
+    ):
         filled_size = filled_difference * current_order.get_price()
 
         if filled_difference <= 0:
             return
 
         # Get position
-        position = self.position_repository.get(current_order.position_id)
+        position = self.position_repository.get_for_update(
+            current_order.position_id
+        )
 
         # Update the portfolio
-        portfolio = self.portfolio_repository.get(position.portfolio_id)
+        portfolio = self.portfolio_repository.get_for_update(
+            position.portfolio_id
+        )
         self.portfolio_repository.update(
             portfolio.id,
             {
@@ -613,7 +853,7 @@ class OrderService(RepositoryService):
         )
 
         # Update the trading symbol position
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "symbol": portfolio.trading_symbol,
                 "portfolio": portfolio.id
@@ -636,7 +876,7 @@ class OrderService(RepositoryService):
         size = remaining * order.get_price()
 
         # Add the remaining amount to the portfolio
-        portfolio = self.portfolio_repository.find(
+        portfolio = self.portfolio_repository.find_for_update(
             {
                 "position": order.position_id
             }
@@ -649,7 +889,7 @@ class OrderService(RepositoryService):
         )
 
         # Add the remaining amount to the trading symbol position
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "symbol": portfolio.trading_symbol,
                 "portfolio": portfolio.id
@@ -666,7 +906,7 @@ class OrderService(RepositoryService):
         remaining = order.get_amount() - order.get_filled()
 
         # Add the remaining back to the position
-        position = self.position_repository.get(order.position_id)
+        position = self.position_repository.get_for_update(order.position_id)
         self.position_repository.update(
             position.id,
             {
@@ -680,7 +920,7 @@ class OrderService(RepositoryService):
         size = remaining * order.get_price()
 
         # Add the remaining amount to the portfolio
-        portfolio = self.portfolio_repository.find(
+        portfolio = self.portfolio_repository.find_for_update(
             {
                 "position": order.position_id
             }
@@ -693,7 +933,7 @@ class OrderService(RepositoryService):
         )
 
         # Add the remaining amount to the trading symbol position
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "symbol": portfolio.trading_symbol,
                 "portfolio": portfolio.id
@@ -710,7 +950,7 @@ class OrderService(RepositoryService):
         remaining = order.get_amount() - order.get_filled()
 
         # Add the remaining back to the position
-        position = self.position_repository.get(order.position_id)
+        position = self.position_repository.get_for_update(order.position_id)
         self.position_repository.update(
             position.id,
             {
@@ -725,7 +965,7 @@ class OrderService(RepositoryService):
         size = remaining * order.get_price()
 
         # Add the remaining amount to the portfolio
-        portfolio = self.portfolio_repository.find(
+        portfolio = self.portfolio_repository.find_for_update(
             {
                 "position": order.position_id
             }
@@ -738,7 +978,7 @@ class OrderService(RepositoryService):
         )
 
         # Add the remaining amount to the trading symbol position
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "symbol": portfolio.trading_symbol,
                 "portfolio": portfolio.id
@@ -755,7 +995,7 @@ class OrderService(RepositoryService):
         remaining = order.get_amount() - order.get_filled()
 
         # Add the remaining back to the position
-        position = self.position_repository.get(order.position_id)
+        position = self.position_repository.get_for_update(order.position_id)
         self.position_repository.update(
             position.id,
             {
@@ -770,7 +1010,7 @@ class OrderService(RepositoryService):
         size = remaining * order.get_price()
 
         # Add the remaining amount to the portfolio
-        portfolio = self.portfolio_repository.find(
+        portfolio = self.portfolio_repository.find_for_update(
             {
                 "position": order.position_id
             }
@@ -783,7 +1023,7 @@ class OrderService(RepositoryService):
         )
 
         # Add the remaining amount to the trading symbol position
-        trading_symbol_position = self.position_repository.find(
+        trading_symbol_position = self.position_repository.find_for_update(
             {
                 "symbol": portfolio.trading_symbol,
                 "portfolio": portfolio.id
@@ -800,7 +1040,7 @@ class OrderService(RepositoryService):
         remaining = order.get_amount() - order.get_filled()
 
         # Add the remaining back to the position
-        position = self.position_repository.get(order.position_id)
+        position = self.position_repository.get_for_update(order.position_id)
         self.position_repository.update(
             position.id,
             {
@@ -836,3 +1076,23 @@ class OrderService(RepositoryService):
             created_orders=created_orders,
             created_at=created_at
         )
+
+    def create_snapshots_on_strategy_run(self, created_at):
+        """
+        Function to create portfolio snapshots after a strategy run. A
+        snapshot is only created for a portfolio if the snapshot
+        interval policy requires it (see SnapshotInterval).
+
+        Args:
+            created_at: datetime - the datetime of the strategy run
+
+        Returns:
+            None
+        """
+
+        for portfolio in self.portfolio_repository.get_all():
+
+            if self.portfolio_snapshot_service.should_create_snapshot(
+                portfolio.id, created_at, strategy_run=True
+            ):
+                self.create_snapshot(portfolio.id, created_at=created_at)
@@ -1,19 +1,43 @@
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 
+from investing_algorithm_framework.domain import SnapshotInterval, \
+    SNAPSHOT_INTERVAL, SNAPSHOT_STRATEGY_ITERATIONS, SNAPSHOT_TIME_INTERVAL, \
+    SNAPSHOT_BUFFER_SIZE, ENVIRONMENT, Environment, OperationalException, \
+    PortfolioSnapshot
 from investing_algorithm_framework.services.repository_service import \
     RepositoryService
 
 
 class PortfolioSnapshotService(RepositoryService):
+    """
+    Service to create portfolio snapshots. Which events result in a
+    snapshot is determined by the SNAPSHOT_INTERVAL config
+    (see SnapshotInterval).
+
+    Created snapshots are kept in an in-memory buffer and written to the
+    database in bulk once the buffer reaches SNAPSHOT_BUFFER_SIZE or when
+    flush is called. By default, snapshots are written directly in live
+    mode, and buffered in backtest mode. A snapshot that is created
+    inside a unit of work is only buffered when the unit of work
+    commits, so a rollback discards it.
+    """
+    DEFAULT_BACKTEST_BUFFER_SIZE = 1000
 
     def __init__(
         self,
         repository,
         position_repository,
-        position_snapshot_service
+        position_snapshot_service,
+        configuration_service,
     ):
         self.position_snapshot_service = position_snapshot_service
         self.position_repository = position_repository
+        self.configuration_service = configuration_service
+        self._buffer = []
+        self._strategy_iterations = {}
+        self._last_strategy_run_snapshots = {}
+        self._lock = threading.Lock()
         super(PortfolioSnapshotService, self).__init__(repository)
 
     def create_snapshot(
@@ -24,6 +48,21 @@ class PortfolioSnapshotService(RepositoryService):
         created_at=None,
         cash_flow=0
     ):
+        """
+        Function to create a snapshot of a portfolio.
+
+        Args:
+            portfolio: The portfolio
+            pending_orders: The open orders of the portfolio
+            created_orders: The created orders of the portfolio
+            created_at: The datetime of the snapshot
+            cash_flow: The cash deposited (or withdrawn) since the
+                previous snapshot
+
+        Returns:
+            PortfolioSnapshot: The written snapshot, or the buffered
+                snapshot (without an id) if it is not written yet
+        """
         pending_value = 0
 
         if created_orders is not None:
@@ -48,20 +87,214 @@ class PortfolioSnapshotService(RepositoryService):
             "cash_flow": cash_flow,
             "created_at": created_at,
         }
-        snapshot = self.create(data)
         positions = self.position_repository.get_all(
             {"portfolio": portfolio.id}
         )
+        position_snapshots_data = [
+            {
+                "symbol": position.symbol,
+                "amount": position.amount,
+                "cost": position.cost,
+            }
+            for position in positions
+        ]
+
+        entry = (data, position_snapshots_data)
+        snapshot = self.after_unit_of_work(
+            lambda: self._add_to_buffer(entry)
+        )
+        return PortfolioSnapshot(**data) if snapshot is None else snapshot
+
+    def _add_to_buffer(self, entry):
+
+        with self._lock:
+            self._buffer.append(entry)
+
+            if len(self._buffer) < self._get_buffer_size():
+                return None
+
+            buffer = self._buffer
+            self._buffer = []
+
+        return self._write(buffer)[buffer.index(entry)]
+
+    def should_create_snapshot(
+        self, portfolio_id, created_at, strategy_run=False
+    ) -> bool:
+        """
+        Function to check, based on the configured snapshot interval,
+        if a snapshot should be created for the given event.
+
+        Args:
+            portfolio_id: The id of the portfolio
+            created_at: The datetime of the event
+            strategy_run: True if the event is a completed strategy run,
+                False if the event is an order that has been
+                created or updated.
+
+        Returns:
+            bool: True if a snapshot should be created
+        """
+        config = self.configuration_service.get_config()
+        snapshot_interval = SnapshotInterval.from_value(
+            config.get(SNAPSHOT_INTERVAL, SnapshotInterval.ON_ORDER.value)
+        )
+
+        if SnapshotInterval.ON_ORDER.equals(snapshot_interval):
+            return not strategy_run
+
+        if not strategy_run:
+            return False
+
+        time_interval = None
+
+        if SnapshotInterval.TIME_INTERVAL.equals(snapshot_interval):
+            time_interval = config.get(SNAPSHOT_TIME_INTERVAL)
+
+            if time_interval is None:
+                raise OperationalException(
+                    f"{SNAPSHOT_TIME_INTERVAL} must be configured when "
+                    f"{SNAPSHOT_INTERVAL} is "
+                    f"{SnapshotInterval.TIME_INTERVAL.value}"
+                )
+
+            if not isinstance(time_interval, timedelta):
+                time_interval = timedelta(seconds=time_interval)
+
+        with self._lock:
+
+            if SnapshotInterval.STRATEGY_ITERATION.equals(snapshot_interval):
+                iterations = self._strategy_iterations.get(portfolio_id, 0)
+                iterations += 1
+                self._strategy_iterations[portfolio_id] = iterations
+                return iterations % \
+                    config.get(SNAPSHOT_STRATEGY_ITERATIONS, 1) == 0
+
+            last_snapshot = self._last_strategy_run_snapshots\
+                .get(portfolio_id)
+
+            if last_snapshot is None:
+                due = True
+            elif time_interval is not None:
+                due = created_at - last_snapshot >= time_interval
+            else:
+                due = created_at.date() != last_snapshot.date()
+
+            if due:
+                self._last_strategy_run_snapshots[portfolio_id] = created_at
 
-        for position in positions:
-            self.position_snapshot_service.create_snapshot(
-                snapshot.id, position
+            return due
+
+    def flush(self):
+        """
+        Function to write all buffered snapshots to the database. The
+        portfolio snapshots and the position snapshots are each written
+        with a single bulk insert.
+
+        Returns:
+            List of the created portfolio snapshots
+        """
+
+        with self._lock:
+            buffer = self._buffer
+            self._buffer = []
+
+        return self._write(buffer)
+
+    def _write(self, buffer):
+
+        if len(buffer) == 0:
+            return []
+
+        snapshots = self.create_all([data for data, _ in buffer])
+        position_snapshots_data = []
+
+        for snapshot, (_, positions_data) in zip(snapshots, buffer):
+
+            for position_data in positions_data:
+                position_data["portfolio_snapshot_id"] = snapshot.id
+                position_snapshots_data.append(position_data)
+
+        if len(position_snapshots_data) > 0:
+            self.position_snapshot_service.create_all(
+                position_snapshots_data
             )
 
-        return snapshot
+        return snapshots
+
+    def reset(self):
+        """
+        Function to reset the snapshot policy state, e.g. before running
+        a new backtest. Buffered snapshots are discarded, so make
+        sure to call flush first if they need to be persisted.
+        """
+
+        with self._lock:
+            self._buffer = []
+            self._strategy_iterations = {}
+            self._last_strategy_run_snapshots = {}
+
+    def _get_buffer_size(self):
+        config = self.configuration_service.get_config()
+        buffer_size = config.get(SNAPSHOT_BUFFER_SIZE)
+
+        if buffer_size is not None:
+            return buffer_size
+
+        if Environment.BACKTEST.equals(config[ENVIRONMENT]):
+            return self.DEFAULT_BACKTEST_BUFFER_SIZE
+
+        return 1
 
     def get_latest_snapshot(self, portfolio_id):
-        pass
+        """
+        Function to get the latest snapshot of a portfolio. Buffered
+        snapshots are written first.
+
+        Args:
+            portfolio_id: The id of the portfolio
+
+        Returns:
+            PortfolioSnapshot: The latest snapshot, or None if the
+                portfolio has no snapshots
+        """
+        self.flush()
+        snapshots = self.get_all(
+            {
+                "portfolio_id": portfolio_id,
+                "order_by_created_at_asc": False,
+                "limit": 1,
+            }
+        )
+        return snapshots[0] if len(snapshots) > 0 else None
 
     def get_snapshots(self, portfolio_id, start_date=None, end_date=None):
-        pass
+        """
+        Function to get the snapshots of a portfolio within a date range,
+        ordered on created_at. The range query is served by the index
+        on portfolio_id and created_at. Buffered snapshots are
+        written first.
+
+        Args:
+            portfolio_id: The id of the portfolio
+            start_date: The (inclusive) start of the range, if None
+                all snapshots up to the end date are returned
+            end_date: The (inclusive) end of the range, if None
+                all snapshots from the start date are returned
+
+        Returns:
+            List of portfolio snapshots
+        """
+        self.flush()
+        query_params = {
+            "portfolio_id": portfolio_id,
+            "order_by_created_at_asc": True,
+        }
+
+        if start_date is not None:
+            query_params["created_at_gte"] = start_date
+
+        if end_date is not None:
+            query_params["created_at_lte"] = end_date
+
+        return self.get_all(query_params)
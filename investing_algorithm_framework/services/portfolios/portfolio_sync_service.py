@@ -1,8 +1,10 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 
 from investing_algorithm_framework.domain import OperationalException, \
     AbstractPortfolioSyncService, RESERVED_BALANCES, SYMBOLS, \
-    ENVIRONMENT, Environment
+    ENVIRONMENT, Environment, OrderStatus
 from investing_algorithm_framework.services.trade_service import TradeService
 
 logger = logging.getLogger(__name__)
@@ -12,6 +14,7 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
     """
     Service to sync the portfolio with the exchange.
     """
+    max_concurrent_symbol_syncs = 8
 
     def __init__(
         self,
@@ -22,7 +25,8 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
         portfolio_repository,
         portfolio_configuration_service,
         market_credential_service,
-        market_service
+        market_service,
+        watermark_repository
     ):
         self.trade_service = trade_service
         self.configuration_service = configuration_service
@@ -32,6 +36,7 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
         self.market_credential_service = market_credential_service
         self.market_service = market_service
         self.portfolio_configuration_service = portfolio_configuration_service
+        self.watermark_repository = watermark_repository
 
     def sync_unallocated(self, portfolio):
         """
@@ -123,7 +128,7 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
             trading_symbol_position = self.position_repository.find(
                 {
                     "symbol": portfolio.trading_symbol,
-                    "portfolio_id": portfolio.id
+                    "portfolio": portfolio.id
                 }
             )
             self.position_repository.update(
@@ -209,10 +214,16 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
 
     def sync_orders(self, portfolio):
         """
-        Function to sync all local orders with the orders on the exchange.
-        This method will go over all local open orders and check if they are
-        changed on the exchange. If they are, the local order will be
-        updated to match the status on the exchange.
+        Function to sync all local open orders with the orders on the
+        exchange. The orders are retrieved per symbol, concurrently for
+        all symbols, and only orders since the sync watermark of the
+        (portfolio, symbol) pair, the time of its last sync, are
+        retrieved. Open orders created before the watermark are not part
+        of this window and are retrieved individually. Local orders whose
+        status and filled amount did not change on the exchange are
+        skipped.
+
+        After the sync, the watermark is moved to the time of the sync.
 
         Args:
             portfolio: Portfolio object
@@ -227,7 +238,86 @@ class PortfolioSyncService(AbstractPortfolioSyncService):
                 and Environment.BACKTEST.equals(config[ENVIRONMENT]):
             return
 
-        self.order_service.check_pending_orders(portfolio=portfolio)
+        synced_at = datetime.utcnow()
+        open_orders = self.order_service.get_all(
+            {"status": OrderStatus.OPEN.value, "portfolio_id": portfolio.id}
+        )
+        open_orders_per_symbol = {}
+
+        for order in open_orders:
+            open_orders_per_symbol.setdefault(order.get_symbol(), [])\
+                .append(order)
+
+        if len(open_orders_per_symbol) == 0:
+            return
+
+        since_per_symbol = {
+            symbol: self._get_since(portfolio, symbol, orders)
+            for symbol, orders in open_orders_per_symbol.items()
+        }
+        max_workers = min(
+            len(since_per_symbol), self.max_concurrent_symbol_syncs
+        )
+
+        # Only the exchange requests are done concurrently, the local
+        # orders are updated sequentially afterwards.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    self.market_service.get_orders,
+                    symbol=symbol,
+                    market=portfolio.market,
+                    since=since
+                )
+                for symbol, since in since_per_symbol.items()
+            }
+
+        for symbol, future in futures.items():
+
+            try:
+                external_orders = future.result() or []
+            except Exception as e:
+                logger.error(f"Could not retrieve orders for {symbol}: {e}")
+                continue
+
+            self.order_service.sync_with_external_orders(
+                open_orders_per_symbol[symbol],
+                {
+                    str(external_order.get_external_id()): external_order
+                    for external_order in external_orders
+                },
+                portfolio.market
+            )
+
+            self._set_watermark(portfolio, symbol, synced_at)
+
+    def _get_since(self, portfolio, symbol, open_orders):
+        watermark = self.watermark_repository.get_all(
+            {"portfolio_id": portfolio.id, "symbol": symbol}
+        )
+
+        if len(watermark) == 0:
+            return min(order.created_at for order in open_orders)
+
+        return watermark[0].get_synced_at()
+
+    def _set_watermark(self, portfolio, symbol, synced_at):
+        watermark = self.watermark_repository.get_all(
+            {"portfolio_id": portfolio.id, "symbol": symbol}
+        )
+
+        if len(watermark) == 0:
+            self.watermark_repository.create(
+                {
+                    "portfolio_id": portfolio.id,
+                    "symbol": symbol,
+                    "synced_at": synced_at
+                }
+            )
+        else:
+            self.watermark_repository.update(
+                watermark[0].id, {"synced_at": synced_at}
+            )
 
     def _get_symbols(self, portfolio):
         config = self.configuration_service.config
@@ -3,15 +3,42 @@ class RepositoryService:
     def __init__(self, repository):
         self.repository = repository
 
+    def unit_of_work(self, commit_on_error=False):
+        return self.repository.unit_of_work(commit_on_error=commit_on_error)
+
+    def after_unit_of_work(self, callback):
+        return self.repository.after_unit_of_work(callback)
+
+    def get_write_generation(self):
+        return self.repository.get_write_generation()
+
+    def get_read_cache(self):
+        return self.repository.get_read_cache()
+
     def create(self, data):
         return self.repository.create(data)
 
+    def create_all(self, data_list):
+        return self.repository.create_all(data_list)
+
     def get(self, object_id):
         return self.repository.get(object_id)
 
+    def get_for_update(self, object_id):
+        return self.repository.get_for_update(object_id)
+
+    def find_for_update(self, query_params):
+        return self.repository.find_for_update(query_params)
+
     def get_all(self, query_params=None):
         return self.repository.get_all(query_params)
 
+    def paginate(self, query_params=None):
+        return self.repository.paginate(query_params)
+
+    def stream(self, query_params=None, batch_size=None):
+        return self.repository.stream(query_params, batch_size)
+
     def update(self, object_id, data):
         return self.repository.update(object_id, data)
 
@@ -35,3 +62,19 @@ class RepositoryService:
 
     def save(self, object):
         return self.repository.save(object)
+
+    def export(self, query_params=None, batch_size=None, database_path=None):
+        return self.repository.export(
+            query_params, batch_size, database_path
+        )
+
+    def export_to_parquet(
+        self,
+        directory,
+        query_params=None,
+        batch_size=None,
+        database_path=None
+    ):
+        return self.repository.export_to_parquet(
+            directory, query_params, batch_size, database_path
+        )
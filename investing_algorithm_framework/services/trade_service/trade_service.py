@@ -78,6 +78,12 @@ class TradeService(RepositoryService):
             data["status"] = TradeStatus.OPEN.value
             data["cost"] = buy_order.filled * buy_order.price
 
+        if buy_order.position_id is not None:
+            position = self.position_repository.get(buy_order.position_id)
+            portfolio = self.portfolio_repository.get(position.portfolio_id)
+            data["portfolio_id"] = portfolio.id
+            data["market"] = portfolio.market
+
         return self.create(data)
 
     def _create_trade_metadata_with_sell_order(self, sell_order):
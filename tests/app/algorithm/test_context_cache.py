@@ -0,0 +1,83 @@
+from sqlalchemy import inspect
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential
+from tests.resources import TestBase, MarketDataSourceServiceStub
+
+
+class Test(TestBase):
+    external_balances = {
+        "EUR": 1000
+    }
+    external_available_symbols = ["BTC/EUR"]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BITVAVO",
+            trading_symbol="EUR"
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="bitvavo",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    market_data_source_service = MarketDataSourceServiceStub()
+
+    def count_calls(self, service, name):
+        calls = []
+        method = getattr(service, name)
+
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return method(*args, **kwargs)
+
+        setattr(service, name, wrapper)
+        return calls
+
+    def test_repeated_reads_are_cached(self):
+        context = self.app.context
+        portfolio_calls = self.count_calls(context.portfolio_service, "find")
+        position_calls = self.count_calls(context.position_service, "find")
+
+        with context.order_service.unit_of_work():
+
+            for _ in range(10):
+                self.assertEqual(
+                    1000, context.get_unallocated(market="BITVAVO")
+                )
+
+        self.assertEqual(1, len(portfolio_calls))
+        self.assertEqual(1, len(position_calls))
+
+        # Outside a unit of work the reads are not cached
+        context.get_unallocated(market="BITVAVO")
+        self.assertEqual(2, len(portfolio_calls))
+
+    def test_cache_is_scoped_to_the_unit_of_work(self):
+        context = self.app.context
+
+        for _ in range(2):
+
+            with context.order_service.unit_of_work() as db:
+                portfolio = context.get_portfolio(market="BITVAVO")
+
+                # The cached portfolio is attached to the session of
+                # the unit of work that reads it
+                self.assertIs(db, inspect(portfolio).session)
+
+    def test_cache_is_invalidated_by_writes(self):
+        context = self.app.context
+
+        with context.order_service.unit_of_work():
+            self.assertEqual(1000, context.get_unallocated(market="BITVAVO"))
+            self.assertFalse(context.position_exists("BTC"))
+            context.create_limit_order(
+                target_symbol="BTC",
+                amount=1,
+                price=10,
+                order_side="BUY",
+            )
+            self.assertEqual(990, context.get_unallocated(market="BITVAVO"))
+            self.assertTrue(context.position_exists("BTC"))
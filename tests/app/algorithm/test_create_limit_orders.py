@@ -0,0 +1,77 @@
+from investing_algorithm_framework import PortfolioConfiguration, \
+    OrderStatus, MarketCredential
+from tests.resources import TestBase, MarketDataSourceServiceStub
+
+
+class Test(TestBase):
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BITVAVO",
+            trading_symbol="EUR"
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="BITVAVO",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000
+    }
+    market_data_source_service = MarketDataSourceServiceStub()
+
+    def test_create_limit_orders(self):
+        orders = self.app.context.create_limit_orders(
+            [
+                {
+                    "target_symbol": "BTC",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "amount": 20,
+                },
+                {
+                    "target_symbol": "ETH",
+                    "price": 5,
+                    "order_side": "BUY",
+                    "amount": 10,
+                },
+            ]
+        )
+        self.assertEqual(2, len(orders))
+        self.assertEqual("BTC", orders[0].get_target_symbol())
+        self.assertEqual("ETH", orders[1].get_target_symbol())
+
+        for order in orders:
+            self.assertEqual(OrderStatus.OPEN.value, order.status)
+            self.assertIsNotNone(order.external_id)
+
+        portfolio = self.app.context.get_portfolio()
+        self.assertEqual(750, portfolio.get_unallocated())
+
+    def test_cancel_orders(self):
+        orders = self.app.context.create_limit_orders(
+            [
+                {
+                    "target_symbol": "BTC",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "amount": 20,
+                },
+                {
+                    "target_symbol": "ETH",
+                    "price": 5,
+                    "order_side": "BUY",
+                    "amount": 10,
+                },
+            ]
+        )
+        cancelled_orders = self.app.context.cancel_orders(orders)
+        self.assertEqual(2, len(cancelled_orders))
+
+        for order in cancelled_orders:
+            self.assertEqual(OrderStatus.CANCELED.value, order.status)
+
+        portfolio = self.app.context.get_portfolio()
+        self.assertEqual(1000, portfolio.get_unallocated())
@@ -70,3 +70,59 @@ class Test(TestBase):
         self.assertEqual("BTC", trade.target_symbol)
         self.assertEqual("EUR", trade.trading_symbol)
         self.assertIsNotNone(trade.closed_at)
+
+
+class TestGetTradesOfPortfolio(TestBase):
+    external_balances = {
+        "EUR": 1000
+    }
+    external_available_symbols = ["BTC/EUR"]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BITVAVO",
+            trading_symbol="EUR"
+        ),
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="bitvavo",
+            api_key="api_key",
+            secret_key="secret_key"
+        ),
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    market_data_source_service = MarketDataSourceServiceStub()
+
+    def test_get_trades_of_portfolio(self):
+        context = self.app.context
+
+        for market, amount in [("BITVAVO", 20), ("BINANCE", 10)]:
+            context.create_limit_order(
+                target_symbol="BTC",
+                price=10,
+                order_side="BUY",
+                amount=amount,
+                market=market
+            )
+
+        self.assertEqual(2, len(context.get_trades()))
+        portfolio = context.get_portfolio(market="BINANCE")
+        trades = context.get_trades(portfolio=portfolio)
+        self.assertEqual(1, len(trades))
+        self.assertEqual(10, trades[0].amount)
+
+        # The portfolio can also be given by its id
+        trades = context.get_trades(portfolio=portfolio.id)
+        self.assertEqual([10], [trade.amount for trade in trades])
+        self.assertEqual(1, context.count_trades(portfolio=portfolio))
+        self.assertEqual(
+            10, context.get_trade(portfolio=portfolio).amount
+        )
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import pandas as pd
+
+from investing_algorithm_framework import TradingStrategy, TimeUnit
+from investing_algorithm_framework.domain import TraceStore
+
+
+class StrategyOne(TradingStrategy):
+    time_unit = TimeUnit.SECOND
+    interval = 2
+
+    def run_strategy(self, context, market_data):
+        pass
+
+
+class Test(TestCase):
+
+    def create_data(self, periods):
+        return pd.DataFrame(
+            {"sma": list(range(periods))},
+            index=pd.date_range("2023-01-01", periods=periods, freq="h")
+        )
+
+    def test_set_traces(self):
+        strategy = StrategyOne()
+        self.assertIsNone(strategy.traces)
+
+        strategy.traces = {"BTC/EUR": self.create_data(5)}
+        strategy.add_trace("ETH/EUR", self.create_data(3))
+        self.assertEqual(5, len(strategy.traces["BTC/EUR"]))
+        self.assertEqual(3, len(strategy.traces["ETH/EUR"]))
+
+        store = TraceStore()
+        strategy.traces = store
+        strategy.add_trace("BTC/EUR", self.create_data(2))
+        self.assertEqual(2, len(store.get("BTC/EUR")))
+
+        strategy.traces = None
+        self.assertIsNone(strategy.traces)
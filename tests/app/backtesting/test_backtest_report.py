@@ -4,7 +4,8 @@ from unittest import TestCase
 
 from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
     TradingStrategy, PortfolioConfiguration, TimeUnit, Algorithm, \
-    BacktestDateRange
+    BacktestDateRange, BACKTESTING_EQUITY_CURVE_RESOLUTION, \
+    load_backtest_report
 from investing_algorithm_framework.services import BacktestService
 
 
@@ -118,3 +119,43 @@ class Test(TestCase):
         self.assertTrue(
             os.path.isfile(os.path.join(self.resource_dir, file_path))
         )
+
+    def test_report_equity_curve(self):
+        app = create_app(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTESTING_EQUITY_CURVE_RESOLUTION: timedelta(hours=1)
+            }
+        )
+        algorithm = Algorithm()
+        algorithm.add_strategy(TestStrategy())
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="bitvavo",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        backtest_date_range = BacktestDateRange(
+            start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 2)
+        )
+        report = app.run_backtest(
+            algorithm=algorithm,
+            backtest_date_range=backtest_date_range
+        )
+
+        # A sample every hour, including the final state at the end date
+        self.assertEqual(25, len(report.equity_curve))
+        self.assertTrue((report.equity_curve["total_value"] == 1000).all())
+        self.assertEqual(0.0, report.max_drawdown)
+        self.assertEqual(0.0, report.exposure)
+        self.assertIsNone(report.sharpe_ratio)
+        file_path = BacktestService.create_report_name(
+            report, os.path.join(self.resource_dir, "backtest_reports")
+        )
+        loaded_report = load_backtest_report(file_path)
+        self.assertEqual(0.0, loaded_report.max_drawdown)
+        self.assertEqual(
+            list(report.equity_curve.index),
+            list(loaded_report.equity_curve.index)
+        )
@@ -0,0 +1,320 @@
+import os
+from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from investing_algorithm_framework import create_app, RESOURCE_DIRECTORY, \
+    TradingStrategy, PortfolioConfiguration, TimeUnit, Algorithm, \
+    create_walk_forward_date_ranges, load_backtest_reports, \
+    OperationalException
+from investing_algorithm_framework.domain import BacktestMarketDataSource, \
+    MarketDataSource, OHLCVMarketDataSource
+
+
+class TestStrategy(TradingStrategy):
+    strategy_id = "test_strategy"
+    time_unit = TimeUnit.HOUR
+    interval = 1
+
+    def run_strategy(self, context, market_data):
+        pass
+
+
+class CountingBacktestMarketDataSource(BacktestMarketDataSource):
+    prepared_date_ranges = []
+    prepared_window_sizes = []
+
+    def prepare_data(self, config, backtest_start_date, backtest_end_date):
+        self.prepared_date_ranges.append(
+            (backtest_start_date, backtest_end_date)
+        )
+        self.prepared_window_sizes.append(
+            getattr(self, "window_size", None)
+        )
+
+    def get_data(self, date, config):
+        return None
+
+    def empty(self):
+        return False
+
+
+class CountingMarketDataSource(MarketDataSource):
+
+    def get_data(self, start_date=None, end_date=None, config=None):
+        return None
+
+    def to_backtest_market_data_source(self):
+        return CountingBacktestMarketDataSource(
+            identifier=self.identifier,
+            market=self.market,
+            symbol=self.symbol
+        )
+
+
+class CountingOHLCVMarketDataSource(OHLCVMarketDataSource):
+
+    def get_data(self, start_date=None, end_date=None, config=None):
+        return None
+
+    def to_backtest_market_data_source(self):
+        backtest_market_data_source = CountingBacktestMarketDataSource(
+            identifier=self.identifier,
+            market=self.market,
+            symbol=self.symbol
+        )
+        backtest_market_data_source.window_size = self.window_size
+        return backtest_market_data_source
+
+
+def create_walk_forward_app():
+    resource_dir = os.path.abspath(
+        os.path.join(
+            os.path.dirname(os.path.realpath(__file__)),
+            os.pardir,
+            os.pardir,
+            "resources"
+        )
+    )
+    app = create_app(config={RESOURCE_DIRECTORY: resource_dir})
+    app.add_market_data_source(
+        CountingMarketDataSource(
+            identifier="counting", market="bitvavo", symbol="BTC/EUR"
+        )
+    )
+    app.add_portfolio_configuration(
+        PortfolioConfiguration(
+            market="bitvavo",
+            trading_symbol="EUR",
+            initial_balance=1000
+        )
+    )
+    return app
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.join(
+                    os.path.join(
+                        os.path.join(
+                            os.path.realpath(__file__),
+                            os.pardir
+                        ),
+                        os.pardir
+                    ),
+                    os.pardir
+                ),
+                "resources"
+            )
+        )
+        CountingBacktestMarketDataSource.prepared_date_ranges = []
+        CountingBacktestMarketDataSource.prepared_window_sizes = []
+
+    def tearDown(self) -> None:
+        database_dir = os.path.join(self.resource_dir, "databases")
+
+        if os.path.exists(database_dir):
+            for root, dirs, files in os.walk(database_dir, topdown=False):
+                for name in files:
+                    os.remove(os.path.join(root, name))
+                for name in dirs:
+                    os.rmdir(os.path.join(root, name))
+
+    def test_create_walk_forward_date_ranges(self):
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 11),
+            in_sample_window=timedelta(days=4),
+            out_of_sample_window=timedelta(days=2),
+        )
+        self.assertEqual(3, len(date_ranges))
+        in_sample, out_of_sample = date_ranges[1]
+        self.assertEqual(datetime(2023, 1, 3), in_sample.start_date)
+        self.assertEqual(datetime(2023, 1, 7), in_sample.end_date)
+        self.assertEqual(datetime(2023, 1, 7), out_of_sample.start_date)
+        self.assertEqual(datetime(2023, 1, 9), out_of_sample.end_date)
+
+        # Anchored in-sample date ranges all start at the start date
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 11),
+            in_sample_window=timedelta(days=4),
+            out_of_sample_window=timedelta(days=2),
+            anchored=True
+        )
+        in_sample, out_of_sample = date_ranges[2]
+        self.assertEqual(datetime(2023, 1, 1), in_sample.start_date)
+        self.assertEqual(datetime(2023, 1, 9), in_sample.end_date)
+        self.assertEqual(datetime(2023, 1, 11), out_of_sample.end_date)
+
+    def test_run_walk_forward_backtest(self):
+        app = create_app(config={RESOURCE_DIRECTORY: self.resource_dir})
+        app.add_market_data_source(
+            CountingMarketDataSource(
+                identifier="counting", market="bitvavo", symbol="BTC/EUR"
+            )
+        )
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="bitvavo",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        algorithms = []
+
+        for name in ["candidate_one", "candidate_two"]:
+            algorithm = Algorithm(name=name)
+            algorithm.add_strategy(TestStrategy())
+            algorithms.append(algorithm)
+
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2),
+            in_sample_window=timedelta(hours=8),
+            out_of_sample_window=timedelta(hours=4),
+        )
+        report = app.run_walk_forward_backtest(
+            algorithms=algorithms,
+            walk_forward_date_ranges=date_ranges
+        )
+
+        # The market data is prepared once for all windows
+        self.assertEqual(
+            [(datetime(2023, 1, 1), datetime(2023, 1, 2))],
+            CountingBacktestMarketDataSource.prepared_date_ranges
+        )
+        self.assertEqual(4, len(report.windows))
+        self.assertEqual(
+            ["candidate_one"] * 4, report.get_selected_algorithms()
+        )
+        self.assertEqual(
+            ["candidate_one", "candidate_two"],
+            list(report.windows[0].in_sample_metrics["name"])
+        )
+
+        # The out-of-sample equity curves are stitched together
+        self.assertEqual(
+            datetime(2023, 1, 1, 8), report.equity_curve.index[0]
+        )
+        self.assertEqual(
+            datetime(2023, 1, 2), report.equity_curve.index[-1]
+        )
+        self.assertTrue(report.equity_curve.index.is_unique)
+        summary = report.get_summary()
+        self.assertEqual(4, summary["number_of_windows"])
+        self.assertEqual(1000, summary["initial_value"])
+        self.assertEqual(1000, summary["total_value"])
+        self.assertEqual(0.0, summary["max_drawdown"])
+
+    def test_prepared_data_is_reused_per_configuration(self):
+        app = create_app(config={RESOURCE_DIRECTORY: self.resource_dir})
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="bitvavo",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        algorithms = []
+
+        # The candidates use the same identifier with another window size
+        for window_size in [10, 20]:
+            algorithm = Algorithm(name=f"window_size_{window_size}")
+            algorithm.add_strategy(
+                TestStrategy(
+                    market_data_sources=[
+                        CountingOHLCVMarketDataSource(
+                            identifier="ohlcv",
+                            market="bitvavo",
+                            symbol="BTC/EUR",
+                            time_frame="1h",
+                            window_size=window_size
+                        )
+                    ]
+                )
+            )
+            algorithms.append(algorithm)
+
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2),
+            in_sample_window=timedelta(hours=8),
+            out_of_sample_window=timedelta(hours=4),
+        )
+        app.run_walk_forward_backtest(
+            algorithms=algorithms,
+            walk_forward_date_ranges=date_ranges
+        )
+
+        # Every configuration is prepared once for all windows
+        self.assertEqual(
+            [10, 20], CountingBacktestMarketDataSource.prepared_window_sizes
+        )
+
+    def test_run_walk_forward_backtest_in_worker_processes(self):
+        app = create_walk_forward_app()
+        algorithms = []
+
+        for name in ["candidate_one", "candidate_two"]:
+            algorithm = Algorithm(name=name)
+            algorithm.add_strategy(TestStrategy())
+            algorithms.append(algorithm)
+
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2),
+            in_sample_window=timedelta(hours=8),
+            out_of_sample_window=timedelta(hours=4),
+        )
+
+        with self.assertRaises(OperationalException):
+            app.run_walk_forward_backtest(
+                algorithms=algorithms,
+                walk_forward_date_ranges=date_ranges,
+                max_workers=2
+            )
+
+        with TemporaryDirectory() as directory:
+            report = app.run_walk_forward_backtest(
+                algorithms=algorithms,
+                walk_forward_date_ranges=date_ranges,
+                output_directory=directory,
+                app_factory=create_walk_forward_app,
+                max_workers=2
+            )
+
+            # The in-sample and out-of-sample reports of every window
+            self.assertEqual(12, len(load_backtest_reports(directory)))
+
+        self.assertEqual(4, len(report.windows))
+        self.assertEqual(
+            ["candidate_one"] * 4, report.get_selected_algorithms()
+        )
+        self.assertEqual(
+            ["candidate_one", "candidate_two"],
+            list(report.windows[0].in_sample_metrics["name"])
+        )
+        self.assertEqual(1000, report.get_summary()["total_value"])
+
+    def test_run_walk_forward_backtest_with_unknown_metric(self):
+        app = create_walk_forward_app()
+        algorithm = Algorithm(name="candidate")
+        algorithm.add_strategy(TestStrategy())
+        date_ranges = create_walk_forward_date_ranges(
+            start_date=datetime(2023, 1, 1),
+            end_date=datetime(2023, 1, 2),
+            in_sample_window=timedelta(hours=8),
+            out_of_sample_window=timedelta(hours=4),
+        )
+
+        # Only the metric columns can be selected on
+        with self.assertRaises(OperationalException):
+            app.run_walk_forward_backtest(
+                algorithms=[algorithm],
+                walk_forward_date_ranges=date_ranges,
+                metric="name"
+            )
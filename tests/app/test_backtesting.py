@@ -1,9 +1,12 @@
 import os
+import shutil
+import sqlite3
 from unittest import TestCase
 
 from investing_algorithm_framework import TradingStrategy, Algorithm, \
     create_app, RESOURCE_DIRECTORY, PortfolioConfiguration, \
-    BacktestDateRange, BacktestReport, Context
+    BacktestDateRange, BacktestReport, Context, \
+    BACKTESTING_IN_MEMORY_DATABASE, BACKTESTING_DATABASE_SNAPSHOT_PATH
 from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI
 
 
@@ -93,3 +96,75 @@ class Test(TestCase):
         database_uri = app.config[SQLALCHEMY_DATABASE_URI]
         self.assertIsNotNone(database_uri)
         self.assertTrue(database_uri.endswith("backtest-database.sqlite3"))
+
+    def test_backtest_with_in_memory_database(self):
+        snapshot_directory = os.path.join(
+            self.resource_dir, "backtest_databases", "snapshots"
+        )
+        app = create_app(
+            config={
+                RESOURCE_DIRECTORY: self.resource_dir,
+                BACKTESTING_IN_MEMORY_DATABASE: True,
+                BACKTESTING_DATABASE_SNAPSHOT_PATH: os.path.join(
+                    snapshot_directory, "snapshot.sqlite3"
+                )
+            }
+        )
+        app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                market="BITVAVO",
+                trading_symbol="USDT"
+            )
+        )
+        date_ranges = [
+            BacktestDateRange(
+                start_date="2021-01-01",
+                end_date="2021-01-02"
+            ),
+            BacktestDateRange(
+                start_date="2021-01-02",
+                end_date="2021-01-03"
+            )
+        ]
+        algorithm = Algorithm(name="in-memory")
+        algorithm.add_strategy(SimpleTradingStrategy)
+        app.add_algorithm(algorithm)
+
+        try:
+            for date_range in date_ranges:
+                report: BacktestReport = app.run_backtest(
+                    backtest_date_range=date_range,
+                    initial_amount=1000
+                )
+                self.assertEqual(report.get_initial_unallocated(), 1000)
+
+            self.assertEqual(
+                "sqlite://", app.config[SQLALCHEMY_DATABASE_URI]
+            )
+
+            # Each backtest writes its own snapshot
+            snapshot_paths = [
+                os.path.join(
+                    snapshot_directory,
+                    "snapshot_in-memory_backtest-start-date_"
+                    f"{start_date}_backtest-end-date_{end_date}.sqlite3"
+                ) for start_date, end_date in [
+                    ("2021-01-01-00-00", "2021-01-02-00-00"),
+                    ("2021-01-02-00-00", "2021-01-03-00-00"),
+                ]
+            ]
+
+            for snapshot_path in snapshot_paths:
+                self.assertTrue(os.path.exists(snapshot_path))
+                connection = sqlite3.connect(snapshot_path)
+
+                try:
+                    snapshots = connection.execute(
+                        "SELECT COUNT(*) FROM portfolio_snapshots"
+                    ).fetchone()[0]
+                finally:
+                    connection.close()
+
+                self.assertGreater(snapshots, 0)
+        finally:
+            shutil.rmtree(snapshot_directory, ignore_errors=True)
@@ -29,3 +29,23 @@ class Test(FlaskTestBase):
         data = json.loads(response.data.decode())
         self.assertEqual(200, response.status_code)
         self.assertEqual(1, len(data["items"]))
+
+    def test_list_orders_paginated(self):
+
+        for _ in range(3):
+            self.iaf_app.context.create_limit_order(
+                amount=1,
+                target_symbol="KSM",
+                price=10,
+                order_side="BUY"
+            )
+
+        response = self.client.get("/api/orders?page=2&per_page=2")
+        data = json.loads(response.data.decode())
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, len(data["items"]))
+        self.assertEqual(3, data["total"])
+        self.assertEqual(2, data["page"])
+        self.assertEqual(2, data["per_page"])
+        response = self.client.get("/api/orders?page=abc")
+        self.assertEqual(400, response.status_code)
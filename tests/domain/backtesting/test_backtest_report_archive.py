@@ -0,0 +1,127 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import pandas as pd
+
+from investing_algorithm_framework.domain import load_backtest_report, \
+    write_backtest_report_archive, read_backtest_report_archive_header, \
+    get_backtest_report, BacktestDateRange, TradeStopLoss, TradeTakeProfit, \
+    TradeRiskType
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.join(
+                    os.path.join(
+                        os.path.join(
+                            os.path.realpath(__file__),
+                            os.pardir
+                        ),
+                        os.pardir
+                    ),
+                    os.pardir
+                ),
+                "resources"
+            )
+        )
+        self.report_file_name = "report_GoldenCrossStrategy_backtest-start-date_2023-08-24-00-00_backtest-end-date_2023-12-02-00-00_created-at_2025-01-27-08-21" # noqa
+
+    def test_round_trip(self):
+        report = load_backtest_report(
+            os.path.join(
+                self.resource_dir,
+                "backtest_reports_for_testing",
+                f"{self.report_file_name}.json"
+            )
+        )
+        index = pd.date_range("2023-08-24", periods=3, freq="D", name="date")
+        report.traces = {
+            "strategy": {
+                "BTC/EUR": pd.DataFrame({"sma": [1.0, 2.0, 3.0]}, index=index)
+            }
+        }
+        trade = report.trades[0]
+        trade.stop_losses = [
+            TradeStopLoss(
+                trade_id=trade.id,
+                trade_risk_type=TradeRiskType.FIXED.value,
+                percentage=5,
+                open_price=trade.open_price,
+                total_amount_trade=trade.amount,
+                sell_prices="1.0,2.0"
+            )
+        ]
+        trade.take_profits = [
+            TradeTakeProfit(
+                trade_id=trade.id,
+                trade_risk_type=TradeRiskType.TRAILING.value,
+                percentage=10,
+                open_price=trade.open_price,
+                total_amount_trade=trade.amount,
+                sell_percentage=50
+            )
+        ]
+        report.equity_curve = pd.DataFrame(
+            {"total_value": [400.0, 410.0, 405.0], "allocated": [0, 100, 90]},
+            index=index.rename("datetime")
+        )
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, f"{self.report_file_name}.zip")
+            write_backtest_report_archive(report, path)
+            header = read_backtest_report_archive_header(path)
+            self.assertEqual("GoldenCrossStrategy", header["report"]["name"])
+
+            # The nested attributes of the trades have their own sections
+            self.assertEqual(
+                "trade_orders.parquet", header["sections"]["trade_orders"]
+            )
+            self.assertIn("trade_stop_losses", header["sections"])
+            self.assertIn("trade_take_profits", header["sections"])
+            self.assertNotIn("orders", header["report"])
+
+            loaded = load_backtest_report(path)
+
+            # The sections are only read when they are accessed
+            self.assertEqual(
+                {"orders", "trades", "positions", "traces", "equity_curve"},
+                set(loaded._section_loaders)
+            )
+            self.assertEqual(report.total_value, loaded.total_value)
+            self.assertEqual(report.created_at, loaded.created_at)
+            self.assertEqual(len(report.orders), len(loaded.orders))
+            self.assertNotIn("orders", loaded._section_loaders)
+            self.assertEqual(
+                [order.to_dict() for order in report.orders],
+                [order.to_dict() for order in loaded.orders]
+            )
+            self.assertEqual(
+                [trade.to_dict() for trade in report.trades],
+                [trade.to_dict() for trade in loaded.trades]
+            )
+            self.assertEqual(
+                [vars(position) for position in report.positions],
+                [vars(position) for position in loaded.positions]
+            )
+            pd.testing.assert_frame_equal(
+                report.equity_curve, loaded.equity_curve, check_freq=False
+            )
+            pd.testing.assert_frame_equal(
+                report.traces["strategy"]["BTC/EUR"],
+                loaded.traces["strategy"]["BTC/EUR"],
+                check_freq=False
+            )
+
+            # Archives are found in a directory of backtest reports
+            found = get_backtest_report(
+                directory,
+                "GoldenCrossStrategy",
+                BacktestDateRange(
+                    start_date="2023-08-24", end_date="2023-12-02"
+                )
+            )
+            self.assertEqual(report.total_value, found.total_value)
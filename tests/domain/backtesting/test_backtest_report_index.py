@@ -0,0 +1,259 @@
+import os
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from investing_algorithm_framework.domain import load_backtest_report, \
+    get_backtest_report, BacktestDateRange, add_backtest_report_to_index, \
+    read_backtest_report_index, BACKTEST_REPORT_INDEX_FILE_NAME, \
+    load_backtest_reports, BacktestReport, DATETIME_FORMAT
+from investing_algorithm_framework.domain.utils import backtest_report_index
+
+
+def _add_reports_to_index(directory, report_path, names):
+    report = load_backtest_report(report_path)
+
+    for name in names:
+        data = report.to_dict(include_sections=False)
+        data["name"] = name
+        add_backtest_report_to_index(
+            directory,
+            BacktestReport.from_dict(data),
+            os.path.join(directory, f"{name}.json")
+        )
+
+
+class Test(TestCase):
+
+    def setUp(self):
+        self.resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.join(
+                    os.path.join(
+                        os.path.join(
+                            os.path.realpath(__file__),
+                            os.pardir
+                        ),
+                        os.pardir
+                    ),
+                    os.pardir
+                ),
+                "resources"
+            )
+        )
+        self.report_file_name = "report_GoldenCrossStrategy_backtest-start-date_2023-08-24-00-00_backtest-end-date_2023-12-02-00-00_created-at_2025-01-27-08-21.json" # noqa
+        self.date_range = BacktestDateRange(
+            start_date="2023-08-24", end_date="2023-12-02"
+        )
+
+    def test_index_is_built_from_existing_reports(self):
+
+        with TemporaryDirectory() as directory:
+            shutil.copy(
+                os.path.join(
+                    self.resource_dir,
+                    "backtest_reports_for_testing",
+                    self.report_file_name
+                ),
+                directory
+            )
+            report = get_backtest_report(
+                directory, "GoldenCrossStrategy", self.date_range
+            )
+            self.assertIsNotNone(report)
+            self.assertTrue(
+                os.path.isfile(
+                    os.path.join(directory, BACKTEST_REPORT_INDEX_FILE_NAME)
+                )
+            )
+            entry = list(read_backtest_report_index(directory).values())[0]
+            self.assertEqual(self.report_file_name, entry["path"])
+            self.assertEqual(report.total_value, entry["total_value"])
+            self.assertIsNone(
+                get_backtest_report(
+                    directory,
+                    "GoldenCrossStrategy",
+                    BacktestDateRange(
+                        start_date="2023-08-25", end_date="2023-12-02"
+                    )
+                )
+            )
+
+            # The index file is not loaded as a report
+            self.assertEqual(1, len(load_backtest_reports(directory)))
+
+    def test_add_report_to_index(self):
+        report = load_backtest_report(
+            os.path.join(
+                self.resource_dir,
+                "backtest_reports_for_testing",
+                self.report_file_name
+            )
+        )
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, self.report_file_name)
+            shutil.copy(
+                os.path.join(
+                    self.resource_dir,
+                    "backtest_reports_for_testing",
+                    self.report_file_name
+                ),
+                path
+            )
+            add_backtest_report_to_index(directory, report, path)
+
+            # An older report does not replace the indexed report
+            data = report.to_dict(include_sections=False)
+            data["created_at"] = (report.created_at - timedelta(days=1)) \
+                .strftime(DATETIME_FORMAT)
+            add_backtest_report_to_index(
+                directory,
+                BacktestReport.from_dict(data),
+                os.path.join(directory, "older.json")
+            )
+            entries = read_backtest_report_index(directory)
+            self.assertEqual(1, len(entries))
+            self.assertEqual(
+                self.report_file_name, list(entries.values())[0]["path"]
+            )
+            self.assertIsNotNone(
+                get_backtest_report(directory, "GoldenCrossStrategy")
+            )
+
+            # A removed report file is not returned
+            os.remove(path)
+            self.assertIsNone(
+                get_backtest_report(
+                    directory, "GoldenCrossStrategy", self.date_range
+                )
+            )
+
+    def test_reports_copied_after_indexing_are_found(self):
+
+        with TemporaryDirectory() as directory:
+
+            # The index of the empty directory is written first
+            self.assertEqual({}, read_backtest_report_index(directory))
+            shutil.copy(
+                os.path.join(
+                    self.resource_dir,
+                    "backtest_reports_for_testing",
+                    self.report_file_name
+                ),
+                directory
+            )
+            self.assertIsNotNone(
+                get_backtest_report(
+                    directory, "GoldenCrossStrategy", self.date_range
+                )
+            )
+            self.assertEqual(1, len(read_backtest_report_index(directory)))
+
+    def test_lookup_in_read_only_directory(self):
+
+        with TemporaryDirectory() as directory:
+            shutil.copy(
+                os.path.join(
+                    self.resource_dir,
+                    "backtest_reports_for_testing",
+                    self.report_file_name
+                ),
+                directory
+            )
+
+            # The index can't be written, the report is found with
+            # the index in memory
+            with mock.patch(
+                "investing_algorithm_framework.domain.utils"
+                ".backtest_report_index.os.replace",
+                side_effect=PermissionError()
+            ):
+                self.assertIsNotNone(
+                    get_backtest_report(
+                        directory, "GoldenCrossStrategy", self.date_range
+                    )
+                )
+
+            self.assertEqual([self.report_file_name], os.listdir(directory))
+
+    def test_index_is_cached(self):
+
+        with TemporaryDirectory() as directory:
+            shutil.copy(
+                os.path.join(
+                    self.resource_dir,
+                    "backtest_reports_for_testing",
+                    self.report_file_name
+                ),
+                directory
+            )
+            read_backtest_report_index(directory)
+
+            with mock.patch.object(
+                backtest_report_index,
+                "_load_index",
+                wraps=backtest_report_index._load_index
+            ) as load_index, mock.patch.object(
+                backtest_report_index,
+                "_read_report_data",
+                wraps=backtest_report_index._read_report_data
+            ) as read_report_data:
+
+                for _ in range(3):
+                    self.assertIsNotNone(
+                        get_backtest_report(
+                            directory, "GoldenCrossStrategy", self.date_range
+                        )
+                    )
+
+                load_index.assert_not_called()
+                read_report_data.assert_not_called()
+
+                # An index replaced by another process is read again
+                path = os.path.join(
+                    directory, BACKTEST_REPORT_INDEX_FILE_NAME
+                )
+
+                with open(path) as index_file:
+                    index = json.load(index_file)
+
+                list(index["reports"].values())[0]["total_value"] = 1
+
+                with open(f"{path}.other", "w") as index_file:
+                    json.dump(index, index_file)
+
+                os.replace(f"{path}.other", path)
+                entry = list(read_backtest_report_index(directory).values())[0]
+                self.assertEqual(1, entry["total_value"])
+                load_index.assert_called_once()
+                read_report_data.assert_not_called()
+
+    def test_add_reports_from_multiple_processes(self):
+        report_path = os.path.join(
+            self.resource_dir,
+            "backtest_reports_for_testing",
+            self.report_file_name
+        )
+
+        with TemporaryDirectory() as directory:
+
+            with ProcessPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        _add_reports_to_index,
+                        [directory] * 4,
+                        [report_path] * 4,
+                        [
+                            [f"Strategy{worker}_{i}" for i in range(5)]
+                            for worker in range(4)
+                        ]
+                    )
+                )
+
+            self.assertEqual(
+                20, len(read_backtest_report_index(directory, rebuild=False))
+            )
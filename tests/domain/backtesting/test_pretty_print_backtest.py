@@ -1,8 +1,13 @@
+import csv
 import os
+import re
+from contextlib import redirect_stdout
+from io import StringIO
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from investing_algorithm_framework.domain import pretty_print_backtest, \
-    load_backtest_report
+    load_backtest_report, OperationalException
 
 
 class Test(TestCase):
@@ -31,3 +36,51 @@ class Test(TestCase):
         )
         report = load_backtest_report(path)
         pretty_print_backtest(report)
+
+    def test_pretty_print_capped_tables(self):
+        path = os.path.join(
+            self.resource_dir,
+            "backtest_reports_for_testing/report_GoldenCrossStrategy_backtest-start-date_2023-08-24-00-00_backtest-end-date_2023-12-02-00-00_created-at_2025-01-27-08-21.json"
+        )
+        report = load_backtest_report(path)
+
+        for view in ["first", "last", "top"]:
+            output = StringIO()
+
+            with redirect_stdout(output):
+                pretty_print_backtest(report, max_rows=1, view=view)
+
+            # Remove the colors of the console output
+            output = re.sub(r"\x1b\[\d+m", "", output.getvalue())
+            self.assertIn(f"Total: {len(report.trades)}", output)
+            self.assertIn("Shown: 1", output)
+
+        with self.assertRaises(OperationalException):
+            pretty_print_backtest(report, max_rows=1, view="unknown")
+
+    def test_pretty_print_to_files(self):
+        path = os.path.join(
+            self.resource_dir,
+            "backtest_reports_for_testing/report_GoldenCrossStrategy_backtest-start-date_2023-08-24-00-00_backtest-end-date_2023-12-02-00-00_created-at_2025-01-27-08-21.json"
+        )
+        report = load_backtest_report(path)
+
+        with TemporaryDirectory() as output_directory:
+            pretty_print_backtest(
+                report, output_directory=output_directory, output_format="csv"
+            )
+
+            with open(os.path.join(output_directory, "trades.csv")) as file:
+                rows = list(csv.DictReader(file))
+
+            self.assertEqual(len(report.trades), len(rows))
+            self.assertIn("Pair (Trade id)", rows[0])
+
+            pretty_print_backtest(report, output_directory=output_directory)
+
+            for name in ["positions", "trades", "stop_losses", "take_profits"]:
+                self.assertTrue(
+                    os.path.isfile(
+                        os.path.join(output_directory, f"{name}.html")
+                    )
+                )
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import pandas as pd
+
+from investing_algorithm_framework.domain.metrics import get_drawdown, \
+    get_equity_curve_metrics
+
+
+class TestEquityCurve(TestCase):
+
+    def create_equity_curve(self, values, allocated=None):
+        index = pd.DatetimeIndex(
+            [datetime(2023, 1, 1) + timedelta(days=i)
+             for i in range(len(values))],
+            name="datetime"
+        )
+        data = {"total_value": values}
+
+        if allocated is not None:
+            data["allocated"] = allocated
+
+        return pd.DataFrame(data, index=index)
+
+    def test_drawdown(self):
+        equity_curve = self.create_equity_curve([100, 120, 90, 110, 130])
+        drawdown = get_drawdown(equity_curve)
+        self.assertEqual([0.0, 0.0, 25.0], list(drawdown[:3]))
+        self.assertAlmostEqual(100 / 12, drawdown.iloc[3])
+        self.assertEqual(0.0, drawdown.iloc[4])
+
+    def test_metrics(self):
+        equity_curve = self.create_equity_curve(
+            [100, 120, 90, 110, 130], allocated=[0, 60, 45, 55, 0]
+        )
+        metrics = get_equity_curve_metrics(equity_curve)
+        self.assertEqual(25.0, metrics["max_drawdown"])
+
+        # Below the peak of day 2 until the new peak on day 5
+        self.assertEqual(2.0, metrics["max_drawdown_duration"])
+        self.assertAlmostEqual(30.0, metrics["exposure"])
+        returns = equity_curve["total_value"].pct_change().dropna()
+        self.assertAlmostEqual(
+            returns.std() * 365 ** 0.5 * 100, metrics["volatility"]
+        )
+        self.assertAlmostEqual(
+            returns.mean() / returns.std() * 365 ** 0.5,
+            metrics["sharpe_ratio"]
+        )
+        self.assertGreater(metrics["sortino_ratio"], metrics["sharpe_ratio"])
+
+    def test_flat_curve(self):
+        metrics = get_equity_curve_metrics(
+            self.create_equity_curve([100, 100, 100])
+        )
+        self.assertEqual(0.0, metrics["max_drawdown"])
+        self.assertEqual(0.0, metrics["volatility"])
+        self.assertIsNone(metrics["sharpe_ratio"])
+        self.assertIsNone(metrics["sortino_ratio"])
+        self.assertIsNone(metrics["exposure"])
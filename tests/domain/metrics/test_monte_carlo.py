@@ -0,0 +1,99 @@
+import os
+from unittest import TestCase
+
+import numpy as np
+
+from investing_algorithm_framework.domain import load_backtest_report, \
+    OperationalException
+from investing_algorithm_framework.domain.metrics import \
+    simulate_trade_sequences
+
+
+class TestMonteCarlo(TestCase):
+
+    def setUp(self):
+        self.returns = np.array([0.1, -0.2, 0.05, -0.1, 0.15, 0.02])
+
+    def test_permutation(self):
+        result = simulate_trade_sequences(
+            self.returns,
+            1000,
+            number_of_simulations=2500,
+            method="permutation",
+            seed=1
+        )
+        self.assertEqual(2500, len(result["final_equity"]))
+
+        # A permutation only changes the path of the equity
+        np.testing.assert_allclose(
+            1000 * np.prod(1 + self.returns), result["final_equity"]
+        )
+        self.assertGreaterEqual(result["max_drawdown"].min(), 20.0 - 1e-9)
+        self.assertLessEqual(result["max_drawdown"].max(), 100.0)
+        self.assertEqual(0.0, result["ruin_probability"])
+
+    def test_bootstrap(self):
+        result = simulate_trade_sequences(
+            self.returns,
+            1000,
+            number_of_simulations=2500,
+            ruin_threshold=20.0,
+            seed=1
+        )
+        self.assertGreater(result["final_equity"].std(), 0)
+        self.assertTrue(0 < result["ruin_probability"] < 1)
+        self.assertLessEqual(
+            result["final_equity_percentiles"][5],
+            result["final_equity_percentiles"][95]
+        )
+
+        # The results do not depend on the number of workers
+        parallel = simulate_trade_sequences(
+            self.returns,
+            1000,
+            number_of_simulations=2500,
+            ruin_threshold=20.0,
+            seed=1,
+            max_workers=3
+        )
+        np.testing.assert_array_equal(
+            result["final_equity"], parallel["final_equity"]
+        )
+
+    def test_invalid_arguments(self):
+
+        with self.assertRaises(OperationalException):
+            simulate_trade_sequences(self.returns, 1000, method="unknown")
+
+        with self.assertRaises(OperationalException):
+            simulate_trade_sequences([], 1000)
+
+    def test_backtest_report(self):
+        resource_dir = os.path.abspath(
+            os.path.join(
+                os.path.realpath(__file__),
+                os.pardir,
+                os.pardir,
+                os.pardir,
+                "resources",
+                "backtest_reports_for_testing"
+            )
+        )
+        report = load_backtest_report(
+            os.path.join(
+                resource_dir,
+                "report_GoldenCrossStrategy_backtest-start-date_2023-08-24-00-00_backtest-end-date_2023-12-02-00-00_created-at_2025-01-27-08-21.json" # noqa
+            )
+        )
+        returns = report.get_trade_returns()
+        self.assertEqual(
+            len([trade for trade in report.trades if trade.closed_at]),
+            len(returns)
+        )
+        result = report.monte_carlo(
+            number_of_simulations=100, method="permutation", seed=1
+        )
+        np.testing.assert_allclose(
+            report.initial_unallocated + report.total_net_gain,
+            result["final_equity"]
+        )
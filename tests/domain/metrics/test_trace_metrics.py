@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from investing_algorithm_framework.domain.metrics import TraceMetrics, \
+    get_trace_metrics, get_price_efficiency_ratio
+
+
+class TestTraceMetrics(TestCase):
+
+    def setUp(self):
+        random = np.random.default_rng(42)
+        index = pd.date_range("2023-01-01", periods=200, freq="h")
+        self.traces = {
+            symbol: pd.DataFrame(
+                {"Close": 100 + random.normal(0, 1, 200).cumsum()},
+                index=index
+            )
+            for symbol in ["BTC/EUR", "ETH/EUR"]
+        }
+        self.traces["ETH/EUR"] = self.traces["ETH/EUR"].iloc[40:]
+
+    def assert_metrics(self, metrics):
+        self.assertEqual(["BTC/EUR", "ETH/EUR"], list(metrics.index))
+
+        for symbol, data in self.traces.items():
+            returns = data["Close"].pct_change().dropna()
+            self.assertAlmostEqual(
+                get_price_efficiency_ratio(data),
+                metrics.loc[symbol, "efficiency_ratio"]
+            )
+            self.assertAlmostEqual(
+                returns.std(), metrics.loc[symbol, "volatility"]
+            )
+            self.assertAlmostEqual(
+                returns.tail(20).std(),
+                metrics.loc[symbol, "rolling_volatility"]
+            )
+            self.assertAlmostEqual(
+                returns.autocorr(1), metrics.loc[symbol, "autocorrelation"]
+            )
+
+    def test_get_trace_metrics(self):
+        self.assert_metrics(get_trace_metrics(self.traces))
+
+        # The traces are not modified
+        self.assertEqual(["Close"], list(self.traces["BTC/EUR"].columns))
+
+    def test_incremental_update(self):
+        trace_metrics = TraceMetrics()
+
+        # Every run traces a window that overlaps the previous runs
+        for end in range(10, 210, 10):
+            trace_metrics.update({
+                symbol: data.iloc[max(0, end - 50):end]
+                for symbol, data in self.traces.items()
+            })
+
+        self.assert_metrics(trace_metrics.get_metrics())
+
+    def test_short_traces(self):
+        index = pd.date_range("2023-01-01", periods=2, freq="h")
+        metrics = get_trace_metrics(
+            {"BTC/EUR": pd.DataFrame({"Close": [100, 101]}, index=index)}
+        )
+        self.assertAlmostEqual(1.0, metrics.loc["BTC/EUR", "efficiency_ratio"])
+        self.assertTrue(np.isnan(metrics.loc["BTC/EUR", "volatility"]))
+        self.assertTrue(np.isnan(metrics.loc["BTC/EUR", "autocorrelation"]))
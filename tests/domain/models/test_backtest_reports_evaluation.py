@@ -2,7 +2,8 @@ import os
 from unittest import TestCase
 
 from investing_algorithm_framework import load_backtest_reports, \
-    BacktestReportsEvaluation
+    BacktestReportsEvaluation, BacktestDateRange, OperationalException, \
+    load_backtest_reports_evaluation
 
 
 class Test(TestCase):
@@ -29,3 +30,90 @@ class Test(TestCase):
         reports = load_backtest_reports(path)
         evaluation = BacktestReportsEvaluation(reports)
         self.assertEqual(len(evaluation.backtest_reports), 3)
+
+    def test_order_and_rank(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+        evaluation = BacktestReportsEvaluation(load_backtest_reports(path))
+        date_range = BacktestDateRange(
+            start_date="2021-12-21", end_date="2022-06-20"
+        )
+        self.assertEqual(2, len(evaluation.get_date_ranges()))
+        self.assertEqual(
+            {"950100", "9-50-100"},
+            {
+                report.name for report in
+                evaluation.get_profit_order(backtest_date_range=date_range)
+            }
+        )
+        self.assertEqual(
+            "GoldenCrossStrategy", evaluation.get_growth_order()[0].name
+        )
+        self.assertEqual(
+            "GoldenCrossStrategy",
+            evaluation.get_percentage_positive_trades_order()[0].name
+        )
+        self.assertEqual("950100", evaluation.rank())
+        self.assertEqual(
+            "GoldenCrossStrategy", evaluation.rank(0, 1)
+        )
+        self.assertEqual(
+            "9-50-100", evaluation.get_report("9-50-100", date_range).name
+        )
+
+        with self.assertRaises(OperationalException):
+            evaluation.get_profit_order(
+                BacktestDateRange(
+                    start_date="2020-01-01", end_date="2020-02-01"
+                )
+            )
+
+    def test_score_and_top_k(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+        evaluation = BacktestReportsEvaluation(load_backtest_reports(path))
+        scores = evaluation.score(
+            {"total_net_gain": 0.5, "percentage_positive_trades": 0.5}
+        )
+        self.assertEqual(3, len(scores))
+
+        # A single report in a date range has no spread to normalize on
+        self.assertTrue((scores["score"] == 0).all())
+
+        top = evaluation.get_top_k(1)
+        self.assertEqual(2, len(top))
+        self.assertEqual([1, 1], list(top["rank"]))
+        self.assertEqual(
+            ["950100", "GoldenCrossStrategy"], list(top["name"])
+        )
+
+        with self.assertRaises(OperationalException):
+            evaluation.score({"unknown": 1})
+
+    def test_reports_are_loaded_on_demand(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+        evaluation = load_backtest_reports_evaluation(path)
+        self.assertTrue(
+            all(
+                report.trades is None
+                for report in evaluation.backtest_reports
+            )
+        )
+        report = evaluation.get_growth_order()[0]
+        self.assertEqual("GoldenCrossStrategy", report.name)
+        self.assertIsNotNone(report.trades)
+        self.assertEqual(1, len(evaluation._loaded_reports))
+
+    def test_top_k_ranks_lower_is_better_metrics_ascending(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+        reports = load_backtest_reports(path)
+        date_range = reports[0].backtest_date_range
+
+        for report, max_drawdown in zip(reports, [10.0, 3.0, 5.0]):
+            report.max_drawdown = max_drawdown
+
+        evaluation = BacktestReportsEvaluation(reports)
+        top = evaluation.get_top_k(1, "max_drawdown", date_range)
+        self.assertEqual(["9-50-100"], list(top["name"]))
+        top = evaluation.get_top_k(
+            1, "max_drawdown", date_range, ascending=False
+        )
+        self.assertEqual(["950100"], list(top["name"]))
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+import pandas as pd
+
+from investing_algorithm_framework.domain import TraceStore
+
+
+class Test(TestCase):
+
+    def create_data(self, start, periods, offset=0.0):
+        index = pd.date_range(start, periods=periods, freq="h")
+        return pd.DataFrame(
+            {
+                "sma": [offset + i for i in range(periods)],
+                "ema": [offset + i for i in range(periods)],
+            },
+            index=index
+        )
+
+    def test_add_overlapping_traces(self):
+        store = TraceStore()
+
+        # Every run traces a window that overlaps the previous window
+        for run in range(50):
+            store.add(
+                "BTC/EUR",
+                self.create_data(
+                    pd.Timestamp("2023-01-01") + pd.Timedelta(hours=run),
+                    10,
+                    offset=run * 1000
+                )
+            )
+
+        traces = store.get("BTC/EUR")
+        self.assertEqual(59, len(traces))
+        self.assertTrue(traces.index.is_unique)
+        self.assertIsInstance(traces.index, pd.DatetimeIndex)
+
+        # The first traced row of an index is kept
+        self.assertEqual(0.0, traces["sma"].iloc[0])
+        self.assertEqual(1.0, traces["sma"].iloc[1])
+        self.assertEqual(49009.0, traces["sma"].iloc[-1])
+        self.assertEqual(["BTC/EUR"], list(store.to_dict()))
+        self.assertIsNone(store.get("ETH/EUR"))
+
+    def test_without_drop_duplicates(self):
+        store = TraceStore()
+        store.add("BTC/EUR", self.create_data("2023-01-01", 5))
+        store.add(
+            "BTC/EUR",
+            self.create_data("2023-01-01", 5),
+            drop_duplicates=False
+        )
+        self.assertEqual(10, len(store.get("BTC/EUR")))
+        store.add("BTC/EUR", self.create_data("2023-01-01", 5))
+        self.assertEqual(5, len(store.get("BTC/EUR")))
+
+    def test_budget(self):
+        store = TraceStore(max_rows=20, max_columns=1)
+
+        for run in range(100):
+            store.add(
+                "BTC/EUR",
+                self.create_data(
+                    pd.Timestamp("2023-01-01") + pd.Timedelta(hours=run), 5
+                )
+            )
+            self.assertLessEqual(
+                sum(len(chunk) for chunk in
+                    store._symbols["BTC/EUR"].chunks),
+                20
+            )
+
+        traces = store.get("BTC/EUR")
+        self.assertEqual(20, len(traces))
+        self.assertEqual(["sma"], list(traces.columns))
+        self.assertEqual(
+            pd.Timestamp("2023-01-01") + pd.Timedelta(hours=103),
+            traces.index[-1]
+        )
+
+    def test_invalid_data(self):
+
+        with self.assertRaises(ValueError):
+            TraceStore().add("BTC/EUR", [1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            TraceStore().add("BTC/EUR", pd.DataFrame({"sma": [1, 2, 3]}))
@@ -1,7 +1,13 @@
 import os
+import shutil
+from collections.abc import Iterator
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from investing_algorithm_framework import load_backtest_reports
+from investing_algorithm_framework import load_backtest_reports, \
+    iterate_backtest_reports, rebuild_backtest_report_index
+from investing_algorithm_framework.domain import \
+    BACKTEST_REPORT_INDEX_FILE_NAME
 
 
 class Test(TestCase):
@@ -23,3 +29,47 @@ class Test(TestCase):
     def test_backtest_reports_evaluation(self):
         path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
         reports = load_backtest_reports(path)
+        self.assertEqual(3, len(reports))
+
+    def test_summary_only(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+        reports = load_backtest_reports(path, summary_only=True)
+        full_reports = load_backtest_reports(path, use_processes=True)
+        self.assertEqual(
+            [report.total_value for report in full_reports],
+            [report.total_value for report in reports]
+        )
+        self.assertTrue(all(report.trades is None for report in reports))
+        self.assertTrue(
+            all(report.trades is not None for report in full_reports)
+        )
+
+        # Loading summaries does not write an index
+        self.assertFalse(
+            os.path.isfile(os.path.join(path, BACKTEST_REPORT_INDEX_FILE_NAME))
+        )
+
+    def test_summary_only_from_index(self):
+        path = os.path.join(self.resource_dir, "backtest_reports_for_testing")
+
+        with TemporaryDirectory() as directory:
+
+            for file in os.listdir(path):
+                shutil.copy(os.path.join(path, file), directory)
+
+            rebuild_backtest_report_index(directory)
+
+            # Indexed reports are not read from their files
+            for file in os.listdir(directory):
+
+                if file != BACKTEST_REPORT_INDEX_FILE_NAME:
+
+                    with open(os.path.join(directory, file), "w") as f:
+                        f.write("{}")
+
+            reports = iterate_backtest_reports(directory, summary_only=True)
+            self.assertIsInstance(reports, Iterator)
+            self.assertEqual(
+                {"950100", "9-50-100", "GoldenCrossStrategy"},
+                {report.name for report in reports}
+            )
@@ -0,0 +1,126 @@
+import os
+from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
+
+import polars
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential
+from investing_algorithm_framework.infrastructure import backup_database
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        order_service = self.app.container.order_service()
+
+        for symbol in ["BTC", "ETH", "DOT"]:
+            order_service.create(
+                {
+                    "portfolio_id": 1,
+                    "target_symbol": symbol,
+                    "amount": 1,
+                    "trading_symbol": "EUR",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "order_type": "LIMIT",
+                    "status": "OPEN",
+                }
+            )
+
+    def test_export_in_batches(self):
+        order_service = self.app.container.order_service()
+        batches = list(
+            order_service.export({"portfolio_id": 1}, batch_size=2)
+        )
+        self.assertEqual([2, 1], [len(batch) for batch in batches])
+        df = polars.concat(batches)
+        self.assertEqual({"BTC", "ETH", "DOT"}, set(df["target_symbol"]))
+        self.assertEqual(polars.Int64, df.schema["id"])
+        self.assertEqual(polars.Float64, df.schema["price"])
+        self.assertEqual(polars.Utf8, df.schema["status"])
+        self.assertEqual(polars.Datetime, df.schema["created_at"])
+        self.assertEqual([], list(order_service.export({"portfolio_id": 2})))
+
+        # Filter on date
+        tomorrow = datetime.utcnow() + timedelta(days=1)
+        self.assertEqual(
+            [], list(order_service.export({"created_at_gte": tomorrow}))
+        )
+        self.assertEqual(
+            3,
+            len(polars.concat(
+                order_service.export({"created_at_lte": tomorrow})
+            ))
+        )
+
+    def test_export_to_parquet(self):
+        trade_service = self.app.container.trade_service()
+
+        with TemporaryDirectory() as directory:
+            paths = trade_service.export_to_parquet(
+                directory, {"portfolio_id": 1}, batch_size=2
+            )
+            self.assertEqual(2, len(paths))
+            df = polars.read_parquet(os.path.join(directory, "*.parquet"))
+            self.assertEqual(3, len(df))
+            self.assertEqual(polars.Float64, df.schema["open_price"])
+
+            # An empty export still writes the typed columns
+            paths = trade_service.export_to_parquet(
+                os.path.join(directory, "empty"), {"portfolio_id": 2}
+            )
+            df = polars.read_parquet(paths[0])
+            self.assertEqual(0, len(df))
+            self.assertEqual(polars.Float64, df.schema["open_price"])
+
+    def test_export_from_database_path(self):
+        order_service = self.app.container.order_service()
+
+        with TemporaryDirectory() as directory:
+            database_path = os.path.join(directory, "backtest.sqlite3")
+            backup_database(database_path)
+            df = polars.concat(
+                order_service.export(
+                    {"portfolio_id": 1}, database_path=database_path
+                )
+            )
+            self.assertEqual(3, len(df))
+
+    def test_export_from_database_path_uses_its_sub_queries(self):
+        position_service = self.app.container.position_service()
+        portfolio_service = self.app.container.portfolio_service()
+        position = position_service.create(
+            {"symbol": "ADA", "amount": 0, "portfolio_id": 1}
+        )
+
+        with TemporaryDirectory() as directory:
+            database_path = os.path.join(directory, "backtest.sqlite3")
+            backup_database(database_path)
+
+            # The position only exists in the exported database
+            position_service.delete(position.id)
+            df = polars.concat(
+                portfolio_service.export(
+                    {"position": position.id}, database_path=database_path
+                )
+            )
+            self.assertEqual(1, len(df))
@@ -0,0 +1,101 @@
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def setUp(self) -> None:
+        super().setUp()
+        order_service = self.app.container.order_service()
+
+        for symbol in ["BTC", "ETH", "DOT", "ADA", "KSM"]:
+            order_service.create(
+                {
+                    "portfolio_id": 1,
+                    "target_symbol": symbol,
+                    "amount": 1,
+                    "trading_symbol": "EUR",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "order_type": "LIMIT",
+                    "status": "OPEN",
+                }
+            )
+
+    def test_limit_and_offset(self):
+        order_service = self.app.container.order_service()
+        orders = order_service.get_all({"order_by_created_at_asc": True})
+        self.assertEqual(5, len(orders))
+        page = order_service.get_all(
+            {"order_by_created_at_asc": True, "limit": 2, "offset": 1}
+        )
+        self.assertEqual(
+            [order.id for order in orders[1:3]],
+            [order.id for order in page]
+        )
+        page = order_service.get_all({"page": 3, "per_page": 2})
+        self.assertEqual(1, len(page))
+
+    def test_keyset_pagination(self):
+        order_service = self.app.container.order_service()
+        ids = []
+        after_id = 0
+
+        while True:
+            page = order_service.get_all({"after_id": after_id, "limit": 2})
+
+            if len(page) == 0:
+                break
+
+            ids += [order.id for order in page]
+            after_id = page[-1].id
+
+        self.assertEqual([1, 2, 3, 4, 5], ids)
+
+    def test_paginate(self):
+        order_service = self.app.container.order_service()
+        result = order_service.paginate(
+            {"target_symbol": "BTC", "per_page": 2}
+        )
+        self.assertEqual(1, result["total"])
+        self.assertEqual(1, result["page"])
+        self.assertEqual(1, len(result["items"]))
+        result = order_service.paginate()
+        self.assertEqual(5, result["total"])
+
+    def test_stream(self):
+        order_service = self.app.container.order_service()
+        symbols = [
+            order.target_symbol
+            for order in order_service.stream(
+                {"order_by_created_at_asc": True}, batch_size=2
+            )
+        ]
+        self.assertEqual(["BTC", "ETH", "DOT", "ADA", "KSM"], symbols)
+
+    def test_context(self):
+        context = self.app.context
+        self.assertEqual(5, len(context.get_orders()))
+        self.assertEqual(2, len(context.get_orders(limit=2)))
+        self.assertEqual(1, len(context.get_orders(limit=2, offset=4)))
+        self.assertEqual(2, len(context.get_trades(limit=2)))
+        self.assertEqual(
+            1, len(context.get_trades(target_symbol="BTC"))
+        )
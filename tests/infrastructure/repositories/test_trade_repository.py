@@ -1,5 +1,9 @@
+from sqlalchemy import text, event
+
 from investing_algorithm_framework import PortfolioConfiguration, \
     MarketCredential, TradeStatus
+from investing_algorithm_framework.infrastructure import Session, \
+    create_all_tables
 from tests.resources import TestBase
 
 
@@ -47,3 +51,112 @@ class Test(TestBase):
         self.assertEqual(1, len(trades))
         trades = trade_service.get_all({"status": TradeStatus.CLOSED.value})
         self.assertEqual(0, len(trades))
+
+    def test_get_all_with_portfolio_id_and_order_id(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+        orders = [
+            order_service.create(
+                {
+                    "portfolio_id": 1,
+                    "target_symbol": symbol,
+                    "amount": 1,
+                    "trading_symbol": "EUR",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "order_type": "LIMIT",
+                    "status": "OPEN",
+                }
+            ) for symbol in ["BTC", "ETH"]
+        ]
+        trades = trade_service.get_all({"portfolio_id": 1})
+        self.assertEqual(2, len(trades))
+
+        for trade in trades:
+            self.assertEqual(1, trade.portfolio_id)
+            self.assertEqual("BINANCE", trade.market)
+
+        # Filters applied before the portfolio filter are kept
+        trades = trade_service.get_all(
+            {"portfolio_id": 1, "order_id": orders[1].id}
+        )
+        self.assertEqual(1, len(trades))
+        self.assertEqual("ETH", trades[0].target_symbol)
+        self.assertEqual(0, len(trade_service.get_all({"portfolio_id": 2})))
+
+    def test_migrate_trades_without_portfolio_id(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+        order_service.create(
+            {
+                "portfolio_id": 1,
+                "target_symbol": "BTC",
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": 10,
+                "order_side": "BUY",
+                "order_type": "LIMIT",
+                "status": "OPEN",
+            }
+        )
+
+        # Simulate a trade created by an earlier version
+        with Session() as db:
+            db.execute(
+                text("UPDATE trades SET portfolio_id = NULL, market = NULL")
+            )
+            db.commit()
+
+        self.assertEqual(0, len(trade_service.get_all({"portfolio_id": 1})))
+        create_all_tables()
+        trades = trade_service.get_all({"portfolio_id": 1})
+        self.assertEqual(1, len(trades))
+        self.assertEqual("BINANCE", trades[0].market)
+
+    def test_relationship_loading(self):
+        order_service = self.app.container.order_service()
+        trade_service = self.app.container.trade_service()
+
+        for symbol in ["BTC", "ETH", "DOT"]:
+            order_service.create(
+                {
+                    "portfolio_id": 1,
+                    "target_symbol": symbol,
+                    "amount": 1,
+                    "trading_symbol": "EUR",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "order_type": "LIMIT",
+                    "status": "OPEN",
+                }
+            )
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        engine = Session().bind
+        event.listen(engine, "before_cursor_execute", capture)
+
+        try:
+            # Counts don't load any relationships
+            self.assertEqual(3, trade_service.count({"portfolio_id": 1}))
+            self.assertEqual(1, len(statements))
+            self.assertNotIn("JOIN", statements[0])
+
+            # Listings load the relationships with one query per
+            # relationship for all trades
+            statements.clear()
+            trades = trade_service.get_all({"portfolio_id": 1})
+            self.assertEqual(4, len(statements))
+
+            # The detail path joins the relationships in
+            statements.clear()
+            trade = trade_service.get(trades[0].id)
+            self.assertEqual(1, len(statements))
+            self.assertIn("JOIN", statements[0])
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        self.assertEqual(1, len(trade.orders))
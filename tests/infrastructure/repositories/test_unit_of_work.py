@@ -0,0 +1,168 @@
+from unittest import mock
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, OperationalException, OrderStatus
+from investing_algorithm_framework.infrastructure.database import \
+    get_unit_of_work_session, rollback_session
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def test_single_session_and_identity_map(self):
+        portfolio_service = self.app.container.portfolio_service()
+        portfolio_id = portfolio_service.get_all()[0].id
+
+        with portfolio_service.unit_of_work() as db:
+            self.assertIs(db, get_unit_of_work_session())
+
+            # Nested units of work join the ambient session
+            with portfolio_service.unit_of_work() as nested_db:
+                self.assertIs(db, nested_db)
+
+            self.assertIs(
+                portfolio_service.get(portfolio_id),
+                portfolio_service.get(portfolio_id)
+            )
+
+        self.assertIsNone(get_unit_of_work_session())
+
+    def test_commit_at_exit(self):
+        portfolio_service = self.app.container.portfolio_service()
+        portfolio_id = portfolio_service.get_all()[0].id
+
+        with portfolio_service.unit_of_work():
+            portfolio_service.update(portfolio_id, {"unallocated": 500})
+
+        self.assertEqual(500, portfolio_service.get(portfolio_id).unallocated)
+
+    def test_rollback_on_error(self):
+        portfolio_service = self.app.container.portfolio_service()
+        portfolio_id = portfolio_service.get_all()[0].id
+
+        with self.assertRaises(ValueError):
+
+            with portfolio_service.unit_of_work():
+                portfolio_service.update(portfolio_id, {"unallocated": 500})
+                raise ValueError()
+
+        self.assertEqual(
+            1000, portfolio_service.get(portfolio_id).unallocated
+        )
+
+    def test_commit_on_error(self):
+        portfolio_service = self.app.container.portfolio_service()
+        portfolio_id = portfolio_service.get_all()[0].id
+
+        with self.assertRaises(ValueError):
+
+            with portfolio_service.unit_of_work(commit_on_error=True):
+                portfolio_service.update(portfolio_id, {"unallocated": 500})
+                raise ValueError()
+
+        self.assertEqual(500, portfolio_service.get(portfolio_id).unallocated)
+
+    def test_raise_on_handled_rollback(self):
+        portfolio_service = self.app.container.portfolio_service()
+        portfolio_id = portfolio_service.get_all()[0].id
+
+        # A failed database operation whose error is handled inside the
+        # unit of work still rolls back all its changes, and raises
+        with self.assertRaises(OperationalException):
+
+            with portfolio_service.unit_of_work(commit_on_error=True) as db:
+                portfolio_service.update(portfolio_id, {"unallocated": 500})
+                rollback_session(db)
+
+        self.assertEqual(
+            1000, portfolio_service.get(portfolio_id).unallocated
+        )
+
+    def test_create_order_in_unit_of_work(self):
+        order_service = self.app.container.order_service()
+        portfolio_service = self.app.container.portfolio_service()
+
+        with order_service.unit_of_work():
+            order_service.create(
+                {
+                    "portfolio_id": 1,
+                    "target_symbol": "BTC",
+                    "amount": 1,
+                    "trading_symbol": "EUR",
+                    "price": 10,
+                    "order_side": "BUY",
+                    "order_type": "LIMIT",
+                    "status": "OPEN",
+                }
+            )
+
+        self.assertEqual(1, order_service.count())
+        self.assertEqual(990, portfolio_service.get(1).unallocated)
+
+    def test_submit_order_after_unit_of_work(self):
+        order_service = self.app.container.order_service()
+        market_service = order_service.market_service
+        submit_order = market_service.submit_order
+        sessions = []
+
+        def record_submit_order(order, market):
+            sessions.append(get_unit_of_work_session())
+            return submit_order(order, market)
+
+        order_data = {
+            "portfolio_id": 1,
+            "target_symbol": "BTC",
+            "amount": 1,
+            "trading_symbol": "EUR",
+            "price": 10,
+            "order_side": "BUY",
+            "order_type": "LIMIT",
+        }
+
+        with mock.patch.object(
+            market_service, "submit_order", side_effect=record_submit_order
+        ):
+
+            with order_service.unit_of_work():
+                order = order_service.create(dict(order_data))
+
+                # The order is only submitted once it is committed
+                self.assertEqual([], sessions)
+                self.assertEqual(OrderStatus.CREATED.value, order.status)
+
+            # The order is submitted outside of the transaction
+            self.assertEqual([None], sessions)
+            self.assertEqual(
+                OrderStatus.OPEN.value, order_service.get(order.id).status
+            )
+
+            # The order of a rolled back unit of work is never submitted
+            with self.assertRaises(ValueError):
+
+                with order_service.unit_of_work():
+                    order_service.create(dict(order_data))
+                    raise ValueError()
+
+            self.assertEqual(1, len(sessions))
+            self.assertEqual(1, order_service.count())
+
+            # Outside a unit of work the order is submitted right away
+            order = order_service.create(dict(order_data))
+            self.assertEqual([None, None], sessions)
+            self.assertEqual(OrderStatus.OPEN.value, order.status)
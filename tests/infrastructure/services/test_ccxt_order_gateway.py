@@ -0,0 +1,78 @@
+from time import time
+from unittest import TestCase
+
+from investing_algorithm_framework import Order, OperationalException
+from investing_algorithm_framework.infrastructure import CCXTMarketService
+from tests.resources import AsyncExchangeStub
+
+
+class Test(TestCase):
+
+    def setUp(self) -> None:
+        self.exchange = AsyncExchangeStub(latency=0.1)
+        self.market_service = CCXTMarketService(
+            market_credential_service=None
+        )
+        self.market_service.initialize_async_exchange = \
+            lambda market, market_credential: self.exchange
+
+    @staticmethod
+    def create_orders(symbols, order_side="BUY"):
+        return [
+            Order(
+                target_symbol=symbol,
+                trading_symbol="EUR",
+                amount=1,
+                price=10,
+                order_side=order_side,
+                order_type="LIMIT",
+                status="CREATED",
+                external_id=str(index),
+            ) for index, symbol in enumerate(symbols)
+        ]
+
+    def test_create_orders_concurrently(self):
+        symbols = ["BTC", "ETH", "ADA", "DOT", "SOL", "XRP", "LTC", "BNB"]
+        start = time()
+        results = self.market_service.create_orders(
+            self.create_orders(symbols), market="binance"
+        )
+        # Eight orders with 0.1s latency each, submitted serially this
+        # would take at least 0.8s.
+        self.assertLess(time() - start, 0.5)
+        self.assertEqual(len(symbols), len(results))
+        self.assertTrue(self.exchange.closed)
+
+        for symbol, order in zip(symbols, results):
+            self.assertEqual(symbol, order.get_target_symbol())
+            self.assertEqual("BUY", order.get_order_side())
+            self.assertIsNotNone(order.get_external_id())
+
+    def test_create_orders_respects_max_concurrent_requests(self):
+        self.market_service.max_concurrent_requests = 2
+        results = self.market_service.create_orders(
+            self.create_orders(["BTC", "ETH", "ADA", "DOT", "SOL"]),
+            market="binance"
+        )
+        self.assertEqual(5, len(results))
+        self.assertEqual(2, self.exchange.max_in_flight)
+
+    def test_create_orders_with_failing_order(self):
+        self.exchange.failing_symbols = ["ETH/EUR"]
+        results = self.market_service.create_orders(
+            self.create_orders(["BTC", "ETH", "ADA"], order_side="SELL"),
+            market="binance"
+        )
+        self.assertIsInstance(results[0], Order)
+        self.assertIsInstance(results[1], OperationalException)
+        self.assertIsInstance(results[2], Order)
+        self.assertEqual(2, len(self.exchange.created_orders))
+
+    def test_cancel_orders(self):
+        orders = self.create_orders(["BTC", "ETH", "ADA"])
+        self.exchange.failing_symbols = ["ADA/EUR"]
+        results = self.market_service.cancel_orders(orders, market="binance")
+        self.assertIsNone(results[0])
+        self.assertIsNone(results[1])
+        self.assertIsInstance(results[2], OperationalException)
+        self.assertEqual(["0", "1"], sorted(self.exchange.cancelled_orders))
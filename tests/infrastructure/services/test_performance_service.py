@@ -0,0 +1,95 @@
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, BacktestReport, BacktestDateRange
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="BINANCE",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="BINANCE",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def create_order(self, target_symbol, order_side, price, filled=True):
+        order_service = self.app.container.order_service()
+        order = order_service.create(
+            {
+                "portfolio_id": 1,
+                "target_symbol": target_symbol,
+                "amount": 1,
+                "trading_symbol": "EUR",
+                "price": price,
+                "order_side": order_side,
+                "order_type": "LIMIT",
+                "status": "OPEN",
+            }
+        )
+
+        if filled:
+            order_service.update(
+                order.id, {"filled": 1, "status": "CLOSED"}
+            )
+
+        return order
+
+    def test_get_backtest_statistics(self):
+        self.create_order("BTC", "BUY", 10)
+        self.create_order("ETH", "BUY", 20)
+        self.create_order("DOT", "BUY", 30, filled=False)
+        self.create_order("BTC", "SELL", 15)
+        self.create_order("ETH", "SELL", 25, filled=False)
+        performance_service = self.app.container.performance_service()
+        tickers = {
+            "BTC/EUR": {"bid": 15, "ask": 16},
+            "ETH/EUR": {"bid": 25, "ask": 26},
+            "DOT/EUR": {"bid": 30, "ask": 31},
+        }
+        backtest_report = BacktestReport(
+            backtest_date_range=BacktestDateRange(
+                start_date="2023-01-01", end_date="2023-12-31"
+            ),
+            initial_unallocated=1000
+        )
+        statistics = performance_service.get_backtest_statistics(
+            1, tickers, backtest_report
+        )
+        # Trades are closed when the sell order is created
+        self.assertEqual(2, statistics["number_of_trades_closed"])
+        self.assertEqual(0, statistics["number_of_trades_open"])
+        self.assertEqual(100.0, statistics["percentage_positive_trades"])
+        self.assertEqual(0.0, statistics["percentage_negative_trades"])
+        self.assertEqual(20, statistics["average_trade_size"])
+        self.assertEqual(1, statistics["pending_amounts"][("DOT", "BUY")])
+        self.assertEqual(1, statistics["pending_amounts"][("ETH", "SELL")])
+        self.assertNotIn(("BTC", "BUY"), statistics["pending_amounts"])
+
+        # The single pass gives the same results as the separate metrics
+        self.assertEqual(
+            performance_service.get_total_value(1, tickers, backtest_report),
+            statistics["total_value"]
+        )
+        self.assertEqual(
+            performance_service.get_growth_of_backtest(
+                1, tickers, backtest_report
+            ),
+            statistics["growth"]
+        )
+        self.assertEqual(
+            performance_service.get_number_of_trades_closed(1),
+            statistics["number_of_trades_closed"]
+        )
+        self.assertEqual(
+            performance_service.get_average_trade_duration(1),
+            statistics["average_trade_duration"]
+        )
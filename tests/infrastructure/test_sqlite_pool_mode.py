@@ -0,0 +1,170 @@
+import threading
+
+from sqlalchemy import QueuePool, text
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, SQLITE_POOL_MODE, SQLitePoolMode, APP_MODE, AppMode, \
+    OperationalException
+from investing_algorithm_framework.domain import SQLALCHEMY_DATABASE_URI
+from investing_algorithm_framework.infrastructure import Session
+from investing_algorithm_framework.infrastructure.database.sql_alchemy \
+    import get_sqlite_pool_mode
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    config = {SQLITE_POOL_MODE: SQLitePoolMode.THREADED.value}
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def test_threaded_pool(self):
+        self.assertIsInstance(Session().bind.pool, QueuePool)
+
+        with Session() as db:
+            self.assertEqual(
+                "wal", db.execute(text("PRAGMA journal_mode")).scalar()
+            )
+
+    def test_readers_do_not_wait_on_writer(self):
+        portfolio_service = self.app.container.portfolio_service()
+        write_started = threading.Event()
+        read_finished = threading.Event()
+        results = {}
+
+        def write():
+
+            with portfolio_service.unit_of_work():
+                portfolio_service.update(1, {"unallocated": 500})
+                write_started.set()
+                results["read_during_write"] = read_finished.wait(10)
+
+        def read():
+            write_started.wait(10)
+            results["unallocated"] = portfolio_service.get(1).unallocated
+            read_finished.set()
+
+        threads = [
+            threading.Thread(target=write), threading.Thread(target=read)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(30)
+
+        # The reader sees the last committed state while the write
+        # is still open
+        self.assertTrue(results["read_during_write"])
+        self.assertEqual(1000, results["unallocated"])
+        self.assertEqual(500, portfolio_service.get(1).unallocated)
+
+    def test_writers_are_serialized(self):
+        portfolio_service = self.app.container.portfolio_service()
+        errors = []
+
+        def write(amount):
+
+            try:
+                for _ in range(10):
+
+                    with portfolio_service.unit_of_work():
+                        portfolio = portfolio_service.get_for_update(1)
+                        portfolio_service.update(
+                            1, {"unallocated": portfolio.unallocated + amount}
+                        )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=write, args=(amount,))
+            for amount in [1, 2, 3]
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(60)
+
+        self.assertEqual([], errors)
+        self.assertEqual(1060, portfolio_service.get(1).unallocated)
+
+    def test_reading_unit_of_work_does_not_block_writers(self):
+        portfolio_service = self.app.container.portfolio_service()
+        read_started = threading.Event()
+        write_finished = threading.Event()
+        results = {}
+
+        def read():
+
+            with portfolio_service.unit_of_work():
+                portfolio_service.get(1)
+                read_started.set()
+                results["write_during_read"] = write_finished.wait(10)
+
+        def write():
+            read_started.wait(10)
+            portfolio_service.update(1, {"unallocated": 500})
+            write_finished.set()
+
+        threads = [
+            threading.Thread(target=read), threading.Thread(target=write)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(30)
+
+        self.assertTrue(results["write_during_read"])
+        self.assertEqual(500, portfolio_service.get(1).unallocated)
+
+    def test_get_for_update_outside_unit_of_work(self):
+        portfolio_service = self.app.container.portfolio_service()
+
+        # The write lock would be released before the update
+        with self.assertRaises(OperationalException):
+            portfolio_service.get_for_update(1)
+
+        with portfolio_service.unit_of_work():
+            self.assertEqual(1, portfolio_service.get_for_update(1).id)
+
+    def test_default_pool_mode(self):
+        uri = "sqlite:///database.sqlite3"
+        self.assertEqual(
+            SQLitePoolMode.THREADED,
+            get_sqlite_pool_mode(
+                {APP_MODE: AppMode.WEB.value, SQLALCHEMY_DATABASE_URI: uri}
+            )
+        )
+        self.assertEqual(
+            SQLitePoolMode.STATIC,
+            get_sqlite_pool_mode(
+                {APP_MODE: AppMode.DEFAULT.value, SQLALCHEMY_DATABASE_URI: uri}
+            )
+        )
+        self.assertEqual(
+            SQLitePoolMode.STATIC,
+            get_sqlite_pool_mode(
+                {
+                    APP_MODE: AppMode.WEB.value,
+                    SQLALCHEMY_DATABASE_URI: "sqlite://"
+                }
+            )
+        )
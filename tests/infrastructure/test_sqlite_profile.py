@@ -0,0 +1,60 @@
+from sqlalchemy import inspect, text
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, SQLITE_PROFILE, SQLiteProfile
+from investing_algorithm_framework.infrastructure import Session
+from tests.resources import TestBase
+
+
+class Test(TestBase):
+    config = {SQLITE_PROFILE: SQLiteProfile.LIVE.value}
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key"
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000,
+    }
+
+    def test_pragmas(self):
+
+        with Session() as db:
+            self.assertEqual(
+                "wal", db.execute(text("PRAGMA journal_mode")).scalar()
+            )
+            # NORMAL
+            self.assertEqual(
+                1, db.execute(text("PRAGMA synchronous")).scalar()
+            )
+            self.assertEqual(
+                -64000, db.execute(text("PRAGMA cache_size")).scalar()
+            )
+
+    def test_indexes(self):
+        inspector = inspect(Session().bind)
+        order_indexes = [
+            index["name"] for index in inspector.get_indexes("orders")
+        ]
+        self.assertIn("ix_orders_position_id_status", order_indexes)
+        self.assertIn(
+            "ix_orders_status_target_symbol_order_side", order_indexes
+        )
+        trade_indexes = [
+            index["name"] for index in inspector.get_indexes("trades")
+        ]
+        self.assertIn(
+            "ix_trades_status_target_symbol_trading_symbol", trade_indexes
+        )
+        position_indexes = [
+            index["name"] for index in inspector.get_indexes("positions")
+        ]
+        self.assertIn("ix_positions_portfolio_id", position_indexes)
@@ -1,5 +1,5 @@
 from .stubs import MarketServiceStub, RandomPriceMarketDataSourceServiceStub,\
-    MarketDataSourceServiceStub
+    MarketDataSourceServiceStub, AsyncExchangeStub
 from .test_base import TestBase, FlaskTestBase
 from .utils import random_string
 
@@ -9,5 +9,6 @@ __all__ = [
     "MarketServiceStub",
     "FlaskTestBase",
     "RandomPriceMarketDataSourceServiceStub",
-    "MarketDataSourceServiceStub"
+    "MarketDataSourceServiceStub",
+    "AsyncExchangeStub",
 ]
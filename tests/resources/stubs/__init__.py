@@ -1,9 +1,11 @@
 from .market_data_source_service_stub import \
     RandomPriceMarketDataSourceServiceStub, MarketDataSourceServiceStub
 from .market_service_stub import MarketServiceStub
+from .async_exchange_stub import AsyncExchangeStub
 
 __all__ = [
     "MarketServiceStub",
     "RandomPriceMarketDataSourceServiceStub",
-    "MarketDataSourceServiceStub"
+    "MarketDataSourceServiceStub",
+    "AsyncExchangeStub",
 ]
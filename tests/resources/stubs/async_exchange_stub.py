@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime
+
+
+class AsyncExchangeStub:
+    """
+    Local fake of an async CCXT exchange. Every request takes `latency`
+    seconds, and the maximum number of requests that were in flight
+    at the same time is recorded.
+    """
+
+    def __init__(self, latency=0.1, failing_symbols=None):
+        self.latency = latency
+        self.failing_symbols = failing_symbols or []
+        self.has = {
+            "createLimitBuyOrder": True,
+            "createLimitSellOrder": True,
+            "createMarketSellOrder": True,
+            "cancelOrder": True,
+        }
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.created_orders = []
+        self.cancelled_orders = []
+        self.closed = False
+
+    async def _request(self, symbol):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(self.latency)
+
+            if symbol in self.failing_symbols:
+                raise Exception(f"Exchange error for {symbol}")
+        finally:
+            self.in_flight -= 1
+
+    async def _create_order(self, symbol, order_type, side, amount, price):
+        await self._request(symbol)
+        order = {
+            "id": str(len(self.created_orders) + 1),
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "amount": amount,
+            "price": price,
+            "filled": 0,
+            "remaining": amount,
+            "cost": 0,
+            "status": "open",
+            "datetime": datetime.utcnow().isoformat(),
+        }
+        self.created_orders.append(order)
+        return order
+
+    async def createLimitBuyOrder(self, symbol, amount, price):
+        return await self._create_order(symbol, "limit", "buy", amount, price)
+
+    async def createLimitSellOrder(self, symbol, amount, price):
+        return await self._create_order(
+            symbol, "limit", "sell", amount, price
+        )
+
+    async def createMarketSellOrder(self, symbol, amount):
+        return await self._create_order(symbol, "market", "sell", amount, None)
+
+    async def cancelOrder(self, order_id, symbol):
+        await self._request(symbol)
+        self.cancelled_orders.append(order_id)
+
+    async def close(self):
+        self.closed = True
@@ -82,7 +82,11 @@ class MarketServiceStub(MarketService):
         pass
 
     def get_closed_orders(
-        self, market, target_symbol: str = None, trading_symbol: str = None
+        self,
+        market,
+        target_symbol: str = None,
+        trading_symbol: str = None,
+        since: datetime = None
     ):
         pass
 
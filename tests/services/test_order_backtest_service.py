@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 import polars as pl
 
 from investing_algorithm_framework import PortfolioConfiguration, \
-    MarketCredential, BACKTESTING_INDEX_DATETIME
+    MarketCredential, BACKTESTING_INDEX_DATETIME, BACKTESTING_FILL_MODEL, \
+    FillModel, PercentageFee, FixedFee, CandleRangeSlippage, MarketDataType
 from investing_algorithm_framework.services import \
     BacktestMarketDataSourceService, OrderBacktestService
 from investing_algorithm_framework.domain import ENVIRONMENT, \
@@ -559,3 +560,142 @@ class TestOrderBacktestService(TestBase):
         ]
         ohlcv_df = pl.DataFrame(ohclv)
         self.assertTrue(order_service.has_executed(sell_order, ohlcv_df))
+
+    def create_buy_order(self, created_at):
+        order_service = self.app.container.order_service()
+        configuration_service = self.app.container.configuration_service()
+        configuration_service.add_value(BACKTESTING_INDEX_DATETIME, created_at)
+        return order_service.create(
+            {
+                "target_symbol": "ADA",
+                "trading_symbol": "EUR",
+                "amount": 1000,
+                "order_side": "BUY",
+                "price": 0.25,
+                "order_type": "LIMIT",
+                "portfolio_id": 1,
+                "status": "CREATED",
+            }
+        )
+
+    @staticmethod
+    def create_market_data(candles):
+        return {
+            "metadata": {
+                MarketDataType.OHLCV: {"ADA/EUR": {"2h": "ADA/EUR-ohlcv"}}
+            },
+            "ADA/EUR-ohlcv": pl.DataFrame(
+                [
+                    {
+                        "Open": low,
+                        "High": high,
+                        "Low": low,
+                        "Close": low,
+                        "Volume": volume,
+                        "Datetime": created_at
+                    } for created_at, high, low, volume in candles
+                ]
+            )
+        }
+
+    def test_check_pending_orders_with_partial_fills(self):
+        self.app.set_config(
+            BACKTESTING_FILL_MODEL, FillModel(max_volume_participation=0.1)
+        )
+        order_service = self.app.container.order_service()
+        configuration_service = self.app.container.configuration_service()
+        start = datetime(2023, 8, 8)
+        order = self.create_buy_order(start)
+        candles = [
+            (start, 0.26, 0.24, 4000),
+            (start + timedelta(hours=2), 0.27, 0.26, 4000),
+        ]
+        configuration_service.add_value(
+            BACKTESTING_INDEX_DATETIME, start + timedelta(hours=2)
+        )
+        order_service.check_pending_orders(self.create_market_data(candles))
+        order = order_service.get(order.id)
+        self.assertEqual("OPEN", order.get_status())
+        self.assertAlmostEqual(400, order.get_filled())
+        self.assertAlmostEqual(600, order.get_remaining())
+
+        # The already used candles are not counted again
+        order_service.check_pending_orders(self.create_market_data(candles))
+        order = order_service.get(order.id)
+        self.assertAlmostEqual(400, order.get_filled())
+
+        candles.append((start + timedelta(hours=4), 0.25, 0.24, 10000))
+        configuration_service.add_value(
+            BACKTESTING_INDEX_DATETIME, start + timedelta(hours=4)
+        )
+        order_service.check_pending_orders(self.create_market_data(candles))
+        order = order_service.get(order.id)
+        self.assertEqual("CLOSED", order.get_status())
+        self.assertEqual(1000, order.get_filled())
+        self.assertEqual(0, order.get_remaining())
+        position = self.app.container.position_service().get(
+            order.position_id
+        )
+        self.assertAlmostEqual(1000, position.get_amount())
+
+    def test_check_pending_orders_with_fees(self):
+        self.app.set_config(
+            BACKTESTING_FILL_MODEL,
+            FillModel(
+                fees={"binance": PercentageFee(0.001)},
+                default_fee=FixedFee(10)
+            )
+        )
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 8, 8)
+        order = self.create_buy_order(start)
+        order_service.check_pending_orders(
+            self.create_market_data([(start, 0.26, 0.24, 4000)])
+        )
+        order = order_service.get(order.id)
+        self.assertEqual("CLOSED", order.get_status())
+        self.assertAlmostEqual(0.25, order.get_order_fee())
+        self.assertAlmostEqual(0.001, order.get_order_fee_rate())
+        self.assertAlmostEqual(250, order.get_cost())
+        self.assertEqual("EUR", order.get_order_fee_currency())
+        portfolio = self.app.container.portfolio_service().find(
+            {"market": "binance"}
+        )
+        self.assertAlmostEqual(749.75, portfolio.get_unallocated())
+        self.assertAlmostEqual(-0.25, portfolio.get_total_net_gain())
+
+    def test_has_executed_with_candle_range_slippage(self):
+        self.app.set_config(
+            BACKTESTING_FILL_MODEL,
+            FillModel(slippage=CandleRangeSlippage(0.5))
+        )
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 8, 8)
+        order = self.create_buy_order(start)
+
+        # The low touches the order price, but the market does not trade
+        # through the order price with half of the candle range
+        market_data = self.create_market_data([(start, 0.27, 0.245, 4000)])
+        self.assertFalse(
+            order_service.has_executed(order, market_data["ADA/EUR-ohlcv"])
+        )
+        market_data = self.create_market_data([(start, 0.255, 0.245, 4000)])
+        self.assertTrue(
+            order_service.has_executed(order, market_data["ADA/EUR-ohlcv"])
+        )
+
+    def test_check_pending_orders_with_fixed_fee(self):
+        self.app.set_config(
+            BACKTESTING_FILL_MODEL, FillModel(default_fee=FixedFee(1))
+        )
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 8, 8)
+        order = self.create_buy_order(start)
+        order_service.check_pending_orders(
+            self.create_market_data([(start, 0.26, 0.24, 4000)])
+        )
+        order = order_service.get(order.id)
+        self.assertAlmostEqual(1, order.get_order_fee())
+
+        # The rate of a fixed fee is the effective rate over the fill value
+        self.assertAlmostEqual(0.004, order.get_order_fee_rate())
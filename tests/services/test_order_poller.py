@@ -0,0 +1,228 @@
+import threading
+from unittest import TestCase
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, Order, OrderStatus
+from investing_algorithm_framework.domain import ORDER_POLL_CACHE_TTL
+from investing_algorithm_framework.services.order_service.order_poller \
+    import OrderPoller
+from tests.resources import TestBase, MarketServiceStub
+
+
+class PollingMarketServiceStub(MarketServiceStub):
+
+    def __init__(self, market_credential_service):
+        super().__init__(market_credential_service)
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.open_orders_calls = 0
+        self.closed_orders_calls = 0
+        self.get_order_calls = 0
+        self.external_id = 0
+        self.failing_polls = 0
+
+    def create_limit_buy_order(
+        self, target_symbol, trading_symbol, amount, price, market
+    ):
+        self.external_id += 1
+        return Order(
+            external_id=self.external_id,
+            amount=amount,
+            status=OrderStatus.OPEN,
+            order_type="limit",
+            order_side="buy",
+            target_symbol=target_symbol,
+            trading_symbol=trading_symbol,
+            price=price
+        )
+
+    def _select(self, target_symbol, open_orders):
+        return [
+            order for order in self.orders
+            if order.get_target_symbol() == target_symbol
+            and OrderStatus.OPEN.equals(order.get_status()) == open_orders
+        ]
+
+    def get_open_orders(
+        self, market, target_symbol=None, trading_symbol=None
+    ):
+        self.open_orders_calls += 1
+
+        if self.failing_polls > 0:
+            self.failing_polls -= 1
+            raise Exception("Market unavailable")
+
+        return self._select(target_symbol, True)
+
+    def get_closed_orders(
+        self, market, target_symbol=None, trading_symbol=None, since=None
+    ):
+        self.closed_orders_calls += 1
+        return self._select(target_symbol, False)
+
+    def get_order(self, order, market):
+        self.get_order_calls += 1
+        return super().get_order(order, market)
+
+
+class TestOrderPoller(TestBase):
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR"
+        )
+    ]
+    external_balances = {
+        "EUR": 1000
+    }
+    market_service = PollingMarketServiceStub(None)
+
+    def setUp(self) -> None:
+        super(TestOrderPoller, self).setUp()
+        self.market_service.reset_counters()
+
+    @staticmethod
+    def create_external_order(order, status, filled):
+        return Order(
+            external_id=order.external_id,
+            target_symbol=order.target_symbol,
+            trading_symbol=order.trading_symbol,
+            order_side=order.order_side,
+            order_type=order.order_type,
+            price=order.price,
+            amount=order.amount,
+            filled=filled,
+            remaining=order.amount - filled,
+            status=status,
+        )
+
+    def create_orders(self):
+        return [
+            self.app.context.create_limit_order(
+                target_symbol=target_symbol,
+                price=10,
+                order_side="BUY",
+                amount=10
+            ) for target_symbol in ["BTC", "BTC", "ETH"]
+        ]
+
+    def test_check_pending_orders_polls_per_symbol(self):
+        order_service = self.app.container.order_service()
+        btc_order_one, btc_order_two, eth_order = self.create_orders()
+        self.market_service.orders = [
+            self.create_external_order(
+                btc_order_one, OrderStatus.CLOSED, 10
+            ),
+            self.create_external_order(btc_order_two, OrderStatus.OPEN, 0),
+            self.create_external_order(eth_order, OrderStatus.OPEN, 5),
+        ]
+        order_service.check_pending_orders()
+        self.assertEqual(2, self.market_service.open_orders_calls)
+        self.assertEqual(2, self.market_service.closed_orders_calls)
+        self.assertEqual(0, self.market_service.get_order_calls)
+
+        btc_order_one = order_service.get(btc_order_one.id)
+        self.assertEqual(OrderStatus.CLOSED.value, btc_order_one.status)
+        btc_order_two = order_service.get(btc_order_two.id)
+        self.assertEqual(OrderStatus.OPEN.value, btc_order_two.status)
+        eth_order = order_service.get(eth_order.id)
+        self.assertEqual(OrderStatus.OPEN.value, eth_order.status)
+        self.assertEqual(5, eth_order.get_filled())
+
+    def test_check_pending_orders_shares_cached_poll(self):
+        order_service = self.app.container.order_service()
+        btc_order_one, btc_order_two, eth_order = self.create_orders()
+        self.market_service.orders = [
+            self.create_external_order(order, OrderStatus.OPEN, 0)
+            for order in [btc_order_one, btc_order_two, eth_order]
+        ]
+        self.app.set_config(ORDER_POLL_CACHE_TTL, 60)
+        order_service.check_pending_orders()
+        self.app.container.order_service().check_pending_orders()
+        self.assertEqual(2, self.market_service.open_orders_calls)
+
+        self.app.set_config(ORDER_POLL_CACHE_TTL, 0)
+        order_service.check_pending_orders()
+        self.assertEqual(4, self.market_service.open_orders_calls)
+
+    def test_check_pending_orders_falls_back_to_get_order(self):
+        order_service = self.app.container.order_service()
+        btc_order_one, btc_order_two, eth_order = self.create_orders()
+        self.market_service.orders = []
+        order_service.check_pending_orders()
+        self.assertEqual(3, self.market_service.get_order_calls)
+
+        for order in order_service.get_all():
+            self.assertEqual(OrderStatus.CLOSED.value, order.status)
+
+    def test_failed_poll_is_not_cached(self):
+        order_poller = self.app.container.order_service().order_poller
+        orders = self.create_orders()
+        self.market_service.orders = [
+            self.create_external_order(order, OrderStatus.OPEN, 0)
+            for order in orders
+        ]
+        self.app.set_config(ORDER_POLL_CACHE_TTL, 60)
+        self.market_service.failing_polls = 1
+        self.assertEqual(
+            {}, order_poller.get_orders("binance", "BTC", "EUR")
+        )
+
+        # The next call polls the market again
+        self.assertEqual(
+            2, len(order_poller.get_orders("binance", "BTC", "EUR"))
+        )
+        self.assertEqual(2, self.market_service.open_orders_calls)
+
+
+class BlockingMarketService:
+
+    def __init__(self):
+        self.btc_polled = threading.Event()
+        self.release_btc = threading.Event()
+
+    def get_open_orders(self, market, target_symbol, trading_symbol):
+
+        if target_symbol == "BTC":
+            self.btc_polled.set()
+            self.release_btc.wait(5)
+
+        return []
+
+    def get_closed_orders(
+        self, market, target_symbol, trading_symbol, since=None
+    ):
+        return []
+
+
+class ConfigurationService:
+    config = {ORDER_POLL_CACHE_TTL: 60}
+
+
+class TestOrderPollerConcurrency(TestCase):
+
+    def test_polls_of_other_symbols_are_not_blocked(self):
+        market_service = BlockingMarketService()
+        poller = OrderPoller(market_service, ConfigurationService())
+        thread = threading.Thread(
+            target=poller.get_orders, args=("binance", "BTC", "EUR")
+        )
+        thread.start()
+
+        try:
+            self.assertTrue(market_service.btc_polled.wait(5))
+
+            # The slow BTC poll doesn't block the ETH poll
+            self.assertEqual({}, poller.get_orders("binance", "ETH", "EUR"))
+            self.assertTrue(thread.is_alive())
+        finally:
+            market_service.release_btc.set()
+            thread.join()
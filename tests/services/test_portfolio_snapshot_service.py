@@ -0,0 +1,190 @@
+from datetime import datetime, timedelta
+
+from investing_algorithm_framework import PortfolioConfiguration, \
+    MarketCredential, SnapshotInterval, SNAPSHOT_INTERVAL
+from investing_algorithm_framework.domain import SNAPSHOT_BUFFER_SIZE, \
+    SNAPSHOT_STRATEGY_ITERATIONS, SNAPSHOT_TIME_INTERVAL, \
+    OperationalException
+from tests.resources import TestBase
+
+
+class TestPortfolioSnapshotService(TestBase):
+    portfolio_configurations = [
+        PortfolioConfiguration(
+            market="binance",
+            trading_symbol="EUR"
+        )
+    ]
+    market_credentials = [
+        MarketCredential(
+            market="binance",
+            api_key="api_key",
+            secret_key="secret_key",
+        )
+    ]
+    external_balances = {
+        "EUR": 1000
+    }
+
+    def create_buy_order(self):
+        self.app.context.create_limit_order(
+            target_symbol="BTC",
+            amount=1,
+            price=10,
+            order_side="BUY",
+        )
+
+    def test_snapshot_on_order(self):
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        self.assertEqual(1, snapshot_service.count())
+        self.create_buy_order()
+
+        # One snapshot for the creation and one for the execution
+        self.assertEqual(3, snapshot_service.count())
+
+    def test_snapshot_every_n_strategy_iterations(self):
+        self.app.set_config(
+            SNAPSHOT_INTERVAL, SnapshotInterval.STRATEGY_ITERATION.value
+        )
+        self.app.set_config(SNAPSHOT_STRATEGY_ITERATIONS, 3)
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+        self.create_buy_order()
+        self.assertEqual(1, snapshot_service.count())
+
+        for _ in range(7):
+            order_service.create_snapshots_on_strategy_run(datetime.utcnow())
+
+        self.assertEqual(3, snapshot_service.count())
+
+    def test_snapshot_time_interval(self):
+        self.app.set_config(
+            SNAPSHOT_INTERVAL, SnapshotInterval.TIME_INTERVAL.value
+        )
+        self.app.set_config(SNAPSHOT_TIME_INTERVAL, timedelta(hours=1))
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 1, 1)
+
+        for minutes in range(0, 180, 15):
+            order_service.create_snapshots_on_strategy_run(
+                start + timedelta(minutes=minutes)
+            )
+
+        self.assertEqual(4, snapshot_service.count())
+
+    def test_snapshot_time_interval_not_configured(self):
+        self.app.set_config(
+            SNAPSHOT_INTERVAL, SnapshotInterval.TIME_INTERVAL.value
+        )
+        order_service = self.app.container.order_service()
+
+        with self.assertRaises(OperationalException):
+            order_service.create_snapshots_on_strategy_run(datetime.utcnow())
+
+    def test_snapshot_daily(self):
+        self.app.set_config(SNAPSHOT_INTERVAL, SnapshotInterval.DAILY.value)
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 1, 1)
+
+        for hours in range(0, 72, 4):
+            order_service.create_snapshots_on_strategy_run(
+                start + timedelta(hours=hours)
+            )
+
+        self.assertEqual(4, snapshot_service.count())
+
+    def test_buffered_snapshots_are_flushed_in_bulk(self):
+        self.app.set_config(SNAPSHOT_BUFFER_SIZE, 10)
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        position_snapshot_service = self.app.container\
+            .position_snapshot_service()
+        self.create_buy_order()
+        self.assertEqual(1, snapshot_service.count())
+
+        snapshots = snapshot_service.flush()
+        self.assertEqual(2, len(snapshots))
+        self.assertEqual(3, snapshot_service.count())
+
+        # Both snapshots have a position snapshot for EUR and BTC
+        for snapshot in snapshots:
+            self.assertEqual(
+                2,
+                position_snapshot_service.count(
+                    {"portfolio_snapshot": snapshot.id}
+                )
+            )
+
+        self.assertEqual([], snapshot_service.flush())
+
+    def test_get_snapshots(self):
+        self.app.set_config(SNAPSHOT_INTERVAL, SnapshotInterval.DAILY.value)
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+        start = datetime(2023, 1, 1)
+
+        for days in range(5):
+            order_service.create_snapshots_on_strategy_run(
+                start + timedelta(days=days)
+            )
+
+        snapshots = snapshot_service.get_snapshots(
+            1,
+            start_date=start + timedelta(days=1),
+            end_date=start + timedelta(days=3)
+        )
+        self.assertEqual(
+            [start + timedelta(days=days) for days in range(1, 4)],
+            [snapshot.created_at for snapshot in snapshots]
+        )
+
+        # The snapshot of the portfolio creation is the latest snapshot
+        snapshots = snapshot_service.get_snapshots(1, start_date=start)
+        self.assertEqual(6, len(snapshots))
+        self.assertEqual(
+            snapshots[-1].id, snapshot_service.get_latest_snapshot(1).id
+        )
+        self.assertEqual(
+            [start], [
+                snapshot.created_at for snapshot in
+                snapshot_service.get_snapshots(1, end_date=start)
+            ]
+        )
+        self.assertIsNone(snapshot_service.get_latest_snapshot(2))
+
+    def test_create_snapshot_returns_snapshot(self):
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+        snapshot = order_service.create_snapshot(1)
+        self.assertIsNotNone(snapshot.id)
+        self.assertEqual(2, snapshot_service.count())
+
+        # A buffered snapshot is returned without an id
+        self.app.set_config(SNAPSHOT_BUFFER_SIZE, 10)
+        snapshot = order_service.create_snapshot(1)
+        self.assertIsNone(getattr(snapshot, "id", None))
+        self.assertEqual("EUR", snapshot.trading_symbol)
+        self.assertEqual(2, snapshot_service.count())
+        self.assertEqual(1, len(snapshot_service.flush()))
+
+    def test_snapshot_of_rolled_back_unit_of_work_is_discarded(self):
+        self.app.set_config(SNAPSHOT_BUFFER_SIZE, 10)
+        snapshot_service = self.app.container.portfolio_snapshot_service()
+        order_service = self.app.container.order_service()
+
+        with self.assertRaises(ValueError):
+
+            with order_service.unit_of_work():
+                order_service.create_snapshot(1)
+                raise ValueError()
+
+        self.assertEqual([], snapshot_service.flush())
+
+        with order_service.unit_of_work():
+            order_service.create_snapshot(1)
+
+            # The snapshot is buffered when the unit of work commits
+            self.assertEqual([], snapshot_service.flush())
+
+        self.assertEqual(1, len(snapshot_service.flush()))
@@ -1,5 +1,6 @@
 from investing_algorithm_framework import PortfolioConfiguration, Algorithm, \
-    MarketCredential, OperationalException, RESERVED_BALANCES
+    MarketCredential, OperationalException, RESERVED_BALANCES, Order, \
+    OrderStatus
 from tests.resources import TestBase
 
 
@@ -132,3 +133,135 @@ class Test(TestBase):
         portfolio = self.app.container.portfolio_service() \
             .find({"identifier": "test"})
         self.assertEqual(500, portfolio.unallocated)
+
+    def initialize_binance_portfolio(self):
+        self.app.add_portfolio_configuration(
+            PortfolioConfiguration(
+                identifier="test",
+                market="binance",
+                trading_symbol="EUR",
+                initial_balance=1000
+            )
+        )
+        self.app.add_market_credential(
+            MarketCredential(
+                market="binance",
+                api_key="test",
+                secret_key="test"
+            )
+        )
+        self.market_service.balances = {"EUR": 1000}
+        self.app.add_algorithm(Algorithm())
+        self.app.initialize_config()
+        self.app.initialize()
+        return self.app.container.portfolio_service()\
+            .find({"identifier": "test"})
+
+    @staticmethod
+    def create_external_order(order, status, filled):
+        return Order(
+            external_id=order.external_id,
+            target_symbol=order.target_symbol,
+            trading_symbol=order.trading_symbol,
+            order_side=order.order_side,
+            order_type=order.order_type,
+            price=order.price,
+            amount=order.amount,
+            filled=filled,
+            remaining=order.amount - filled,
+            status=status,
+        )
+
+    def test_sync_orders(self):
+        portfolio = self.initialize_binance_portfolio()
+        portfolio_sync_service = self.app.container.portfolio_sync_service()
+        watermark_repository = self.app.container\
+            .portfolio_sync_watermark_repository()
+        btc_order = self.app.context.create_limit_order(
+            target_symbol="BTC", price=10, order_side="BUY", amount=10
+        )
+        eth_order = self.app.context.create_limit_order(
+            target_symbol="ETH", price=10, order_side="BUY", amount=10
+        )
+        self.market_service.orders = [
+            self.create_external_order(btc_order, OrderStatus.CLOSED, 10),
+            self.create_external_order(eth_order, OrderStatus.OPEN, 0),
+        ]
+        portfolio_sync_service.sync_orders(portfolio)
+
+        btc_order = self.app.container.order_service().get(btc_order.id)
+        self.assertEqual(OrderStatus.CLOSED.value, btc_order.status)
+        self.assertEqual(10, btc_order.get_filled())
+        eth_order = self.app.container.order_service().get(eth_order.id)
+        self.assertEqual(OrderStatus.OPEN.value, eth_order.status)
+
+        # The watermarks move to the time of the sync
+        eth_watermark = watermark_repository.find(
+            {"portfolio_id": portfolio.id, "symbol": "ETH/EUR"}
+        )
+        self.assertGreaterEqual(eth_watermark.synced_at, eth_order.created_at)
+        btc_watermark = watermark_repository.find(
+            {"portfolio_id": portfolio.id, "symbol": "BTC/EUR"}
+        )
+        self.assertGreaterEqual(btc_watermark.synced_at, btc_order.created_at)
+
+    def test_sync_orders_since_watermark(self):
+        portfolio = self.initialize_binance_portfolio()
+        portfolio_sync_service = self.app.container.portfolio_sync_service()
+        watermark_repository = self.app.container\
+            .portfolio_sync_watermark_repository()
+        order = self.app.context.create_limit_order(
+            target_symbol="BTC", price=10, order_side="BUY", amount=10
+        )
+        self.market_service.orders = [
+            self.create_external_order(order, OrderStatus.OPEN, 0)
+        ]
+        requested_since = []
+        get_orders = self.market_service.get_orders
+
+        def recording_get_orders(symbol, market, since=None):
+            requested_since.append(since)
+            return get_orders(symbol=symbol, market=market, since=since)
+
+        self.market_service.get_orders = recording_get_orders
+
+        # Without a watermark, the orders since the oldest open order
+        # are retrieved
+        portfolio_sync_service.sync_orders(portfolio)
+        self.assertEqual(order.created_at, requested_since[0])
+        watermark = watermark_repository.find(
+            {"portfolio_id": portfolio.id, "symbol": "BTC/EUR"}
+        )
+        synced_at = watermark.synced_at
+        self.assertGreater(synced_at, order.created_at)
+
+        # The watermark narrows the window of the next sync, the open
+        # order from before the watermark is retrieved individually
+        self.market_service.orders = []
+        self.market_service.get_order = lambda order, market: \
+            self.create_external_order(order, OrderStatus.CLOSED, 10)
+        portfolio_sync_service.sync_orders(portfolio)
+        self.assertEqual(synced_at, requested_since[1])
+        order = self.app.container.order_service().get(order.id)
+        self.assertEqual(OrderStatus.CLOSED.value, order.status)
+
+    def test_sync_orders_with_partially_filled_order(self):
+        portfolio = self.initialize_binance_portfolio()
+        portfolio_sync_service = self.app.container.portfolio_sync_service()
+        order = self.app.context.create_limit_order(
+            target_symbol="BTC", price=10, order_side="BUY", amount=10
+        )
+        self.market_service.orders = [
+            self.create_external_order(order, OrderStatus.OPEN, 4)
+        ]
+        portfolio_sync_service.sync_orders(portfolio)
+        order = self.app.container.order_service().get(order.id)
+        self.assertEqual(OrderStatus.OPEN.value, order.status)
+        self.assertEqual(4, order.get_filled())
+        position = self.app.context.get_position("BTC")
+        self.assertEqual(4, position.get_amount())
+
+        # Syncing again with the same external state changes nothing
+        portfolio_sync_service.sync_orders(portfolio)
+        position = self.app.context.get_position("BTC")
+        self.assertEqual(4, position.get_amount())